@@ -48,19 +48,34 @@ See Also:
     - docs/TWO_LAYER_ARCHITECTURE_ROADMAP.md: Architecture details
 """
 
-from openmun_ech.version_router import VersionRouter, ECH0020Version
+from openmun_ech._lazy import lazy_exports
 
-# Import component models (latest versions)
-from openmun_ech.ech0007.v5 import ECH0007Municipality
-from openmun_ech.ech0008.v3 import ECH0008Country
-from openmun_ech.ech0010.v5 import ECH0010MailAddress
-from openmun_ech.ech0011.v8 import ECH0011Person
-from openmun_ech.ech0021.v8 import ECH0021PersonAdditionalData
-from openmun_ech.ech0044.v4 import ECH0044PersonIdentification
-from openmun_ech.ech0058.v5 import ECH0058Header
-from openmun_ech.ech0097.v2 import ECH0097OrganisationIdentification
-from openmun_ech.i18n import get_label
-from openmun_ech.specdoc import get_desc
+# Exports are imported on first access (see _lazy.py): `import openmun_ech`
+# alone does not load any standard.
+_EXPORTS = {
+    'VersionRouter': 'openmun_ech.version_router',
+    'ECH0020Version': 'openmun_ech.version_router',
+    # Component models (latest versions)
+    'ECH0007Municipality': 'openmun_ech.ech0007.v5',
+    'ECH0008Country': 'openmun_ech.ech0008.v3',
+    'ECH0010MailAddress': 'openmun_ech.ech0010.v5',
+    'ECH0011Person': 'openmun_ech.ech0011.v8',
+    'ECH0021PersonAdditionalData': 'openmun_ech.ech0021.v8',
+    'ECH0044PersonIdentification': 'openmun_ech.ech0044.v4',
+    'ECH0058Header': 'openmun_ech.ech0058.v5',
+    'ECH0097OrganisationIdentification': 'openmun_ech.ech0097.v2',
+    'get_label': 'openmun_ech.i18n',
+    'get_desc': 'openmun_ech.specdoc',
+}
+
+# Subpackages are also attributes of the package once imported, as before
+_SUBMODULES = (
+    'core', 'utils', 'validation',
+    'ech0006', 'ech0007', 'ech0008', 'ech0010', 'ech0011', 'ech0020', 'ech0021',
+    'ech0044', 'ech0058', 'ech0097', 'ech0099', 'ech0129', 'ech0133',
+)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, _SUBMODULES)
 
 __all__ = [
     'VersionRouter',
@@ -0,0 +1,59 @@
+"""Lazy attribute loading for package __init__ modules (PEP 562).
+
+Package __init__ modules re-export classes from their submodules. Importing
+them all eagerly makes `import openmun_ech.ech0020` build every model of the
+standard, although CLI tools and validation functions typically use a few.
+
+lazy_exports() returns the module-level __getattr__/__dir__ pair: a name is
+imported from its submodule on first access and then cached in the package
+namespace, so later accesses are plain attribute lookups.
+
+Usage (in a package __init__.py):
+    from openmun_ech._lazy import lazy_exports
+
+    _EXPORTS = {
+        'ECH0020Delivery': '.v3',
+        'Sex': 'openmun_ech.ech0011.enums',
+    }
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, submodules=['v3'])
+    __all__ = list(_EXPORTS)
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Build __getattr__/__dir__ for a package with lazily imported exports.
+
+    Args:
+        package: The package's __name__
+        exports: Exported name → module it is defined in (relative to
+                 `package` if it starts with '.')
+        submodules: Submodule names exposed as attributes (e.g. 'v7')
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> object:
+        if name in exports:
+            module = importlib.import_module(exports[name], package)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f'{package}.{name}')
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports) | submodules)
+
+    return __getattr__, __dir__
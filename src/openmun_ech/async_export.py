@@ -0,0 +1,257 @@
+"""Asyncio facade for exporting eCH-0020 deliveries from event-driven services.
+
+Conversion (Layer 2 → Layer 1), XML serialization and XSD validation are
+synchronous and CPU-bound. Calling them directly from a coroutine blocks the
+event loop. This module runs them in a bounded executor instead:
+
+- Concurrency limit: at most `max_concurrency` exports run at once; further
+  callers wait (backpressure) instead of piling work onto the executor
+- Non-blocking writes: files are written in the executor, via a temporary file
+  and an atomic rename (the sedex outbox never sees partial files)
+- Per-stage latency: every result carries ExportTimings (wait, convert,
+  validate, serialize, write)
+
+Design goals:
+- Same output as the synchronous API (finalize() + to_file())
+- Validation is on by default; validate=False must be chosen explicitly
+- No namespace pollution (not added to top-level exports)
+
+Usage:
+    exporter = AsyncExporter(config, max_concurrency=4)
+    async with exporter:
+        result = await exporter.export(event, path=outbox / 'msg.xml')
+        log.info("exported in %.1f ms", result.timings.total_s * 1000)
+
+    # One-off export (creates and closes a private exporter)
+    result = await export_delivery(event, config, path=outbox / 'msg.xml')
+
+Note: an AsyncExporter binds to the event loop it is first used in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from openmun_ech.ech0020 import BaseDeliveryEvent, DeliveryConfig
+from openmun_ech.ech0020.layer2 import DeliveryFactory
+from openmun_ech.core.indent import indent
+from openmun_ech.ech0020.v3 import ECH0020Delivery
+from openmun_ech.ech0058 import ActionType
+from openmun_ech.utils._xml_stream import create_temp_file
+from openmun_ech.utils.schema_cache import validate_xml_cached
+
+
+@dataclass(frozen=True)
+class ExportTimings:
+    """Per-stage latency of one export, in seconds.
+
+    wait_s covers both the concurrency limit and executor queueing.
+    """
+
+    wait_s: float
+    convert_s: float
+    validate_s: float
+    serialize_s: float
+    write_s: float
+
+    @property
+    def total_s(self) -> float:
+        return self.wait_s + self.convert_s + self.validate_s + self.serialize_s + self.write_s
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """Outcome of one export: the Layer 1 delivery, its XML bytes and timings."""
+
+    delivery: ECH0020Delivery
+    data: bytes
+    path: Optional[Path]
+    timings: ExportTimings
+
+
+def _export_sync(
+    factory: DeliveryFactory,
+    event: BaseDeliveryEvent,
+    validate: bool,
+    schema_name: str,
+    message_id: Optional[str],
+    message_date: Optional[datetime],
+    action: ActionType,
+    pretty_print: bool,
+    submitted: float,
+) -> Tuple[ECH0020Delivery, bytes, Tuple[float, float, float, float]]:
+    """Convert, validate and serialize one event (runs in the executor)."""
+    started = time.perf_counter()
+
+    delivery = factory.build(event, message_id=message_id, message_date=message_date, action=action)
+    root = delivery.to_xml()
+    converted = time.perf_counter()
+
+    if validate:
+        validate_xml_cached(root, schema_name=schema_name, raise_on_error=True)
+    validated = time.perf_counter()
+
+    if pretty_print:
+        indent(root, space='  ')
+    data = ET.tostring(root, encoding='utf-8', xml_declaration=True)
+    serialized = time.perf_counter()
+
+    return delivery, data, (
+        started - submitted,
+        converted - started,
+        validated - converted,
+        serialized - validated,
+    )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a uniquely named temporary file in the same directory, then rename."""
+    f, tmp_path = create_temp_file(path)
+    try:
+        with f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class AsyncExporter:
+    """Bounded asyncio exporter for single-event eCH-0020 deliveries.
+
+    Args:
+        config: Deployment configuration (see DeliveryConfig)
+        max_concurrency: Maximum number of exports in flight
+        executor: Executor for CPU-bound stages and file writes
+            (default: private ThreadPoolExecutor with max_concurrency workers)
+        schema_name: XSD used when validate=True
+        pretty_print: Indent output like ECH0020Delivery.to_file()
+        **optional_header_fields: Static optional eCH-0058 header fields
+    """
+
+    def __init__(
+        self,
+        config: DeliveryConfig,
+        max_concurrency: int = 4,
+        executor: Optional[Executor] = None,
+        schema_name: str = 'eCH-0020-3-0.xsd',
+        pretty_print: bool = True,
+        **optional_header_fields,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self.factory = DeliveryFactory(config, **optional_header_fields)
+        self.max_concurrency = max_concurrency
+        self.schema_name = schema_name
+        self.pretty_print = pretty_print
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='openmun-export'
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def export(
+        self,
+        event: BaseDeliveryEvent,
+        *,
+        validate: bool = True,
+        path: Union[str, Path, None] = None,
+        message_id: Optional[str] = None,
+        message_date: Optional[datetime] = None,
+        action: ActionType = ActionType.NEW,
+    ) -> ExportResult:
+        """Export one event as a complete delivery without blocking the event loop.
+
+        Args:
+            event: Layer 2 event
+            validate: Validate against the XSD before returning/writing
+            path: Write the XML document here (atomic); None = bytes only
+            message_id: Unique message ID (auto-generated UUID if None)
+            message_date: Timezone-aware message date (now, UTC if None)
+            action: eCH-0058 action
+
+        Returns:
+            ExportResult with delivery, XML bytes, path and per-stage timings
+
+        Raises:
+            ValidationError: If event or header values are invalid
+            xmlschema.XMLSchemaException: If XSD validation fails (nothing is written)
+        """
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+
+        async with self._semaphore:
+            delivery, data, (wait_s, convert_s, validate_s, serialize_s) = await loop.run_in_executor(
+                self._executor, _export_sync,
+                self.factory, event, validate, self.schema_name,
+                message_id, message_date, action, self.pretty_print, submitted,
+            )
+
+            write_s = 0.0
+            out_path = None
+            if path is not None:
+                out_path = Path(path)
+                write_started = time.perf_counter()
+                await loop.run_in_executor(self._executor, _write_atomic, out_path, data)
+                write_s = time.perf_counter() - write_started
+
+        return ExportResult(
+            delivery=delivery,
+            data=data,
+            path=out_path,
+            timings=ExportTimings(
+                wait_s=wait_s,
+                convert_s=convert_s,
+                validate_s=validate_s,
+                serialize_s=serialize_s,
+                write_s=write_s,
+            ),
+        )
+
+    def close(self) -> None:
+        """Shut down the private executor (no-op for a caller-supplied executor)."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncExporter':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+async def export_delivery(
+    event: BaseDeliveryEvent,
+    config: DeliveryConfig,
+    *,
+    validate: bool = True,
+    path: Union[str, Path, None] = None,
+    message_id: Optional[str] = None,
+    message_date: Optional[datetime] = None,
+    action: ActionType = ActionType.NEW,
+    exporter: Optional[AsyncExporter] = None,
+) -> ExportResult:
+    """Export one event asynchronously (see AsyncExporter.export()).
+
+    Pass a shared `exporter` in long-running services so the concurrency limit
+    applies across calls; otherwise a private single-slot exporter is used.
+
+    Raises:
+        ValueError: If `exporter` was created for a different config
+    """
+    kwargs = dict(validate=validate, path=path, message_id=message_id,
+                  message_date=message_date, action=action)
+    if exporter is not None:
+        if exporter.factory.config != config:
+            raise ValueError("exporter was created for a different DeliveryConfig")
+        return await exporter.export(event, **kwargs)
+    async with AsyncExporter(config, max_concurrency=1) as private_exporter:
+        return await private_exporter.export(event, **kwargs)
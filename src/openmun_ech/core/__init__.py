@@ -3,11 +3,15 @@
 Public API:
     NS — Namespace constants for all eCH standards and versions.
     ECHModel — Base class for declarative XML models.
+    FrozenECHModel — ECHModel for immutable, shareable value objects.
     xml_field — Field descriptor with XML serialization metadata.
+    profile_xml — Per-class to_xml()/from_xml() profiling (opt-in).
+    strict_xml — Reject unexpected or out-of-order elements in from_xml() (opt-in).
 """
 
 from openmun_ech.core.fields import XmlMeta, xml_field
-from openmun_ech.core.model import ECHModel
+from openmun_ech.core.model import ECHModel, FrozenECHModel, strict_xml
 from openmun_ech.core.namespace import NS
+from openmun_ech.core.profiling import profile_xml
 
-__all__ = ['NS', 'ECHModel', 'XmlMeta', 'xml_field']
+__all__ = ['NS', 'ECHModel', 'FrozenECHModel', 'XmlMeta', 'profile_xml', 'strict_xml', 'xml_field']
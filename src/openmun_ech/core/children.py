@@ -0,0 +1,71 @@
+"""Child element index for hand-written from_xml() parsers.
+
+`elem.find('eCH-0011:foo', ns)` runs ElementPath on every call: the prefix
+is translated and the namespace dict is sorted into a cache key, then the
+children are scanned until the tag matches. A parser resolving a dozen
+fields scans the same children a dozen times, often twice per field
+(`find(...) is not None`, then `find(...)` again).
+
+ChildIndex scans the children once and groups them by Clark-notation tag;
+every lookup after that is a dict access. Semantics are those of find()/
+findall() with a single-step path: direct children only, document order.
+
+Usage:
+    children = ChildIndex(elem)
+    name_elem = children.require(namespace, 'nameData')      # ValueError if missing
+    death_elem = children.find(namespace, 'deathData')       # None if missing
+    origins = children.findall(namespace, 'placeOfOrigin')   # [] if none
+    language = children.text(namespace, 'languageOfCorrespondance')
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+_EMPTY: List[ET.Element] = []
+
+
+class ChildIndex:
+    """Children of one element, grouped by tag in document order."""
+
+    __slots__ = ('_by_tag',)
+
+    def __init__(self, elem: ET.Element):
+        by_tag: Dict[str, List[ET.Element]] = {}
+        for child in elem:
+            same = by_tag.get(child.tag)
+            if same is None:
+                by_tag[child.tag] = [child]
+            else:
+                same.append(child)
+        self._by_tag = by_tag
+
+    def find(self, namespace: str, name: str) -> Optional[ET.Element]:
+        """First child {namespace}name, or None (as elem.find())."""
+        same = self._by_tag.get(f'{{{namespace}}}{name}')
+        return same[0] if same else None
+
+    def findall(self, namespace: str, name: str) -> List[ET.Element]:
+        """All children {namespace}name in document order (as elem.findall())."""
+        # Copy: callers may modify the list
+        return list(self._by_tag.get(f'{{{namespace}}}{name}', _EMPTY))
+
+    def require(self, namespace: str, name: str) -> ET.Element:
+        """First child {namespace}name.
+
+        Raises:
+            ValueError: If there is no such child ("Missing required field: name")
+        """
+        same = self._by_tag.get(f'{{{namespace}}}{name}')
+        if not same:
+            raise ValueError(f"Missing required field: {name}")
+        return same[0]
+
+    def text(self, namespace: str, name: str) -> Optional[str]:
+        """Stripped text of the first child {namespace}name; None if missing or without text."""
+        same = self._by_tag.get(f'{{{namespace}}}{name}')
+        if not same or not same[0].text:
+            return None
+        return same[0].text.strip()
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._by_tag
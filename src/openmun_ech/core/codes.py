@@ -0,0 +1,82 @@
+"""Code value tables and text interning for bulk parsing.
+
+A register file repeats a handful of code values (sex, marital status,
+religion, canton, building category, ...) hundreds of thousands of times,
+and the same few thousand municipality, country and town names. This
+module keeps that repetition cheap:
+
+- decode_enum(): raw element text → enum member through a dict built once
+  per enum class (instead of EnumMeta.__call__ per value); surrounding
+  whitespace is tolerated, unknown codes raise the same ValueError as
+  Enum(value)
+- enum_text(): member → XML text, precomputed per enum class
+- intern_text(): shared instance of a repeated free-text value, so parsed
+  models reference one string instead of one copy per person. Used for
+  xml_field(..., intern=True) and by hand-written parsers; the pool is
+  bounded and cleared when full, like the XML fragment memo
+
+Usage:
+    from openmun_ech.core.codes import decode_enum, intern_text
+
+    sex = decode_enum(Sex, sex_elem.text)
+    municipality_name = intern_text(name_elem.text.strip())
+"""
+
+from enum import Enum
+from typing import Dict, Optional, Type, TypeVar
+
+E = TypeVar('E', bound=Enum)
+
+# Enum class → {code value: member}
+_DECODE: Dict[type, Dict[str, Enum]] = {}
+
+# Enum class → {member: XML text}
+_TEXT: Dict[type, Dict[Enum, str]] = {}
+
+_TEXT_POOL: Dict[str, str] = {}
+_TEXT_POOL_MAX = 16384
+
+
+def decode_enum(enum_cls: Type[E], text: Optional[str]) -> E:
+    """Enum member for a code value, ignoring surrounding whitespace.
+
+    Raises:
+        ValueError: If text is not a value of enum_cls (as enum_cls(text))
+    """
+    table = _DECODE.get(enum_cls)
+    if table is None:
+        table = _DECODE[enum_cls] = {
+            member.value: member for member in enum_cls if isinstance(member.value, str)
+        }
+    member = table.get(text)
+    if member is None:
+        # None (no element text) falls through to the enum's ValueError
+        stripped = text.strip() if text is not None else text
+        member = table.get(stripped)
+        if member is None:
+            # Not a code: let the enum decide (_missing_ hooks, error message)
+            return enum_cls(stripped)
+    return member
+
+
+def enum_text(member: Enum) -> str:
+    """XML text of an enum member (str(member.value), computed once per class)."""
+    table = _TEXT.get(type(member))
+    if table is None:
+        table = _TEXT[type(member)] = {m: str(m.value) for m in type(member)}
+    return table[member]
+
+
+def intern_text(text: str) -> str:
+    """Shared instance of text (bounded pool, see module docstring)."""
+    shared = _TEXT_POOL.get(text)
+    if shared is None:
+        if len(_TEXT_POOL) >= _TEXT_POOL_MAX:
+            _TEXT_POOL.clear()
+        shared = _TEXT_POOL[text] = text
+    return shared
+
+
+def clear_text_pool() -> None:
+    """Drop all interned text values (see intern_text)."""
+    _TEXT_POOL.clear()
@@ -47,6 +47,9 @@ class XmlMeta:
     is_list: bool = False
     """Serialize as repeated elements (one per list item)."""
 
+    intern: bool = False
+    """Share parsed text between instances (repeated names, see core.codes.intern_text)."""
+
 
 def _snake_to_camel(name: str) -> str:
     """Convert snake_case to camelCase.
@@ -67,6 +70,7 @@ def xml_field(
     child_ns: str | None = None,
     wrapper: bool = False,
     is_list: bool = False,
+    intern: bool = False,
     # Pydantic Field pass-through
     default: Any = PydanticUndefined,
     default_factory: Callable | None = None,
@@ -84,6 +88,8 @@ def xml_field(
         child_ns: Namespace for child model content (only with wrapper=True).
         wrapper: Enable wrapper pattern for cross-namespace composition.
         is_list: Field is List[T], serialize each item separately.
+        intern: Parsed text of this str field is interned (frequently repeated
+                values such as municipality or country names).
         default: Default value (pass-through to Pydantic Field).
         default_factory: Default factory (pass-through to Pydantic Field).
         min_length: String min length constraint.
@@ -102,6 +108,7 @@ def xml_field(
         child_ns=child_ns,
         wrapper=wrapper,
         is_list=is_list,
+        intern=intern,
     )
 
     # Build Pydantic Field kwargs
@@ -150,6 +157,7 @@ def get_xml_meta(field_info: FieldInfo, field_name: str) -> XmlMeta | None:
             child_ns=meta.child_ns,
             wrapper=meta.wrapper,
             is_list=meta.is_list,
+            intern=meta.intern,
         )
 
     return meta
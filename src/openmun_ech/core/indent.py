@@ -0,0 +1,40 @@
+"""Indentation of output trees that share elements with models.
+
+Models holding raw XML (eCH-0058 attachment/extension payloads, see
+ech0058.AnyXMLContent) append their stored element to output trees by
+reference, so to_xml() costs the same for a large payload as for a small
+one. ET.indent() rewrites whitespace in place: indenting such a tree
+directly would change the stored payload.
+
+- register_shared_wrapper(tag): the children of elements with this tag may
+  be shared with a model
+- indent(tree, space, level): ET.indent() for output trees; the children of
+  registered wrappers are replaced by copies first, so payloads are copied
+  only for output that is actually indented
+
+Usage:
+    root = delivery.to_xml()
+    indent(root, space='  ')
+    ET.ElementTree(root).write(path, encoding='utf-8', xml_declaration=True)
+"""
+
+import copy
+import xml.etree.ElementTree as ET
+from typing import List, Union
+
+# Tags of elements whose children may be shared with a model
+_SHARED_WRAPPERS: List[str] = []
+
+
+def register_shared_wrapper(tag: str) -> None:
+    """Register the Clark tag of elements whose children to_xml() shares."""
+    if tag not in _SHARED_WRAPPERS:
+        _SHARED_WRAPPERS.append(tag)
+
+
+def indent(tree: Union[ET.Element, ET.ElementTree], space: str = '  ', level: int = 0) -> None:
+    """ET.indent() that leaves elements shared with models unchanged."""
+    for tag in _SHARED_WRAPPERS:
+        for wrapper in tree.iter(tag):
+            wrapper[:] = [copy.deepcopy(child) for child in wrapper]
+    ET.indent(tree, space=space, level=level)
@@ -13,18 +13,99 @@ Usage:
 
         country_id: Optional[str] = xml_field('countryId', default=None)
         country_name_short: str = xml_field('countryNameShort')
+
+FrozenECHModel is the base of immutable value objects (model_config
+frozen=True): equal instances may be shared between documents.
+
+to_xml_bytes()/write_xml() serialize to UTF-8 without building elements
+(see core.xml_bytes); the output is canonically equal to to_xml().
+
+The generic from_xml() reads the children of an element in one pass against
+a per-class tag → field map (see _parse_plan), so parsing is linear in the
+number of children however many optional fields a type declares. Unknown
+and out-of-order elements are skipped; inside strict_xml() they are errors.
+
+content_hash() is a digest of the field values (see _content_digest): equal
+content gives equal digests whatever the namespace prefixes or whitespace of
+the XML. A parent combines the digests of its child models, which frozen
+models compute once.
 """
 
+import hashlib
+import os
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, ClassVar, Optional, Self, get_args, get_origin
+from typing import (
+    Any, BinaryIO, ClassVar, Dict, Iterator, List, Mapping, Optional, Self, Tuple, Union,
+    get_args, get_origin,
+)
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
+from openmun_ech.core import profiling, xml_bytes
+from openmun_ech.core.codes import decode_enum, enum_text, intern_text
 from openmun_ech.core.fields import XmlMeta, get_xml_meta
 
 
+# ============================================================================
+# PARSE PLANS (generic from_xml)
+# ============================================================================
+
+# (field name, XmlMeta, resolved field type, required)
+_FieldPlan = Tuple[str, XmlMeta, type, bool]
+
+# (model class, namespace) → (fields in declaration order, Clark tag → field index)
+_PARSE_PLANS: Dict[tuple, Tuple[Tuple[_FieldPlan, ...], Dict[str, int]]] = {}
+
+_STRICT: ContextVar[bool] = ContextVar('openmun_ech_strict_xml', default=False)
+
+
+def _parse_plan(cls: type, ns: str) -> Tuple[Tuple[_FieldPlan, ...], Dict[str, int]]:
+    """Field table of cls for content namespace ns, built on first use."""
+    key = (cls, ns)
+    plan = _PARSE_PLANS.get(key)
+    if plan is None:
+        fields: List[_FieldPlan] = []
+        tags: Dict[str, int] = {}
+        for field_name, field_info in cls.model_fields.items():
+            meta = get_xml_meta(field_info, field_name)
+            if meta is None:
+                continue
+            tag = f'{{{meta.ns or ns}}}{meta.xml_name}'
+            if tag in tags:
+                raise TypeError(f"{cls.__name__} declares element {meta.xml_name} twice")
+            tags[tag] = len(fields)
+            fields.append((
+                field_name, meta, _resolve_field_type(cls, field_name), field_info.is_required(),
+            ))
+        plan = _PARSE_PLANS[key] = (tuple(fields), tags)
+    return plan
+
+
+@contextmanager
+def strict_xml() -> Iterator[None]:
+    """Reject unexpected, repeated and out-of-order elements in generic from_xml().
+
+    By default the generic parser skips elements it has no field for and
+    accepts fields in any order. Within this context (per thread / task)
+    every generic from_xml() call raises ValueError instead, also for models
+    nested in classes with a hand-written from_xml(). The expected order is
+    the field declaration order, which follows the XSD sequence.
+
+    Usage:
+        with strict_xml():
+            building = ECH0129Building.from_xml(elem)
+    """
+    token = _STRICT.set(True)
+    try:
+        yield
+    finally:
+        _STRICT.reset(token)
+
+
 class ECHModel(BaseModel):
     """Base class for eCH XML models with declarative serialization.
 
@@ -37,9 +118,19 @@ class ECHModel(BaseModel):
 
     __xml_ns__: ClassVar[str]
     __xml_element__: ClassVar[str]
+    # False for classes with a hand-written to_xml() (set per subclass)
+    __xml_generic__: ClassVar[bool] = True
 
     model_config = ConfigDict(populate_by_name=True)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__xml_generic__ = cls.to_xml is ECHModel.to_xml
+        # Classes defined while profile_xml() is active are instrumented too
+        if profiling._active is not None:
+            profiling._on_class_created()
+
     def to_xml(
         self,
         parent: Optional[ET.Element] = None,
@@ -102,37 +193,250 @@ class ECHModel(BaseModel):
             Instance of this model.
 
         Raises:
-            ValueError: If a required field is missing.
+            ValueError: If a required field is missing, or (inside strict_xml())
+                        an element is unexpected, repeated or out of order.
         """
         ns = namespace or cls.__xml_ns__
+        fields, tags = _parse_plan(cls, ns)
+
+        # One pass over the children: bucket them by field
+        found = _collect(cls, elem, fields, tags)
+
         kwargs: dict[str, Any] = {}
+        for (field_name, meta, field_type, is_required), same in zip(fields, found):
+            if same is None:
+                if is_required:
+                    raise ValueError(f"Missing required field: {meta.xml_name}")
+            elif meta.is_list:
+                kwargs[field_name] = [
+                    _deserialize_value(child_elem, meta, field_type, ns)
+                    for child_elem in same
+                ]
+            else:
+                # As elem.find(): the first occurrence wins
+                kwargs[field_name] = _deserialize_value(same[0], meta, field_type, ns)
+
+        return cls(**kwargs)
+
+    def content_hash(self) -> bytes:
+        """Digest (16 bytes) of this model's type and field values.
+
+        Fields are hashed in declaration order under their XML element name
+        (field name for fields without xml_field()); None and empty lists are
+        both absent, as in the XML. Child models contribute their own
+        content_hash(), so equal subtrees can be compared without walking them.
+        Frozen models (FrozenECHModel) compute the digest once.
+        """
+        if not isinstance(self, FrozenECHModel):
+            return _content_digest(self)
+        memo = self._content_hash
+        # model_copy() copies the memo, but gives the copy new field values
+        if memo is None or memo.fields is not self.__dict__:
+            memo = self._content_hash = _DigestMemo(self.__dict__, _content_digest(self))
+        return memo.digest
+
+    def to_xml_bytes(
+        self,
+        namespace: str | None = None,
+        element_name: str | None = None,
+        wrapper_namespace: str | None = None,
+        *,
+        indent: str | None = None,
+        level: int = 0,
+        declared: Mapping[str, str] | None = None,
+    ) -> bytes:
+        """Serialize this model to UTF-8 XML bytes (fast backend).
+
+        Canonically equal to ET.tostring(self.to_xml(...)); see write_xml().
+        """
+        buf = bytearray()
+        self.write_xml(
+            buf, namespace, element_name, wrapper_namespace,
+            indent=indent, level=level, declared=declared,
+        )
+        return bytes(buf)
+
+    def write_xml(
+        self,
+        out: Union[bytearray, BinaryIO],
+        namespace: str | None = None,
+        element_name: str | None = None,
+        wrapper_namespace: str | None = None,
+        *,
+        indent: str | None = None,
+        level: int = 0,
+        declared: Mapping[str, str] | None = None,
+    ) -> None:
+        """Write this model as UTF-8 XML without building an element tree.
+
+        Args:
+            out: bytearray to append to, or writable binary file object.
+            namespace, element_name, wrapper_namespace: As for to_xml().
+            indent: Indentation unit (as ET.indent(space=...)); None: no whitespace.
+            level: Nesting level of this element (as ET.indent(level=...)).
+            declared: Namespace URI → prefix already declared by the enclosing
+                      document; those declarations are not repeated.
+        """
+        xml_bytes.write_model(
+            self, out, namespace, element_name, wrapper_namespace,
+            indent=indent, level=level, declared=declared,
+        )
+
+
+class FrozenECHModel(ECHModel):
+    """ECHModel for immutable value objects (places, countries, partial dates).
+
+    Assigning a field raises ValidationError, so equal instances can be
+    shared between persons and documents (see ech0020.layer2.helpers).
+    content_hash() is computed once per instance.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    _content_hash: Optional['_DigestMemo'] = PrivateAttr(default=None)
+
+
+# OPENMUN_ECH_PROFILE=1 (table on stderr) or =<path> (pstats file at exit)
+if os.environ.get('OPENMUN_ECH_PROFILE'):
+    profiling._start_from_environment()
+
+
+def _collect(
+    cls: type,
+    elem: ET.Element,
+    fields: Tuple[_FieldPlan, ...],
+    tags: Dict[str, int],
+) -> List[Optional[List[ET.Element]]]:
+    """Children of elem per field of the parse plan (None: absent), in one pass."""
+    found: List[Optional[List[ET.Element]]] = [None] * len(fields)
+    if _STRICT.get():
+        _collect_strict(cls, elem, fields, tags, found)
+        return found
+    for child in elem:
+        index = tags.get(child.tag)
+        if index is not None:
+            same = found[index]
+            if same is None:
+                found[index] = [child]
+            else:
+                same.append(child)
+    return found
+
+
+def _collect_strict(
+    cls: type,
+    elem: ET.Element,
+    fields: Tuple[_FieldPlan, ...],
+    tags: Dict[str, int],
+    found: List[Optional[List[ET.Element]]],
+) -> None:
+    """Bucket the children of elem like _collect(), rejecting anything unexpected."""
+    last = -1
+    for child in elem:
+        if not isinstance(child.tag, str):
+            continue  # comment or processing instruction
+        index = tags.get(child.tag)
+        if index is None:
+            raise ValueError(f"Unexpected element {child.tag} in {cls.__name__}")
+        if index < last:
+            raise ValueError(
+                f"Element {fields[index][1].xml_name} out of order in {cls.__name__} "
+                f"(after {fields[last][1].xml_name})"
+            )
+        same = found[index]
+        if same is None:
+            found[index] = [child]
+        elif fields[index][1].is_list:
+            same.append(child)
+        else:
+            raise ValueError(f"Repeated element {fields[index][1].xml_name} in {cls.__name__}")
+        last = index
+
+
+# ============================================================================
+# CONTENT HASH
+# ============================================================================
+
+class _DigestMemo:
+    """content_hash() of a frozen model, for the field values it was computed from.
+
+    Equal to every other memo and to None: pydantic compares private
+    attributes in ==, and whether a digest was computed must not matter.
+    """
+
+    __slots__ = ('fields', 'digest')
+
+    def __init__(self, fields: Dict[str, Any], digest: bytes):
+        self.fields = fields
+        self.digest = digest
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _DigestMemo)
+
 
+# Model class → (type token, (field name, label token) in declaration order)
+_HASH_PLANS: Dict[type, Tuple[str, Tuple[Tuple[str, str], ...]]] = {}
+
+
+def _hash_plan(cls: type) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Tokens content_hash() uses for cls and its fields, built on first use."""
+    plan = _HASH_PLANS.get(cls)
+    if plan is None:
+        fields = []
         for field_name, field_info in cls.model_fields.items():
             meta = get_xml_meta(field_info, field_name)
-            if meta is None:
-                continue
+            fields.append((field_name, _token(meta.xml_name if meta is not None else field_name)))
+        plan = _HASH_PLANS[cls] = (_token(f'{cls.__module__}.{cls.__qualname__}'), tuple(fields))
+    return plan
 
-            field_ns = meta.ns or ns
-            field_type = _resolve_field_type(cls, field_name)
-            is_required = field_info.is_required()
 
-            if meta.is_list:
-                found = elem.findall(f'{{{field_ns}}}{meta.xml_name}')
-                if found:
-                    kwargs[field_name] = [
-                        _deserialize_value(child_elem, meta, field_type, ns)
-                        for child_elem in found
-                    ]
-                elif is_required:
-                    raise ValueError(f"Missing required field: {meta.xml_name}")
-            else:
-                found = elem.find(f'{{{field_ns}}}{meta.xml_name}')
-                if found is not None:
-                    kwargs[field_name] = _deserialize_value(found, meta, field_type, ns)
-                elif is_required:
-                    raise ValueError(f"Missing required field: {meta.xml_name}")
+def _token(text: str) -> str:
+    """Length-prefixed text (netstring), so concatenated tokens stay unambiguous."""
+    return f'{len(text)}:{text}'
 
-        return cls(**kwargs)
+
+def _content_digest(model: BaseModel) -> bytes:
+    """Digest of a model: type token, then label and value token per present value.
+
+    Models that are not ECHModels (e.g. list entries of hand-written parsers)
+    are hashed the same way, without memo.
+    """
+    type_token, fields = _hash_plan(type(model))
+    parts = [type_token]
+    for field_name, label in fields:
+        value = getattr(model, field_name)
+        if value is None:
+            continue
+        if isinstance(value, list):
+            for item in value:
+                if item is not None:
+                    parts.append(label)
+                    parts.append(_value_token(item))
+        else:
+            parts.append(label)
+            parts.append(_value_token(value))
+    return hashlib.blake2b(''.join(parts).encode('utf-8'), digest_size=16).digest()
+
+
+def _value_token(value: Any) -> str:
+    """Token of one field value: child digest for models, else its XML text."""
+    if type(value) is str:
+        return 'T' + _token(value)
+    if isinstance(value, ECHModel):
+        return 'M' + value.content_hash().hex()
+    if isinstance(value, BaseModel):
+        return 'M' + _content_digest(value).hex()
+    if isinstance(value, (datetime, date)):
+        return 'T' + _token(value.isoformat())
+    if isinstance(value, Enum):
+        return 'T' + _token(enum_text(value))
+    if isinstance(value, bool):
+        return 'T' + _token('true' if value else 'false')
+    if isinstance(value, (str, int, float)):
+        return 'T' + _token(str(value))
+    if isinstance(value, (list, tuple)):
+        return f'L{len(value)}:' + ''.join(_value_token(item) for item in value)
+    raise TypeError(f"Cannot hash value of type {type(value).__name__}")
 
 
 def _serialize_value(parent_elem: ET.Element, parent_ns: str, meta: XmlMeta, value: Any) -> None:
@@ -166,7 +470,7 @@ def _serialize_value(parent_elem: ET.Element, parent_ns: str, meta: XmlMeta, val
         # Enum before str/int — (str, Enum) passes isinstance(v, str) but
         # str() gives "EnumClass.MEMBER" in Python 3.11+, not the value.
         sub = ET.SubElement(parent_elem, f'{{{field_ns}}}{meta.xml_name}')
-        sub.text = str(value.value)
+        sub.text = enum_text(value)
 
     elif isinstance(value, bool):
         sub = ET.SubElement(parent_elem, f'{{{field_ns}}}{meta.xml_name}')
@@ -210,7 +514,7 @@ def _deserialize_value(elem: ET.Element, meta: XmlMeta, field_type: type, parent
         text = elem.text
         if not text:
             raise ValueError(f"Empty text for enum field: {meta.xml_name}")
-        return field_type(text.strip())
+        return decode_enum(field_type, text)
 
     elif field_type is bool:
         text = elem.text
@@ -225,7 +529,9 @@ def _deserialize_value(elem: ET.Element, meta: XmlMeta, field_type: type, parent
         return int(text.strip())
 
     elif field_type is str:
-        return elem.text.strip() if elem.text else None
+        if not elem.text:
+            return None
+        return intern_text(elem.text.strip()) if meta.intern else elem.text.strip()
 
     else:
         raise TypeError(
@@ -94,20 +94,29 @@ class NS:
     }
 
 
+# Versioned variants not in PREFIXES (output prefixes only, not for find() calls)
+_VERSIONED_PREFIXES: dict[str, str] = {
+    'eCH-0006-v3': NS.ECH0006_V3,
+    'eCH-0007-v5': NS.ECH0007_V5,
+    'eCH-0010-v6': NS.ECH0010_V6,
+    'eCH-0010-v8': NS.ECH0010_V8,
+    'eCH-0011-v9': NS.ECH0011_V9,
+    'eCH-0021-v7': NS.ECH0021_V7,
+    'eCH-0058-v4': NS.ECH0058_V4,
+}
+
+# Namespace URI → prefix in serialized output (ElementTree and to_xml_bytes())
+URI_PREFIXES: dict[str, str] = {
+    uri: prefix for prefix, uri in {**NS.PREFIXES, **_VERSIONED_PREFIXES}.items()
+}
+
+
 # Register human-readable prefixes for ElementTree output.
 # This makes ET.tostring() produce eCH-0020:delivery instead of ns0:delivery.
 # Only affects stdlib xml.etree — lxml uses nsmap= per element.
 def _register_prefixes() -> None:
-    for prefix, uri in NS.PREFIXES.items():
+    for uri, prefix in URI_PREFIXES.items():
         ET.register_namespace(prefix, uri)
-    # Also register versioned variants not in PREFIXES
-    ET.register_namespace('eCH-0006-v3', NS.ECH0006_V3)
-    ET.register_namespace('eCH-0007-v5', NS.ECH0007_V5)
-    ET.register_namespace('eCH-0010-v6', NS.ECH0010_V6)
-    ET.register_namespace('eCH-0010-v8', NS.ECH0010_V8)
-    ET.register_namespace('eCH-0011-v9', NS.ECH0011_V9)
-    ET.register_namespace('eCH-0021-v7', NS.ECH0021_V7)
-    ET.register_namespace('eCH-0058-v4', NS.ECH0058_V4)
 
 
 _register_prefixes()
@@ -0,0 +1,328 @@
+"""Opt-in profiling of to_xml()/from_xml() per model class.
+
+A slow export does not show which eCH types dominate: cProfile attributes
+the generic ECHModel.to_xml() to a single function, whatever the class.
+This module records, per model class and method:
+
+- calls: number of (non-delegating) calls
+- total_time: inclusive time (outermost call of a recursive chain only)
+- own_time: time excluding nested instrumented calls
+- elements: XML elements produced (to_xml) or read (from_xml), excluding
+  those of nested instrumented calls
+
+Hand-written overrides (eCH-0011, eCH-0021, deliveries, headers) are
+measured like the generic serializer; a super() call or a shared
+from_xml() on the same element counts once, for the subclass.
+
+Disabled, it costs nothing: the wrappers are installed on enter and the
+original methods restored on exit. Classes created while profiling
+(e.g. eCH-0021 factory classes, lazily imported modules) are instrumented
+when they are defined.
+
+Usage:
+    from openmun_ech.core.profiling import profile_xml
+
+    with profile_xml() as profile:
+        delivery.to_xml()
+    print(profile.table(sort='own_time', limit=20))
+    profile.dump_stats('export.prof')  # pstats format (snakeviz, gprof2dot)
+
+Environment switch (whole process, report at exit):
+    OPENMUN_ECH_PROFILE=1 python export.py           # table on stderr
+    OPENMUN_ECH_PROFILE=export.prof python export.py  # pstats file
+"""
+
+import atexit
+import functools
+import inspect
+import marshal
+import os
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+METHODS = ('to_xml', 'from_xml')
+
+SORT_KEYS = ('own_time', 'total_time', 'calls', 'elements', 'name')
+
+_Key = Tuple[type, str]
+
+
+@dataclass
+class XmlCallStats:
+    """Accumulated cost of one model class method."""
+
+    name: str
+    method: str
+    calls: int = 0
+    primitive_calls: int = 0
+    total_time: float = 0.0
+    own_time: float = 0.0
+    elements: int = 0
+
+
+class _Frame:
+    __slots__ = ('key', 'obj', 'child_time', 'child_elements')
+
+    def __init__(self, key: _Key, obj: Any):
+        self.key = key
+        self.obj = obj
+        self.child_time = 0.0
+        self.child_elements = 0
+
+
+def _class_name(cls: type) -> str:
+    return f"{cls.__module__.removeprefix('openmun_ech.')}.{cls.__qualname__}"
+
+
+def _count_elements(elem: Any) -> int:
+    if not isinstance(elem, ET.Element):
+        return 0
+    return sum(1 for _ in elem.iter())
+
+
+class XmlProfile:
+    """Per-class to_xml()/from_xml() statistics of one profiling session."""
+
+    def __init__(self):
+        self._stats: Dict[_Key, XmlCallStats] = {}
+        # callee → caller → [calls, primitive calls, own time, total time]
+        self._callers: Dict[_Key, Dict[_Key, List[float]]] = {}
+        self._functions: Dict[_Key, Callable] = {}
+        self._local = threading.local()
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _call(self, owner: type, method: str, obj: Any, func: Callable,
+              first: Any, args: tuple, kwargs: dict) -> Any:
+        stack = self._stack()
+        key = (owner, method)
+        if stack and stack[-1].key == key and stack[-1].obj is obj:
+            # super().to_xml() / delegation on the same object: one call
+            return func(first, *args, **kwargs)
+
+        recursive = any(frame.key == key for frame in stack)
+        self._functions.setdefault(key, func)
+        frame = _Frame(key, obj)
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            result = func(first, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+
+        subtree = _count_elements(result if method == 'to_xml' else obj)
+        own_time = elapsed - frame.child_time
+
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = XmlCallStats(_class_name(owner), method)
+        stats.calls += 1
+        stats.own_time += own_time
+        stats.elements += max(0, subtree - frame.child_elements)
+        if not recursive:
+            stats.primitive_calls += 1
+            stats.total_time += elapsed
+
+        if stack:
+            parent = stack[-1]
+            parent.child_time += elapsed
+            parent.child_elements += subtree
+            edge = self._callers.setdefault(key, {}).setdefault(parent.key, [0, 0, 0.0, 0.0])
+            edge[0] += 1
+            edge[2] += own_time
+            if not recursive:
+                edge[1] += 1
+                edge[3] += elapsed
+        return result
+
+    def stats(self, sort: str = 'own_time') -> List[XmlCallStats]:
+        """Statistics rows, most expensive first (sort by name: alphabetical).
+
+        Raises:
+            ValueError: If sort is not one of SORT_KEYS
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort!r} (expected one of {', '.join(SORT_KEYS)})")
+        rows = list(self._stats.values())
+        if sort == 'name':
+            return sorted(rows, key=lambda s: (s.name, s.method))
+        return sorted(rows, key=lambda s: getattr(s, sort), reverse=True)
+
+    def table(self, sort: str = 'own_time', limit: Optional[int] = None) -> str:
+        """Statistics as a text table."""
+        rows = self.stats(sort)
+        total_own = sum(s.own_time for s in rows) or 1.0
+        lines = [
+            f"{'class':<48} {'method':<8} {'calls':>9} {'total ms':>10} "
+            f"{'own ms':>10} {'own %':>6} {'µs/call':>8} {'elements':>10}"
+        ]
+        for s in rows[:limit]:
+            lines.append(
+                f"{s.name:<48} {s.method:<8} {s.calls:>9,} {s.total_time * 1000:>10.2f} "
+                f"{s.own_time * 1000:>10.2f} {s.own_time / total_own:>6.1%} "
+                f"{s.own_time / s.calls * 1e6:>8.1f} {s.elements:>10,}"
+            )
+        return '\n'.join(lines)
+
+    def _pstats_key(self, key: _Key) -> Tuple[str, int, str]:
+        cls, method = key
+        code = getattr(self._functions[key], '__code__', None)
+        filename = getattr(sys.modules.get(cls.__module__), '__file__', None) or cls.__module__
+        # Inherited implementations (generic serializer) have no line in the class module
+        lineno = code.co_firstlineno if code is not None and code.co_filename == filename else 0
+        return (filename, lineno, f"{cls.__qualname__}.{method}")
+
+    def dump_stats(self, path: str) -> None:
+        """Write the statistics in pstats format (pstats.Stats(path), snakeviz)."""
+        result = {}
+        for key, s in self._stats.items():
+            callers = {
+                self._pstats_key(caller): (int(edge[1]), int(edge[0]), edge[2], edge[3])
+                for caller, edge in self._callers.get(key, {}).items()
+            }
+            result[self._pstats_key(key)] = (s.primitive_calls, s.calls, s.own_time, s.total_time, callers)
+        with open(path, 'wb') as f:
+            marshal.dump(result, f)
+
+    def reset(self) -> None:
+        """Drop all recorded statistics."""
+        self._stats.clear()
+        self._callers.clear()
+        self._functions.clear()
+
+
+# ============================================================================
+# Instrumentation
+# ============================================================================
+
+_lock = threading.RLock()
+_active: Optional[XmlProfile] = None
+# (class, method name, original class attribute) for restore
+_patched: List[Tuple[type, str, Any]] = []
+_patched_keys: set = set()
+
+
+def _wrap(cls: type, name: str) -> None:
+    raw = cls.__dict__[name]
+    is_classmethod = isinstance(raw, classmethod)
+    func = raw.__func__ if is_classmethod else raw
+    # from_xml(cls, elem, ...) / from_xml(cls, element, ...): the element may be a keyword
+    params = list(inspect.signature(func).parameters)
+    element_param = params[1] if is_classmethod and len(params) > 1 else None
+
+    @functools.wraps(func)
+    def wrapper(first, *args, **kwargs):
+        profile = _active
+        if profile is None:
+            return func(first, *args, **kwargs)
+        if is_classmethod:
+            obj = args[0] if args else kwargs.get(element_param)
+            return profile._call(first, name, obj, func, first, args, kwargs)
+        return profile._call(type(first), name, first, func, first, args, kwargs)
+
+    setattr(cls, name, classmethod(wrapper) if is_classmethod else wrapper)
+    _patched.append((cls, name, raw))
+    _patched_keys.add((cls, name))
+
+
+def _iter_model_classes() -> Iterator[type]:
+    seen = set()
+    pending = [BaseModel]
+    while pending:
+        cls = pending.pop()
+        for sub in cls.__subclasses__():
+            if sub not in seen:
+                seen.add(sub)
+                pending.append(sub)
+                if sub.__module__.startswith('openmun_ech'):
+                    yield sub
+
+
+def _instrument_loaded() -> None:
+    """Wrap to_xml/from_xml defined by any loaded model class (idempotent)."""
+    with _lock:
+        for cls in list(_iter_model_classes()):
+            for name in METHODS:
+                if name in cls.__dict__ and (cls, name) not in _patched_keys:
+                    _wrap(cls, name)
+
+
+def _on_class_created() -> None:
+    """Called by ECHModel.__pydantic_init_subclass__ while profiling."""
+    if _active is not None:
+        _instrument_loaded()
+
+
+def _restore() -> None:
+    with _lock:
+        for cls, name, raw in reversed(_patched):
+            setattr(cls, name, raw)
+        _patched.clear()
+        _patched_keys.clear()
+
+
+def start() -> XmlProfile:
+    """Start profiling (prefer the profile_xml() context manager).
+
+    Raises:
+        RuntimeError: If a profile is already active
+    """
+    global _active
+    with _lock:
+        if _active is not None:
+            raise RuntimeError("XML profiling is already active")
+        _active = XmlProfile()
+        _instrument_loaded()
+        return _active
+
+
+def stop() -> Optional[XmlProfile]:
+    """Stop profiling, restore the original methods, return the profile."""
+    global _active
+    with _lock:
+        profile, _active = _active, None
+        _restore()
+        return profile
+
+
+@contextmanager
+def profile_xml() -> Iterator[XmlProfile]:
+    """Record per-class to_xml()/from_xml() statistics inside the block."""
+    profile = start()
+    try:
+        yield profile
+    finally:
+        stop()
+
+
+def _start_from_environment() -> None:
+    """OPENMUN_ECH_PROFILE=1 (table on stderr) or =<path> (pstats file)."""
+    target = os.environ.get('OPENMUN_ECH_PROFILE', '')
+    if not target or _active is not None:
+        return
+    start()
+
+    def report():
+        profile = stop()
+        if profile is None:
+            return
+        if target.lower() in ('1', 'true', 'yes'):
+            print(profile.table(), file=sys.stderr)
+        else:
+            profile.dump_stats(target)
+
+    atexit.register(report)
+
@@ -0,0 +1,149 @@
+"""Compact read-only records of Layer 1 models.
+
+Analytics over a parsed register only read the models, but every Pydantic
+instance carries an attribute dict, a fields-set and validator state; the
+containers cost more than the values. A record is the read-only
+alternative generated from the same model class:
+
+- A namedtuple subclass per model class (record_type()): no __dict__,
+  immutable, same attribute names as the model fields
+- Nested models are records, lists are tuples
+- parse_record() fills records straight from XML with the model's
+  xml_field() declarations (see ECHModel.from_xml), without validation;
+  classes with a hand-written from_xml() are parsed by it and converted
+- record.to_model() builds (and validates) the full Pydantic model
+
+Record values are the parsed values (str, int, bool, date, enum members);
+model validators that normalize values only run in to_model().
+
+Usage:
+    from openmun_ech.core.records import parse_record
+
+    person = parse_record(ECH0020BaseDeliveryPerson, elem)
+    person.person_identification.official_name
+    model = person.to_model()
+"""
+
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from openmun_ech.core.model import (
+    ECHModel, _collect, _deserialize_value, _is_model_type, _parse_plan,
+)
+
+# Model class → record type
+_RECORD_TYPES: Dict[type, type] = {}
+
+# (model class, namespace) → (record defaults, per parse plan field:
+# (record index, namespace of a nested model or None for simple values))
+_RECORD_PLANS: Dict[tuple, Tuple[tuple, Tuple[Tuple[int, Optional[str]], ...]]] = {}
+
+
+class ModelRecord(tuple):
+    """Base class of the generated record types."""
+
+    __slots__ = ()
+    __model__: ClassVar[type]
+
+    def to_model(self) -> BaseModel:
+        """Full (validated) Pydantic model of this record."""
+        return self.__model__(**{
+            name: _model_value(value) for name, value in zip(self._fields, self)
+        })
+
+
+def record_type(model_cls: type) -> type:
+    """Record type of a model class (created on first use)."""
+    rec_type = _RECORD_TYPES.get(model_cls)
+    if rec_type is None:
+        name = f'{model_cls.__name__}Record'
+        base = namedtuple(name, tuple(model_cls.model_fields), module=model_cls.__module__)
+        rec_type = _RECORD_TYPES[model_cls] = type(
+            name, (base, ModelRecord), {'__slots__': (), '__model__': model_cls},
+        )
+    return rec_type
+
+
+def to_record(model: BaseModel) -> ModelRecord:
+    """Record of a model instance (nested models and lists converted too)."""
+    rec_type = record_type(type(model))
+    return rec_type._make(_record_value(getattr(model, name)) for name in rec_type._fields)
+
+
+def parse_record(model_cls: type, elem: ET.Element, namespace: str | None = None) -> ModelRecord:
+    """Parse elem into a record of model_cls (same rules as model_cls.from_xml()).
+
+    Raises:
+        ValueError: If a required field is missing (see ECHModel.from_xml())
+    """
+    if getattr(model_cls.from_xml, '__func__', None) is not ECHModel.from_xml.__func__:
+        # Hand-written parser: its rules (choices, wrappers) are in the code
+        if namespace is None:
+            return to_record(model_cls.from_xml(elem))
+        return to_record(model_cls.from_xml(elem, namespace=namespace))
+
+    ns = namespace or model_cls.__xml_ns__
+    fields, tags = _parse_plan(model_cls, ns)
+    defaults, targets = _record_plan(model_cls, ns)
+
+    row = list(defaults)
+    found = _collect(model_cls, elem, fields, tags)
+    for field, same, (position, nested_ns) in zip(fields, found, targets):
+        _, meta, field_type, is_required = field
+        if same is None:
+            if is_required:
+                raise ValueError(f"Missing required field: {meta.xml_name}")
+        elif nested_ns is not None:
+            # Nested model (wrapper or plain): a record as well
+            if meta.is_list:
+                row[position] = tuple(parse_record(field_type, child, nested_ns) for child in same)
+            else:
+                row[position] = parse_record(field_type, same[0], nested_ns)
+        elif meta.is_list:
+            row[position] = tuple(_deserialize_value(child, meta, field_type, ns) for child in same)
+        else:
+            row[position] = _deserialize_value(same[0], meta, field_type, ns)
+    return record_type(model_cls)._make(row)
+
+
+def _record_plan(model_cls: type, ns: str) -> Tuple[tuple, Tuple[Tuple[int, Optional[str]], ...]]:
+    key = (model_cls, ns)
+    plan = _RECORD_PLANS.get(key)
+    if plan is None:
+        names = list(model_cls.model_fields)
+        defaults = []
+        for info in model_cls.model_fields.values():
+            default = info.get_default(call_default_factory=True)
+            defaults.append(None if default is PydanticUndefined else _record_value(default))
+        targets = []
+        for field_name, meta, field_type, _ in _parse_plan(model_cls, ns)[0]:
+            # Same namespaces as _deserialize_value() passes to nested from_xml()
+            if meta.wrapper:
+                nested_ns = meta.child_ns
+            elif _is_model_type(field_type):
+                nested_ns = meta.ns or ns
+            else:
+                nested_ns = None
+            targets.append((names.index(field_name), nested_ns))
+        plan = _RECORD_PLANS[key] = (tuple(defaults), tuple(targets))
+    return plan
+
+
+def _record_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_record(value)
+    if isinstance(value, list):
+        return tuple(_record_value(item) for item in value)
+    return value
+
+
+def _model_value(value: Any) -> Any:
+    if isinstance(value, ModelRecord):
+        return value.to_model()
+    if type(value) is tuple:
+        return [_model_value(item) for item in value]
+    return value
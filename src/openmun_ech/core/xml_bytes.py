@@ -0,0 +1,329 @@
+"""Bytes-level XML serializer for ECHModel (to_xml_bytes() / write_xml()).
+
+The ElementTree backend builds one Element per field, then walks the tree
+again to indent and serialize it. For large exports that object work costs
+more than the text itself. This backend writes escaped UTF-8 straight into
+a bytearray:
+
+- Open/close tags are precomputed per (prefix, element name), with the
+  prefixes of core.namespace (URI_PREFIXES, the ones ElementTree uses)
+- xml_field metadata is resolved once per class
+- Namespace declarations go on the fragment's root start tag, sorted by
+  prefix, like ET.tostring(); namespaces already declared by an enclosing
+  document (`declared`) are left out
+
+Output is canonically equal (C14N 2.0) to ET.tostring(model.to_xml(...)),
+and byte-identical for models on the generic serializer. Models with a
+hand-written to_xml() (eCH-0011, eCH-0021, deliveries, ...) are serialized
+through their to_xml() element, so the result never depends on which
+backend a class supports.
+
+Usage:
+    data = building.to_xml_bytes(indent='  ')
+
+    with open('records.xml', 'wb') as f:
+        for record in records:
+            record.write_xml(f, namespace=NS.ECH0133_V3, declared=root_namespaces)
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import date
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Mapping, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from openmun_ech.core.codes import enum_text
+from openmun_ech.core.fields import XmlMeta, get_xml_meta
+from openmun_ech.core.indent import indent as indent_tree
+from openmun_ech.core.namespace import URI_PREFIXES
+
+_XML_NS = 'http://www.w3.org/XML/1998/namespace'
+
+# (prefix, element name) → (b'<prefix:name', b'</prefix:name>')
+_TAGS: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {}
+
+# Model class → ((field name, XmlMeta), ...) in declaration order
+_FIELDS: Dict[type, Tuple[Tuple[str, XmlMeta], ...]] = {}
+
+# Enum class → {member: escaped UTF-8 text}
+_ENUM_TEXT: Dict[type, Dict[Enum, bytes]] = {}
+
+
+def _xml_fields(cls: type) -> Tuple[Tuple[str, XmlMeta], ...]:
+    fields = _FIELDS.get(cls)
+    if fields is None:
+        fields = _FIELDS[cls] = tuple(
+            (name, meta)
+            for name, info in cls.model_fields.items()
+            if (meta := get_xml_meta(info, name)) is not None
+        )
+    return fields
+
+
+def _is_generic(value: Any) -> bool:
+    """True if the model serializes through the generic ECHModel.to_xml()."""
+    return getattr(type(value), '__xml_generic__', False)
+
+
+def _escape_text(text: str) -> bytes:
+    # Same escaping as ElementTree (character data)
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text.encode('utf-8', 'xmlcharrefreplace')
+
+
+def _escape_attrib(text: str) -> bytes:
+    # Same escaping as ElementTree (attribute values)
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if '\r' in text:
+        text = text.replace('\r', '&#13;')
+    if '\n' in text:
+        text = text.replace('\n', '&#10;')
+    if '\t' in text:
+        text = text.replace('\t', '&#09;')
+    return text.encode('utf-8', 'xmlcharrefreplace')
+
+
+def _text(value: Any, meta: XmlMeta) -> bytes:
+    """Element text of a simple field value (same rules as _serialize_value)."""
+    if type(value) is str:
+        return _escape_text(value)
+    if isinstance(value, date):
+        # datetime is a date subclass; isoformat() gives the right XSD form for both
+        return value.isoformat().encode('ascii')
+    if isinstance(value, Enum):
+        # Enum before str/int — (str, Enum) members are str instances
+        table = _ENUM_TEXT.get(type(value))
+        if table is None:
+            table = _ENUM_TEXT[type(value)] = {m: _escape_text(enum_text(m)) for m in type(value)}
+        return table[value]
+    if isinstance(value, bool):
+        return b'true' if value else b'false'
+    if isinstance(value, str):
+        return _escape_text(value)
+    if isinstance(value, (int, float)):
+        return str(value).encode('ascii')
+    raise TypeError(
+        f"Cannot serialize field {meta.xml_name}: unsupported type {type(value).__name__}"
+    )
+
+
+class _Writer:
+    """Serialization state of one fragment."""
+
+    __slots__ = ('buf', 'used', 'indent', '_newlines')
+
+    def __init__(self, buf: bytearray, indent: Optional[str]):
+        self.buf = buf
+        # Namespace URI → prefix, in order of first use (ElementTree order)
+        self.used: Dict[str, str] = {}
+        self.indent = indent
+        self._newlines: Dict[int, bytes] = {}
+
+    def newline(self, level: int) -> bytes:
+        newline = self._newlines.get(level)
+        if newline is None:
+            newline = self._newlines[level] = ('\n' + self.indent * level).encode('utf-8')
+        return newline
+
+    def _prefix(self, uri: str) -> str:
+        prefix = self.used.get(uri)
+        if prefix is None:
+            if uri == _XML_NS:
+                return 'xml'
+            # Unregistered namespaces are numbered like ElementTree does
+            prefix = self.used[uri] = URI_PREFIXES.get(uri) or f'ns{len(self.used)}'
+        return prefix
+
+    def tag(self, uri: str, name: str) -> Tuple[bytes, bytes]:
+        key = (self._prefix(uri), name)
+        tags = _TAGS.get(key)
+        if tags is None:
+            qname = f'{key[0]}:{name}'
+            tags = _TAGS[key] = (f'<{qname}'.encode('utf-8'), f'</{qname}>'.encode('utf-8'))
+        return tags
+
+    def qname(self, name: str) -> bytes:
+        if name[:1] != '{':
+            return name.encode('utf-8')
+        uri, local = name[1:].rsplit('}', 1)
+        return f'{self._prefix(uri)}:{local}'.encode('utf-8')
+
+    def model(self, model: BaseModel, ns: str, start: bytes, close: bytes, level: int) -> None:
+        """Write a generic model as element start/close with its fields in ns."""
+        buf = self.buf
+        buf += start
+        mark = len(buf)
+        buf += b'>'
+        if self.fields(model, ns, level + 1):
+            if self.indent is not None:
+                buf += self.newline(level)
+            buf += close
+        else:
+            buf[mark:] = b' />'
+
+    def fields(self, model: BaseModel, ns: str, level: int) -> bool:
+        """Write the xml_field children of a generic model; True if any."""
+        newline = self.newline(level) if self.indent is not None else None
+        written = False
+        for name, meta in _xml_fields(type(model)):
+            value = getattr(model, name)
+            if value is None:
+                continue
+            for item in (value if meta.is_list else (value,)):
+                if newline is not None:
+                    self.buf += newline
+                self.value(item, ns, meta, level)
+                written = True
+        return written
+
+    def value(self, value: Any, parent_ns: str, meta: XmlMeta, level: int) -> None:
+        """Write one field value (mirrors model._serialize_value)."""
+        buf = self.buf
+        if meta.wrapper:
+            assert meta.child_ns is not None, f"wrapper=True requires child_ns for {meta.xml_name}"
+            start, close = self.tag(parent_ns, meta.xml_name)
+            if _is_generic(value):
+                self.model(value, meta.child_ns, start, close, level)
+            else:
+                self.wrapper(value.to_xml(namespace=meta.child_ns), start, close, level)
+            return
+
+        field_ns = meta.ns or parent_ns
+        if isinstance(value, BaseModel) and hasattr(value, 'to_xml'):
+            if _is_generic(value):
+                start, close = self.tag(field_ns, meta.xml_name)
+                self.model(value, field_ns, start, close, level)
+            else:
+                elem = value.to_xml(namespace=field_ns, element_name=meta.xml_name)
+                if self.indent is not None:
+                    indent_tree(elem, space=self.indent, level=level)
+                self.element(elem)
+            return
+
+        text = _text(value, meta)
+        start, close = self.tag(field_ns, meta.xml_name)
+        if text:
+            buf += start
+            buf += b'>'
+            buf += text
+            buf += close
+        else:
+            buf += start
+            buf += b' />'
+
+    def wrapper(self, container: ET.Element, start: bytes, close: bytes, level: int) -> None:
+        """Write a wrapper element holding the children of a to_xml() result."""
+        buf = self.buf
+        buf += start
+        if not len(container):
+            buf += b' />'
+            return
+        buf += b'>'
+        for child in container:
+            if self.indent is not None:
+                indent_tree(child, space=self.indent, level=level + 1)
+                buf += self.newline(level + 1)
+            self.element(child)
+        if self.indent is not None:
+            buf += self.newline(level)
+        buf += close
+
+    def element(self, elem: ET.Element) -> None:
+        """Write an ElementTree subtree as ET.tostring() does (without its tail)."""
+        if not isinstance(elem.tag, str):
+            raise TypeError(f"Cannot serialize {elem.tag!r} nodes, only elements")
+        buf = self.buf
+        qname = self.qname(elem.tag)
+        buf += b'<'
+        buf += qname
+        for key, value in elem.items():
+            buf += b' '
+            buf += self.qname(key)
+            buf += b'="'
+            buf += _escape_attrib(value)
+            buf += b'"'
+        text = elem.text
+        if text or len(elem):
+            buf += b'>'
+            if text:
+                buf += _escape_text(text)
+            for child in elem:
+                self.element(child)
+                if child.tail:
+                    buf += _escape_text(child.tail)
+            buf += b'</'
+            buf += qname
+            buf += b'>'
+        else:
+            buf += b' />'
+
+
+def write_model(
+    model: BaseModel,
+    out: Union[bytearray, BinaryIO],
+    namespace: Optional[str] = None,
+    element_name: Optional[str] = None,
+    wrapper_namespace: Optional[str] = None,
+    *,
+    indent: Optional[str] = None,
+    level: int = 0,
+    declared: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Serialize a model as UTF-8 XML into a bytearray or binary file object.
+
+    Args:
+        model: Model to serialize (arguments as for its to_xml())
+        out: bytearray (appended to) or writable binary file (one write() call)
+        indent: Indentation unit, as ET.indent(space=...); None for no whitespace
+        level: Nesting level of the fragment, as ET.indent(level=...)
+        declared: Namespace URI → prefix already declared by the enclosing
+            document; matching declarations are left out of the fragment
+    """
+    buf = out if isinstance(out, bytearray) else bytearray()
+    offset = len(buf)
+    writer = _Writer(buf, indent)
+
+    if _is_generic(model):
+        ns = namespace or model.__xml_ns__
+        start, close = writer.tag(wrapper_namespace or ns, element_name or model.__xml_element__)
+        writer.model(model, ns, start, close, level)
+        mark = offset + len(start)
+    else:
+        kwargs = {
+            key: value
+            for key, value in (
+                ('namespace', namespace),
+                ('element_name', element_name),
+                ('wrapper_namespace', wrapper_namespace),
+            )
+            if value is not None
+        }
+        elem = model.to_xml(**kwargs)
+        if indent is not None:
+            indent_tree(elem, space=indent, level=level)
+        writer.element(elem)
+        mark = offset + 1 + len(writer.qname(elem.tag))
+
+    declared = declared or {}
+    declarations = b''.join(
+        b' xmlns:' + prefix.encode('utf-8') + b'="' + _escape_attrib(uri) + b'"'
+        for uri, prefix in sorted(writer.used.items(), key=lambda item: item[1])
+        if declared.get(uri) != prefix
+    )
+    buf[mark:mark] = declarations
+
+    if buf is not out:
+        out.write(buf)
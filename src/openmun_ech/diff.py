@@ -0,0 +1,376 @@
+"""Structural diff of eCH deliveries, matched per entity.
+
+Nightly register exports are checked against the previous night. A textual
+or tree-walking diff of two full-register files neither scales nor answers
+the question asked ("which persons changed, and where"). This module
+compares two deliveries entity by entity:
+
+- Entities (eCH-0020 messages, eCH-0099 reportedPerson, ...) are matched
+  by a key read from their content (local person ID, VN, ...), so order in
+  the file does not matter
+- Files are streamed with iterparse; an entity is released as soon as it
+  has been hashed. Memory holds one key and digest per entity, plus the
+  entities that actually changed
+- Unchanged entities are recognized by a digest of their canonical form
+  (namespace prefixes, indentation and attribute order do not matter) and
+  never compared element by element
+- Changed entities are compared structurally; repeated siblings
+  (placeOfOrigin, parentalRelationship, ...) are matched by content first,
+  then by position
+
+Passes: the old file is read once to index digests, the new file once to
+classify entities, and the old file a second time only if entities
+changed (to compare them with the stored new versions).
+
+Paths in results use the prefixes of core.namespace and are relative to
+the entity element; repeated siblings carry a 1-based position
+('eCH-0011:placeOfOrigin[2]/eCH-0011:originName'). Only entities are
+compared: headers (message ID, date) differ between any two deliveries.
+
+Usage:
+    from openmun_ech.diff import diff_deliveries, ECH0020_VN
+
+    result = diff_deliveries('register_2025-01-01.xml', 'register_2025-01-02.xml')
+    print(len(result.added), len(result.removed), result.unchanged)
+    for entity in result.changed:
+        for change in entity.changes:
+            print(entity.key, change.kind, change.path, change.old, change.new)
+
+    # Match by VN instead of local person ID
+    result = diff_deliveries('register_2025-01-01.xml', 'register_2025-01-02.xml', key=ECH0020_VN)
+"""
+
+import hashlib
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from openmun_ech.utils._xml_entities import (
+    ECH0020_ENTITY,
+    ECH0020_PERSON,
+    ECH0099_ENTITY,
+    ECH0099_PERSON,
+    PREFIX_URIS,
+    Source,
+    canonical_digest,
+    entity_tags,
+    iterparse,
+    qname,
+    root_tag,
+)
+
+Key = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class EntityKey:
+    """Which elements are entities, and what identifies them.
+
+    Args:
+        entity: '/'-separated path of the entity elements from the root,
+            with core.namespace prefixes ('eCH-0099:delivery/eCH-0099:reportedPerson')
+        fields: ElementPath expressions relative to the entity whose texts
+            form the key
+
+    Raises:
+        ValueError: If the entity path is malformed or uses an unknown prefix
+    """
+
+    entity: str
+    fields: Sequence[str]
+
+    def __post_init__(self):
+        object.__setattr__(self, 'fields', tuple(self.fields))
+        object.__setattr__(self, '_tags', entity_tags(self.entity))
+
+    def key_of(self, elem: ET.Element) -> Optional[Key]:
+        """Key of an entity element; None if a key field is missing or empty."""
+        values = []
+        for path in self.fields:
+            text = elem.findtext(path, namespaces=PREFIX_URIS)
+            if not text or not text.strip():
+                return None
+            values.append(text.strip())
+        return tuple(values)
+
+
+ECH0020_LOCAL_PERSON_ID = EntityKey(
+    ECH0020_ENTITY,
+    (f'{ECH0020_PERSON}/eCH-0044:localPersonId/eCH-0044:personIdCategory',
+     f'{ECH0020_PERSON}/eCH-0044:localPersonId/eCH-0044:personId'),
+)
+ECH0020_VN = EntityKey(
+    ECH0020_ENTITY,
+    (f'{ECH0020_PERSON}/eCH-0044:vn',),
+)
+ECH0099_LOCAL_PERSON_ID = EntityKey(
+    ECH0099_ENTITY,
+    (f'{ECH0099_PERSON}/eCH-0044:localPersonId/eCH-0044:personIdCategory',
+     f'{ECH0099_PERSON}/eCH-0044:localPersonId/eCH-0044:personId'),
+)
+ECH0099_VN = EntityKey(
+    ECH0099_ENTITY,
+    (f'{ECH0099_PERSON}/eCH-0044:vn',),
+)
+
+# Root element → key used when diff_deliveries() gets none
+DEFAULT_KEYS: Dict[str, EntityKey] = {
+    key._tags[0]: key for key in (ECH0020_LOCAL_PERSON_ID, ECH0099_LOCAL_PERSON_ID)
+}
+
+
+@dataclass(frozen=True)
+class Change:
+    """One difference inside a matched entity."""
+
+    kind: str
+    """'added', 'removed' or 'changed' (text or attribute value)."""
+
+    path: str
+    """Element path relative to the entity ('.../@attribute' for attributes)."""
+
+    old: Optional[str] = None
+    """Old text or attribute value (None for containers and added elements)."""
+
+    new: Optional[str] = None
+    """New text or attribute value (None for containers and removed elements)."""
+
+
+@dataclass
+class EntityDiff:
+    """Differences of one entity present in both deliveries."""
+
+    key: Key
+    changes: List[Change] = field(default_factory=list)
+
+
+@dataclass
+class DeliveryDiff:
+    """Result of diff_deliveries()."""
+
+    added: List[Key] = field(default_factory=list)
+    """Keys only in the new delivery (new document order)."""
+
+    removed: List[Key] = field(default_factory=list)
+    """Keys only in the old delivery (old document order)."""
+
+    changed: List[EntityDiff] = field(default_factory=list)
+    """Entities in both deliveries with different content (old document order)."""
+
+    unchanged: int = 0
+    """Number of entities with identical content."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+# ============================================================================
+# Structural comparison of one matched pair
+# ============================================================================
+
+def _text(text: Optional[str]) -> str:
+    # Indentation and surrounding whitespace are not content
+    return text.strip() if text else ''
+
+
+def _subtree_digests(elem: ET.Element, digests: Dict[int, bytes]) -> bytes:
+    """Digest of every element of a subtree by id(), each from its children's (Merkle)."""
+    attrib = elem.attrib
+    own = (elem.tag, repr(sorted(attrib.items())) if attrib else '', _text(elem.text))
+    h = hashlib.blake2b('\x00'.join(own).encode('utf-8'), digest_size=16)
+    for child in elem:
+        h.update(_subtree_digests(child, digests))
+    digest = digests[id(elem)] = h.digest()
+    return digest
+
+
+def _diff_elements(
+    old: ET.Element,
+    new: ET.Element,
+    path: str,
+    digests: Dict[int, bytes],
+    changes: List[Change],
+) -> None:
+    old_text, new_text = _text(old.text), _text(new.text)
+    if old_text != new_text:
+        changes.append(Change('changed', path, old_text or None, new_text or None))
+    if old.attrib != new.attrib:
+        for name in sorted(set(old.attrib) | set(new.attrib)):
+            old_value, new_value = old.get(name), new.get(name)
+            if old_value != new_value:
+                attribute = f'{path}/@{qname(name)}' if path else f'@{qname(name)}'
+                kind = 'added' if old_value is None else 'removed' if new_value is None else 'changed'
+                changes.append(Change(kind, attribute, old_value, new_value))
+
+    # Children grouped by tag, in order of first appearance
+    groups: Dict[str, Tuple[List[ET.Element], List[ET.Element]]] = {}
+    for child in old:
+        groups.setdefault(child.tag, ([], []))[0].append(child)
+    for child in new:
+        groups.setdefault(child.tag, ([], []))[1].append(child)
+
+    for tag, (old_children, new_children) in groups.items():
+        step = f'{path}/{qname(tag)}' if path else qname(tag)
+        if len(old_children) == len(new_children) == 1:
+            if digests[id(old_children[0])] != digests[id(new_children[0])]:
+                _diff_elements(old_children[0], new_children[0], step, digests, changes)
+            continue
+
+        # Repeated siblings: identical content matches first (reordering is
+        # not a change), the rest pairs up by position
+        unmatched: Dict[bytes, List[int]] = {}
+        for i, child in enumerate(new_children):
+            unmatched.setdefault(digests[id(child)], []).append(i)
+        old_rest = []
+        for i, child in enumerate(old_children):
+            same = unmatched.get(digests[id(child)])
+            if same:
+                same.pop(0)
+            else:
+                old_rest.append(i)
+        new_rest = sorted(i for indexes in unmatched.values() for i in indexes)
+
+        repeated = max(len(old_children), len(new_children)) > 1
+
+        def position(i: int) -> str:
+            return f'{step}[{i + 1}]' if repeated else step
+
+        for i, j in zip(old_rest, new_rest):
+            _diff_elements(old_children[i], new_children[j], position(j), digests, changes)
+        for i in old_rest[len(new_rest):]:
+            changes.append(Change('removed', position(i), old=_text(old_children[i].text) or None))
+        for j in new_rest[len(old_rest):]:
+            changes.append(Change('added', position(j), new=_text(new_children[j].text) or None))
+
+
+def diff_entities(old: ET.Element, new: ET.Element) -> List[Change]:
+    """Structural differences between two versions of one entity element."""
+    digests: Dict[int, bytes] = {}
+    changes: List[Change] = []
+    if _subtree_digests(old, digests) != _subtree_digests(new, digests):
+        _diff_elements(old, new, '', digests, changes)
+    return changes
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+def _entities(source: Source, key: EntityKey) -> Iterator[Tuple[Key, ET.Element]]:
+    """(key, element) of each entity, released after the consumer has seen it."""
+    tags = key._tags
+    entity_level = len(tags) - 1
+    # Open elements down to the entity level, and whether they are on the entity path
+    stack: List[ET.Element] = []
+    on_path: List[bool] = []
+    depth = 0
+    count = 0
+    for event, elem in iterparse(source, rewind=True):
+        if event == 'start':
+            level = depth
+            depth += 1
+            if level > entity_level:
+                continue
+            if level == 0 and elem.tag != tags[0]:
+                raise ValueError(
+                    f"Root element {qname(elem.tag)} does not match entity path {key.entity!r}"
+                )
+            stack.append(elem)
+            on_path.append(elem.tag == tags[level] and (level == 0 or on_path[-1]))
+            continue
+
+        depth -= 1
+        level = depth
+        if level > entity_level:
+            continue
+        stack.pop()
+        matched = on_path.pop()
+        if level == 0:
+            break
+        if matched and level == entity_level:
+            count += 1
+            entity_key = key.key_of(elem)
+            if entity_key is None:
+                raise ValueError(f"Entity #{count} ({key.entity}) has no key {key.fields}")
+            yield entity_key, elem
+        # Completed elements (entities, headers) are not needed any more
+        stack[-1].remove(elem)
+
+
+def diff_deliveries(old: Source, new: Source, key: Optional[EntityKey] = None) -> DeliveryDiff:
+    """Compare two deliveries entity by entity (see module docstring).
+
+    Args:
+        old: Previous delivery (path or seekable binary file object)
+        new: Current delivery (path or seekable binary file object)
+        key: Entities and their key (default: local person ID, chosen by the
+             root element of old from DEFAULT_KEYS)
+
+    Returns:
+        Added and removed keys, per-entity changes of changed entities,
+        number of unchanged entities
+
+    Raises:
+        ValueError: If no default key exists for the document, the documents
+                    do not match the entity path, or an entity has no or a
+                    duplicate key
+    """
+    if key is None:
+        root = root_tag(old)
+        key = DEFAULT_KEYS.get(root)
+        if key is None:
+            raise ValueError(f"No default entity key for root element {qname(root)}; pass key=")
+
+    result = DeliveryDiff()
+
+    # Pass 1: key → digest of the old version
+    digests: Dict[Key, Optional[bytes]] = {}
+    for entity_key, elem in _entities(old, key):
+        if entity_key in digests:
+            raise ValueError(f"Duplicate key {entity_key} in old delivery")
+        digests[entity_key] = canonical_digest(elem)
+
+    with tempfile.TemporaryFile() as spool:
+        # Pass 2: classify new entities; changed ones go to the spool file for
+        # pass 3, so memory stays bounded when most entities changed
+        changed: Dict[Key, Tuple[int, int]] = {}
+        added = set()
+        for entity_key, elem in _entities(new, key):
+            if entity_key not in digests:
+                if entity_key in added:
+                    raise ValueError(f"Duplicate key {entity_key} in new delivery")
+                added.add(entity_key)
+                result.added.append(entity_key)
+                continue
+            digest = digests[entity_key]
+            if digest is None:
+                raise ValueError(f"Duplicate key {entity_key} in new delivery")
+            digests[entity_key] = None  # Matched
+            if digest == canonical_digest(elem):
+                result.unchanged += 1
+            else:
+                elem.tail = None
+                data = ET.tostring(elem)
+                changed[entity_key] = (spool.tell(), len(data))
+                spool.write(data)
+        result.removed = [k for k, digest in digests.items() if digest is not None]
+        del digests
+
+        # Pass 3: compare changed entities with their old version
+        if changed:
+            for entity_key, elem in _entities(old, key):
+                location = changed.pop(entity_key, None)
+                if location is not None:
+                    offset, length = location
+                    spool.seek(offset)
+                    new_elem = ET.fromstring(spool.read(length))
+                    changes = diff_entities(elem, new_elem)
+                    if changes:
+                        result.changed.append(EntityDiff(entity_key, changes))
+                    else:
+                        # Only repeated siblings were reordered
+                        result.unchanged += 1
+                    if not changed:
+                        break
+    return result
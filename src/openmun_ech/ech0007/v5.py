@@ -14,7 +14,7 @@ from typing import Optional
 
 from pydantic import field_validator
 
-from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core import ECHModel, FrozenECHModel, NS, xml_field
 
 
 class CantonAbbreviation(str, Enum):
@@ -89,7 +89,7 @@ class CantonFLAbbreviation(str, Enum):
     FL = "FL"  # Fürstentum Liechtenstein (Principality of Liechtenstein)
 
 
-class ECH0007SwissMunicipality(ECHModel):
+class ECH0007SwissMunicipality(FrozenECHModel):
     """eCH-0007 Swiss Municipality.
 
     Represents a Swiss municipality with BFS number and canton.
@@ -105,7 +105,7 @@ class ECH0007SwissMunicipality(ECHModel):
         description="BFS municipality number (1-4 digits, optional per XSD)"
     )
     municipality_name: str = xml_field(
-        'municipalityName', min_length=1, max_length=40,
+        'municipalityName', min_length=1, max_length=40, intern=True,
         description="Official municipality name (required)"
     )
     canton_abbreviation: Optional[CantonAbbreviation] = xml_field(
@@ -177,7 +177,7 @@ class ECH0007SwissAndFLMunicipality(ECHModel):
         description="BFS municipality number (1-4 digits, REQUIRED)"
     )
     municipality_name: str = xml_field(
-        'municipalityName', min_length=1, max_length=40,
+        'municipalityName', min_length=1, max_length=40, intern=True,
         description="Official municipality name (REQUIRED)"
     )
     canton_fl_abbreviation: CantonFLAbbreviation = xml_field(
@@ -222,7 +222,7 @@ class ECH0007SwissAndFLMunicipality(ECHModel):
         return v
 
 
-class ECH0007Municipality(ECHModel):
+class ECH0007Municipality(FrozenECHModel):
     """eCH-0007 Municipality (Swiss).
 
     Wrapper for Swiss municipality data with BFS number and canton.
@@ -37,7 +37,7 @@ class ECH0007v6SwissMunicipality(ECHModel):
         'municipalityId', default=None, min_length=1, max_length=4,
     )
     municipality_name: str = xml_field(
-        'municipalityName', min_length=1, max_length=40,
+        'municipalityName', min_length=1, max_length=40, intern=True,
     )
     canton_abbreviation: Optional[CantonAbbreviation] = xml_field(
         'cantonAbbreviation', default=None,
@@ -100,7 +100,7 @@ class ECH0007v6SwissAndFLMunicipality(ECHModel):
         'municipalityId', min_length=1, max_length=4,
     )
     municipality_name: str = xml_field(
-        'municipalityName', min_length=1, max_length=40,
+        'municipalityName', min_length=1, max_length=40, intern=True,
     )
     canton_fl_abbreviation: CantonFLAbbreviation = xml_field(
         'cantonFlAbbreviation',
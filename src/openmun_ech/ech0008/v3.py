@@ -16,11 +16,11 @@ from typing import Optional
 
 from pydantic import field_validator
 
-from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core import ECHModel, FrozenECHModel, NS, xml_field
 from openmun_opendata.countries import get_country, get_country_by_bfs
 
 
-class ECH0008Country(ECHModel):
+class ECH0008Country(FrozenECHModel):
     """eCH-0008 Country.
 
     Represents a country with BFS code, ISO code, and multilingual names.
@@ -33,7 +33,7 @@ class ECH0008Country(ECHModel):
 
     country_id: Optional[str] = xml_field('countryId', default=None, min_length=4, max_length=4)
     country_id_iso2: Optional[str] = xml_field('countryIdISO2', default=None, max_length=2)
-    country_name_short: str = xml_field('countryNameShort', min_length=1, max_length=50)
+    country_name_short: str = xml_field('countryNameShort', min_length=1, max_length=50, intern=True)
 
     @field_validator('country_id')
     @classmethod
@@ -139,7 +139,7 @@ class ECH0008CountryShort(ECHModel):
     __xml_ns__ = NS.ECH0008_V3
     __xml_element__ = 'country'
 
-    country_name_short: str = xml_field('countryNameShort', min_length=1, max_length=50)
+    country_name_short: str = xml_field('countryNameShort', min_length=1, max_length=50, intern=True)
 
     @classmethod
     def from_country_name(cls, country_name: str) -> 'ECH0008CountryShort':
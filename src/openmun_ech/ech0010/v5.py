@@ -104,7 +104,7 @@ class ECH0010AddressInformation(ECHModel):
 
     # Town/locality
     locality: Optional[str] = xml_field('locality', default=None, max_length=40)
-    town: str = xml_field('town', max_length=40)
+    town: str = xml_field('town', max_length=40, intern=True)
 
     # Postal code (choice: Swiss OR foreign)
     swiss_zip_code: Optional[int] = xml_field(
@@ -266,7 +266,7 @@ class ECH0010SwissAddressInformation(ECHModel):
     locality: Optional[str] = xml_field('locality', default=None, max_length=40)
 
     # Town (required)
-    town: str = xml_field('town', max_length=40)
+    town: str = xml_field('town', max_length=40, intern=True)
 
     # Swiss ZIP code (REQUIRED - unlike addressInformationType)
     swiss_zip_code: int = xml_field('swissZipCode', ge=1000, le=9999)
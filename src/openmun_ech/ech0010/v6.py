@@ -118,7 +118,7 @@ class ECH0010v6AddressInformation(ECHModel):
     )
 
     locality: Optional[str] = xml_field('locality', default=None, max_length=40)
-    town: str = xml_field('town', max_length=40)
+    town: str = xml_field('town', max_length=40, intern=True)
 
     # xs:choice: Swiss zip code sequence OR foreign zip code
     swiss_zip_code: Optional[int] = xml_field(
@@ -244,7 +244,7 @@ class ECH0010v6SwissAddressInformation(ECHModel):
     dwelling_number: Optional[str] = xml_field('dwellingNumber', default=None, max_length=10)
 
     locality: Optional[str] = xml_field('locality', default=None, max_length=40)
-    town: str = xml_field('town', max_length=40)
+    town: str = xml_field('town', max_length=40, intern=True)
 
     swiss_zip_code: int = xml_field('swissZipCode', ge=1000, le=9999)
     swiss_zip_code_add_on: Optional[str] = xml_field(
@@ -18,7 +18,7 @@ from datetime import date
 from pydantic import field_validator, model_validator
 
 # Import components we depend on
-from openmun_ech.ech0007 import ECH0007Municipality, CantonAbbreviation
+from openmun_ech.ech0007 import ECH0007Municipality, ECH0007SwissMunicipality, CantonAbbreviation
 from openmun_ech.ech0008 import ECH0008Country
 from openmun_ech.ech0044 import (
     ECH0044PersonIdentification,
@@ -27,7 +27,9 @@ from openmun_ech.ech0044 import (
 )
 from openmun_ech.ech0010 import ECH0010MailAddress, ECH0010SwissAddressInformation, ECH0010AddressInformation
 from openmun_ech.ech0006 import ResidencePermitType
-from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core import ECHModel, FrozenECHModel, NS, xml_field
+from openmun_ech.core.children import ChildIndex
+from openmun_ech.core.codes import decode_enum, intern_text
 
 # Import enums from this package
 from .enums import (
@@ -40,6 +42,21 @@ from .enums import (
 )
 
 
+def _swiss_municipality(elem: ET.Element) -> Optional[ECH0007SwissMunicipality]:
+    """Parse swissMunicipalityType content of elem; None without municipalityName."""
+    children = ChildIndex(elem)
+    ns_0007 = NS.ECH0007_V5
+    name = children.find(ns_0007, 'municipalityName')
+    if name is None or not name.text:
+        return None
+    return ECH0007SwissMunicipality(
+        municipality_id=children.text(ns_0007, 'municipalityId'),
+        municipality_name=intern_text(name.text.strip()),
+        canton_abbreviation=children.text(ns_0007, 'cantonAbbreviation'),
+        history_municipality_id=children.text(ns_0007, 'historyMunicipalityId')
+    )
+
+
 class ECH0011SwissMunicipalityWithoutBFS(ECHModel):
     """eCH-0011 Swiss municipality without mandatory BFS number.
 
@@ -136,23 +153,23 @@ class ECH0011SwissMunicipalityWithoutBFS(ECHModel):
             }
 
         ns_0007 = nsmap['eCH-0007']
+        children = ChildIndex(elem)
 
         # Extract municipality name (required)
-        mun_name_elem = elem.find(f"{{{ns_0007}}}municipalityName")
+        mun_name_elem = children.find(ns_0007, 'municipalityName')
         if mun_name_elem is None or not mun_name_elem.text:
             raise ValueError("Missing required field: municipalityName")
 
         # Extract optional municipality ID
-        mun_id_elem = elem.find(f"{{{ns_0007}}}municipalityId")
-        mun_id = mun_id_elem.text.strip() if mun_id_elem is not None and mun_id_elem.text else None
+        mun_id = children.text(ns_0007, 'municipalityId')
 
         # Extract optional canton abbreviation
-        canton_elem = elem.find(f"{{{ns_0007}}}cantonAbbreviation")
-        canton = CantonAbbreviation(canton_elem.text.strip()) if canton_elem is not None and canton_elem.text else None
+        canton_text = children.text(ns_0007, 'cantonAbbreviation')
+        canton = decode_enum(CantonAbbreviation, canton_text) if canton_text is not None else None
 
         return cls(
             municipality_id=mun_id,
-            municipality_name=mun_name_elem.text.strip(),
+            municipality_name=intern_text(mun_name_elem.text.strip()),
             canton_abbreviation=canton
         )
 
@@ -197,7 +214,7 @@ class ECH0011NameData(ECHModel):
     declared_foreign_name: Optional[ECH0011ForeignerName] = xml_field(default=None)
 
 
-class ECH0011GeneralPlace(ECHModel):
+class ECH0011GeneralPlace(FrozenECHModel):
     """eCH-0011 General place (birth/death location).
 
     Represents a place that can be:
@@ -306,49 +323,34 @@ class ECH0011GeneralPlace(ECHModel):
         Raises:
             ValueError: If validation fails
         """
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0007': NS.ECH0007_V5,
-            'eCH-0008': NS.ECH0008_V3
-        }
+        children = ChildIndex(elem)
 
         # Check for unknown
-        unknown_elem = elem.find('eCH-0011:unknown', ns)
-        unknown = unknown_elem is not None
+        unknown = children.find(namespace, 'unknown') is not None
 
         # Check for Swiss municipality - swissTown element in eCH-0011 namespace
         # Parse swissMunicipalityType content directly (municipalityId, municipalityName, etc.)
-        swiss_elem = elem.find('eCH-0011:swissTown', ns)
+        swiss_elem = children.find(namespace, 'swissTown')
         swiss_mun = None
         if swiss_elem is not None:
-            from openmun_ech.ech0007 import ECH0007SwissMunicipality
-            mun_id_elem = swiss_elem.find('eCH-0007:municipalityId', ns)
-            mun_name_elem = swiss_elem.find('eCH-0007:municipalityName', ns)
-            canton_elem = swiss_elem.find('eCH-0007:cantonAbbreviation', ns)
-            hist_id_elem = swiss_elem.find('eCH-0007:historyMunicipalityId', ns)
-
-            if mun_name_elem is not None and mun_name_elem.text:
-                swiss_municipality = ECH0007SwissMunicipality(
-                    municipality_id=mun_id_elem.text.strip() if mun_id_elem is not None and mun_id_elem.text else None,
-                    municipality_name=mun_name_elem.text.strip(),
-                    canton_abbreviation=canton_elem.text.strip() if canton_elem is not None and canton_elem.text else None,
-                    history_municipality_id=hist_id_elem.text.strip() if hist_id_elem is not None and hist_id_elem.text else None
-                )
+            swiss_municipality = _swiss_municipality(swiss_elem)
+            if swiss_municipality is not None:
                 swiss_mun = ECH0007Municipality(swiss_municipality=swiss_municipality)
 
         # Check for foreign country
-        foreign_container = elem.find('eCH-0011:foreignCountry', ns)
+        foreign_container = children.find(namespace, 'foreignCountry')
         foreign_country = None
         foreign_town = None
 
         if foreign_container is not None:
+            foreign = ChildIndex(foreign_container)
             # country element is in eCH-0011 namespace (wrapper), content is in eCH-0008
-            country_elem = foreign_container.find('eCH-0011:country', ns)
+            country_elem = foreign.find(namespace, 'country')
             if country_elem is not None:
                 foreign_country = ECH0008Country.from_xml(country_elem, NS.ECH0008_V3)
 
-            town_elem = foreign_container.find('eCH-0011:town', ns)
-            foreign_town = town_elem.text.strip() if town_elem is not None and town_elem.text else None
+            town = foreign.text(namespace, 'town')
+            foreign_town = intern_text(town) if town is not None else None
 
         return cls(
             unknown=unknown if unknown else None,
@@ -419,27 +421,21 @@ class ECH0011BirthData(ECHModel):
         Raises:
             ValueError: If required fields missing
         """
-        ns = {'eCH-0011': namespace}
+        children = ChildIndex(elem)
 
         # Date of birth (required) - uses eCH-0044 datePartiallyKnownType
-        dob_elem = elem.find('eCH-0011:dateOfBirth', ns)
-        if dob_elem is None:
-            raise ValueError("Missing required field: dateOfBirth")
+        dob_elem = children.require(namespace, 'dateOfBirth')
         # Parse yearMonthDay element (full date) - in eCH-0044 namespace
-        ns_0044 = {'eCH-0044': NS.ECH0044_V4}
-        ymd_elem = dob_elem.find('eCH-0044:yearMonthDay', ns_0044)
+        ymd_elem = dob_elem.find(f'{{{NS.ECH0044_V4}}}yearMonthDay')
         if ymd_elem is None or not ymd_elem.text:
             raise ValueError("Missing yearMonthDay in dateOfBirth")
         dob = date.fromisoformat(ymd_elem.text.strip())
 
         # Place of birth (required)
-        place_elem = elem.find('eCH-0011:placeOfBirth', ns)
-        if place_elem is None:
-            raise ValueError("Missing required field: placeOfBirth")
-        place = ECH0011GeneralPlace.from_xml(place_elem, namespace)
+        place = ECH0011GeneralPlace.from_xml(children.require(namespace, 'placeOfBirth'), namespace)
 
         # Sex (required)
-        sex_elem = elem.find('eCH-0011:sex', ns)
+        sex_elem = children.find(namespace, 'sex')
         if sex_elem is None or not sex_elem.text:
             raise ValueError("Missing required field: sex")
 
@@ -667,7 +663,7 @@ class ECH0011PlaceOfOrigin(ECHModel):
     __xml_ns__ = NS.ECH0011_V8
     __xml_element__ = 'placeOfOrigin'
 
-    origin_name: str = xml_field(max_length=50)
+    origin_name: str = xml_field(max_length=50, intern=True)
     canton: str = xml_field(min_length=2, max_length=2)
     place_of_origin_id: Optional[int] = xml_field(default=None)
     history_municipality_id: Optional[str] = xml_field(default=None)
@@ -803,14 +799,15 @@ class ECH0011PartnerIdOrganisation(ECHModel):
 
         # Parse local person ID (required)
         # The localPersonId element is in eCH-0011 namespace, children in eCH-0044
-        local_person_id_elem = elem.find(f"{{{ns}}}localPersonId")
+        children = ChildIndex(elem)
+        local_person_id_elem = children.find(ns, 'localPersonId')
         if local_person_id_elem is None:
             raise ValueError("Missing required localPersonId in partnerIdOrganisation")
 
         # Parse the namedPersonId structure manually
-        ech0044_ns = {'eCH-0044': nsmap['eCH-0044']}
-        category_elem = local_person_id_elem.find('eCH-0044:personIdCategory', ech0044_ns)
-        id_elem = local_person_id_elem.find('eCH-0044:personId', ech0044_ns)
+        ns_0044 = nsmap['eCH-0044']
+        category_elem = local_person_id_elem.find(f'{{{ns_0044}}}personIdCategory')
+        id_elem = local_person_id_elem.find(f'{{{ns_0044}}}personId')
 
         if category_elem is None or id_elem is None:
             raise ValueError("Missing personIdCategory or personId in localPersonId")
@@ -822,9 +819,9 @@ class ECH0011PartnerIdOrganisation(ECHModel):
 
         # Parse other person IDs (optional, multiple)
         other_person_ids = []
-        for other_id_elem in elem.findall(f"{{{ns}}}otherPersonId"):
-            other_category = other_id_elem.find('eCH-0044:personIdCategory', ech0044_ns)
-            other_id = other_id_elem.find('eCH-0044:personId', ech0044_ns)
+        for other_id_elem in children.findall(ns, 'otherPersonId'):
+            other_category = other_id_elem.find(f'{{{ns_0044}}}personIdCategory')
+            other_id = other_id_elem.find(f'{{{ns_0044}}}personId')
             if other_category is not None and other_id is not None:
                 other_person_ids.append(ECH0044NamedPersonId(
                     person_id_category=other_category.text,
@@ -969,11 +966,7 @@ class ECH0011ContactData(ECHModel):
         Raises:
             ValueError: If required fields missing
         """
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0044': NS.ECH0044_V4,
-            'eCH-0010': NS.ECH0010_V5
-        }
+        children = ChildIndex(elem)
 
         # Parse optional choice (at most one of three variants)
         contact_person = None
@@ -981,7 +974,7 @@ class ECH0011ContactData(ECHModel):
         contact_organization = None
 
         # Variant 1: personIdentification (full) - wrapper in eCH-0011, content in eCH-0044
-        person_elem = elem.find('eCH-0011:personIdentification', ns)
+        person_elem = children.find(namespace, 'personIdentification')
         if person_elem is not None:
             contact_person = ECH0044PersonIdentification.from_xml(
                 person_elem,
@@ -989,7 +982,7 @@ class ECH0011ContactData(ECHModel):
             )
 
         # Variant 2: personIdentificationPartner (light) - wrapper in eCH-0011, content in eCH-0044
-        partner_elem = elem.find('eCH-0011:personIdentificationPartner', ns)
+        partner_elem = children.find(namespace, 'personIdentificationPartner')
         if partner_elem is not None:
             contact_person_partner = ECH0044PersonIdentificationLight.from_xml(
                 partner_elem,
@@ -997,7 +990,7 @@ class ECH0011ContactData(ECHModel):
             )
 
         # Variant 3: partnerIdOrganisation
-        org_elem = elem.find(f'{{{namespace}}}partnerIdOrganisation')
+        org_elem = children.find(namespace, 'partnerIdOrganisation')
         if org_elem is not None:
             contact_organization = ECH0011PartnerIdOrganisation.from_xml(
                 org_elem,
@@ -1008,18 +1001,16 @@ class ECH0011ContactData(ECHModel):
             )
 
         # Contact address (required) - contactAddress element in eCH-0011, content in eCH-0010
-        address_elem = elem.find('eCH-0011:contactAddress', ns)
-        if address_elem is None:
-            raise ValueError("Missing required field: contactAddress")
+        address_elem = children.require(namespace, 'contactAddress')
         contact_address = ECH0010MailAddress.from_xml(address_elem, NS.ECH0010_V5)
 
         # Valid from (optional)
-        from_elem = elem.find('eCH-0011:contactValidFrom', ns)
-        valid_from = date.fromisoformat(from_elem.text.strip()) if from_elem is not None and from_elem.text else None
+        from_text = children.text(namespace, 'contactValidFrom')
+        valid_from = date.fromisoformat(from_text) if from_text else None
 
         # Valid till (optional)
-        till_elem = elem.find('eCH-0011:contactValidTill', ns)
-        valid_till = date.fromisoformat(till_elem.text.strip()) if till_elem is not None and till_elem.text else None
+        till_text = children.text(namespace, 'contactValidTill')
+        valid_till = date.fromisoformat(till_text) if till_text else None
 
         return cls(
             contact_person=contact_person,
@@ -1155,53 +1146,37 @@ class ECH0011DestinationType(ECHModel):
         Returns:
             Parsed destination object
         """
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0007': NS.ECH0007_V5,
-            'eCH-0008': NS.ECH0008_V3,
-            'eCH-0010': NS.ECH0010_V5
-        }
+        children = ChildIndex(elem)
 
         # Check for unknown
-        unknown_elem = elem.find('eCH-0011:unknown', ns)
-        unknown = unknown_elem is not None
+        unknown = children.find(namespace, 'unknown') is not None
 
         # Check for Swiss municipality - swissTown element in eCH-0011 namespace
         # Parse swissMunicipalityType content directly (municipalityId, municipalityName, etc.)
-        swiss_elem = elem.find('eCH-0011:swissTown', ns)
+        swiss_elem = children.find(namespace, 'swissTown')
         swiss_mun = None
         if swiss_elem is not None:
-            from openmun_ech.ech0007 import ECH0007SwissMunicipality
-            mun_id_elem = swiss_elem.find('eCH-0007:municipalityId', ns)
-            mun_name_elem = swiss_elem.find('eCH-0007:municipalityName', ns)
-            canton_elem = swiss_elem.find('eCH-0007:cantonAbbreviation', ns)
-            hist_id_elem = swiss_elem.find('eCH-0007:historyMunicipalityId', ns)
-
-            if mun_name_elem is not None and mun_name_elem.text:
-                swiss_municipality = ECH0007SwissMunicipality(
-                    municipality_id=mun_id_elem.text.strip() if mun_id_elem is not None and mun_id_elem.text else None,
-                    municipality_name=mun_name_elem.text.strip(),
-                    canton_abbreviation=canton_elem.text.strip() if canton_elem is not None and canton_elem.text else None,
-                    history_municipality_id=hist_id_elem.text.strip() if hist_id_elem is not None and hist_id_elem.text else None
-                )
+            swiss_municipality = _swiss_municipality(swiss_elem)
+            if swiss_municipality is not None:
                 swiss_mun = ECH0007Municipality(swiss_municipality=swiss_municipality)
 
         # Check for foreign country
-        foreign_container = elem.find('eCH-0011:foreignCountry', ns)
+        foreign_container = children.find(namespace, 'foreignCountry')
         foreign_country = None
         foreign_town = None
 
         if foreign_container is not None:
+            foreign = ChildIndex(foreign_container)
             # country element is in eCH-0011 namespace (wrapper), content is in eCH-0008
-            country_elem = foreign_container.find('eCH-0011:country', ns)
+            country_elem = foreign.find(namespace, 'country')
             if country_elem is not None:
                 foreign_country = ECH0008Country.from_xml(country_elem, NS.ECH0008_V3)
 
-            town_elem = foreign_container.find('eCH-0011:town', ns)
-            foreign_town = town_elem.text.strip() if town_elem is not None and town_elem.text else None
+            town = foreign.text(namespace, 'town')
+            foreign_town = intern_text(town) if town is not None else None
 
         # Mail address (optional) - wrapper in eCH-0011, content in eCH-0010
-        mail_elem = elem.find('eCH-0011:mailAddress', ns)
+        mail_elem = children.find(namespace, 'mailAddress')
         mail_address = None
         if mail_elem is not None:
             # Parse addressInformationType content (no wrapper inside mailAddress)
@@ -1316,39 +1291,32 @@ class ECH0011DwellingAddress(ECHModel):
     def from_xml(cls, elem: ET.Element,
                  namespace: str = NS.ECH0011_V8) -> 'ECH0011DwellingAddress':
         """Import from eCH-0011 XML."""
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0010': NS.ECH0010_V5
-        }
+        children = ChildIndex(elem)
 
         # EGID (optional)
-        egid_elem = elem.find('eCH-0011:EGID', ns)
-        egid = int(egid_elem.text.strip()) if egid_elem is not None and egid_elem.text else None
+        egid_text = children.text(namespace, 'EGID')
+        egid = int(egid_text) if egid_text else None
 
         # EWID (optional)
-        ewid_elem = elem.find('eCH-0011:EWID', ns)
-        ewid = int(ewid_elem.text.strip()) if ewid_elem is not None and ewid_elem.text else None
+        ewid_text = children.text(namespace, 'EWID')
+        ewid = int(ewid_text) if ewid_text else None
 
         # Household ID (optional)
-        hh_elem = elem.find('eCH-0011:householdID', ns)
-        household_id = hh_elem.text.strip() if hh_elem is not None and hh_elem.text else None
+        household_id = children.text(namespace, 'householdID')
 
         # Address (required) - address element in eCH-0011, content in eCH-0010
-        from openmun_ech.ech0010 import ECH0010SwissAddressInformation
-        address_elem = elem.find('eCH-0011:address', ns)
-        if address_elem is None:
-            raise ValueError("Missing required field: address")
+        address_elem = children.require(namespace, 'address')
         address = ECH0010SwissAddressInformation.from_xml(address_elem, NS.ECH0010_V5)
 
         # Type of household (required)
-        type_elem = elem.find('eCH-0011:typeOfHousehold', ns)
+        type_elem = children.find(namespace, 'typeOfHousehold')
         if type_elem is None or not type_elem.text:
             raise ValueError("Missing required field: typeOfHousehold")
         type_of_household = type_elem.text.strip()
 
         # Moving date (optional)
-        date_elem = elem.find('eCH-0011:movingDate', ns)
-        moving_date = date.fromisoformat(date_elem.text.strip()) if date_elem is not None and date_elem.text else None
+        date_text = children.text(namespace, 'movingDate')
+        moving_date = date.fromisoformat(date_text) if date_text else None
 
         return cls(
             egid=egid,
@@ -1450,56 +1418,36 @@ class ECH0011ResidenceData(ECHModel):
     def from_xml(cls, elem: ET.Element,
                  namespace: str = NS.ECH0011_V8) -> 'ECH0011ResidenceData':
         """Import from eCH-0011 XML."""
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0007': NS.ECH0007_V5
-        }
+        children = ChildIndex(elem)
 
         # Reporting municipality (required) - reportingMunicipality element in eCH-0011 namespace
-        mun_elem = elem.find('eCH-0011:reportingMunicipality', ns)
-        if mun_elem is None:
-            raise ValueError("Missing required field: reportingMunicipality")
+        mun_elem = children.require(namespace, 'reportingMunicipality')
 
         # Parse swissMunicipalityType content from within reportingMunicipality element
-        from openmun_ech.ech0007 import ECH0007SwissMunicipality
-        mun_id_elem = mun_elem.find('eCH-0007:municipalityId', ns)
-        mun_name_elem = mun_elem.find('eCH-0007:municipalityName', ns)
-        canton_elem = mun_elem.find('eCH-0007:cantonAbbreviation', ns)
-        hist_id_elem = mun_elem.find('eCH-0007:historyMunicipalityId', ns)
-
-        if mun_name_elem is None or not mun_name_elem.text:
+        swiss_muni = _swiss_municipality(mun_elem)
+        if swiss_muni is None:
             raise ValueError("Missing required field: municipalityName in reportingMunicipality")
-
-        swiss_muni = ECH0007SwissMunicipality(
-            municipality_id=mun_id_elem.text.strip() if mun_id_elem is not None and mun_id_elem.text else None,
-            municipality_name=mun_name_elem.text.strip(),
-            canton_abbreviation=canton_elem.text.strip() if canton_elem is not None and canton_elem.text else None,
-            history_municipality_id=hist_id_elem.text.strip() if hist_id_elem is not None and hist_id_elem.text else None
-        )
         reporting_municipality = ECH0007Municipality(swiss_municipality=swiss_muni)
 
         # Arrival date (required)
-        arrival_elem = elem.find('eCH-0011:arrivalDate', ns)
+        arrival_elem = children.find(namespace, 'arrivalDate')
         if arrival_elem is None or not arrival_elem.text:
             raise ValueError("Missing required field: arrivalDate")
         arrival_date = date.fromisoformat(arrival_elem.text.strip())
 
         # Comes from (optional)
-        comes_elem = elem.find('eCH-0011:comesFrom', ns)
+        comes_elem = children.find(namespace, 'comesFrom')
         comes_from = ECH0011DestinationType.from_xml(comes_elem, namespace) if comes_elem is not None else None
 
         # Dwelling address (required)
-        dwelling_elem = elem.find('eCH-0011:dwellingAddress', ns)
-        if dwelling_elem is None:
-            raise ValueError("Missing required field: dwellingAddress")
-        dwelling_address = ECH0011DwellingAddress.from_xml(dwelling_elem, namespace)
+        dwelling_address = ECH0011DwellingAddress.from_xml(children.require(namespace, 'dwellingAddress'), namespace)
 
         # Departure date (optional)
-        departure_elem = elem.find('eCH-0011:departureDate', ns)
-        departure_date = date.fromisoformat(departure_elem.text.strip()) if departure_elem is not None and departure_elem.text else None
+        departure_text = children.text(namespace, 'departureDate')
+        departure_date = date.fromisoformat(departure_text) if departure_text else None
 
         # Goes to (optional)
-        goes_elem = elem.find('eCH-0011:goesTo', ns)
+        goes_elem = children.find(namespace, 'goesTo')
         goes_to = ECH0011DestinationType.from_xml(goes_elem, namespace) if goes_elem is not None else None
 
         return cls(
@@ -1577,34 +1525,17 @@ class ECH0011MainResidence(ECHModel):
     def from_xml(cls, elem: ET.Element,
                  namespace: str = NS.ECH0011_V8) -> 'ECH0011MainResidence':
         """Import from eCH-0011 XML."""
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0007': NS.ECH0007_V5
-        }
+        children = ChildIndex(elem)
 
         # Main residence (required)
-        main_elem = elem.find('eCH-0011:mainResidence', ns)
-        if main_elem is None:
-            raise ValueError("Missing required field: mainResidence")
-        main_residence = ECH0011ResidenceData.from_xml(main_elem, namespace)
+        main_residence = ECH0011ResidenceData.from_xml(children.require(namespace, 'mainResidence'), namespace)
 
         # Secondary residences (optional, multiple) - wrapper in eCH-0011, content in eCH-0007
         secondary_list = []
-        for secondary_elem in elem.findall('eCH-0011:secondaryResidence', ns):
+        for secondary_elem in children.findall(namespace, 'secondaryResidence'):
             # Parse swissMunicipalityType content directly (municipalityId, municipalityName, etc.)
-            from openmun_ech.ech0007 import ECH0007SwissMunicipality
-            mun_id_elem = secondary_elem.find('eCH-0007:municipalityId', ns)
-            mun_name_elem = secondary_elem.find('eCH-0007:municipalityName', ns)
-            canton_elem = secondary_elem.find('eCH-0007:cantonAbbreviation', ns)
-            hist_id_elem = secondary_elem.find('eCH-0007:historyMunicipalityId', ns)
-
-            if mun_name_elem is not None and mun_name_elem.text:
-                swiss_municipality = ECH0007SwissMunicipality(
-                    municipality_id=mun_id_elem.text.strip() if mun_id_elem is not None and mun_id_elem.text else None,
-                    municipality_name=mun_name_elem.text.strip(),
-                    canton_abbreviation=canton_elem.text.strip() if canton_elem is not None and canton_elem.text else None,
-                    history_municipality_id=hist_id_elem.text.strip() if hist_id_elem is not None and hist_id_elem.text else None
-                )
+            swiss_municipality = _swiss_municipality(secondary_elem)
+            if swiss_municipality is not None:
                 secondary_list.append(ECH0007Municipality(swiss_municipality=swiss_municipality))
 
         return cls(
@@ -1708,52 +1639,40 @@ class ECH0011SecondaryResidence(ECHModel):
     def from_xml(cls, elem: ET.Element,
                  namespace: str = NS.ECH0011_V8) -> 'ECH0011SecondaryResidence':
         """Import from eCH-0011 XML."""
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0007': NS.ECH0007_V5
-        }
+        ns_0007 = NS.ECH0007_V5
+        children = ChildIndex(elem)
 
         # Main residence municipality (required)
-        main_elem = elem.find(f'{{{NS.ECH0007_V5}}}mainResidence', ns)
-        if main_elem is None:
-            raise ValueError("Missing required field: mainResidence")
-        main_residence = ECH0007Municipality.from_xml(main_elem, NS.ECH0007_V5)
+        main_residence = ECH0007Municipality.from_xml(children.require(ns_0007, 'mainResidence'), ns_0007)
 
         # Secondary residence element (required)
-        sec_elem = elem.find('eCH-0011:secondaryResidence', ns)
-        if sec_elem is None:
-            raise ValueError("Missing required field: secondaryResidence")
+        secondary = ChildIndex(children.require(namespace, 'secondaryResidence'))
 
         # Reporting municipality (required)
-        mun_elem = sec_elem.find(f'{{{NS.ECH0007_V5}}}reportingMunicipality', ns)
-        if mun_elem is None:
-            raise ValueError("Missing required field: reportingMunicipality")
-        reporting_municipality = ECH0007Municipality.from_xml(mun_elem, NS.ECH0007_V5)
+        mun_elem = secondary.require(ns_0007, 'reportingMunicipality')
+        reporting_municipality = ECH0007Municipality.from_xml(mun_elem, ns_0007)
 
         # Arrival date (required)
-        arrival_elem = sec_elem.find('eCH-0011:arrivalDate', ns)
+        arrival_elem = secondary.find(namespace, 'arrivalDate')
         if arrival_elem is None or not arrival_elem.text:
             raise ValueError("Missing required field: arrivalDate")
         arrival_date = date.fromisoformat(arrival_elem.text.strip())
 
         # Comes from (REQUIRED for secondary residence)
-        comes_elem = sec_elem.find('eCH-0011:comesFrom', ns)
+        comes_elem = secondary.find(namespace, 'comesFrom')
         if comes_elem is None:
             raise ValueError("Missing required field: comesFrom (required for secondary residence)")
         comes_from = ECH0011DestinationType.from_xml(comes_elem, namespace)
 
         # Dwelling address (required)
-        dwelling_elem = sec_elem.find('eCH-0011:dwellingAddress', ns)
-        if dwelling_elem is None:
-            raise ValueError("Missing required field: dwellingAddress")
-        dwelling_address = ECH0011DwellingAddress.from_xml(dwelling_elem, namespace)
+        dwelling_address = ECH0011DwellingAddress.from_xml(secondary.require(namespace, 'dwellingAddress'), namespace)
 
         # Departure date (optional)
-        departure_elem = sec_elem.find('eCH-0011:departureDate', ns)
-        departure_date = date.fromisoformat(departure_elem.text.strip()) if departure_elem is not None and departure_elem.text else None
+        departure_text = secondary.text(namespace, 'departureDate')
+        departure_date = date.fromisoformat(departure_text) if departure_text else None
 
         # Goes to (optional)
-        goes_elem = sec_elem.find('eCH-0011:goesTo', ns)
+        goes_elem = secondary.find(namespace, 'goesTo')
         goes_to = ECH0011DestinationType.from_xml(goes_elem, namespace) if goes_elem is not None else None
 
         return cls(
@@ -1875,40 +1794,41 @@ class ECH0011OtherResidence(ECHModel):
         secondary_residence_elem = elem.find(f"{{{ns}}}secondaryResidence")
         if secondary_residence_elem is None:
             raise ValueError("Missing required secondaryResidence element in otherResidence")
+        secondary = ChildIndex(secondary_residence_elem)
 
         # Parse reporting municipality
-        reporting_municipality_elem = secondary_residence_elem.find(f"{{{ns}}}reportingMunicipality")
+        reporting_municipality_elem = secondary.find(ns, 'reportingMunicipality')
         if reporting_municipality_elem is None:
             raise ValueError("Missing required reportingMunicipality in other residence")
         reporting_municipality = ECH0007Municipality.from_xml(reporting_municipality_elem, nsmap)
 
         # Parse arrival date
-        arrival_date_elem = secondary_residence_elem.find(f"{{{ns}}}arrivalDate")
+        arrival_date_elem = secondary.find(ns, 'arrivalDate')
         if arrival_date_elem is None:
             raise ValueError("Missing required arrivalDate in other residence")
         arrival_date = date.fromisoformat(arrival_date_elem.text)
 
         # Parse comes from (REQUIRED for other residence)
-        comes_from_elem = secondary_residence_elem.find(f"{{{ns}}}comesFrom")
+        comes_from_elem = secondary.find(ns, 'comesFrom')
         if comes_from_elem is None:
             raise ValueError("Missing required comesFrom in other residence")
         comes_from = ECH0011DestinationType.from_xml(comes_from_elem, nsmap)
 
         # Parse dwelling address
-        dwelling_address_elem = secondary_residence_elem.find(f"{{{ns}}}dwellingAddress")
+        dwelling_address_elem = secondary.find(ns, 'dwellingAddress')
         if dwelling_address_elem is None:
             raise ValueError("Missing required dwellingAddress in other residence")
         dwelling_address = ECH0011DwellingAddress.from_xml(dwelling_address_elem, nsmap)
 
         # Parse optional departure date
         departure_date = None
-        departure_date_elem = secondary_residence_elem.find(f"{{{ns}}}departureDate")
+        departure_date_elem = secondary.find(ns, 'departureDate')
         if departure_date_elem is not None and departure_date_elem.text:
             departure_date = date.fromisoformat(departure_date_elem.text)
 
         # Parse optional goes to
         goes_to = None
-        goes_to_elem = secondary_residence_elem.find(f"{{{ns}}}goesTo")
+        goes_to_elem = secondary.find(ns, 'goesTo')
         if goes_to_elem is not None:
             goes_to = ECH0011DestinationType.from_xml(goes_to_elem, nsmap)
 
@@ -2105,70 +2025,41 @@ class ECH0011Person(ECHModel):
         Raises:
             ValueError: If required fields missing or validation fails
         """
-        ns = {
-            'eCH-0011': namespace,
-            'eCH-0044': NS.ECH0044_V4
-        }
+        children = ChildIndex(elem)
 
         # Person identification (required, eCH-0044 type in eCH-0011 namespace)
         # Note: The element is in eCH-0011 namespace, but uses eCH-0044:personIdentificationType
-        person_id_elem = elem.find('eCH-0011:personIdentification', ns)
-        if person_id_elem is None:
-            raise ValueError("Missing required field: personIdentification")
+        person_id_elem = children.require(namespace, 'personIdentification')
         person_id = ECH0044PersonIdentification.from_xml(person_id_elem, NS.ECH0044_V4)
 
-        # Name data (required)
-        name_elem = elem.find('eCH-0011:nameData', ns)
-        if name_elem is None:
-            raise ValueError("Missing required field: nameData")
-        name_data = ECH0011NameData.from_xml(name_elem, namespace)
-
-        # Birth data (required)
-        birth_elem = elem.find('eCH-0011:birthData', ns)
-        if birth_elem is None:
-            raise ValueError("Missing required field: birthData")
-        birth_data = ECH0011BirthData.from_xml(birth_elem, namespace)
-
-        # Religion data (required)
-        religion_elem = elem.find('eCH-0011:religionData', ns)
-        if religion_elem is None:
-            raise ValueError("Missing required field: religionData")
-        religion_data = ECH0011ReligionData.from_xml(religion_elem, namespace)
-
-        # Marital data (required)
-        marital_elem = elem.find('eCH-0011:maritalData', ns)
-        if marital_elem is None:
-            raise ValueError("Missing required field: maritalData")
-        marital_data = ECH0011MaritalData.from_xml(marital_elem, namespace)
-
-        # Nationality data (required)
-        nationality_elem = elem.find('eCH-0011:nationalityData', ns)
-        if nationality_elem is None:
-            raise ValueError("Missing required field: nationalityData")
-        nationality_data = ECH0011NationalityData.from_xml(nationality_elem, namespace)
+        # Required data blocks
+        name_data = ECH0011NameData.from_xml(children.require(namespace, 'nameData'), namespace)
+        birth_data = ECH0011BirthData.from_xml(children.require(namespace, 'birthData'), namespace)
+        religion_data = ECH0011ReligionData.from_xml(children.require(namespace, 'religionData'), namespace)
+        marital_data = ECH0011MaritalData.from_xml(children.require(namespace, 'maritalData'), namespace)
+        nationality_data = ECH0011NationalityData.from_xml(children.require(namespace, 'nationalityData'), namespace)
 
         # Death data (optional)
-        death_elem = elem.find('eCH-0011:deathData', ns)
+        death_elem = children.find(namespace, 'deathData')
         death_data = ECH0011DeathData.from_xml(death_elem, namespace) if death_elem is not None else None
 
         # Contact data (optional)
-        contact_elem = elem.find('eCH-0011:contactData', ns)
+        contact_elem = children.find(namespace, 'contactData')
         contact_data = ECH0011ContactData.from_xml(contact_elem, namespace) if contact_elem is not None else None
 
         # Language of correspondance (optional)
-        lang_elem = elem.find('eCH-0011:languageOfCorrespondance', ns)
-        language = lang_elem.text.strip() if lang_elem is not None and lang_elem.text else None
+        language = children.text(namespace, 'languageOfCorrespondance')
 
         # Restricted voting rights (optional)
-        vote_elem = elem.find('eCH-0011:restrictedVotingAndElectionRightFederation', ns)
-        restricted_voting = vote_elem.text.strip().lower() == 'true' if vote_elem is not None and vote_elem.text else None
+        vote_text = children.text(namespace, 'restrictedVotingAndElectionRightFederation')
+        restricted_voting = vote_text.lower() == 'true' if vote_text is not None else None
 
         # Choice: placeOfOrigin OR residencePermit
         origins = []
-        for origin_elem in elem.findall('eCH-0011:placeOfOrigin', ns):
+        for origin_elem in children.findall(namespace, 'placeOfOrigin'):
             origins.append(ECH0011PlaceOfOrigin.from_xml(origin_elem, namespace))
 
-        permit_elem = elem.find('eCH-0011:residencePermit', ns)
+        permit_elem = children.find(namespace, 'residencePermit')
         permit = ECH0011ResidencePermitData.from_xml(permit_elem, namespace) if permit_elem is not None else None
 
         return cls(
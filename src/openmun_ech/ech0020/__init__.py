@@ -117,53 +117,50 @@ See Also:
     docs/TWO_LAYER_ARCHITECTURE_ROADMAP.md: Implementation status
 """
 
-# Import all Layer 2 models from models.py
-from .models import (
-    # Main API
-    BaseDeliveryPerson,
-    BaseDeliveryEvent,
-    DeliveryConfig,
-
-    # Supporting models
-    PersonIdentification,
-    ParentInfo,
-    GuardianInfo,
-    SecondaryResidenceInfo,
-    DwellingAddressInfo,
-    DestinationInfo,
-
-    # Layer 2 enums (CHOICE constraints)
-    ResidenceType,
-    ReportingType,
-    PlaceType,
-    GuardianType,
-    DatePrecision,
-)
-
-# Re-export eCH-0011 enums used in Layer 2 fields
-from openmun_ech.ech0011.enums import (
-    Sex,
-    MaritalStatus,
-    SeparationType,
-    NationalityStatus,
-    PartnershipAbolition,
-    ReligionCode,      # convenience — not exhaustive, BFS allows additional codes
-    LanguageCode,       # convenience — not exhaustive, XSD allows any ISO 639-1
-    TypeOfHousehold,
-    FederalRegister,
-)
-
-# Re-export eCH-0021 enums used in Layer 2 fields
-from openmun_ech.ech0021.enums import (
-    MrMrs,
-    TypeOfRelationship,
-    CareType,
-    KindOfEmployment,
-    DataLockType,
-)
-
-# Import Layer 1 for advanced users (production XML parsing)
-from .v3 import ECH0020Delivery
+from openmun_ech._lazy import lazy_exports
+
+# Exports are imported on first access (see openmun_ech/_lazy.py), so e.g.
+# ECH0020Delivery does not load the Layer 2 person module.
+_EXPORTS = {
+    # Layer 2 models (layer2/)
+    'BaseDeliveryPerson': '.layer2',
+    'BaseDeliveryEvent': '.layer2',
+    'DeliveryConfig': '.layer2',
+    'PersonIdentification': '.layer2',
+    'ParentInfo': '.layer2',
+    'GuardianInfo': '.layer2',
+    'SecondaryResidenceInfo': '.layer2',
+    'DwellingAddressInfo': '.layer2',
+    'DestinationInfo': '.layer2',
+    'ResidenceType': '.layer2',
+    'ReportingType': '.layer2',
+    'PlaceType': '.layer2',
+    'GuardianType': '.layer2',
+    'DatePrecision': '.layer2',
+
+    # Re-exported eCH-0011 enums used in Layer 2 fields
+    'Sex': 'openmun_ech.ech0011.enums',
+    'MaritalStatus': 'openmun_ech.ech0011.enums',
+    'SeparationType': 'openmun_ech.ech0011.enums',
+    'NationalityStatus': 'openmun_ech.ech0011.enums',
+    'PartnershipAbolition': 'openmun_ech.ech0011.enums',
+    'ReligionCode': 'openmun_ech.ech0011.enums',   # convenience — not exhaustive, BFS allows additional codes
+    'LanguageCode': 'openmun_ech.ech0011.enums',   # convenience — not exhaustive, XSD allows any ISO 639-1
+    'TypeOfHousehold': 'openmun_ech.ech0011.enums',
+    'FederalRegister': 'openmun_ech.ech0011.enums',
+
+    # Re-exported eCH-0021 enums used in Layer 2 fields
+    'MrMrs': 'openmun_ech.ech0021.enums',
+    'TypeOfRelationship': 'openmun_ech.ech0021.enums',
+    'CareType': 'openmun_ech.ech0021.enums',
+    'KindOfEmployment': 'openmun_ech.ech0021.enums',
+    'DataLockType': 'openmun_ech.ech0021.enums',
+
+    # Layer 1 for advanced users (production XML parsing)
+    'ECH0020Delivery': '.v3',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Main API - Start here for creating deliveries
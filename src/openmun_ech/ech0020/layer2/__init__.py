@@ -24,6 +24,7 @@ from .event import (
     ResidenceType, SecondaryResidenceInfo, DwellingAddressInfo,
     DestinationInfo, BaseDeliveryEvent,
 )
+from .factory import DeliveryFactory
 
 __all__ = [
     'DeliveryConfig',
@@ -32,6 +33,7 @@ __all__ = [
     'BaseDeliveryPerson',
     'ResidenceType', 'SecondaryResidenceInfo', 'DwellingAddressInfo',
     'DestinationInfo', 'BaseDeliveryEvent',
+    'DeliveryFactory',
     # Public helper API
     'extract_date_of_birth', 'extract_date_of_birth_with_precision',
     'extract_person_identification', 'date_to_partially_known',
@@ -0,0 +1,335 @@
+"""eCH-0020 Layer 2: Columnar export of base delivery persons.
+
+Writes BaseDeliveryPerson records as flat tables (one column per Layer 2
+field) so analytical scans do not have to re-parse eCH-0020 XML, and reads
+them back into validated Layer 2 models.
+
+Formats (chosen by file suffix unless `format` is given):
+- parquet (.parquet): requires pyarrow (optional dependency)
+- ndjson (.ndjson, .jsonl): pure Python, one JSON object per person
+- csv (.csv): pure Python, header row = Layer 2 field names
+
+Column encoding:
+- str / Enum fields: string (Enum value)
+- bool fields: boolean ('true'/'false' in CSV)
+- date fields: date (ISO 8601 string in NDJSON/CSV)
+- structured fields (places_of_origin, nationalities, parents, guardians, ...):
+  JSON text (nested JSON in NDJSON)
+
+Design:
+- Lossless: read-back goes through BaseDeliveryPerson validation and yields
+  models equal to the exported ones
+- Streaming: records are consumed and written in batches of `batch_size`
+- CSV cannot distinguish '' from a missing value, so empty strings are rejected
+  on CSV export (use NDJSON or Parquet)
+
+Usage:
+    from openmun_ech.ech0020.layer2.columnar import write_columnar, read_columnar
+
+    write_columnar(delivery.event, 'persons.parquet')
+    for person in read_columnar('persons.parquet'):
+        ...
+"""
+
+import csv
+import json
+from datetime import date
+from enum import Enum
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, get_args, get_origin
+
+from openmun_ech.ech0020.v3 import ECH0020BaseDeliveryPerson, ECH0020EventBaseDelivery
+
+from .person import BaseDeliveryPerson
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+FORMATS = ('parquet', 'ndjson', 'csv')
+
+_SUFFIX_FORMATS = {
+    '.parquet': 'parquet',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+}
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+# ============================================================================
+# COLUMN SCHEMA (derived from BaseDeliveryPerson field annotations)
+# ============================================================================
+
+def _column_kind(annotation: Any) -> str:
+    """Classify a field annotation as 'str', 'bool', 'date' or 'json'."""
+    if get_origin(annotation) is Union:
+        non_none = [a for a in get_args(annotation) if a is not type(None)]
+        if len(non_none) != 1:
+            return 'json'
+        annotation = non_none[0]
+    if not isinstance(annotation, type):
+        return 'json'  # List[...], Dict[...]
+    if issubclass(annotation, bool):
+        return 'bool'
+    if issubclass(annotation, date):
+        return 'date'
+    if issubclass(annotation, (str, Enum)):
+        return 'str'
+    return 'json'
+
+
+COLUMNS: Dict[str, str] = {
+    name: _column_kind(field_info.annotation)
+    for name, field_info in BaseDeliveryPerson.model_fields.items()
+}
+"""Layer 2 field name → column kind, in BaseDeliveryPerson declaration order."""
+
+
+# ============================================================================
+# RECORD NORMALIZATION AND BATCHING
+# ============================================================================
+
+PersonRecord = Union[BaseDeliveryPerson, ECH0020EventBaseDelivery, ECH0020BaseDeliveryPerson]
+
+
+def _as_person(record: Any) -> BaseDeliveryPerson:
+    """Convert a supported record type to a Layer 2 BaseDeliveryPerson."""
+    if isinstance(record, BaseDeliveryPerson):
+        return record
+    if isinstance(record, ECH0020EventBaseDelivery):
+        return BaseDeliveryPerson.from_ech0020(record.base_delivery_person)
+    if isinstance(record, ECH0020BaseDeliveryPerson):
+        return BaseDeliveryPerson.from_ech0020(record)
+    # BaseDeliveryEvent (avoid circular import: event.py imports person.py)
+    person = getattr(record, 'person', None)
+    if isinstance(person, BaseDeliveryPerson):
+        return person
+    raise TypeError(
+        f"Cannot export {type(record).__name__}: expected BaseDeliveryPerson, "
+        f"BaseDeliveryEvent, ECH0020EventBaseDelivery or ECH0020BaseDeliveryPerson"
+    )
+
+
+def _encode_row(person: BaseDeliveryPerson) -> Dict[str, Any]:
+    """Flatten one person into column values (None for absent fields)."""
+    data = person.model_dump(mode='json')
+    row = {}
+    for name, kind in COLUMNS.items():
+        value = data[name]
+        if value is None:
+            row[name] = None
+        elif kind == 'json':
+            row[name] = json.dumps(value, ensure_ascii=False)
+        elif kind == 'date':
+            row[name] = getattr(person, name)
+        else:
+            row[name] = value
+    return row
+
+
+def iter_column_batches(
+    records: Iterable[PersonRecord],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Dict[str, List[Any]]]:
+    """Stream records as columnar batches (field name → list of values).
+
+    Args:
+        records: BaseDeliveryPerson, BaseDeliveryEvent, ECH0020EventBaseDelivery
+                 or ECH0020BaseDeliveryPerson instances (may be mixed)
+        batch_size: Maximum number of rows per batch
+
+    Yields:
+        Dict with one list per column in COLUMNS order; structured fields are JSON text
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    iterator = iter(records)
+    while True:
+        rows = [_encode_row(_as_person(record)) for record in islice(iterator, batch_size)]
+        if not rows:
+            return
+        yield {name: [row[name] for row in rows] for name in COLUMNS}
+
+
+def _batch_len(batch: Dict[str, List[Any]]) -> int:
+    return len(next(iter(batch.values())))
+
+
+def _decode_row(row: Dict[str, Any], empty_is_absent: bool = False) -> Dict[str, Any]:
+    """Turn stored column values back into BaseDeliveryPerson input."""
+    decoded = {}
+    for name, value in row.items():
+        if value is None or name not in COLUMNS or (empty_is_absent and value == ''):
+            continue
+        if COLUMNS[name] == 'json' and isinstance(value, str):
+            value = json.loads(value)
+        decoded[name] = value
+    return decoded
+
+
+# ============================================================================
+# WRITE
+# ============================================================================
+
+def _resolve_format(path: Path, format: Optional[str]) -> str:
+    if format is None:
+        format = _SUFFIX_FORMATS.get(path.suffix.lower())
+        if format is None:
+            raise ValueError(
+                f"Cannot infer columnar format from suffix '{path.suffix}'; "
+                f"pass format= one of {FORMATS}"
+            )
+    if format not in FORMATS:
+        raise ValueError(f"Unknown columnar format '{format}', expected one of {FORMATS}")
+    if format == 'parquet' and not HAS_PYARROW:
+        raise ImportError(
+            "pyarrow is required for Parquet export. "
+            "Install with: pip install pyarrow (or use .ndjson / .csv)"
+        )
+    return format
+
+
+def _arrow_schema() -> 'pa.Schema':
+    types = {'str': pa.string(), 'json': pa.string(), 'bool': pa.bool_(), 'date': pa.date32()}
+    return pa.schema([(name, types[kind]) for name, kind in COLUMNS.items()])
+
+
+def write_columnar(
+    records: Iterable[PersonRecord],
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Write person records to a columnar file.
+
+    Args:
+        records: Records accepted by iter_column_batches()
+        path: Output file path
+        format: 'parquet', 'ndjson' or 'csv' (default: inferred from suffix)
+        batch_size: Rows per batch (Parquet row group size)
+
+    Returns:
+        Number of persons written
+
+    Raises:
+        ImportError: If Parquet is requested but pyarrow is not installed
+        ValueError: If the format is unknown, or CSV export meets an empty string
+    """
+    path = Path(path)
+    format = _resolve_format(path, format)
+    batches = iter_column_batches(records, batch_size)
+    count = 0
+
+    if format == 'parquet':
+        schema = _arrow_schema()
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in batches:
+                writer.write_batch(pa.RecordBatch.from_pydict(batch, schema=schema))
+                count += _batch_len(batch)
+        return count
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if format == 'ndjson':
+            for batch in batches:
+                for i in range(_batch_len(batch)):
+                    obj = {}
+                    for name, kind in COLUMNS.items():
+                        value = batch[name][i]
+                        if value is None:
+                            continue
+                        if kind == 'json':
+                            value = json.loads(value)
+                        elif kind == 'date':
+                            value = value.isoformat()
+                        obj[name] = value
+                    f.write(json.dumps(obj, ensure_ascii=False))
+                    f.write('\n')
+                    count += 1
+        else:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for batch in batches:
+                for i in range(_batch_len(batch)):
+                    writer.writerow([
+                        _csv_cell(name, kind, batch[name][i]) for name, kind in COLUMNS.items()
+                    ])
+                    count += 1
+    return count
+
+
+def _csv_cell(name: str, kind: str, value: Any) -> str:
+    if value is None:
+        return ''
+    if kind == 'bool':
+        return 'true' if value else 'false'
+    if kind == 'date':
+        return value.isoformat()
+    if value == '':
+        raise ValueError(
+            f"Field '{name}' is an empty string, which CSV cannot distinguish from "
+            f"a missing value. Use NDJSON or Parquet for this data."
+        )
+    return value
+
+
+# ============================================================================
+# READ
+# ============================================================================
+
+def iter_columnar_rows(
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[List[Dict[str, Any]]]:
+    """Read a columnar file as batches of BaseDeliveryPerson input dicts.
+
+    Absent values are omitted and structured fields are decoded from JSON,
+    so each dict can be passed to BaseDeliveryPerson.bulk_from_rows().
+    """
+    path = Path(path)
+    format = _resolve_format(path, format)
+
+    if format == 'parquet':
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield [_decode_row(row) for row in record_batch.to_pylist()]
+        return
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if format == 'ndjson':
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        empty_is_absent = format == 'csv'
+        while True:
+            batch = [_decode_row(row, empty_is_absent) for row in islice(rows, batch_size)]
+            if not batch:
+                return
+            yield batch
+
+
+def read_columnar(
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    trusted: bool = False
+) -> Iterator[BaseDeliveryPerson]:
+    """Read a columnar file back into validated BaseDeliveryPerson models.
+
+    Args:
+        path: File written by write_columnar()
+        format: 'parquet', 'ndjson' or 'csv' (default: inferred from suffix)
+        batch_size: Rows per batch
+        trusted: Passed to BaseDeliveryPerson.bulk_from_rows() (batch-wise CHOICE checks)
+
+    Yields:
+        BaseDeliveryPerson in file order
+    """
+    for rows in iter_columnar_rows(path, format, batch_size):
+        yield from BaseDeliveryPerson.bulk_from_rows(rows, trusted=trusted)
@@ -1336,49 +1336,15 @@ class BaseDeliveryEvent(BaseModel):
         **optional_header_fields
     ) -> ECH0020Delivery:
         """Create complete eCH-0020 delivery ready for XML export."""
-        # Step 1: Auto-generate message_id if not provided (UUID)
-        if message_id is None:
-            message_id = str(uuid4())
-
-        # Step 2: Default message_date to now() if not provided
-        if message_date is None:
-            message_date = datetime.now(timezone.utc)
-
-        # Step 3: Determine message_type
-        message_type = config.message_type_override or NS.ECH0020_V3
-
-        # Step 4: Build ECH0058SendingApplication from config
-        sending_application = ECH0058SendingApplication(
-            manufacturer=config.manufacturer,
-            product=config.product,
-            product_version=config.product_version
+        # Step 1: Build the deliveryHeader from config (see build_delivery_header)
+        ech0020_header = build_delivery_header(
+            config, message_id, message_date, action, **optional_header_fields
         )
 
-        # Step 5: Build ECH0058Header
-        ech0058_header = ECH0058Header(
-            sender_id=config.sender_id,
-            message_id=message_id,
-            message_type=message_type,
-            sending_application=sending_application,
-            message_date=message_date,
-            action=action,
-            test_delivery_flag=config.test_delivery_flag,
-            original_sender_id=config.original_sender_id,
-            **optional_header_fields
-        )
-
-        # Step 6: Build ECH0020Header wrapper
-        ech0020_header = ECH0020Header(
-            header=ech0058_header,
-            data_lock=None,
-            data_lock_valid_from=None,
-            data_lock_valid_till=None
-        )
-
-        # Step 7: Convert Layer 2 event to Layer 1 event
+        # Step 2: Convert Layer 2 event to Layer 1 event
         event_layer1 = self.to_ech0020_event()
 
-        # Step 8: Construct complete ECH0020Delivery
+        # Step 3: Construct complete ECH0020Delivery
         delivery = ECH0020Delivery(
             delivery_header=ech0020_header,
             event=[event_layer1],
@@ -1386,3 +1352,53 @@ class BaseDeliveryEvent(BaseModel):
         )
 
         return delivery
+
+
+# ============================================================================
+# DELIVERY HEADER
+# ============================================================================
+
+
+def build_delivery_header(
+    config: DeliveryConfig,
+    message_id: Optional[str] = None,
+    message_date: Optional[datetime] = None,
+    action: ActionType = ActionType.NEW,
+    **optional_header_fields
+) -> ECH0020Header:
+    """Build the eCH-0020 deliveryHeader (eCH-0058 v5 header) from config.
+
+    Shared by finalize(), finalize_0020_base(), DeliveryFactory and the
+    streaming writer, so every delivery carries the same header fields.
+
+    Args:
+        config: Deployment configuration
+        message_id: Unique message ID (auto-generated UUID if None)
+        message_date: Message timestamp (now, UTC if None)
+        action: eCH-0058 action
+        **optional_header_fields: Additional eCH-0058 header fields
+
+    Raises:
+        ValidationError: If a header field is invalid
+    """
+    header = ECH0058Header(
+        sender_id=config.sender_id,
+        message_id=message_id if message_id is not None else str(uuid4()),
+        message_type=config.message_type_override or NS.ECH0020_V3,
+        sending_application=ECH0058SendingApplication(
+            manufacturer=config.manufacturer,
+            product=config.product,
+            product_version=config.product_version
+        ),
+        message_date=message_date if message_date is not None else datetime.now(timezone.utc),
+        action=action,
+        test_delivery_flag=config.test_delivery_flag,
+        original_sender_id=config.original_sender_id,
+        **optional_header_fields
+    )
+    return ECH0020Header(
+        header=header,
+        data_lock=None,
+        data_lock_valid_from=None,
+        data_lock_valid_till=None
+    )
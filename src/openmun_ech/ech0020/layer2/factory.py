@@ -0,0 +1,194 @@
+"""eCH-0020 Layer 2: Reusable delivery factory for repeated finalize() calls.
+
+BaseDeliveryEvent.finalize() rebuilds and re-validates the sending application,
+eCH-0058 header and eCH-0020 header for every delivery, although only
+messageId, messageDate and action change between messages of one deployment.
+
+DeliveryFactory does the static work once:
+- Validates the header built from DeliveryConfig (+ optional header fields)
+- Pre-serializes the deliveryHeader (ech0058.codec.HeaderTemplate) with
+  slots for the three per-message values, and the root element around it
+
+Per message it only validates and stamps messageId, messageDate and action.
+
+Usage:
+    factory = DeliveryFactory(config)
+
+    delivery = factory.build(event)            # Layer 1 ECH0020Delivery
+    xml_bytes = factory.to_bytes(event)        # Serialized XML document
+
+Equivalence:
+    factory.build(event, message_id=m, message_date=d, action=a) equals
+    event.finalize(config, message_id=m, message_date=d, action=a).
+    factory.to_bytes() parses back to the same delivery; namespace declarations
+    are placed on deliveryHeader and baseDelivery instead of the root element.
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from uuid import uuid4
+
+from openmun_ech.core import NS
+from openmun_ech.ech0020.v3 import ECH0020Delivery
+from openmun_ech.ech0058 import ECH0058Header, ActionType
+from openmun_ech.ech0058.codec import HeaderTemplate
+
+from .config import DeliveryConfig
+from .event import BaseDeliveryEvent, build_delivery_header
+
+
+# Per-message header fields
+_STAMPED_FIELDS = ('message_id', 'message_date', 'action')
+
+_BODY_MARKER = '__openmun_event_body__'
+
+
+class DeliveryFactory:
+    """Build eCH-0020 deliveries from one DeliveryConfig with a cached header.
+
+    Args:
+        config: Deployment configuration (same as for finalize())
+        pretty_print: Indent to_bytes() output like ECH0020Delivery.to_file()
+        encoding: to_bytes() output encoding
+        **optional_header_fields: Static optional eCH-0058 header fields
+            (e.g. recipient_id, comment), validated once
+
+    Raises:
+        ValidationError: If config or optional header fields are invalid
+    """
+
+    def __init__(
+        self,
+        config: DeliveryConfig,
+        pretty_print: bool = True,
+        encoding: str = 'utf-8',
+        **optional_header_fields
+    ):
+        self.config = config
+        self.pretty_print = pretty_print
+        self.encoding = encoding
+
+        # Placeholder message values: stamped per message, never emitted
+        self._delivery_header_template = build_delivery_header(
+            config,
+            message_id='template',
+            message_date=datetime(2000, 1, 1, tzinfo=timezone.utc),
+            **optional_header_fields
+        )
+        self._header_template = self._delivery_header_template.header
+        self._header_text = HeaderTemplate(
+            self._header_template,
+            wrapper=f'{{{NS.ECH0020_V3}}}deliveryHeader',
+            slots=_STAMPED_FIELDS,
+            pretty_print=pretty_print,
+            level=1,
+        )
+        self._prefix, self._separator, self._suffix = self._compile_root()
+
+    # ------------------------------------------------------------------------
+    # Template compilation
+    # ------------------------------------------------------------------------
+
+    def _compile_root(self) -> Tuple[str, str, str]:
+        """Serialize the delivery root once: text before deliveryHeader, between
+        deliveryHeader and the event body, and after the body."""
+        ns = NS.ECH0020_V3
+        root = ET.Element(f'{{{ns}}}delivery')
+        root.set('version', '3.0')
+        ET.SubElement(root, f'{{{ns}}}{_BODY_MARKER}')
+        if self.pretty_print:
+            ET.indent(root, space='  ')
+        text = ET.tostring(root, encoding='unicode')
+
+        # "<root ...>\n  <marker />\n</root>": the marker stands for each child
+        start_tag_end = text.index('>') + 1
+        marker_start = text.rindex('<', 0, text.index(_BODY_MARKER))
+        marker_end = text.index('/>', marker_start) + len('/>')
+        separator = text[start_tag_end:marker_start]
+        # The marker's tail (newline before </delivery>) comes from the body's tail
+        suffix = text[marker_end:]
+        suffix = suffix[suffix.index('</'):]
+
+        declaration = f"<?xml version='1.0' encoding='{self.encoding}'?>\n"
+        return declaration + text[:start_tag_end] + separator, separator, suffix
+
+    # ------------------------------------------------------------------------
+    # Per-message stamping
+    # ------------------------------------------------------------------------
+
+    def _stamp_header(
+        self,
+        message_id: Optional[str],
+        message_date: Optional[datetime],
+        action: ActionType
+    ) -> ECH0058Header:
+        """Copy the validated header template and validate the per-message fields."""
+        if message_id is None:
+            message_id = str(uuid4())
+        if message_date is None:
+            message_date = datetime.now(timezone.utc)
+
+        return self._header_text.stamp(
+            message_id=message_id, message_date=message_date, action=action,
+        )
+
+    def build(
+        self,
+        event: BaseDeliveryEvent,
+        message_id: Optional[str] = None,
+        message_date: Optional[datetime] = None,
+        action: ActionType = ActionType.NEW
+    ) -> ECH0020Delivery:
+        """Create a complete ECH0020Delivery (same result as event.finalize(config)).
+
+        Args:
+            event: Layer 2 event to deliver
+            message_id: Unique message ID (auto-generated UUID if None)
+            message_date: Timezone-aware message date (now, UTC if None)
+            action: eCH-0058 action
+
+        Raises:
+            ValidationError: If message_id, message_date or action is invalid
+        """
+        header = self._stamp_header(message_id, message_date, action)
+        delivery_header = self._delivery_header_template.model_copy(update={'header': header})
+        return ECH0020Delivery(
+            delivery_header=delivery_header,
+            event=[event.to_ech0020_event()],
+            version="3.0"
+        )
+
+    def to_bytes(
+        self,
+        event: BaseDeliveryEvent,
+        message_id: Optional[str] = None,
+        message_date: Optional[datetime] = None,
+        action: ActionType = ActionType.NEW
+    ) -> bytes:
+        """Serialize a complete delivery document using the pre-serialized header.
+
+        Arguments and validation as for build().
+
+        Returns:
+            Encoded XML document (with XML declaration)
+        """
+        header = self._stamp_header(message_id, message_date, action)
+
+        delivery = ECH0020Delivery(
+            delivery_header=self._delivery_header_template,
+            event=[event.to_ech0020_event()],
+            version="3.0"
+        )
+        # Serialize only the event body; the header comes from the template
+        ns = NS.ECH0020_V3
+        root = ET.Element(f'{{{ns}}}delivery')
+        delivery._events_to_xml(root, ns)
+        if self.pretty_print:
+            ET.indent(root, space='  ')
+        body = ET.tostring(root[0], encoding='unicode')
+
+        parts = (
+            self._prefix, self._header_text.fill(header), self._separator, body, self._suffix,
+        )
+        return ''.join(parts).encode(self.encoding)
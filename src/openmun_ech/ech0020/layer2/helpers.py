@@ -1,8 +1,16 @@
-"""eCH-0020 Layer 2: Layer 1 to Layer 2 extraction helpers."""
+"""eCH-0020 Layer 2: Layer 1 to Layer 2 extraction helpers.
+
+Also provides the shared Layer 1 value objects (places, countries) used by
+to_ech0020(), so equal places are one object across all persons of an export.
+"""
 
 from datetime import date
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
+from openmun_ech.ech0007 import CantonAbbreviation, ECH0007Municipality, ECH0007SwissMunicipality
+from openmun_ech.ech0008 import ECH0008Country
+from openmun_ech.ech0011 import ECH0011GeneralPlace
 from openmun_ech.ech0044 import (
     ECH0044PersonIdentification,
     ECH0044PersonIdentificationLight,
@@ -13,6 +21,10 @@ from openmun_ech.ech0044 import (
 from .types import DatePrecision, PersonIdentification
 
 
+# Distinct values kept per shared-object cache (places, countries, dates)
+_SHARED_CACHE_SIZE = 4096
+
+
 # ============================================================================
 # LAYER 1 → LAYER 2 EXTRACTION HELPERS
 # ============================================================================
@@ -60,6 +72,7 @@ def extract_date_of_birth_with_precision(
     return None, DatePrecision.FULL
 
 
+@lru_cache(maxsize=_SHARED_CACHE_SIZE)
 def date_to_partially_known(
     d: date,
     precision: DatePrecision,
@@ -67,7 +80,8 @@ def date_to_partially_known(
     """Construct ECH0044DatePartiallyKnown from a date and precision.
 
     Uses the ECH0044DatePartiallyKnown factory methods to create the
-    correct XSD CHOICE branch based on precision.
+    correct XSD CHOICE branch based on precision. The result is frozen and
+    shared between calls with equal arguments.
     """
     if precision == DatePrecision.YEAR_MONTH:
         return ECH0044DatePartiallyKnown.from_year_month(d.year, d.month)
@@ -112,6 +126,68 @@ def extract_person_identification(
     )
 
 
+# ============================================================================
+# LAYER 2 → LAYER 1 SHARED VALUE OBJECTS
+# ============================================================================
+#
+# Places and countries are frozen Layer 1 models. A registry export repeats the
+# same birth places and nationalities for thousands of persons, so they are
+# built (and validated) once per distinct value and then shared. Validation
+# errors are not cached: invalid values raise on every call.
+
+
+UNKNOWN_PLACE = ECH0011GeneralPlace(unknown=True)
+"""Shared 'unknown' general place."""
+
+
+@lru_cache(maxsize=_SHARED_CACHE_SIZE)
+def shared_country(
+    country_id: Optional[str],
+    country_iso: Optional[str],
+    country_name_short: Optional[str],
+) -> ECH0008Country:
+    """Return the shared ECH0008Country for these values."""
+    return ECH0008Country(
+        country_id=country_id,
+        country_id_iso2=country_iso,
+        country_name_short=country_name_short
+    )
+
+
+@lru_cache(maxsize=_SHARED_CACHE_SIZE)
+def shared_swiss_place(
+    municipality_id: Optional[str],
+    municipality_name: Optional[str],
+    canton_abbreviation: Optional[CantonAbbreviation],
+    history_municipality_id: Optional[str],
+) -> ECH0011GeneralPlace:
+    """Return the shared Swiss municipality ECH0011GeneralPlace for these values."""
+    return ECH0011GeneralPlace(
+        swiss_municipality=ECH0007Municipality(
+            swiss_municipality=ECH0007SwissMunicipality(
+                municipality_id=municipality_id,
+                municipality_name=municipality_name,
+                canton_abbreviation=canton_abbreviation,
+                history_municipality_id=history_municipality_id
+            )
+        )
+    )
+
+
+@lru_cache(maxsize=_SHARED_CACHE_SIZE)
+def shared_foreign_place(
+    country_id: Optional[str],
+    country_iso: Optional[str],
+    country_name_short: Optional[str],
+    town: Optional[str] = None,
+) -> ECH0011GeneralPlace:
+    """Return the shared foreign ECH0011GeneralPlace for these values."""
+    return ECH0011GeneralPlace(
+        foreign_country=shared_country(country_id, country_iso, country_name_short),
+        foreign_town=town
+    )
+
+
 # Deprecated aliases — use the unprefixed versions
 _extract_date_of_birth = extract_date_of_birth
 _extract_person_identification = extract_person_identification
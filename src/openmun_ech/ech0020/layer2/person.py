@@ -28,8 +28,8 @@ Type 2 "Duplication" (Relationships):
 """
 
 from datetime import date
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, ValidationInfo
 
 # Import Layer 1 models for conversion
 from openmun_ech.ech0020.v3 import (
@@ -58,7 +58,6 @@ from openmun_ech.ech0011 import (
     ECH0011DeathPeriod,
     ECH0011DeathData,
     ECH0011ContactData,
-    ECH0011GeneralPlace,
     ECH0011ForeignerName,
     ECH0011PartnerIdOrganisation,
     ECH0011DwellingAddress,
@@ -100,8 +99,6 @@ from openmun_ech.ech0011.enums import (
     SeparationType,
     PartnershipAbolition,
 )
-from openmun_ech.ech0007 import ECH0007Municipality, ECH0007SwissMunicipality
-from openmun_ech.ech0008 import ECH0008Country
 from openmun_ech.ech0010 import (
     ECH0010MailAddress,
     ECH0010PersonMailAddress,
@@ -116,6 +113,10 @@ from .helpers import (
     extract_date_of_birth_with_precision,
     extract_person_identification,
     date_to_partially_known,
+    shared_country,
+    shared_foreign_place,
+    shared_swiss_place,
+    UNKNOWN_PLACE,
     _extract_date_of_birth,
     _extract_person_identification,
 )
@@ -129,6 +130,17 @@ from .types import (
 )
 
 
+# Validation context marking a batch whose CHOICE constraints were already
+# checked column-wise by BaseDeliveryPerson.bulk_from_rows(trusted=True).
+_BULK_TRUSTED_KEY = 'bulk_choices_checked'
+_BULK_TRUSTED_CONTEXT = {_BULK_TRUSTED_KEY: True}
+
+
+def _choices_prechecked(info: ValidationInfo) -> bool:
+    """True if the CHOICE model validators may skip (batch already checked)."""
+    return bool(info.context) and info.context.get(_BULK_TRUSTED_KEY, False)
+
+
 # ============================================================================
 # LAYER 2 MAIN MODEL: BASE DELIVERY PERSON
 # ============================================================================
@@ -856,8 +868,11 @@ class BaseDeliveryPerson(BaseModel):
         return v
 
     @model_validator(mode='after')
-    def validate_citizenship_choice(self) -> 'BaseDeliveryPerson':
+    def validate_citizenship_choice(self, info: ValidationInfo) -> 'BaseDeliveryPerson':
         """Validate CHOICE: Exactly ONE of places_of_origin OR residence_permit must be present."""
+        if _choices_prechecked(info):
+            return self
+
         has_origin = self.places_of_origin is not None and len(self.places_of_origin) > 0
         has_permit = self.residence_permit is not None
 
@@ -875,8 +890,11 @@ class BaseDeliveryPerson(BaseModel):
         return self
 
     @model_validator(mode='after')
-    def validate_birth_place_data(self) -> 'BaseDeliveryPerson':
+    def validate_birth_place_data(self, info: ValidationInfo) -> 'BaseDeliveryPerson':
         """Validate birth place data based on birth_place_type (XSD CHOICE)."""
+        if _choices_prechecked(info):
+            return self
+
         _swiss_fields = (
             self.birth_municipality_bfs, self.birth_municipality_name,
             self.birth_canton_abbreviation, self.birth_municipality_history_id,
@@ -913,8 +931,11 @@ class BaseDeliveryPerson(BaseModel):
         return self
 
     @model_validator(mode='after')
-    def validate_foreign_name_choice(self) -> 'BaseDeliveryPerson':
+    def validate_foreign_name_choice(self, info: ValidationInfo) -> 'BaseDeliveryPerson':
         """Validate CHOICE: At most ONE of name_on_foreign_passport OR declared_foreign_name."""
+        if _choices_prechecked(info):
+            return self
+
         has_passport_name = self.name_on_foreign_passport is not None
         has_declared_name = self.declared_foreign_name is not None
 
@@ -927,8 +948,11 @@ class BaseDeliveryPerson(BaseModel):
         return self
 
     @model_validator(mode='after')
-    def validate_contact_data(self) -> 'BaseDeliveryPerson':
+    def validate_contact_data(self, info: ValidationInfo) -> 'BaseDeliveryPerson':
         """Validate contact data: CHOICE constraint and required fields."""
+        if _choices_prechecked(info):
+            return self
+
         # Check if any contact fields are provided
         has_person_name = self.contact_person_official_name is not None
         has_org_name = self.contact_organization_name is not None
@@ -962,6 +986,128 @@ class BaseDeliveryPerson(BaseModel):
 
         return self
 
+    # ========================================================================
+    # BULK CONSTRUCTION (registry imports)
+    # ========================================================================
+
+    @classmethod
+    def bulk_from_rows(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        trusted: bool = False
+    ) -> List['BaseDeliveryPerson']:
+        """Construct many persons from row dicts (e.g., database query results).
+
+        With trusted=False every row goes through model_validate() exactly like
+        BaseDeliveryPerson(**row).
+
+        With trusted=True the CHOICE constraints (citizenship, birth place,
+        foreign name, contact data) are checked once for the whole batch,
+        column by column, before any instance is built. Instances are then
+        created with full field validation but without re-running the CHOICE
+        model validators per instance. The CHOICE rules are identical in both
+        modes; only where they run differs.
+
+        Args:
+            rows: Mappings keyed by BaseDeliveryPerson field names
+            trusted: Check CHOICE constraints batch-wise instead of per instance
+
+        Returns:
+            List of BaseDeliveryPerson in input order
+
+        Raises:
+            ValueError: If a row violates a CHOICE constraint (message names the row index)
+            ValidationError: If a row fails field validation
+        """
+        rows = list(rows)
+        if not trusted:
+            return [cls.model_validate(row) for row in rows]
+
+        cls._check_choice_columns(rows)
+        return [cls.model_validate(row, context=_BULK_TRUSTED_CONTEXT) for row in rows]
+
+    @staticmethod
+    def _check_choice_columns(rows: List[Mapping[str, Any]]) -> None:
+        """Column-wise equivalent of the CHOICE model validators for a batch.
+
+        Raises ValueError for the first offending row. Rows with a missing or
+        invalid birth_place_type are skipped here; field validation rejects them.
+        """
+        def column(name: str) -> list:
+            return [row.get(name) for row in rows]
+
+        def fail(index: int, message: str) -> None:
+            raise ValueError(f"Row {index}: {message}")
+
+        # Citizenship CHOICE: places_of_origin XOR residence_permit
+        for i, (origin, permit) in enumerate(zip(column('places_of_origin'), column('residence_permit'))):
+            has_origin = origin is not None and len(origin) > 0
+            has_permit = permit is not None
+            if not has_origin and not has_permit:
+                fail(i, "Must provide either places_of_origin (Swiss citizen) "
+                        "OR residence_permit (foreign national)")
+            if has_origin and has_permit:
+                fail(i, "Cannot provide both places_of_origin AND residence_permit "
+                        "(XSD CHOICE constraint)")
+
+        # Birth place CHOICE: unknown XOR swiss XOR foreign
+        swiss_columns = list(zip(
+            column('birth_municipality_bfs'), column('birth_municipality_name'),
+            column('birth_canton_abbreviation'), column('birth_municipality_history_id'),
+        ))
+        foreign_columns = list(zip(
+            column('birth_country_id'), column('birth_country_iso'),
+            column('birth_country_name_short'),
+        ))
+        place_types = {member.value: member for member in PlaceType}
+        for i, place_type in enumerate(column('birth_place_type')):
+            place_type = place_types.get(place_type)
+            if place_type is None:
+                continue
+            swiss_fields = swiss_columns[i]
+            foreign_fields = foreign_columns[i]
+            if place_type == PlaceType.SWISS:
+                if not swiss_fields[0]:
+                    fail(i, "Swiss birth requires birth_municipality_bfs")
+                if foreign_fields.count(None) != len(foreign_fields):
+                    fail(i, "Swiss birth cannot have foreign birth fields "
+                            "(birth_country_id, birth_country_iso, birth_country_name_short)")
+            elif place_type == PlaceType.FOREIGN:
+                if not foreign_fields[1]:
+                    fail(i, "Foreign birth requires birth_country_iso")
+                if swiss_fields.count(None) != len(swiss_fields):
+                    fail(i, "Foreign birth cannot have Swiss birth fields "
+                            "(birth_municipality_bfs, birth_municipality_name, "
+                            "birth_canton_abbreviation, birth_municipality_history_id)")
+            elif (swiss_fields + foreign_fields).count(None) != len(swiss_fields) + len(foreign_fields):
+                fail(i, "Unknown birth place cannot have Swiss or foreign birth fields")
+
+        # Foreign name CHOICE: at most one
+        for i, (passport, declared) in enumerate(zip(
+            column('name_on_foreign_passport'), column('declared_foreign_name')
+        )):
+            if passport is not None and declared is not None:
+                fail(i, "Cannot provide both name_on_foreign_passport AND declared_foreign_name "
+                        "(XSD CHOICE constraint)")
+
+        # Contact data: person XOR organisation, address required if any contact data
+        contact_columns = zip(
+            column('contact_person_official_name'), column('contact_organization_name'),
+            column('contact_address_street'), column('contact_address_postal_code'),
+            column('contact_address_town'), column('contact_valid_from'),
+            column('contact_valid_till'),
+        )
+        for i, contact in enumerate(contact_columns):
+            person_name, org_name, _street, postal_code, town = contact[:5]
+            if person_name is not None and org_name is not None:
+                fail(i, "Cannot provide both contact_person_official_name AND contact_organization_name "
+                        "(XSD CHOICE constraint)")
+            if contact.count(None) != len(contact):
+                if not postal_code:
+                    fail(i, "If contact_data is provided, contact_address_postal_code is required")
+                if not town:
+                    fail(i, "If contact_data is provided, contact_address_town is required")
+
     # ========================================================================
     # CONVERSION METHODS (Layer 2 ↔ Layer 1)
     # ========================================================================
@@ -1084,6 +1230,9 @@ class BaseDeliveryPerson(BaseModel):
             self.date_of_birth, self.date_of_birth_precision
         )
 
+        # Type 1 field, converted once for person_identification and birth_data
+        sex = Sex(self.sex)
+
         # Construct person_identification (REQUIRED)
         person_identification = ECH0044PersonIdentification(
             vn=self.vn,
@@ -1092,7 +1241,7 @@ class BaseDeliveryPerson(BaseModel):
             official_name=self.official_name,  # Type 1 field
             first_name=self.first_name,  # Type 1 field
             original_name=self.original_name,
-            sex=Sex(self.sex),  # Type 1 field - convert to enum
+            sex=sex,  # Type 1 field
             date_of_birth=date_of_birth_wrapper  # Type 1 field
         )
 
@@ -1141,10 +1290,10 @@ class BaseDeliveryPerson(BaseModel):
         # CHOICE: birth place type
         # ====================================================================
 
-        # Construct birth place based on CHOICE
+        # Construct birth place based on CHOICE (shared value objects, see helpers)
         place_of_birth = None
         if self.birth_place_type == PlaceType.UNKNOWN:
-            place_of_birth = ECH0011GeneralPlace(unknown=True)
+            place_of_birth = UNKNOWN_PLACE
         elif self.birth_place_type == PlaceType.SWISS:
             # Import canton abbreviation enum if needed
             canton_abbr_enum = None
@@ -1163,29 +1312,23 @@ class BaseDeliveryPerson(BaseModel):
             if birth_hist_muni_id is not None and not isinstance(birth_hist_muni_id, str):
                 birth_hist_muni_id = str(birth_hist_muni_id)
 
-            place_of_birth = ECH0011GeneralPlace(
-                swiss_municipality=ECH0007Municipality(
-                    swiss_municipality=ECH0007SwissMunicipality(
-                        municipality_id=self.birth_municipality_bfs,
-                        municipality_name=self.birth_municipality_name,
-                        canton_abbreviation=canton_abbr_enum,
-                        history_municipality_id=birth_hist_muni_id
-                    )
-                )
+            place_of_birth = shared_swiss_place(
+                self.birth_municipality_bfs,
+                self.birth_municipality_name,
+                canton_abbr_enum,
+                birth_hist_muni_id
             )
         elif self.birth_place_type == PlaceType.FOREIGN:
-            place_of_birth = ECH0011GeneralPlace(
-                foreign_country=ECH0008Country(
-                    country_id=self.birth_country_id,
-                    country_id_iso2=self.birth_country_iso,
-                    country_name_short=self.birth_country_name_short
-                ),
-                foreign_town=self.birth_town
+            place_of_birth = shared_foreign_place(
+                self.birth_country_id,
+                self.birth_country_iso,
+                self.birth_country_name_short,
+                self.birth_town
             )
 
         # Construct birth_data
         birth_data = ECH0011BirthData(
-            sex=Sex(self.sex),  # Type 1 COPY
+            sex=sex,  # Type 1 COPY
             date_of_birth=self.date_of_birth,  # Type 1 COPY
             place_of_birth=place_of_birth
         )
@@ -1284,7 +1427,7 @@ class BaseDeliveryPerson(BaseModel):
         if self.marriage_place_type:
             place_of_marriage = None
             if self.marriage_place_type == PlaceType.UNKNOWN:
-                place_of_marriage = ECH0011GeneralPlace(unknown=True)
+                place_of_marriage = UNKNOWN_PLACE
             elif self.marriage_place_type == PlaceType.SWISS:
                 if self.marriage_municipality_bfs:
                     # Import canton abbreviation enum if needed
@@ -1304,25 +1447,19 @@ class BaseDeliveryPerson(BaseModel):
                     if marriage_hist_muni_id is not None and not isinstance(marriage_hist_muni_id, str):
                         marriage_hist_muni_id = str(marriage_hist_muni_id)
 
-                    place_of_marriage = ECH0011GeneralPlace(
-                        swiss_municipality=ECH0007Municipality(
-                            swiss_municipality=ECH0007SwissMunicipality(
-                                municipality_id=self.marriage_municipality_bfs,
-                                municipality_name=self.marriage_municipality_name,
-                                canton_abbreviation=marriage_canton_abbr_enum,
-                                history_municipality_id=marriage_hist_muni_id
-                            )
-                        )
+                    place_of_marriage = shared_swiss_place(
+                        self.marriage_municipality_bfs,
+                        self.marriage_municipality_name,
+                        marriage_canton_abbr_enum,
+                        marriage_hist_muni_id
                     )
             elif self.marriage_place_type == PlaceType.FOREIGN:
                 if self.marriage_country_iso:
-                    place_of_marriage = ECH0011GeneralPlace(
-                        foreign_country=ECH0008Country(
-                            country_id=self.marriage_country_id,
-                            country_id_iso2=self.marriage_country_iso,
-                            country_name_short=self.marriage_country_name_short
-                        ),
-                        foreign_town=self.marriage_town
+                    place_of_marriage = shared_foreign_place(
+                        self.marriage_country_id,
+                        self.marriage_country_iso,
+                        self.marriage_country_name_short,
+                        self.marriage_town
                     )
 
             if place_of_marriage:
@@ -1343,10 +1480,10 @@ class BaseDeliveryPerson(BaseModel):
         country_info_list = []
         if self.nationalities:
             for nat_dict in self.nationalities:
-                country = ECH0008Country(
-                    country_id=nat_dict.get('country_id'),  # BFS 4-digit code (optional)
-                    country_id_iso2=nat_dict['country_iso'],  # ISO 2-letter code (required)
-                    country_name_short=nat_dict.get('country_name_short')
+                country = shared_country(
+                    nat_dict.get('country_id'),  # BFS 4-digit code (optional)
+                    nat_dict['country_iso'],  # ISO 2-letter code (required)
+                    nat_dict.get('country_name_short')
                 )
                 country_info = ECH0011CountryInfo(
                     country=country,
@@ -1433,7 +1570,7 @@ class BaseDeliveryPerson(BaseModel):
             # Construct death place based on type
             place_of_death = None
             if self.death_place_type == PlaceType.UNKNOWN:
-                place_of_death = ECH0011GeneralPlace(unknown=True)
+                place_of_death = UNKNOWN_PLACE
             elif self.death_place_type == PlaceType.SWISS:
                 if self.death_municipality_bfs and self.death_municipality_name:
                     # Convert canton abbreviation to enum if present
@@ -1453,24 +1590,18 @@ class BaseDeliveryPerson(BaseModel):
                     if death_hist_muni_id is not None and not isinstance(death_hist_muni_id, str):
                         death_hist_muni_id = str(death_hist_muni_id)
 
-                    place_of_death = ECH0011GeneralPlace(
-                        swiss_municipality=ECH0007Municipality(
-                            swiss_municipality=ECH0007SwissMunicipality(
-                                municipality_id=self.death_municipality_bfs,
-                                municipality_name=self.death_municipality_name,
-                                canton_abbreviation=death_canton_abbr_enum,
-                                history_municipality_id=death_hist_muni_id
-                            )
-                        )
+                    place_of_death = shared_swiss_place(
+                        self.death_municipality_bfs,
+                        self.death_municipality_name,
+                        death_canton_abbr_enum,
+                        death_hist_muni_id
                     )
             elif self.death_place_type == PlaceType.FOREIGN:
                 if self.death_country_iso and self.death_country_name_short:
-                    place_of_death = ECH0011GeneralPlace(
-                        foreign_country=ECH0008Country(
-                            country_id=self.death_country_id,
-                            country_id_iso2=self.death_country_iso,
-                            country_name_short=self.death_country_name_short
-                        )
+                    place_of_death = shared_foreign_place(
+                        self.death_country_id,
+                        self.death_country_iso,
+                        self.death_country_name_short
                     )
 
             death_data = ECH0011DeathData(
@@ -0,0 +1,411 @@
+"""Streaming privacy minimization of eCH-0020 deliveries.
+
+Full-register extracts handed to third parties must not carry more personal
+data than needed. This module removes elements from an eCH-0020 delivery as
+an element-level filter, without building Pydantic models:
+
+- The document is read with iterparse; each child of the root (header,
+  events) and each child of baseDelivery (messages) is filtered, written and
+  released as soon as it is complete, so memory stays bounded by the largest
+  single person, whatever the file size
+- What to remove is declared by a MinimizationPolicy (element paths to drop,
+  exceptions to keep, texts to replace)
+- With workers=N, filtering and serialization run in N processes on batches
+  of messages, with output kept in input order
+
+Policy paths are '/'-separated element names from the root element, with the
+prefixes of core.namespace (eCH-0020, eCH-0044, eCH-0021-v7, ...):
+- '*' in a step matches any characters within one element name
+  ('*:jobData', 'eCH-0021*:vn')
+- '**' matches any number of elements (including none)
+
+Design goals:
+- Same output structure as ECH0020Delivery.to_file() (parses back with
+  ECH0020Delivery.from_file() as long as no required element is dropped)
+- No namespace pollution (not added to ech0020 exports)
+
+Usage:
+    from openmun_ech.ech0020.minimize import PRIVACY_POLICY, minimize_delivery
+
+    result = minimize_delivery('register.xml', 'register_minimized.xml', PRIVACY_POLICY)
+    print(result.messages, dict(result.counts))
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from openmun_ech.core.namespace import URI_PREFIXES
+from openmun_ech.utils._xml_entities import Source, iterparse, qname
+from openmun_ech.utils._xml_stream import (
+    StreamTarget,
+    root_namespaces,
+    serialize_fragment,
+    xmlns_attributes,
+)
+
+_INDENT = '  '
+
+DEFAULT_BATCH_SIZE = 256
+
+_ECH0020_NS_PREFIX = 'http://www.ech.ch/xmlns/eCH-0020/'
+
+_KNOWN_PREFIXES = frozenset(URI_PREFIXES.values())
+
+
+def _compile_path(path: str) -> str:
+    """Regex for one policy path, matched against 'name name ... ' strings."""
+    parts = []
+    for step in path.split('/'):
+        if step == '**':
+            parts.append(r'(?:[^ ]+ )*')
+            continue
+        if not step or ' ' in step:
+            raise ValueError(f"Invalid step {step!r} in policy path {path!r}")
+        if step != '*':
+            prefix = step.split(':', 1)[0] if ':' in step else None
+            if prefix is None or ('*' not in prefix and prefix not in _KNOWN_PREFIXES):
+                raise ValueError(f"Unknown namespace prefix in policy path {path!r}: {step!r}")
+        parts.append(re.escape(step).replace(r'\*', '[^ ]*') + ' ')
+    return ''.join(parts)
+
+
+@dataclass(frozen=True)
+class MinimizationPolicy:
+    """Declarative element filter (see module docstring for the path syntax).
+
+    Args:
+        drop: Paths of elements to remove (with their content)
+        keep: Exceptions: elements matching a drop path and a keep path stay
+        replace: Path → new text for matching elements (e.g. vendor names)
+
+    Raises:
+        ValueError: If a path is malformed or uses an unknown prefix
+    """
+
+    drop: Sequence[str] = ()
+    keep: Sequence[str] = ()
+    replace: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'drop', tuple(self.drop))
+        object.__setattr__(self, 'keep', tuple(self.keep))
+        object.__setattr__(self, 'replace', dict(self.replace))
+        # One alternation per rule list; group n+1 ↔ drop[n] for counting
+        drop_re = keep_re = None
+        if self.drop:
+            drop_re = re.compile(
+                r'\A(?:' + '|'.join(f'({_compile_path(p)})' for p in self.drop) + r')\Z'
+            )
+        if self.keep:
+            keep_re = re.compile(
+                r'\A(?:' + '|'.join(_compile_path(p) for p in self.keep) + r')\Z'
+            )
+        replace = tuple(
+            (path, re.compile(r'\A' + _compile_path(path) + r'\Z'), text)
+            for path, text in self.replace.items()
+        )
+        object.__setattr__(self, '_drop_re', drop_re)
+        object.__setattr__(self, '_keep_re', keep_re)
+        object.__setattr__(self, '_replace', replace)
+
+    def _dropped_by(self, path: str) -> Optional[str]:
+        if self._drop_re is None:
+            return None
+        match = self._drop_re.match(path)
+        if match is None or (self._keep_re is not None and self._keep_re.match(path)):
+            return None
+        return self.drop[match.lastindex - 1]
+
+    def _filter(self, elem: ET.Element, path: str, counts: Counter) -> bool:
+        """Apply the policy to elem (at path) and its subtree; False if elem is dropped."""
+        rule = self._dropped_by(path)
+        if rule is not None:
+            counts[rule] += 1
+            return False
+        for rule, regex, text in self._replace:
+            if regex.match(path):
+                elem.text = text
+                counts[rule] += 1
+        for child in list(elem):
+            if not self._filter(child, f'{path}{qname(child.tag)} ', counts):
+                elem.remove(child)
+        return True
+
+    def apply(self, root: ET.Element) -> Counter:
+        """Filter a whole in-memory document in place; returns rule → elements affected."""
+        counts: Counter = Counter()
+        path = f'{qname(root.tag)} '
+        for child in list(root):
+            if not self._filter(child, f'{path}{qname(child.tag)} ', counts):
+                root.remove(child)
+        return counts
+
+
+_PERSON = 'eCH-0020:delivery/eCH-0020:baseDelivery/eCH-0020:messages/eCH-0020:baseDeliveryPerson'
+
+# Privacy-first extract for third parties:
+# - VN (AHV number) of the person, job, health insurance, armed forces, civil
+#   defense, fire service, political rights, additional and matrimonial
+#   inheritance data, guardian relationships are removed
+# - Contact data (c/o addresses for care homes) and parental relationships
+#   (names of father/mother) are kept
+PRIVACY_POLICY = MinimizationPolicy(drop=(
+    f'{_PERSON}/eCH-0020:personIdentification/eCH-0044:vn',
+    f'{_PERSON}/eCH-0020:personAdditionalData',
+    f'{_PERSON}/eCH-0020:politicalRightData',
+    f'{_PERSON}/eCH-0020:jobData',
+    f'{_PERSON}/eCH-0020:guardianRelationship',
+    f'{_PERSON}/eCH-0020:armedForcesData',
+    f'{_PERSON}/eCH-0020:civilDefenseData',
+    f'{_PERSON}/eCH-0020:fireServiceData',
+    f'{_PERSON}/eCH-0020:healthInsuranceData',
+    f'{_PERSON}/eCH-0020:matrimonialInheritanceArrangementData',
+))
+
+
+@dataclass
+class MinimizationResult:
+    """Summary of a minimize_delivery() run."""
+
+    messages: int = 0
+    """Number of messages elements written."""
+
+    counts: Counter = field(default_factory=Counter)
+    """Policy rule → number of elements removed (drop) or changed (replace)."""
+
+
+# ============================================================================
+# Filtering and serialization of one unit (root or baseDelivery child)
+# ============================================================================
+
+def _strip_indentation(elem: ET.Element) -> None:
+    for node in elem.iter():
+        if len(node) and node.text and not node.text.strip():
+            node.text = None
+        if node.tail and not node.tail.strip():
+            node.tail = None
+
+
+def _minimize_unit(
+    elem: ET.Element,
+    path: str,
+    level: int,
+    policy: MinimizationPolicy,
+    namespaces: Dict[str, str],
+    pretty_print: bool,
+    counts: Counter,
+) -> Optional[str]:
+    """Filter and serialize one unit; None if the policy drops it."""
+    if not policy._filter(elem, path, counts):
+        return None
+    if pretty_print:
+        ET.indent(elem, space=_INDENT, level=level)
+    else:
+        _strip_indentation(elem)
+    elem.tail = None
+    return serialize_fragment(elem, namespaces)
+
+
+def _minimize_batch(
+    units: List[Tuple[bytes, str, int]],
+    policy: MinimizationPolicy,
+    namespaces: Dict[str, str],
+    pretty_print: bool,
+) -> Tuple[List[Optional[str]], Counter]:
+    """Filter and serialize a batch of serialized units (runs in worker processes)."""
+    counts: Counter = Counter()
+    texts = [
+        _minimize_unit(ET.fromstring(data), path, level, policy, namespaces, pretty_print, counts)
+        for data, path, level in units
+    ]
+    return texts, counts
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+def _start_tag(elem: ET.Element, namespaces: Dict[str, str], declare: bool) -> Tuple[str, str]:
+    """Start and end tag of elem (attributes kept, content not written)."""
+    text = serialize_fragment(ET.Element(elem.tag, elem.attrib), namespaces)
+    name = text[1:-3].split(' ', 1)[0]
+    attributes = text[1 + len(name):-3]
+    declarations = xmlns_attributes(namespaces) if declare else ''
+    return f'<{name}{declarations}{attributes}>', f'</{name}>'
+
+
+def _pieces(
+    source: Source,
+    policy: MinimizationPolicy,
+    pretty_print: bool,
+    workers: Optional[int],
+    batch_size: int,
+    result: MinimizationResult,
+) -> Iterator[Tuple[int, str]]:
+    """(indentation level, text) of the output document, in order."""
+    pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+    # In order: (level, text) or (None, future of a batch of (level, unit name))
+    pending: deque = deque()
+    batch: List[Tuple[bytes, str, int]] = []
+    batch_meta: List[Tuple[int, str]] = []
+    in_flight = 0
+    namespaces: Optional[Dict[str, str]] = None
+    uris: List[str] = []
+    # Open elements down to the unit level (root, baseDelivery, unit)
+    stack: List[ET.Element] = []
+    paths: List[str] = []
+    depth = 0
+    unit_level = 1  # 2 inside baseDelivery
+
+    def submit() -> None:
+        nonlocal batch, batch_meta, in_flight
+        if batch:
+            future = pool.submit(_minimize_batch, batch, policy, namespaces, pretty_print)
+            pending.append((None, (future, batch_meta)))
+            batch, batch_meta = [], []
+            in_flight += 1
+
+    def ready(block: bool) -> Iterator[Tuple[int, str]]:
+        """Pieces that are done (block: all; else wait only above 2*workers batches)."""
+        nonlocal in_flight
+        while pending:
+            level, item = pending[0]
+            if level is None:
+                future, meta = item
+                if not (block or future.done() or in_flight >= 2 * workers):
+                    return
+                texts, counts = future.result()
+                in_flight -= 1
+                result.counts.update(counts)
+                pending.popleft()
+                for (unit_level, local), text in zip(meta, texts):
+                    if text is not None:
+                        result.messages += local == 'messages'
+                        yield unit_level, text
+            else:
+                pending.popleft()
+                yield level, item
+
+    def emit(level: int, text: str) -> Iterator[Tuple[int, str]]:
+        if pool is None:
+            yield level, text
+        else:
+            submit()
+            pending.append((level, text))
+            yield from ready(block=False)
+
+    try:
+        for event, item in iterparse(source, events=('start-ns', 'start', 'end')):
+            if event == 'start-ns':
+                if namespaces is None:
+                    uris.append(item[1])
+                continue
+
+            if event == 'start':
+                level = depth
+                depth += 1
+                if level > unit_level:
+                    continue
+                path = f'{paths[-1] if paths else ""}{qname(item.tag)} '
+                stack.append(item)
+                paths.append(path)
+                if level == 0:
+                    if not (item.tag.startswith('{' + _ECH0020_NS_PREFIX) and item.tag.endswith('}delivery')):
+                        raise ValueError(f"Not an eCH-0020 delivery: root element is {item.tag}")
+                    root_uri = item.tag[1:].split('}', 1)[0]
+                    namespaces = root_namespaces([root_uri] + [u for u in uris if u != root_uri])
+                    start, root_end = _start_tag(item, namespaces, declare=True)
+                    yield from emit(0, start)
+                elif level == 1 and item.tag.endswith('}baseDelivery'):
+                    unit_level = 2
+                    start, container_end = _start_tag(item, namespaces, declare=False)
+                    yield from emit(1, start)
+                continue
+
+            # event == 'end'
+            depth -= 1
+            level = depth
+            if level > unit_level:
+                continue
+            elem = stack.pop()
+            path = paths.pop()
+            if level == 0:
+                yield from emit(0, root_end)
+            elif level < unit_level:
+                unit_level = 1
+                stack[-1].remove(elem)
+                yield from emit(1, container_end)
+            else:
+                # Complete unit: filter, write, release
+                local = elem.tag.rsplit('}', 1)[-1]
+                stack[-1].remove(elem)
+                if pool is None:
+                    text = _minimize_unit(elem, path, level, policy, namespaces, pretty_print, result.counts)
+                    if text is not None:
+                        result.messages += local == 'messages'
+                        yield level, text
+                else:
+                    elem.tail = None
+                    batch.append((ET.tostring(elem), path, level))
+                    batch_meta.append((level, local))
+                    if len(batch) >= batch_size:
+                        submit()
+                        yield from ready(block=False)
+
+        if pool is not None:
+            submit()
+            yield from ready(block=True)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def minimize_delivery(
+    source: Source,
+    target: Union[str, Path, BinaryIO],
+    policy: MinimizationPolicy = PRIVACY_POLICY,
+    encoding: str = 'utf-8',
+    pretty_print: bool = True,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> MinimizationResult:
+    """Write a minimized copy of an eCH-0020 delivery, element by element.
+
+    Args:
+        source: Input path or readable binary file object
+        target: Output path or writable binary file object
+        policy: Elements to drop/keep/replace (default: PRIVACY_POLICY)
+        encoding: Output encoding
+        pretty_print: Indent output like ECH0020Delivery.to_file()
+        workers: Filter in this many worker processes (None/0 = in-process)
+        batch_size: Units (messages) per worker task
+
+    Returns:
+        Number of messages written and per-rule counts
+
+    Raises:
+        ValueError: If the source is not an eCH-0020 delivery (nothing is
+                    written to a path target)
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    result = MinimizationResult()
+    out = StreamTarget(target, encoding)
+    try:
+        out.write_declaration()
+        first = True
+        for level, text in _pieces(source, policy, pretty_print, workers, batch_size, result):
+            if pretty_print and not first:
+                out.write('\n' + _INDENT * level)
+            out.write(text)
+            first = False
+    except BaseException:
+        out.abort()
+        raise
+    out.commit()
+    return result
@@ -0,0 +1,188 @@
+"""eCH-0020 streaming export for baseDelivery (full register extracts).
+
+finalize_0020_base() materializes every Layer 1 event and the whole XML tree
+before to_file(). A baseDelivery covers every resident of a municipality, so
+this module streams instead:
+
+- The deliveryHeader is written once
+- Each event is converted and serialized to its messages element straight
+  to the output, then dropped
+
+Peak memory is independent of the number of persons.
+
+Design goals:
+- Same document as finalize_0020_base(...).to_file()
+  (parses back with ECH0020Delivery.from_file())
+- No namespace pollution (not added to ech0020 exports)
+
+Usage:
+    from openmun_ech.ech0020.streaming import write_base_delivery
+
+    count = write_base_delivery(iter_events(), config, 'base_delivery.xml')
+
+    # Incremental
+    with ECH0020StreamWriter('base_delivery.xml', delivery_header) as writer:
+        for event in iter_events():
+            writer.write_event(event)
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Union
+
+from openmun_ech.core import NS
+from openmun_ech.core.indent import indent
+from openmun_ech.ech0058 import ActionType
+from openmun_ech.utils._xml_stream import (
+    StreamTarget,
+    root_namespaces,
+    serialize_fragment,
+    xmlns_attributes,
+)
+
+from .layer2 import BaseDeliveryEvent, DeliveryConfig
+from .layer2.event import build_delivery_header
+from .v3 import ECH0020EventBaseDelivery, ECH0020Header
+
+
+# Namespaces declared once on <delivery>
+_ROOT_NAMESPACES = root_namespaces([
+    NS.ECH0020_V3, NS.ECH0058_V5, NS.ECH0044_V4, NS.ECH0011_V8,
+    NS.ECH0021_V7, NS.ECH0010_V5, NS.ECH0007_V5, NS.ECH0008_V3,
+])
+
+_INDENT = '  '
+
+
+class ECH0020StreamWriter:
+    """Write an eCH-0020 baseDelivery message by message.
+
+    Args:
+        target: Output path or writable binary file object
+        delivery_header: eCH-0020 delivery header (written once)
+        encoding: Output encoding
+        pretty_print: Indent output like ECH0020Delivery.to_file()
+
+    For a path, output goes to a temporary file that replaces `target` on
+    close(); an exception inside the `with` block leaves `target` untouched.
+    """
+
+    def __init__(
+        self,
+        target: Union[str, Path, BinaryIO],
+        delivery_header: ECH0020Header,
+        encoding: str = 'utf-8',
+        pretty_print: bool = True,
+    ):
+        self.pretty_print = pretty_print
+        self.count = 0
+        self._out = StreamTarget(target, encoding)
+
+        ns = NS.ECH0020_V3
+        prefix = _ROOT_NAMESPACES[ns]
+        header_elem = delivery_header.to_xml(None, namespace=ns, element_name='deliveryHeader')
+        if pretty_print:
+            indent(header_elem, space=_INDENT, level=1)
+
+        self._root_tag = f'{prefix}:delivery'
+        self._container_tag = f'{prefix}:baseDelivery'
+        self._out.write_declaration()
+        self._out.write(f'<{self._root_tag}{xmlns_attributes(_ROOT_NAMESPACES)} version="3.0">')
+        self._write_at(1, serialize_fragment(header_elem, _ROOT_NAMESPACES))
+        self._write_at(1, f'<{self._container_tag}>')
+
+    def _write_at(self, level: int, text: str) -> None:
+        if self.pretty_print:
+            self._out.write('\n' + _INDENT * level)
+        self._out.write(text)
+
+    def write(self, event: ECH0020EventBaseDelivery) -> None:
+        """Serialize and write one Layer 1 event as messages element.
+
+        Raises:
+            ValueError: If the writer is closed
+        """
+        if self._out.closed:
+            raise ValueError("ECH0020StreamWriter is closed")
+        # Generic serializer: element_name turns the event element into messages
+        data = event.to_xml_bytes(
+            namespace=NS.ECH0020_V3, element_name='messages',
+            indent=_INDENT if self.pretty_print else None,
+            level=2, declared=_ROOT_NAMESPACES,
+        )
+        self._write_at(2, data.decode('utf-8'))
+        self.count += 1
+
+    def write_event(self, event: BaseDeliveryEvent) -> None:
+        """Convert a Layer 2 event and write it."""
+        self.write(event.to_ech0020_event())
+
+    def close(self) -> None:
+        """Finish the document (and move it into place for path targets).
+
+        Raises:
+            ValueError: If no event was written (at least one required)
+        """
+        if self._out.closed:
+            return
+        if self.count == 0:
+            self.abort()
+            raise ValueError("baseDelivery requires at least one messages element")
+        self._write_at(1, f'</{self._container_tag}>')
+        self._write_at(0, f'</{self._root_tag}>')
+        self._out.commit()
+
+    def abort(self) -> None:
+        """Stop writing; a path target is left untouched (partial output removed)."""
+        self._out.abort()
+
+    def __enter__(self) -> 'ECH0020StreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def write_base_delivery(
+    events: Iterable[BaseDeliveryEvent],
+    config: DeliveryConfig,
+    target: Union[str, Path, BinaryIO],
+    message_id: Optional[str] = None,
+    message_date: Optional[datetime] = None,
+    action: ActionType = ActionType.NEW,
+    encoding: str = 'utf-8',
+    pretty_print: bool = True,
+    **optional_header_fields
+) -> int:
+    """Stream a complete eCH-0020 baseDelivery to a file or binary stream.
+
+    Streaming counterpart of finalize_0020_base(...).to_file().
+
+    Args:
+        events: Iterable of BaseDeliveryEvent (consumed once, lazily)
+        config: Deployment configuration
+        target: Output path or writable binary file object
+        message_id: Unique message ID (auto-generated UUID if not provided)
+        message_date: Message timestamp (defaults to now())
+        action: Action type (default: NEW)
+        encoding: Output encoding
+        pretty_print: Indent output like ECH0020Delivery.to_file()
+        **optional_header_fields: Additional eCH-0058 header fields
+
+    Returns:
+        Number of messages elements written
+
+    Raises:
+        ValueError: If events is empty (nothing is written)
+    """
+    delivery_header = build_delivery_header(
+        config, message_id or None, message_date, action, **optional_header_fields
+    )
+    with ECH0020StreamWriter(target, delivery_header, encoding=encoding,
+                             pretty_print=pretty_print) as writer:
+        for event in events:
+            writer.write_event(event)
+    return writer.count
@@ -7,6 +7,8 @@ from datetime import date
 from pydantic import BaseModel, Field, ConfigDict
 
 from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core.children import ChildIndex
+from openmun_ech.core.indent import indent
 from openmun_ech.ech0021 import DataLockType
 from openmun_ech.ech0044 import ECH0044PersonIdentification
 from openmun_ech.ech0058 import ECH0058Header
@@ -132,19 +134,20 @@ class ECH0020Header(BaseModel):
         ns_020 = NS.ECH0020_V3
 
         header = ECH0058Header.from_xml(elem)
+        children = ChildIndex(elem)
 
         data_lock = None
-        dl_elem = elem.find(f'{{{ns_020}}}dataLock')
+        dl_elem = children.find(ns_020, 'dataLock')
         if dl_elem is not None and dl_elem.text:
             data_lock = DataLockType(dl_elem.text)
 
         data_lock_valid_from = None
-        vf_elem = elem.find(f'{{{ns_020}}}dataLockValidFrom')
+        vf_elem = children.find(ns_020, 'dataLockValidFrom')
         if vf_elem is not None and vf_elem.text:
             data_lock_valid_from = date.fromisoformat(vf_elem.text)
 
         data_lock_valid_till = None
-        vt_elem = elem.find(f'{{{ns_020}}}dataLockValidTill')
+        vt_elem = children.find(ns_020, 'dataLockValidTill')
         if vt_elem is not None and vt_elem.text:
             data_lock_valid_till = date.fromisoformat(vt_elem.text)
 
@@ -257,6 +260,28 @@ _EVENT_ELEMENT_NAME_OVERRIDES = {
     'ECH0020EventEntryResidencePermit': 'changeResidencePermit',
 }
 
+# Event element → type parsed by ECH0020Delivery.from_xml(), in dispatch order
+_PARSED_EVENTS = (
+    ('correctReporting', ECH0020EventCorrectReporting),
+    ('moveIn', ECH0020EventMoveIn),
+    ('correctContact', ECH0020EventCorrectContact),
+    ('moveOut', ECH0020EventMoveOut),
+    ('move', ECH0020EventMove),
+    ('death', ECH0020EventDeath),
+    ('marriage', ECH0020EventMarriage),
+    ('correctMaritalInfo', ECH0020EventCorrectMaritalInfo),
+    ('correctBirthInfo', ECH0020EventCorrectBirthInfo),
+    ('correctIdentification', ECH0020EventCorrectIdentification),
+    ('correctName', ECH0020EventCorrectName),
+    ('correctPersonAdditionalData', ECH0020EventCorrectPersonAdditionalData),
+    ('correctResidencePermit', ECH0020EventCorrectResidencePermit),
+    ('correctParentalRelationship', ECH0020EventCorrectParentalRelationship),
+    ('correctPlaceOfOrigin', ECH0020EventCorrectPlaceOfOrigin),
+    ('birth', ECH0020EventBirth),
+    ('changeName', ECH0020EventChangeName),
+    ('contact', ECH0020EventContact),
+)
+
 ECH0020EventType = Union[
     List[ECH0020EventBaseDelivery],
     List[ECH0020EventKeyExchange],
@@ -357,6 +382,12 @@ class ECH0020Delivery(BaseModel):
         # deliveryHeader
         self.delivery_header.to_xml(parent=elem, namespace=namespace, element_name='deliveryHeader')
 
+        self._events_to_xml(elem, namespace)
+
+        return elem
+
+    def _events_to_xml(self, elem: ET.Element, namespace: str) -> None:
+        """Serialize the event CHOICE into the delivery element (after deliveryHeader)."""
         # Event dispatch
         if isinstance(self.event, list):
             if len(self.event) > 0:
@@ -385,11 +416,10 @@ class ECH0020Delivery(BaseModel):
                     event_name = event_name[0].lower() + event_name[1:]
                 self.event.to_xml(parent=elem, namespace=namespace, element_name=event_name)
 
-        return elem
-
     @classmethod
     def from_xml(cls, element: ET.Element) -> 'ECH0020Delivery':
-        ns = {'eCH-0020': NS.ECH0020_V3}
+        ns = NS.ECH0020_V3
+        children = ChildIndex(element)
 
         version = element.get('version')
         if version is None:
@@ -398,76 +428,29 @@ class ECH0020Delivery(BaseModel):
                 "(eCH-0020 v3.0 XSD: use='required')."
             )
 
-        header_elem = element.find('eCH-0020:deliveryHeader', ns)
+        header_elem = children.find(ns, 'deliveryHeader')
         if header_elem is None:
             raise ValueError("delivery requires deliveryHeader")
         delivery_header = ECH0020Header.from_xml(header_elem)
 
         # Event dispatch (CHOICE of 71 types)
-        base_elem = element.find('eCH-0020:baseDelivery', ns)
+        base_elem = children.find(ns, 'baseDelivery')
+        event = None
         if base_elem is not None:
             messages = []
-            for msg_elem in base_elem.findall('eCH-0020:messages', ns):
+            for msg_elem in base_elem.iterfind(f'{{{ns}}}messages'):
                 messages.append(ECH0020EventBaseDelivery.from_xml(msg_elem))
             if len(messages) == 0:
                 raise ValueError("baseDelivery requires at least one messages element")
             event = messages
-
-        elif element.find('eCH-0020:correctReporting', ns) is not None:
-            event = ECH0020EventCorrectReporting.from_xml(element.find('eCH-0020:correctReporting', ns))
-
-        elif element.find('eCH-0020:moveIn', ns) is not None:
-            event = ECH0020EventMoveIn.from_xml(element.find('eCH-0020:moveIn', ns))
-
-        elif element.find('eCH-0020:correctContact', ns) is not None:
-            event = ECH0020EventCorrectContact.from_xml(element.find('eCH-0020:correctContact', ns))
-
-        elif element.find('eCH-0020:moveOut', ns) is not None:
-            event = ECH0020EventMoveOut.from_xml(element.find('eCH-0020:moveOut', ns))
-
-        elif element.find('eCH-0020:move', ns) is not None:
-            event = ECH0020EventMove.from_xml(element.find('eCH-0020:move', ns))
-
-        elif element.find('eCH-0020:death', ns) is not None:
-            event = ECH0020EventDeath.from_xml(element.find('eCH-0020:death', ns))
-
-        elif element.find('eCH-0020:marriage', ns) is not None:
-            event = ECH0020EventMarriage.from_xml(element.find('eCH-0020:marriage', ns))
-
-        elif element.find('eCH-0020:correctMaritalInfo', ns) is not None:
-            event = ECH0020EventCorrectMaritalInfo.from_xml(element.find('eCH-0020:correctMaritalInfo', ns))
-
-        elif element.find('eCH-0020:correctBirthInfo', ns) is not None:
-            event = ECH0020EventCorrectBirthInfo.from_xml(element.find('eCH-0020:correctBirthInfo', ns))
-
-        elif element.find('eCH-0020:correctIdentification', ns) is not None:
-            event = ECH0020EventCorrectIdentification.from_xml(element.find('eCH-0020:correctIdentification', ns))
-
-        elif element.find('eCH-0020:correctName', ns) is not None:
-            event = ECH0020EventCorrectName.from_xml(element.find('eCH-0020:correctName', ns))
-
-        elif element.find('eCH-0020:correctPersonAdditionalData', ns) is not None:
-            event = ECH0020EventCorrectPersonAdditionalData.from_xml(element.find('eCH-0020:correctPersonAdditionalData', ns))
-
-        elif element.find('eCH-0020:correctResidencePermit', ns) is not None:
-            event = ECH0020EventCorrectResidencePermit.from_xml(element.find('eCH-0020:correctResidencePermit', ns))
-
-        elif element.find('eCH-0020:correctParentalRelationship', ns) is not None:
-            event = ECH0020EventCorrectParentalRelationship.from_xml(element.find('eCH-0020:correctParentalRelationship', ns))
-
-        elif element.find('eCH-0020:correctPlaceOfOrigin', ns) is not None:
-            event = ECH0020EventCorrectPlaceOfOrigin.from_xml(element.find('eCH-0020:correctPlaceOfOrigin', ns))
-
-        elif element.find('eCH-0020:birth', ns) is not None:
-            event = ECH0020EventBirth.from_xml(element.find('eCH-0020:birth', ns))
-
-        elif element.find('eCH-0020:changeName', ns) is not None:
-            event = ECH0020EventChangeName.from_xml(element.find('eCH-0020:changeName', ns))
-
-        elif element.find('eCH-0020:contact', ns) is not None:
-            event = ECH0020EventContact.from_xml(element.find('eCH-0020:contact', ns))
-
         else:
+            for event_name, event_cls in _PARSED_EVENTS:
+                event_elem = children.find(ns, event_name)
+                if event_elem is not None:
+                    event = event_cls.from_xml(event_elem)
+                    break
+
+        if event is None:
             supported = "baseDelivery, correctReporting, moveIn, correctContact, moveOut, move, death, marriage, correctMaritalInfo, correctBirthInfo, correctIdentification, correctName, correctPersonAdditionalData, correctResidencePermit, correctParentalRelationship, correctPlaceOfOrigin, birth, changeName, contact"
             raise NotImplementedError(
                 f"Unsupported event type. Currently implemented (19 types): {supported}"
@@ -493,6 +476,6 @@ class ECH0020Delivery(BaseModel):
         path = Path(file_path) if isinstance(file_path, str) else file_path
         root = self.to_xml()
         if pretty_print:
-            ET.indent(root, space='  ')
+            indent(root, space='  ')
         tree = ET.ElementTree(root)
         tree.write(path, encoding=encoding, xml_declaration=xml_declaration, method='xml')
@@ -5,6 +5,7 @@ from typing import Optional, Self
 from datetime import date
 
 from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core.codes import decode_enum
 from openmun_ech.ech0011 import (
     ECH0011NameData,
     ECH0011BirthData,
@@ -142,7 +143,7 @@ class ECH0020MaritalInfoRestrictedMarriage(ECHModel):
         status_elem = marital_data_elem.find(f'{{{ns}}}maritalStatus')
         if status_elem is None:
             raise ValueError("maritalStatus is required in maritalData")
-        marital_status = MaritalStatus(status_elem.text)
+        marital_status = decode_enum(MaritalStatus, status_elem.text)
 
         date_of_marital_status = None
         date_elem = marital_data_elem.find(f'{{{ns}}}dateOfMaritalStatus')
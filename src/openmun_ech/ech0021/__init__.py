@@ -25,51 +25,52 @@ Usage:
     from openmun_ech.ech0021 import v8
 """
 
-from .enums import (
+from openmun_ech._lazy import lazy_exports
+
+# Exports are imported on first access (see openmun_ech/_lazy.py): importing
+# the enums does not create the v8 models.
+_EXPORTS = {
     # Enums and simple types
-    TypeOfRelationship,
-    CareType,
-    KindOfEmployment,
-    YesNo,
-    MrMrs,
-    UIDOrganisationIdCategory,
-    DataLockType,  # v7 only (changed to yesNoType in v8)
-)
-
-from .v8 import (
+    'TypeOfRelationship': '.enums',
+    'CareType': '.enums',
+    'KindOfEmployment': '.enums',
+    'YesNo': '.enums',
+    'MrMrs': '.enums',
+    'UIDOrganisationIdCategory': '.enums',
+    'DataLockType': '.enums',  # v7 only (changed to yesNoType in v8)
+
     # Core data types
-    ECH0021PersonAdditionalData,
-    ECH0021LockData,
-    ECH0021PlaceOfOriginAddonData,
-    ECH0021MaritalDataAddon,
+    'ECH0021PersonAdditionalData': '.v8',
+    'ECH0021LockData': '.v8',
+    'ECH0021PlaceOfOriginAddonData': '.v8',
+    'ECH0021MaritalDataAddon': '.v8',
 
     # Birth addon
-    ECH0021NameOfParent,
-    ECH0021BirthAddonData,
+    'ECH0021NameOfParent': '.v8',
+    'ECH0021BirthAddonData': '.v8',
 
     # Job data
-    ECH0021JobData,
-    ECH0021OccupationData,
-    ECH0021UIDStructure,
+    'ECH0021JobData': '.v8',
+    'ECH0021OccupationData': '.v8',
+    'ECH0021UIDStructure': '.v8',
 
     # Relationships
-    ECH0021Partner,
-    ECH0021MaritalRelationship,
-    ECH0021ParentalRelationship,
-    ECH0021GuardianMeasureInfo,
-    ECH0021GuardianRelationship,
+    'ECH0021Partner': '.v8',
+    'ECH0021MaritalRelationship': '.v8',
+    'ECH0021ParentalRelationship': '.v8',
+    'ECH0021GuardianMeasureInfo': '.v8',
+    'ECH0021GuardianRelationship': '.v8',
 
     # Optional (low priority)
-    ECH0021ArmedForcesData,
-    ECH0021CivilDefenseData,
-    ECH0021FireServiceData,
-    ECH0021HealthInsuranceData,
-    ECH0021MatrimonialInheritanceArrangementData,
-)
-
-# Import versioned modules for explicit version selection
-from . import v7
-from . import v8
+    'ECH0021ArmedForcesData': '.v8',
+    'ECH0021CivilDefenseData': '.v8',
+    'ECH0021FireServiceData': '.v8',
+    'ECH0021HealthInsuranceData': '.v8',
+    'ECH0021MatrimonialInheritanceArrangementData': '.v8',
+}
+
+# Versioned modules for explicit version selection
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, submodules=['v7', 'v8'])
 
 __all__ = [
     # Enums
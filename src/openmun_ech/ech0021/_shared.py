@@ -8,14 +8,18 @@ Pattern: ECH0021VersionConfig dataclass + factory functions.
 Precedent: eCH-0058 _shared.py (Phase 4b).
 """
 
+import sys
+import threading
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional, Self, Union
+from typing import Callable, Dict, List, Optional, Self, Tuple, Union
 
 from pydantic import Field, field_validator, model_validator
 
 from openmun_ech.core import NS, ECHModel, xml_field
+from openmun_ech.core.children import ChildIndex
+from openmun_ech.core.codes import decode_enum
 from openmun_ech.ech0010 import (
     ECH0010AddressInformation,
     ECH0010MailAddress,
@@ -687,52 +691,54 @@ def _make_guardian_classes(cfg: ECH0021VersionConfig) -> tuple:
         @classmethod
         def from_xml(cls, elem: ET.Element, namespace: str | None = None) -> Self:
             ns = namespace or cls.__xml_ns__
+            children = ChildIndex(elem)
 
             # guardianRelationshipId (required)
-            id_elem = elem.find(f'{{{ns}}}guardianRelationshipId')
+            id_elem = children.find(ns, 'guardianRelationshipId')
             guardian_relationship_id = id_elem.text
 
             # partner (optional) — parse xs:choice
-            partner_elem = elem.find(f'{{{ns}}}partner')
+            partner_elem = children.find(ns, 'partner')
             person_identification = None
             person_identification_partner = None
             partner_id_organisation = None
             partner_address = None
 
             if partner_elem is not None:
-                person_id_elem = partner_elem.find(f'{{{ns}}}personIdentification')
+                partner = ChildIndex(partner_elem)
+                person_id_elem = partner.find(ns, 'personIdentification')
                 if person_id_elem is not None:
                     person_identification = ECH0044PersonIdentification.from_xml(person_id_elem)
 
-                person_partner_elem = partner_elem.find(f'{{{ns}}}personIdentificationPartner')
+                person_partner_elem = partner.find(ns, 'personIdentificationPartner')
                 if person_partner_elem is not None:
                     person_identification_partner = (
                         ECH0044PersonIdentificationLight.from_xml(person_partner_elem)
                     )
 
-                org_elem = partner_elem.find(f'{{{ns}}}partnerIdOrganisation')
+                org_elem = partner.find(ns, 'partnerIdOrganisation')
                 if org_elem is not None:
                     partner_id_organisation = ECH0011PartnerIdOrganisation.from_xml(org_elem)
 
-                addr_elem = partner_elem.find(f'{{{ns}}}address')
+                addr_elem = partner.find(ns, 'address')
                 if addr_elem is not None:
                     partner_address = ECH0010MailAddress.from_xml(
                         addr_elem, namespace=cfg.ns_ech0010,
                     )
 
             # typeOfRelationship (required)
-            rel_elem = elem.find(f'{{{ns}}}typeOfRelationship')
-            type_of_relationship = TypeOfRelationship(rel_elem.text)
+            rel_elem = children.find(ns, 'typeOfRelationship')
+            type_of_relationship = decode_enum(TypeOfRelationship, rel_elem.text)
 
             # guardianMeasureInfo (required)
-            measure_elem = elem.find(f'{{{ns}}}guardianMeasureInfo')
+            measure_elem = children.find(ns, 'guardianMeasureInfo')
             guardian_measure_info = ECH0021GuardianMeasureInfo.from_xml(
                 measure_elem, namespace=ns,
             )
 
             # care (optional)
-            care_elem = elem.find(f'{{{ns}}}care')
-            care = CareType(care_elem.text) if care_elem is not None else None
+            care_elem = children.find(ns, 'care')
+            care = decode_enum(CareType, care_elem.text) if care_elem is not None else None
 
             return cls(
                 guardian_relationship_id=guardian_relationship_id,
@@ -829,8 +835,9 @@ def _make_health_insurance_data(cfg: ECH0021VersionConfig) -> type:
         def from_xml(cls, elem: ET.Element, namespace: str | None = None) -> Self:
             ns = namespace or cls.__xml_ns__
 
-            hi_elem = elem.find(f'{{{ns}}}healthInsured')
-            ins_elem = elem.find(f'{{{ns}}}insurance')
+            children = ChildIndex(elem)
+            hi_elem = children.find(ns, 'healthInsured')
+            ins_elem = children.find(ns, 'insurance')
 
             insurance_name = None
             insurance_address = None
@@ -857,10 +864,10 @@ def _make_health_insurance_data(cfg: ECH0021VersionConfig) -> type:
                                 address_information=addr_info,
                             )
 
-            from_elem = elem.find(f'{{{ns}}}healthInsuranceValidFrom')
+            from_elem = children.find(ns, 'healthInsuranceValidFrom')
 
             return cls(
-                health_insured=YesNo(hi_elem.text),
+                health_insured=decode_enum(YesNo, hi_elem.text),
                 insurance_name=insurance_name,
                 insurance_address=insurance_address,
                 health_insurance_valid_from=date.fromisoformat(from_elem.text)
@@ -869,3 +876,48 @@ def _make_health_insurance_data(cfg: ECH0021VersionConfig) -> type:
             )
 
     return ECH0021HealthInsuranceData
+
+
+# ============================================================================
+# Deferred Class Creation
+# ============================================================================
+
+
+def _lazy_classes(
+    module_name: str,
+    cfg: ECH0021VersionConfig,
+    factories: Dict[Callable[[ECH0021VersionConfig], object], Tuple[str, ...]],
+) -> Callable[[str], type]:
+    """Build a module __getattr__ creating factory classes on first access.
+
+    Creating all shared classes costs most of the v7/v8 import time although a
+    delivery typically uses a few of them. Each factory runs once, when one of
+    its names is first accessed; its classes are then stored in the module
+    namespace (so later accesses are plain attribute lookups).
+
+    Args:
+        module_name: The version module's __name__
+        cfg: Namespace configuration passed to the factories
+        factories: Factory → names of the classes it returns (in order)
+
+    Returns:
+        Module-level __getattr__ (PEP 562)
+    """
+    groups = {name: (factory, names) for factory, names in factories.items() for name in names}
+    lock = threading.Lock()
+
+    def __getattr__(name: str) -> type:
+        if name not in groups:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        module = sys.modules[module_name]
+        with lock:
+            if name not in module.__dict__:  # Not created by another thread meanwhile
+                factory, names = groups[name]
+                classes = factory(cfg)
+                if len(names) == 1:
+                    classes = (classes,)
+                for class_name, cls in zip(names, classes):
+                    setattr(module, class_name, cls)
+        return module.__dict__[name]
+
+    return __getattr__
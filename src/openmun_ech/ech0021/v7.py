@@ -16,6 +16,7 @@ from typing import List, Optional, Self
 from pydantic import Field, field_validator
 
 from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core.codes import decode_enum
 
 from .enums import (
     CareType,
@@ -25,6 +26,7 @@ from .enums import (
 )
 from ._shared import (
     V7_CONFIG,
+    _lazy_classes,
     _make_armed_forces_data,
     _make_civil_defense_data,
     _make_fire_service_data,
@@ -44,26 +46,25 @@ from ._shared import (
 # Shared Classes (namespace-parameterized via V7_CONFIG)
 # ============================================================================
 
-ECH0021PersonAdditionalData = _make_person_additional_data(V7_CONFIG)
-ECH0021PlaceOfOriginAddonData = _make_place_of_origin_addon_data(V7_CONFIG)
-ECH0021PlaceOfOriginAddonRestrictedUnDo = _make_place_of_origin_addon_restricted_undo(V7_CONFIG)
-ECH0021MaritalDataAddon = _make_marital_data_addon(V7_CONFIG)
-ECH0021ArmedForcesData = _make_armed_forces_data(V7_CONFIG)
-ECH0021CivilDefenseData = _make_civil_defense_data(V7_CONFIG)
-ECH0021FireServiceData = _make_fire_service_data(V7_CONFIG)
-ECH0021MatrimonialInheritanceArrangementData = (
-    _make_matrimonial_inheritance_arrangement_data(V7_CONFIG)
-)
-ECH0021HealthInsuranceData = _make_health_insurance_data(V7_CONFIG)
-ECH0021UIDStructure, ECH0021OccupationData, ECH0021JobData = (
-    _make_job_classes(V7_CONFIG)
-)
+# Created on first access (see _lazy_classes), except Partner and
+# MaritalRelationship: ECH0021ParentalRelationship below needs ECH0021Partner.
 ECH0021Partner, ECH0021MaritalRelationship = (
     _make_partner_and_marital(V7_CONFIG)
 )
-ECH0021GuardianMeasureInfo, ECH0021GuardianRelationship = (
-    _make_guardian_classes(V7_CONFIG)
-)
+
+__getattr__ = _lazy_classes(__name__, V7_CONFIG, {
+    _make_person_additional_data: ('ECH0021PersonAdditionalData',),
+    _make_place_of_origin_addon_data: ('ECH0021PlaceOfOriginAddonData',),
+    _make_place_of_origin_addon_restricted_undo: ('ECH0021PlaceOfOriginAddonRestrictedUnDo',),
+    _make_marital_data_addon: ('ECH0021MaritalDataAddon',),
+    _make_armed_forces_data: ('ECH0021ArmedForcesData',),
+    _make_civil_defense_data: ('ECH0021CivilDefenseData',),
+    _make_fire_service_data: ('ECH0021FireServiceData',),
+    _make_matrimonial_inheritance_arrangement_data: ('ECH0021MatrimonialInheritanceArrangementData',),
+    _make_health_insurance_data: ('ECH0021HealthInsuranceData',),
+    _make_job_classes: ('ECH0021UIDStructure', 'ECH0021OccupationData', 'ECH0021JobData'),
+    _make_guardian_classes: ('ECH0021GuardianMeasureInfo', 'ECH0021GuardianRelationship'),
+})
 
 
 # ============================================================================
@@ -177,7 +178,7 @@ class ECH0021NameOfParent(ECHModel):
         # Infer type_of_relationship from element name if not explicitly provided
         type_of_relationship = None
         if rel_elem is not None:
-            type_of_relationship = TypeOfRelationship(rel_elem.text)
+            type_of_relationship = decode_enum(TypeOfRelationship, rel_elem.text)
         else:
             element_tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
             if element_tag == 'nameOfFather':
@@ -327,3 +328,29 @@ class ECH0021PoliticalRightData(ECHModel):
         'restrictedVotingAndElectionRightFederation', default=None,
         alias='restrictedVotingAndElectionRightFederation',
     )
+
+
+# Listed explicitly: the lazily created classes are not in the namespace yet
+__all__ = [
+    'ECH0021ArmedForcesData',
+    'ECH0021BirthAddonData',
+    'ECH0021CivilDefenseData',
+    'ECH0021FireServiceData',
+    'ECH0021GuardianMeasureInfo',
+    'ECH0021GuardianRelationship',
+    'ECH0021HealthInsuranceData',
+    'ECH0021JobData',
+    'ECH0021LockData',
+    'ECH0021MaritalDataAddon',
+    'ECH0021MaritalRelationship',
+    'ECH0021MatrimonialInheritanceArrangementData',
+    'ECH0021NameOfParent',
+    'ECH0021OccupationData',
+    'ECH0021ParentalRelationship',
+    'ECH0021Partner',
+    'ECH0021PersonAdditionalData',
+    'ECH0021PlaceOfOriginAddonData',
+    'ECH0021PlaceOfOriginAddonRestrictedUnDo',
+    'ECH0021PoliticalRightData',
+    'ECH0021UIDStructure',
+]
@@ -16,6 +16,7 @@ from typing import List, Optional, Self
 from pydantic import Field, field_validator
 
 from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core.codes import decode_enum
 
 from .enums import (
     CareType,
@@ -24,6 +25,7 @@ from .enums import (
 )
 from ._shared import (
     V8_CONFIG,
+    _lazy_classes,
     _make_armed_forces_data,
     _make_civil_defense_data,
     _make_fire_service_data,
@@ -42,25 +44,24 @@ from ._shared import (
 # Shared Classes (namespace-parameterized via V8_CONFIG)
 # ============================================================================
 
-ECH0021PersonAdditionalData = _make_person_additional_data(V8_CONFIG)
-ECH0021PlaceOfOriginAddonData = _make_place_of_origin_addon_data(V8_CONFIG)
-ECH0021MaritalDataAddon = _make_marital_data_addon(V8_CONFIG)
-ECH0021ArmedForcesData = _make_armed_forces_data(V8_CONFIG)
-ECH0021CivilDefenseData = _make_civil_defense_data(V8_CONFIG)
-ECH0021FireServiceData = _make_fire_service_data(V8_CONFIG)
-ECH0021MatrimonialInheritanceArrangementData = (
-    _make_matrimonial_inheritance_arrangement_data(V8_CONFIG)
-)
-ECH0021HealthInsuranceData = _make_health_insurance_data(V8_CONFIG)
-ECH0021UIDStructure, ECH0021OccupationData, ECH0021JobData = (
-    _make_job_classes(V8_CONFIG)
-)
+# Created on first access (see _lazy_classes), except Partner and
+# MaritalRelationship: ECH0021ParentalRelationship below needs ECH0021Partner.
 ECH0021Partner, ECH0021MaritalRelationship = (
     _make_partner_and_marital(V8_CONFIG)
 )
-ECH0021GuardianMeasureInfo, ECH0021GuardianRelationship = (
-    _make_guardian_classes(V8_CONFIG)
-)
+
+__getattr__ = _lazy_classes(__name__, V8_CONFIG, {
+    _make_person_additional_data: ('ECH0021PersonAdditionalData',),
+    _make_place_of_origin_addon_data: ('ECH0021PlaceOfOriginAddonData',),
+    _make_marital_data_addon: ('ECH0021MaritalDataAddon',),
+    _make_armed_forces_data: ('ECH0021ArmedForcesData',),
+    _make_civil_defense_data: ('ECH0021CivilDefenseData',),
+    _make_fire_service_data: ('ECH0021FireServiceData',),
+    _make_matrimonial_inheritance_arrangement_data: ('ECH0021MatrimonialInheritanceArrangementData',),
+    _make_health_insurance_data: ('ECH0021HealthInsuranceData',),
+    _make_job_classes: ('ECH0021UIDStructure', 'ECH0021OccupationData', 'ECH0021JobData'),
+    _make_guardian_classes: ('ECH0021GuardianMeasureInfo', 'ECH0021GuardianRelationship'),
+})
 
 
 # ============================================================================
@@ -177,7 +178,7 @@ class ECH0021NameOfParent(ECHModel):
             official_name=on_elem.text if on_elem is not None else None,
             first_name_only=fno_elem.text if fno_elem is not None else None,
             official_name_only=ono_elem.text if ono_elem is not None else None,
-            type_of_relationship=TypeOfRelationship(rel_elem.text) if rel_elem is not None else None,
+            type_of_relationship=decode_enum(TypeOfRelationship, rel_elem.text) if rel_elem is not None else None,
             official_proof_of_name_of_parents_yes_no=(proof_elem.text == 'true') if proof_elem is not None else None,
         )
 
@@ -228,3 +229,27 @@ class ECH0021ParentalRelationship(ECHModel):
                 f"FOSTER_FATHER (5), or FOSTER_MOTHER (6), got: {v}"
             )
         return v
+
+
+# Listed explicitly: the lazily created classes are not in the namespace yet
+__all__ = [
+    'ECH0021ArmedForcesData',
+    'ECH0021BirthAddonData',
+    'ECH0021CivilDefenseData',
+    'ECH0021FireServiceData',
+    'ECH0021GuardianMeasureInfo',
+    'ECH0021GuardianRelationship',
+    'ECH0021HealthInsuranceData',
+    'ECH0021JobData',
+    'ECH0021LockData',
+    'ECH0021MaritalDataAddon',
+    'ECH0021MaritalRelationship',
+    'ECH0021MatrimonialInheritanceArrangementData',
+    'ECH0021NameOfParent',
+    'ECH0021OccupationData',
+    'ECH0021ParentalRelationship',
+    'ECH0021Partner',
+    'ECH0021PersonAdditionalData',
+    'ECH0021PlaceOfOriginAddonData',
+    'ECH0021UIDStructure',
+]
@@ -20,7 +20,7 @@ from typing import List, Optional, Self
 
 from pydantic import field_validator, model_validator
 
-from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core import ECHModel, FrozenECHModel, NS, xml_field
 
 
 class Sex(str, Enum):
@@ -34,7 +34,7 @@ class Sex(str, Enum):
     UNKNOWN = "3"   # unbestimmt (undetermined/unknown)
 
 
-class ECH0044DatePartiallyKnown(ECHModel):
+class ECH0044DatePartiallyKnown(FrozenECHModel):
     """eCH-0044 Partially known date.
 
     Represents a date that may be:
@@ -10,9 +10,11 @@ import xml.etree.ElementTree as ET
 from datetime import date, datetime
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator
 
 from openmun_ech.core import NS
+from openmun_ech.core.codes import decode_enum
+from openmun_ech.core.indent import register_shared_wrapper
 
 from .enums import ActionType
 
@@ -24,31 +26,75 @@ from .enums import ActionType
 class AnyXMLContent(BaseModel):
     """Wrapper for xs:anyType - arbitrary XML content.
 
-    Stores raw XML elements as strings for Pydantic compatibility.
     Used for attachment and extension fields that can contain any well-formed XML.
+
+    Keeps the content in the form it was given — an element (e.g. from a
+    parsed delivery) or a string — and converts only when the other form is
+    asked for (each conversion is done once and cached):
+    - to_element() returns the stored element itself (for reading)
+    - to_xml() appends the stored element itself, so parsed content is passed
+      through without copying, serializing or re-parsing
+    - xml_content (string view) is computed on first access
+
+    Output trees share the stored element: indent them with core.indent.indent()
+    (as to_file() and the streaming writers do), which copies the payload of
+    attachment/extension wrappers first. Treat to_element() as read-only.
     """
 
-    xml_content: str = Field(
-        ...,
-        description="Raw XML content as string"
-    )
+    _element: Optional[ET.Element] = PrivateAttr(default=None)
+    _text: Optional[str] = PrivateAttr(default=None)
+
+    def __init__(self, xml_content: Optional[str] = None, **data: Any):
+        super().__init__(**data)
+        if xml_content is not None:
+            if not isinstance(xml_content, str):
+                raise TypeError(
+                    f"xml_content must be a string, got {type(xml_content).__name__}"
+                )
+            self._text = xml_content
+        else:
+            raise ValueError("xml_content is required (or use from_element())")
 
     @classmethod
     def from_element(cls, elem: ET.Element) -> 'AnyXMLContent':
-        """Create from an XML element."""
-        xml_str = ET.tostring(elem, encoding='unicode')
-        return cls(xml_content=xml_str)
+        """Create from an XML element (kept by reference, not serialized)."""
+        content = cls.model_construct()
+        content._element = elem
+        return content
+
+    @computed_field
+    @property
+    def xml_content(self) -> str:
+        """Raw XML content as string (computed on first access)."""
+        if self._text is None:
+            self._text = ET.tostring(self._element, encoding='unicode')
+        return self._text
 
     def to_element(self) -> ET.Element:
-        """Convert back to XML element."""
-        return ET.fromstring(self.xml_content)
+        """Return the content as XML element (parsed on first call if needed)."""
+        if self._element is None:
+            self._element = ET.fromstring(self._text)
+        return self._element
 
     def to_xml(self, parent: ET.Element) -> ET.Element:
-        """Append this arbitrary XML content to parent."""
+        """Append this arbitrary XML content to parent (the stored element, not a copy)."""
         elem = self.to_element()
         parent.append(elem)
         return elem
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AnyXMLContent):
+            return NotImplemented
+        if self._element is not None and self._element is other._element:
+            return True
+        return self.xml_content == other.xml_content
+
+
+# Header wrappers holding AnyXMLContent payloads (see core.indent)
+for _ns in (NS.ECH0058_V4, NS.ECH0058_V5):
+    register_shared_wrapper(f'{{{_ns}}}attachment')
+    register_shared_wrapper(f'{{{_ns}}}extension')
+
 
 # ============================================================================
 # Header Base (shared field declarations for v4/v5)
@@ -318,7 +364,7 @@ def _header_to_xml(
     if header.attachment:
         for attach in header.attachment:
             attach_wrapper = ET.SubElement(elem, f'{{{ns}}}attachment')
-            attach_wrapper.append(attach.to_element())
+            attach.to_xml(attach_wrapper)
 
     # Required: testDeliveryFlag
     ET.SubElement(elem, f'{{{ns}}}testDeliveryFlag').text = 'true' if header.test_delivery_flag else 'false'
@@ -339,7 +385,7 @@ def _header_to_xml(
     # Optional: extension (xs:anyType) — always last
     if header.extension:
         ext_wrapper = ET.SubElement(elem, f'{{{ns}}}extension')
-        ext_wrapper.append(header.extension.to_element())
+        header.extension.to_xml(ext_wrapper)
 
     return elem
 
@@ -397,7 +443,7 @@ def _header_from_xml(
     # Parse required fields
     sending_app = sending_app_cls.from_xml(send_app_elem, namespace=namespace)
     message_date = datetime.fromisoformat(msg_date_elem.text.strip())
-    action = ActionType(action_elem.text.strip())
+    action = decode_enum(ActionType, action_elem.text)
     test_flag = test_flag_elem.text.strip().lower() == 'true'
 
     # Optional string fields
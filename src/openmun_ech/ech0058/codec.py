@@ -0,0 +1,246 @@
+"""eCH-0058 header codec working on bytes.
+
+For gateways that handle many small deliveries where only the header differs,
+and for routing/acknowledgement services that never look at the payload:
+
+- HeaderTemplate serializes a header once (sendingApplication, messageType,
+  senderId, testDeliveryFlag, ... stay as pre-serialized text) with slots
+  for the per-message fields; render() only validates and fills the slots
+- read_delivery_header() parses just the deliveryHeader of a delivery with a
+  pull parser and stops reading there; the payload is never parsed
+
+Works for every delivery whose deliveryHeader extends the eCH-0058 header
+(eCH-0020, eCH-0099, eCH-0133, ...). The eCH-0058 version (v4/v5) is taken
+from the namespace of the header fields.
+
+Usage:
+    from openmun_ech.ech0058.codec import HeaderTemplate, read_delivery_header
+
+    template = HeaderTemplate(header, wrapper=f'{{{NS.ECH0020_V3}}}deliveryHeader')
+    header_bytes = template.render(message_id=str(uuid4()), message_date=now)
+
+    header = read_delivery_header('incoming/data_1234.xml')
+    route(header.message_type, header.recipient_id)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape
+
+from openmun_ech.core import NS
+from openmun_ech.core.indent import indent
+
+from . import v4, v5
+from ._shared import _HeaderBase
+
+
+# Header fields that can be slots (model field name → eCH-0058 element name)
+SLOT_FIELDS: Dict[str, str] = {
+    'declaration_local_reference': 'declarationLocalReference',
+    'message_id': 'messageId',
+    'reference_message_id': 'referenceMessageId',
+    'business_process_id': 'businessProcessId',
+    'our_business_reference_id': 'ourBusinessReferenceId',
+    'your_business_reference_id': 'yourBusinessReferenceId',
+    'unique_id_business_transaction': 'uniqueIdBusinessTransaction',
+    'sub_message_type': 'subMessageType',
+    'subject': 'subject',
+    'comment': 'comment',
+    'message_date': 'messageDate',
+    'initial_message_date': 'initialMessageDate',
+    'event_date': 'eventDate',
+    'modification_date': 'modificationDate',
+    'action': 'action',
+}
+
+DEFAULT_SLOTS = ('message_id', 'message_date', 'action')
+
+_HEADER_CLASSES = {
+    NS.ECH0058_V4: v4.ECH0058Header,
+    NS.ECH0058_V5: v5.ECH0058Header,
+}
+
+Source = Union[str, Path, BinaryIO, bytes]
+
+
+def _slot_text(value) -> str:
+    """Render a validated slot value as XML text (same format as _header_to_xml)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return escape(value)
+
+
+class HeaderTemplate:
+    """Pre-serialized eCH-0058 header with slots for per-message fields.
+
+    Args:
+        header: Header with the static values; slot fields must be set
+                (their values are placeholders, never emitted)
+        wrapper: Qualified tag ('{namespace}name') of the element holding the
+                 header fields, e.g. the delivery's deliveryHeader
+                 (default: standalone eCH-0058 header element)
+        slots: Model field names filled per message (see SLOT_FIELDS)
+        pretty_print: Indent like to_file(), for a wrapper at `level`
+        level: Nesting level of the wrapper in the target document
+        encoding: render() output encoding
+
+    Raises:
+        ValueError: If a slot is unknown or not set in the template header
+    """
+
+    def __init__(
+        self,
+        header: _HeaderBase,
+        wrapper: Optional[str] = None,
+        slots: Iterable[str] = DEFAULT_SLOTS,
+        pretty_print: bool = False,
+        level: int = 0,
+        encoding: str = 'utf-8',
+    ):
+        self.header = header
+        self.header_cls = type(header)
+        self.namespace = NS.ECH0058_V4 if isinstance(header, v4.ECH0058Header) else NS.ECH0058_V5
+        self.slots = tuple(slots)
+        self.encoding = encoding
+        self._segments, self._slot_order = self._compile(
+            wrapper or f'{{{self.namespace}}}header', pretty_print, level,
+        )
+
+    def _compile(self, wrapper: str, pretty_print: bool, level: int) -> Tuple[List[str], List[str]]:
+        root = ET.Element(wrapper)
+        self.header.to_xml(parent=root, namespace=self.namespace, skip_wrapper=True)
+
+        tokens = {}
+        for field_name in self.slots:
+            if field_name not in SLOT_FIELDS:
+                raise ValueError(
+                    f"Unknown header slot '{field_name}' (allowed: {', '.join(SLOT_FIELDS)})"
+                )
+            slot_elem = root.find(f'{{{self.namespace}}}{SLOT_FIELDS[field_name]}')
+            if slot_elem is None:
+                raise ValueError(f"Header slot '{field_name}' must be set in the template header")
+            token = f'__openmun_slot_{field_name}__'
+            slot_elem.text = token
+            tokens[token] = field_name
+
+        if pretty_print:
+            indent(root, space='  ', level=level)
+        text = ET.tostring(root, encoding='unicode')
+
+        segments, order = [], []
+        while True:
+            positions = [(text.find(token), token) for token in tokens if token in text]
+            if not positions:
+                segments.append(text)
+                break
+            pos, token = min(positions)
+            segments.append(text[:pos])
+            order.append(tokens[token])
+            text = text[pos + len(token):]
+        return segments, order
+
+    def stamp(self, **values) -> _HeaderBase:
+        """Copy the template header with validated slot values.
+
+        Raises:
+            ValueError: If a value is given for a field that is not a slot
+            ValidationError: If a value is invalid
+        """
+        unknown = set(values) - set(self.slots)
+        if unknown:
+            raise ValueError(f"Not a slot of this template: {', '.join(sorted(unknown))}")
+        header = self.header.model_copy()
+        validator = self.header_cls.__pydantic_validator__
+        for field_name, value in values.items():
+            validator.validate_assignment(header, field_name, value)
+        return header
+
+    def render(self, **values) -> bytes:
+        """Serialize the header element with the given slot values.
+
+        Slots without a value keep the template header's value. Validation as
+        for stamp(); the static parts are not serialized again.
+        """
+        return self.fill(self.stamp(**values)).encode(self.encoding)
+
+    def fill(self, header: _HeaderBase) -> str:
+        """Header element text with the slot values of a stamp()ed header (not encoded)."""
+        parts = [self._segments[0]]
+        for field_name, segment in zip(self._slot_order, self._segments[1:]):
+            parts.append(_slot_text(getattr(header, field_name)))
+            parts.append(segment)
+        return ''.join(parts)
+
+
+# ============================================================================
+# HEADER-ONLY PARSING
+# ============================================================================
+
+def _open(source: Source):
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source), True
+    if isinstance(source, (str, Path)):
+        return open(source, 'rb'), True
+    return source, False
+
+
+def read_delivery_header(
+    source: Source,
+    element_name: str = 'deliveryHeader',
+    root: Optional[str] = None,
+) -> _HeaderBase:
+    """Parse only the eCH-0058 header of a delivery.
+
+    Reads the document with a pull parser up to the end of the header element
+    (a child of the root named `element_name`, in any namespace, or a root
+    eCH-0058 header) and stops; nothing after it is read or parsed.
+
+    Args:
+        source: File path, binary file object or document bytes
+        element_name: Local name of the header element below the root
+        root: Expected qualified tag of the root element (default: any)
+
+    Returns:
+        v4.ECH0058Header or v5.ECH0058Header (from the fields' namespace)
+
+    Raises:
+        ValueError: If the root element is not `root`, or the document has no
+                    header before its first payload element
+    """
+    f, owned = _open(source)
+    try:
+        depth = 0
+        target = None
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if depth == 1 and root is not None and elem.tag != root:
+                    raise ValueError(f"Unexpected root element {elem.tag} (expected {root})")
+                if depth == 1 and elem.tag in (f'{{{NS.ECH0058_V4}}}header', f'{{{NS.ECH0058_V5}}}header'):
+                    target = elem
+                elif depth == 2 and target is None:
+                    if elem.tag.rpartition('}')[2] != element_name:
+                        break  # Payload before any header
+                    target = elem
+                continue
+            depth -= 1
+            if elem is target:
+                return _header_from_element(elem)
+    finally:
+        if owned:
+            f.close()
+    raise ValueError(f"Missing required {element_name} element")
+
+
+def _header_from_element(elem: ET.Element) -> _HeaderBase:
+    for child in elem:
+        namespace = child.tag[1:].partition('}')[0]
+        if namespace in _HEADER_CLASSES:
+            return _HEADER_CLASSES[namespace].from_xml(elem, namespace=namespace)
+    raise ValueError(f"{elem.tag} contains no eCH-0058 header fields")
@@ -1718,38 +1718,28 @@ class StatisticsDeliveryConfig(BaseModel):
 # FINALIZATION HELPER
 # ============================================================================
 
-def finalize_statistics_delivery(
-    events: List[StatisticsDeliveryEvent],
+def build_statistics_header(
     config: StatisticsDeliveryConfig,
     message_id: Optional[str] = None,
     message_date: Optional[datetime] = None,
     action: ActionType = ActionType.NEW,
-    general_data: Optional[List[ECH0099DataType]] = None,
     **optional_header_fields
-) -> ECH0099Delivery:
-    """Finalize eCH-0099 statistics delivery from Layer 2 events.
+) -> ECH0058Header:
+    """Build the eCH-0099 deliveryHeader (eCH-0058 v4 header) from config.
 
-    Builds eCH-0058 v4 header and converts each Layer 2 event to
-    ECH0099ReportedPerson.
+    Shared by finalize_statistics_delivery() and the streaming writer, so
+    every delivery carries the same header fields.
 
     Args:
-        events: List of StatisticsDeliveryEvent (at least one required)
         config: Deployment configuration
-        message_id: Unique message ID (auto-generated UUID if not provided)
-        message_date: Message timestamp (defaults to now())
-        action: Action type (default: NEW)
-        general_data: Optional delivery-wide data
+        message_id: Unique message ID (auto-generated UUID if None)
+        message_date: Message timestamp (now, UTC if None)
+        action: eCH-0058 action
         **optional_header_fields: Additional eCH-0058 header fields
 
-    Returns:
-        Complete ECH0099Delivery ready for XML export
-
     Raises:
-        ValueError: If events list is empty
+        ValidationError: If a header field is invalid
     """
-    if not events:
-        raise ValueError("At least one StatisticsDeliveryEvent is required")
-
     msg_id = message_id or str(uuid4())
     msg_date = message_date or datetime.now(timezone.utc)
 
@@ -1761,7 +1751,7 @@ def finalize_statistics_delivery(
     )
 
     # Build eCH-0058 v4 header
-    header = ECH0058Header(
+    return ECH0058Header(
         sender_id=config.sender_id,
         message_id=msg_id,
         message_type=NS.ECH0099_V2,
@@ -1773,6 +1763,43 @@ def finalize_statistics_delivery(
         **optional_header_fields
     )
 
+
+def finalize_statistics_delivery(
+    events: List[StatisticsDeliveryEvent],
+    config: StatisticsDeliveryConfig,
+    message_id: Optional[str] = None,
+    message_date: Optional[datetime] = None,
+    action: ActionType = ActionType.NEW,
+    general_data: Optional[List[ECH0099DataType]] = None,
+    **optional_header_fields
+) -> ECH0099Delivery:
+    """Finalize eCH-0099 statistics delivery from Layer 2 events.
+
+    Builds eCH-0058 v4 header and converts each Layer 2 event to
+    ECH0099ReportedPerson.
+
+    Args:
+        events: List of StatisticsDeliveryEvent (at least one required)
+        config: Deployment configuration
+        message_id: Unique message ID (auto-generated UUID if not provided)
+        message_date: Message timestamp (defaults to now())
+        action: Action type (default: NEW)
+        general_data: Optional delivery-wide data
+        **optional_header_fields: Additional eCH-0058 header fields
+
+    Returns:
+        Complete ECH0099Delivery ready for XML export
+
+    Raises:
+        ValueError: If events list is empty
+    """
+    if not events:
+        raise ValueError("At least one StatisticsDeliveryEvent is required")
+
+    header = build_statistics_header(
+        config, message_id, message_date, action, **optional_header_fields
+    )
+
     # Convert Layer 2 events to Layer 1 reported persons
     reported_persons = [event.to_ech0099_reported_person() for event in events]
 
@@ -0,0 +1,258 @@
+"""eCH-0099 streaming export for full municipal populations.
+
+finalize_statistics_delivery() materializes every StatisticsDeliveryEvent,
+every ECH0099ReportedPerson and the whole XML tree before to_file(). The
+quarterly BFS delivery covers every resident, so this module streams instead:
+
+- The eCH-0058 v4 header is written once
+- Each event is converted and serialized to its reportedPerson element
+  straight to the output, then dropped
+- generalData is appended when the delivery is closed
+
+Peak memory is independent of population size. With workers=N, conversion
+and serialization run in N processes on batches of events, with at most
+2*N batches in flight and output kept in input order.
+
+Design goals:
+- Same document as finalize_statistics_delivery(...).to_file()
+  (parses back with ECH0099Delivery.from_file())
+- No namespace pollution (not added to ech0099 exports)
+
+Usage:
+    from openmun_ech.ech0099.streaming import write_statistics_delivery
+
+    count = write_statistics_delivery(iter_events(), config, 'statpop.xml', workers=4)
+
+    # Incremental (e.g. generalData computed from the streamed persons)
+    with ECH0099StreamWriter('statpop.xml', header) as writer:
+        for event in iter_events():
+            writer.write_event(event)
+        writer.close(general_data=[ECH0099DataType(field='count', value=str(writer.count))])
+"""
+
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from openmun_ech.core import NS
+from openmun_ech.core.indent import indent
+from openmun_ech.ech0058.v4 import ECH0058Header, ActionType
+from openmun_ech.utils._xml_stream import (
+    StreamTarget,
+    root_namespaces,
+    serialize_fragment,
+    xmlns_attributes,
+)
+
+from .models import StatisticsDeliveryConfig, StatisticsDeliveryEvent, build_statistics_header
+from .v2 import ECH0099DataType, ECH0099ReportedPerson
+
+
+# Namespaces declared once on <delivery>
+_ROOT_NAMESPACES = root_namespaces([
+    NS.ECH0099_V2, NS.ECH0058_V4, NS.ECH0011_V8, NS.ECH0044_V4,
+    NS.ECH0007_V5, NS.ECH0008_V3, NS.ECH0010_V5,
+])
+
+_INDENT = '  '
+
+DEFAULT_BATCH_SIZE = 256
+
+
+def _serialize_reported_person(person: ECH0099ReportedPerson, pretty_print: bool) -> str:
+    data = person.to_xml_bytes(
+        namespace=NS.ECH0099_V2, indent=_INDENT if pretty_print else None,
+        level=1, declared=_ROOT_NAMESPACES,
+    )
+    return data.decode('utf-8')
+
+
+def _serialize_events(events: List[StatisticsDeliveryEvent], pretty_print: bool) -> List[str]:
+    """Convert and serialize a batch of events (runs in worker processes)."""
+    return [
+        _serialize_reported_person(event.to_ech0099_reported_person(), pretty_print)
+        for event in events
+    ]
+
+
+class ECH0099StreamWriter:
+    """Write an eCH-0099 delivery reportedPerson by reportedPerson.
+
+    Args:
+        target: Output path or writable binary file object
+        header: eCH-0058 v4 header (written once)
+        encoding: Output encoding
+        pretty_print: Indent output like ECH0099Delivery.to_file()
+
+    For a path, output goes to a temporary file that replaces `target` on
+    close(); an exception inside the `with` block leaves `target` untouched.
+    """
+
+    def __init__(
+        self,
+        target: Union[str, Path, BinaryIO],
+        header: ECH0058Header,
+        encoding: str = 'utf-8',
+        pretty_print: bool = True,
+    ):
+        self.pretty_print = pretty_print
+        self.count = 0
+        self._out = StreamTarget(target, encoding)
+        try:
+            self._write_prefix(header)
+        except BaseException:
+            self._out.abort()
+            raise
+
+    def _write_prefix(self, header: ECH0058Header) -> None:
+        ns = NS.ECH0099_V2
+        header_elem = ET.Element(f'{{{ns}}}deliveryHeader')
+        header.to_xml(parent=header_elem, namespace=NS.ECH0058_V4, skip_wrapper=True)
+        if self.pretty_print:
+            indent(header_elem, space=_INDENT, level=1)
+
+        self._root_tag = f'{_ROOT_NAMESPACES[ns]}:delivery'
+        self._out.write_declaration()
+        self._out.write(f'<{self._root_tag}{xmlns_attributes(_ROOT_NAMESPACES)} version="2.1">')
+        self._write_at(1, serialize_fragment(header_elem, _ROOT_NAMESPACES))
+
+    def _write_at(self, level: int, text: str) -> None:
+        if self.pretty_print:
+            self._out.write('\n' + _INDENT * level)
+        self._out.write(text)
+
+    def _check_open(self) -> None:
+        if self._out.closed:
+            raise ValueError("ECH0099StreamWriter is closed")
+
+    def write(self, person: ECH0099ReportedPerson) -> None:
+        """Serialize and write one Layer 1 reportedPerson."""
+        self._check_open()
+        self._write_at(1, _serialize_reported_person(person, self.pretty_print))
+        self.count += 1
+
+    def write_event(self, event: StatisticsDeliveryEvent) -> None:
+        """Convert a Layer 2 event and write it as reportedPerson."""
+        self.write(event.to_ech0099_reported_person())
+
+    def _write_serialized(self, fragments: Iterable[str]) -> None:
+        """Write reportedPerson fragments produced by _serialize_events()."""
+        self._check_open()
+        for fragment in fragments:
+            self._write_at(1, fragment)
+            self.count += 1
+
+    def close(self, general_data: Optional[Iterable[ECH0099DataType]] = None) -> None:
+        """Append generalData and finish the document.
+
+        Raises:
+            ValueError: If no reportedPerson was written (at least one required)
+        """
+        if self._out.closed:
+            return
+        if self.count == 0:
+            self.abort()
+            raise ValueError("At least one StatisticsDeliveryEvent is required")
+        for data in general_data or ():
+            elem = data.to_xml(namespace=NS.ECH0099_V2, element_name='generalData')
+            if self.pretty_print:
+                ET.indent(elem, space=_INDENT, level=1)
+            self._write_at(1, serialize_fragment(elem, _ROOT_NAMESPACES))
+        self._write_at(0, f'</{self._root_tag}>')
+        self._out.commit()
+
+    def abort(self) -> None:
+        """Stop writing; a path target is left untouched (partial output removed)."""
+        self._out.abort()
+
+    def __enter__(self) -> 'ECH0099StreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def _batches(events: Iterable[StatisticsDeliveryEvent], batch_size: int) -> Iterator[List[StatisticsDeliveryEvent]]:
+    iterator = iter(events)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _serialized_batches(
+    events: Iterable[StatisticsDeliveryEvent],
+    pretty_print: bool,
+    workers: Optional[int],
+    batch_size: int,
+) -> Iterator[List[str]]:
+    """Serialized reportedPerson batches in input order (bounded in-flight work)."""
+    if not workers:
+        for batch in _batches(events, batch_size):
+            yield _serialize_events(batch, pretty_print)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in _batches(events, batch_size):
+            pending.append(pool.submit(_serialize_events, batch, pretty_print))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_statistics_delivery(
+    events: Iterable[StatisticsDeliveryEvent],
+    config: StatisticsDeliveryConfig,
+    target: Union[str, Path, BinaryIO],
+    message_id: Optional[str] = None,
+    message_date: Optional[datetime] = None,
+    action: ActionType = ActionType.NEW,
+    general_data: Optional[List[ECH0099DataType]] = None,
+    encoding: str = 'utf-8',
+    pretty_print: bool = True,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **optional_header_fields
+) -> int:
+    """Stream a complete eCH-0099 delivery to a file or binary stream.
+
+    Streaming counterpart of finalize_statistics_delivery(...).to_file().
+
+    Args:
+        events: Iterable of StatisticsDeliveryEvent (consumed once, lazily)
+        config: Deployment configuration
+        target: Output path or writable binary file object
+        message_id: Unique message ID (auto-generated UUID if not provided)
+        message_date: Message timestamp (defaults to now())
+        action: Action type (default: NEW)
+        general_data: Optional delivery-wide data (written after all persons)
+        encoding: Output encoding
+        pretty_print: Indent output like ECH0099Delivery.to_file()
+        workers: Convert in this many worker processes (None/0 = in-process);
+                 events must be picklable
+        batch_size: Events per worker task
+        **optional_header_fields: Additional eCH-0058 header fields
+
+    Returns:
+        Number of reportedPerson elements written
+
+    Raises:
+        ValueError: If events is empty (nothing is written)
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    header = build_statistics_header(
+        config, message_id, message_date, action, **optional_header_fields
+    )
+    with ECH0099StreamWriter(target, header, encoding=encoding, pretty_print=pretty_print) as writer:
+        for fragments in _serialized_batches(events, pretty_print, workers, batch_size):
+            writer._write_serialized(fragments)
+        writer.close(general_data=general_data)
+    return writer.count
@@ -25,6 +25,7 @@ from datetime import date
 from pydantic import Field, field_validator
 
 from openmun_ech.core import ECHModel, xml_field, NS
+from openmun_ech.core.indent import indent
 from openmun_ech.ech0011 import ECH0011ReportedPerson
 from openmun_ech.ech0044 import ECH0044PersonIdentification
 from openmun_ech.ech0058.v4 import ECH0058Header
@@ -213,7 +214,7 @@ class ECH0099Delivery(ECHModel):
         path = Path(file_path) if isinstance(file_path, str) else file_path
         root = self.to_xml()
         if pretty_print:
-            ET.indent(root, space='  ')
+            indent(root, space='  ')
         tree = ET.ElementTree(root)
         tree.write(path, encoding=encoding, xml_declaration=xml_declaration, method='xml')
 
@@ -16,134 +16,125 @@ Implementation: 60 ECHModel classes + 38 enum classes.
 See docs/plans/ECH0129_IMPLEMENTATION_PLAN.md for session tracker.
 """
 
-# --- ECHModel classes from v6/ submodules (60 classes) ---
+from openmun_ech._lazy import lazy_exports
 
-from openmun_ech.ech0129.v6 import (
-    # authority_person.py
-    ECH0129BuildingAuthority,
-    ECH0129BuildingAuthorityOnly,
-    ECH0129Email,
-    ECH0129IdentificationChoice,
-    ECH0129Person,
-    ECH0129PersonOnly,
-    ECH0129Phone,
-    # base_types.py
-    ECH0129BuildingDate,
-    ECH0129BuildingVolume,
-    ECH0129Contact,
-    ECH0129Coordinates,
-    ECH0129DatePartiallyKnown,
-    ECH0129DateRange,
-    ECH0129Heating,
-    ECH0129HotWater,
-    ECH0129NamedId,
-    ECH0129NamedMetaData,
-    ECH0129PersonIdentification,
-    # building.py
-    ECH0129Building,
-    ECH0129BuildingIdentification,
-    ECH0129BuildingOnly,
-    # cadastral.py
-    ECH0129CadastralMap,
-    ECH0129CadastralSurveyorRemark,
-    ECH0129CoveringAreaOfSDR,
-    ECH0129PartialAreaOfBuilding,
-    ECH0129Right,
-    # construction.py
-    ECH0129ConstructionLocalisation,
-    ECH0129ConstructionProject,
-    ECH0129ConstructionProjectIdentification,
-    ECH0129KindOfConstructionWork,
-    # dwelling.py
-    ECH0129Dwelling,
-    ECH0129DwellingIdentification,
-    ECH0129DwellingUsage,
-    # entrance.py
-    ECH0129AddressStreetDescription,
-    ECH0129AddressStreetEntry,
-    ECH0129BuildingAddress,
-    ECH0129BuildingAddressLight,
-    ECH0129BuildingEntrance,
-    ECH0129BuildingEntranceIdentification,
-    ECH0129BuildingEntranceOnly,
-    # estimation.py
-    ECH0129EstimationObject,
-    ECH0129EstimationObjectOnly,
-    ECH0129EstimationValue,
-    ECH0129Value,
-    # insurance.py
-    ECH0129InsuranceObject,
-    ECH0129InsuranceObjectOnly,
-    ECH0129InsuranceSum,
-    ECH0129InsuranceValue,
-    ECH0129InsuranceVolume,
-    # realestate.py
-    ECH0129Area,
-    ECH0129FiscalOwnership,
-    ECH0129Realestate,
-    ECH0129RealestateIdentification,
-    # street_locality.py
-    ECH0129Locality,
-    ECH0129LocalityName,
-    ECH0129PlaceName,
-    ECH0129Street,
-    ECH0129StreetDescription,
-    ECH0129StreetDescriptionEntry,
-    ECH0129StreetSection,
-)
+# Exports are imported on first access (see openmun_ech/_lazy.py): using the
+# enums or one entity type does not load every v6 submodule.
+_EXPORTS = {
+    # ECHModel classes from v6/ submodules (60 classes)
+    'ECH0129BuildingAuthority': '.v6.authority_person',
+    'ECH0129BuildingAuthorityOnly': '.v6.authority_person',
+    'ECH0129Email': '.v6.authority_person',
+    'ECH0129IdentificationChoice': '.v6.authority_person',
+    'ECH0129Person': '.v6.authority_person',
+    'ECH0129PersonOnly': '.v6.authority_person',
+    'ECH0129Phone': '.v6.authority_person',
+    'ECH0129BuildingDate': '.v6.base_types',
+    'ECH0129BuildingVolume': '.v6.base_types',
+    'ECH0129Contact': '.v6.base_types',
+    'ECH0129Coordinates': '.v6.base_types',
+    'ECH0129DatePartiallyKnown': '.v6.base_types',
+    'ECH0129DateRange': '.v6.base_types',
+    'ECH0129Heating': '.v6.base_types',
+    'ECH0129HotWater': '.v6.base_types',
+    'ECH0129NamedId': '.v6.base_types',
+    'ECH0129NamedMetaData': '.v6.base_types',
+    'ECH0129PersonIdentification': '.v6.base_types',
+    'ECH0129Building': '.v6.building',
+    'ECH0129BuildingIdentification': '.v6.building',
+    'ECH0129BuildingOnly': '.v6.building',
+    'ECH0129CadastralMap': '.v6.cadastral',
+    'ECH0129CadastralSurveyorRemark': '.v6.cadastral',
+    'ECH0129CoveringAreaOfSDR': '.v6.cadastral',
+    'ECH0129PartialAreaOfBuilding': '.v6.cadastral',
+    'ECH0129Right': '.v6.cadastral',
+    'ECH0129ConstructionLocalisation': '.v6.construction',
+    'ECH0129ConstructionProject': '.v6.construction',
+    'ECH0129ConstructionProjectIdentification': '.v6.construction',
+    'ECH0129KindOfConstructionWork': '.v6.construction',
+    'ECH0129Dwelling': '.v6.dwelling',
+    'ECH0129DwellingIdentification': '.v6.dwelling',
+    'ECH0129DwellingUsage': '.v6.dwelling',
+    'ECH0129AddressStreetDescription': '.v6.entrance',
+    'ECH0129AddressStreetEntry': '.v6.entrance',
+    'ECH0129BuildingAddress': '.v6.entrance',
+    'ECH0129BuildingAddressLight': '.v6.entrance',
+    'ECH0129BuildingEntrance': '.v6.entrance',
+    'ECH0129BuildingEntranceIdentification': '.v6.entrance',
+    'ECH0129BuildingEntranceOnly': '.v6.entrance',
+    'ECH0129EstimationObject': '.v6.estimation',
+    'ECH0129EstimationObjectOnly': '.v6.estimation',
+    'ECH0129EstimationValue': '.v6.estimation',
+    'ECH0129Value': '.v6.estimation',
+    'ECH0129InsuranceObject': '.v6.insurance',
+    'ECH0129InsuranceObjectOnly': '.v6.insurance',
+    'ECH0129InsuranceSum': '.v6.insurance',
+    'ECH0129InsuranceValue': '.v6.insurance',
+    'ECH0129InsuranceVolume': '.v6.insurance',
+    'ECH0129Area': '.v6.realestate',
+    'ECH0129FiscalOwnership': '.v6.realestate',
+    'ECH0129Realestate': '.v6.realestate',
+    'ECH0129RealestateIdentification': '.v6.realestate',
+    'ECH0129Locality': '.v6.street_locality',
+    'ECH0129LocalityName': '.v6.street_locality',
+    'ECH0129PlaceName': '.v6.street_locality',
+    'ECH0129Street': '.v6.street_locality',
+    'ECH0129StreetDescription': '.v6.street_locality',
+    'ECH0129StreetDescriptionEntry': '.v6.street_locality',
+    'ECH0129StreetSection': '.v6.street_locality',
 
-# --- Enumerations from enums.py (38 classes) ---
-
-from openmun_ech.ech0129.enums import (
+    # Enumerations from enums.py (38 classes)
     # Construction (§4.3)
-    TypeOfConstructionProject,
-    TypeOfPermit,
-    ProjectStatus,
-    TypeOfClient,
-    TypeOfConstruction,
-    KindOfWork,
+    'TypeOfConstructionProject': '.enums',
+    'TypeOfPermit': '.enums',
+    'ProjectStatus': '.enums',
+    'TypeOfClient': '.enums',
+    'TypeOfConstruction': '.enums',
+    'KindOfWork': '.enums',
     # Building (§4.5)
-    PeriodOfConstruction,
-    BuildingCategory,
-    BuildingStatus,
-    HeatGeneratorHeating,
-    HeatGeneratorHotWater,
-    EnergySource,
-    InformationSource,
-    BuildingVolumeInformationSource,
-    BuildingVolumeNorm,
-    ThermotechnicalDeviceHeatingType,
+    'PeriodOfConstruction': '.enums',
+    'BuildingCategory': '.enums',
+    'BuildingStatus': '.enums',
+    'HeatGeneratorHeating': '.enums',
+    'HeatGeneratorHotWater': '.enums',
+    'EnergySource': '.enums',
+    'InformationSource': '.enums',
+    'BuildingVolumeInformationSource': '.enums',
+    'BuildingVolumeNorm': '.enums',
+    'ThermotechnicalDeviceHeatingType': '.enums',
     # Dwelling (§4.6)
-    DwellingStatus,
-    DwellingUsageCode,
-    DwellingInformationSource,
-    UsageLimitation,
+    'DwellingStatus': '.enums',
+    'DwellingUsageCode': '.enums',
+    'DwellingInformationSource': '.enums',
+    'UsageLimitation': '.enums',
     # Realestate (§4.8)
-    RealestateType,
-    RealestateStatus,
+    'RealestateType': '.enums',
+    'RealestateStatus': '.enums',
     # Area (§4.9)
-    AreaType,
-    AreaDescriptionCode,
+    'AreaType': '.enums',
+    'AreaDescriptionCode': '.enums',
     # Insurance/Estimation (§4.13-4.14)
-    UsageCode,
-    LocationCode,
-    ChangeReason,
-    TypeOfValue,
+    'UsageCode': '.enums',
+    'LocationCode': '.enums',
+    'ChangeReason': '.enums',
+    'TypeOfValue': '.enums',
     # Street/Cadastral (§4.15-4.19)
-    StreetKind,
-    StreetStatus,
-    StreetLanguage,
-    NumberingType,
-    PlaceNameType,
-    RemarkType,
+    'StreetKind': '.enums',
+    'StreetStatus': '.enums',
+    'StreetLanguage': '.enums',
+    'NumberingType': '.enums',
+    'PlaceNameType': '.enums',
+    'RemarkType': '.enums',
     # Contact (§4.22-4.23)
-    PhoneCategory,
-    EmailCategory,
+    'PhoneCategory': '.enums',
+    'EmailCategory': '.enums',
     # Coordinates (§4.24)
-    OriginOfCoordinates,
+    'OriginOfCoordinates': '.enums',
     # Fiscal ownership
-    FiscalRelationship,
-)
+    'FiscalRelationship': '.enums',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 # No model_rebuild() needed — eCH-0129 types have no forward references.
 # All cross-standard imports (eCH-0007, 0008, 0010, 0044, 0097) are resolved
@@ -0,0 +1,330 @@
+"""Lookup index over eCH-0129 object graphs (parcels, buildings, dwellings).
+
+Reconciling building data against the person register needs lookups such as
+"dwelling EWID 3 in building EGID 190123" or "parcel 1234 in municipality
+6172". ECH0129ObjectIndex registers the parsed models once and answers these
+with dict lookups instead of scanning nested lists:
+
+- Buildings by EGID
+- Building entrances by EGAID and by (EGID, EDID)
+- Dwellings by (EGID, EWID) — EWID is only unique within its building
+- Realestates by EGRID and by (municipality BFS number, parcel number)
+- Reverse links: entrance/dwelling → building, building ↔ realestates
+
+Models are referenced, never copied. A model equal to one already registered
+under the same identifier resolves to that object (eCH-0133 repeats parcels
+and buildings across records): add_*() return the registered object and the
+index keeps no reference to the duplicate. A different model under the same
+identifier raises ValueError.
+
+Usage:
+    from openmun_ech.ech0129.index import ECH0129ObjectIndex
+    from openmun_ech.ech0133.streaming import iter_realestate_information
+
+    index = ECH0129ObjectIndex.from_ech0133(iter_realestate_information('dump.xml'))
+    for dwelling, egid in gwr_dwellings:
+        index.add_dwelling(dwelling, egid)
+
+    dwelling = index.get_dwelling(egid=190123, ewid=3)
+    building = index.get_building_of(dwelling)
+    parcels = index.get_realestates_of(building)
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from openmun_ech.ech0129.v6.building import ECH0129Building, ECH0129BuildingOnly
+from openmun_ech.ech0129.v6.dwelling import ECH0129Dwelling
+from openmun_ech.ech0129.v6.entrance import ECH0129BuildingEntrance
+from openmun_ech.ech0129.v6.realestate import ECH0129Realestate
+
+AnyBuilding = Union[ECH0129Building, ECH0129BuildingOnly]
+
+# Link keys: identifier when the model has one, object identity otherwise
+_LinkKey = Tuple
+
+
+def _building_egid(building: AnyBuilding) -> Optional[int]:
+    """EGID of a building (direct EGID element or buildingIdentification)."""
+    if building.egid is not None:
+        return building.egid
+    if building.building_identification is not None:
+        return building.building_identification.egid
+    return None
+
+
+def _municipality_number(municipality) -> Optional[int]:
+    """BFS number from an int, a numeric string or an eCH-0007 municipality."""
+    if municipality is None or isinstance(municipality, int):
+        return municipality
+    if isinstance(municipality, str):
+        return int(municipality)
+    if municipality.municipality_id is None:
+        return None
+    return int(municipality.municipality_id)
+
+
+class ECH0129ObjectIndex:
+    """Indexed container of eCH-0129 realestates, buildings and dwellings.
+
+    Build it with add_realestate()/add_building()/add_dwelling(), or from
+    eCH-0133 deliveries/records with from_ech0133(). All get_* methods are
+    dict lookups and return None (or an empty list) for unknown identifiers.
+    """
+
+    def __init__(self):
+        self._buildings: Dict[int, AnyBuilding] = {}
+        self._entrances: Dict[int, ECH0129BuildingEntrance] = {}
+        self._entrances_by_edid: Dict[Tuple[int, int], ECH0129BuildingEntrance] = {}
+        self._dwellings: Dict[Tuple[int, int], ECH0129Dwelling] = {}
+        self._realestates: Dict[str, ECH0129Realestate] = {}
+        self._realestates_by_number: Dict[Tuple[int, str, Optional[str]], ECH0129Realestate] = {}
+
+        # Reverse links (values keep the referenced objects alive, so id() stays valid)
+        self._building_egid_of: Dict[int, Tuple[object, int]] = {}
+        self._dwellings_of: Dict[int, List[ECH0129Dwelling]] = {}
+        self._realestates_of: Dict[_LinkKey, List[ECH0129Realestate]] = {}
+        self._buildings_on: Dict[_LinkKey, List[AnyBuilding]] = {}
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def _register(self, table: dict, key, obj, label: str):
+        """Store obj under key; return the object registered under key."""
+        existing = table.get(key)
+        if existing is None:
+            table[key] = obj
+            return obj
+        if existing is not obj and existing != obj:
+            raise ValueError(f"Conflicting {label} for {key!r}")
+        return existing
+
+    def _registered_realestate(self, realestate: ECH0129Realestate) -> ECH0129Realestate:
+        """The registered realestate equal to realestate (by EGRID), else realestate."""
+        egrid = realestate.realestate_identification.egrid
+        existing = self._realestates.get(egrid) if egrid is not None else None
+        if existing is not None and (existing is realestate or existing == realestate):
+            return existing
+        return realestate
+
+    def add_realestate(
+        self,
+        realestate: ECH0129Realestate,
+        municipality=None,
+    ) -> ECH0129Realestate:
+        """Register a realestate (by EGRID, and by parcel number if the municipality is known).
+
+        Args:
+            realestate: Realestate to register
+            municipality: BFS number (int/str) or eCH-0007 municipality the parcel lies in
+
+        Returns:
+            The registered realestate (an earlier equal one, if any)
+        """
+        identification = realestate.realestate_identification
+        registered = realestate
+        if identification.egrid is not None:
+            registered = self._register(self._realestates, identification.egrid, realestate, 'realestate')
+        bfs = _municipality_number(municipality)
+        if bfs is not None:
+            key = (bfs, identification.number, identification.sub_district)
+            registered = self._register(self._realestates_by_number, key, registered, 'realestate')
+        return registered
+
+    def add_building(
+        self,
+        building: AnyBuilding,
+        realestates: Iterable[ECH0129Realestate] = (),
+    ) -> AnyBuilding:
+        """Register a building, its entrances and the realestates it stands on.
+
+        Args:
+            building: ECH0129Building or ECH0129BuildingOnly
+            realestates: Realestates linked to the building (register them first
+                         with add_realestate() to make them findable by identifier)
+
+        Returns:
+            The registered building (an earlier equal one, if any)
+        """
+        egid = _building_egid(building)
+        registered = building
+        if egid is not None:
+            registered = self._register(self._buildings, egid, building, 'building')
+            for entrance in getattr(building, 'building_entrance', ()):
+                self._add_entrance(entrance, egid)
+
+        building_key = self._link_key(registered)
+        for realestate in realestates:
+            realestate = self._registered_realestate(realestate)
+            realestate_key = self._link_key(realestate)
+            linked = self._realestates_of.setdefault(building_key, [])
+            if not any(self._link_key(r) == realestate_key for r in linked):
+                linked.append(realestate)
+                self._buildings_on.setdefault(realestate_key, []).append(registered)
+        return registered
+
+    def _add_entrance(self, entrance: ECH0129BuildingEntrance, egid: int) -> None:
+        registered = entrance
+        if entrance.egaid is not None:
+            registered = self._register(self._entrances, entrance.egaid, entrance, 'building entrance')
+        if entrance.edid is not None:
+            registered = self._register(
+                self._entrances_by_edid, (egid, entrance.edid), registered, 'building entrance'
+            )
+        if registered is entrance:
+            self._building_egid_of[id(entrance)] = (entrance, egid)
+
+    def add_dwelling(
+        self,
+        dwelling: ECH0129Dwelling,
+        building: Union[AnyBuilding, int],
+    ) -> ECH0129Dwelling:
+        """Register a dwelling of a building.
+
+        The building may be registered before or after its dwellings.
+
+        Args:
+            dwelling: Dwelling to register (must have an EWID)
+            building: The building or its EGID
+
+        Returns:
+            The registered dwelling (an earlier equal one, if any)
+
+        Raises:
+            ValueError: If the dwelling has no EWID or the building no EGID
+        """
+        egid = building if isinstance(building, int) else _building_egid(building)
+        if egid is None:
+            raise ValueError("Dwelling can only be indexed for a building with EGID")
+        if dwelling.ewid is None:
+            raise ValueError(f"Dwelling in building EGID {egid} has no EWID")
+        registered = self._register(self._dwellings, (egid, dwelling.ewid), dwelling, 'dwelling')
+        if registered is dwelling:
+            self._building_egid_of[id(dwelling)] = (dwelling, egid)
+            self._dwellings_of.setdefault(egid, []).append(dwelling)
+        return registered
+
+    @classmethod
+    def from_ech0133(cls, source) -> 'ECH0129ObjectIndex':
+        """Build an index from an eCH-0133 delivery or an iterable of its records.
+
+        Args:
+            source: ECH0133Delivery, or an iterable of ECH0133RealestateInfo /
+                    ECH0133EstimationInfo (e.g. from openmun_ech.ech0133.streaming)
+        """
+        index = cls()
+        index.add_ech0133(source)
+        return index
+
+    def add_ech0133(self, source) -> None:
+        """Register all realestates and buildings of eCH-0133 data (see from_ech0133())."""
+        from openmun_ech.ech0133.v3 import ECH0133Delivery, ECH0133EstimationInfo
+
+        if isinstance(source, ECH0133Delivery):
+            if source.realestate_base_delivery is not None:
+                records = source.realestate_base_delivery.realestate_information
+            elif source.estimation_base_delivery is not None:
+                records = source.estimation_base_delivery.estimation_information
+            elif source.estimation is not None:
+                records = source.estimation.realestate_info
+            else:
+                records = [source.owner_or_beneficiary]
+        else:
+            records = source
+
+        for record in records:
+            if isinstance(record, ECH0133EstimationInfo):
+                self._add_estimation_info(record)
+                continue
+            # realestateInformation, estimation realestateInfo, ownerOrBeneficiary
+            realestate = self.add_realestate(record.realestate, record.municipality)
+            for info in getattr(record, 'building_information', ()):
+                self.add_building(info.building, [realestate])
+
+    def _add_estimation_info(self, record) -> None:
+        if record.realestate_information is not None:
+            info = record.realestate_information
+            realestate = self.add_realestate(info.realestate, info.municipality)
+            for building in info.building:
+                self.add_building(building, [realestate])
+        for building_info in record.building_information:
+            realestates = [
+                self.add_realestate(info.realestate, info.municipality)
+                for info in building_info.realestate_information
+            ]
+            self.add_building(building_info.building, realestates)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_building(self, egid: int) -> Optional[AnyBuilding]:
+        """Building by EGID."""
+        return self._buildings.get(egid)
+
+    def get_entrance(self, egaid: int) -> Optional[ECH0129BuildingEntrance]:
+        """Building entrance by EGAID."""
+        return self._entrances.get(egaid)
+
+    def get_entrance_by_edid(self, egid: int, edid: int) -> Optional[ECH0129BuildingEntrance]:
+        """Building entrance by EGID and EDID."""
+        return self._entrances_by_edid.get((egid, edid))
+
+    def get_dwelling(self, egid: int, ewid: int) -> Optional[ECH0129Dwelling]:
+        """Dwelling by EGID and EWID."""
+        return self._dwellings.get((egid, ewid))
+
+    def get_realestate(self, egrid: str) -> Optional[ECH0129Realestate]:
+        """Realestate by EGRID."""
+        return self._realestates.get(egrid)
+
+    def get_realestate_by_number(
+        self,
+        municipality: Union[int, str],
+        number: str,
+        sub_district: Optional[str] = None,
+    ) -> Optional[ECH0129Realestate]:
+        """Realestate by municipality BFS number and parcel number."""
+        return self._realestates_by_number.get(
+            (_municipality_number(municipality), number, sub_district)
+        )
+
+    # ------------------------------------------------------------------
+    # Reverse links
+    # ------------------------------------------------------------------
+
+    def get_building_of(
+        self,
+        obj: Union[ECH0129BuildingEntrance, ECH0129Dwelling],
+    ) -> Optional[AnyBuilding]:
+        """Building of a registered entrance or dwelling (None if the building is unknown).
+
+        Pass the registered object (as returned by add_*()); equal duplicates
+        are not kept by the index.
+        """
+        entry = self._building_egid_of.get(id(obj))
+        if entry is None or entry[0] is not obj:
+            return None
+        return self._buildings.get(entry[1])
+
+    def get_dwellings_of(self, building: Union[AnyBuilding, int]) -> List[ECH0129Dwelling]:
+        """Registered dwellings of a building (or EGID)."""
+        egid = building if isinstance(building, int) else _building_egid(building)
+        return list(self._dwellings_of.get(egid, ()))
+
+    def get_realestates_of(self, building: AnyBuilding) -> List[ECH0129Realestate]:
+        """Realestates a building stands on."""
+        return list(self._realestates_of.get(self._link_key(building), ()))
+
+    def get_buildings_on(self, realestate: ECH0129Realestate) -> List[AnyBuilding]:
+        """Buildings standing on a realestate."""
+        return list(self._buildings_on.get(self._link_key(realestate), ()))
+
+    # ------------------------------------------------------------------
+
+    def _link_key(self, obj) -> _LinkKey:
+        if isinstance(obj, ECH0129Realestate):
+            egrid = obj.realestate_identification.egrid
+            return ('EGRID', egrid) if egrid is not None else ('id', id(obj))
+        egid = _building_egid(obj)
+        return ('EGID', egid) if egid is not None else ('id', id(obj))
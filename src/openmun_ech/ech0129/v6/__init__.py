@@ -13,88 +13,74 @@
   partialAreaOfBuilding, kindOfConstructionWork.
 """
 
-from .authority_person import (
-    ECH0129BuildingAuthority,
-    ECH0129BuildingAuthorityOnly,
-    ECH0129Email,
-    ECH0129IdentificationChoice,
-    ECH0129Person,
-    ECH0129PersonOnly,
-    ECH0129Phone,
-)
-from .base_types import (
-    ECH0129BuildingDate,
-    ECH0129BuildingVolume,
-    ECH0129Contact,
-    ECH0129Coordinates,
-    ECH0129DatePartiallyKnown,
-    ECH0129DateRange,
-    ECH0129Heating,
-    ECH0129HotWater,
-    ECH0129NamedId,
-    ECH0129NamedMetaData,
-    ECH0129PersonIdentification,
-)
-from .construction import (
-    ECH0129ConstructionLocalisation,
-    ECH0129ConstructionProject,
-    ECH0129ConstructionProjectIdentification,
-    ECH0129KindOfConstructionWork,
-)
-from .dwelling import (
-    ECH0129Dwelling,
-    ECH0129DwellingIdentification,
-    ECH0129DwellingUsage,
-)
-from .building import (
-    ECH0129Building,
-    ECH0129BuildingIdentification,
-    ECH0129BuildingOnly,
-)
-from .entrance import (
-    ECH0129AddressStreetDescription,
-    ECH0129AddressStreetEntry,
-    ECH0129BuildingAddress,
-    ECH0129BuildingAddressLight,
-    ECH0129BuildingEntrance,
-    ECH0129BuildingEntranceIdentification,
-    ECH0129BuildingEntranceOnly,
-)
-from .cadastral import (
-    ECH0129CadastralMap,
-    ECH0129CadastralSurveyorRemark,
-    ECH0129CoveringAreaOfSDR,
-    ECH0129PartialAreaOfBuilding,
-    ECH0129Right,
-)
-from .estimation import (
-    ECH0129EstimationObject,
-    ECH0129EstimationObjectOnly,
-    ECH0129EstimationValue,
-    ECH0129Value,
-)
-from .insurance import (
-    ECH0129InsuranceObject,
-    ECH0129InsuranceObjectOnly,
-    ECH0129InsuranceSum,
-    ECH0129InsuranceValue,
-    ECH0129InsuranceVolume,
-)
-from .realestate import (
-    ECH0129Area,
-    ECH0129FiscalOwnership,
-    ECH0129Realestate,
-    ECH0129RealestateIdentification,
-)
-from .street_locality import (
-    ECH0129Locality,
-    ECH0129LocalityName,
-    ECH0129PlaceName,
-    ECH0129Street,
-    ECH0129StreetDescription,
-    ECH0129StreetDescriptionEntry,
-    ECH0129StreetSection,
-)
+from openmun_ech._lazy import lazy_exports
+
+# Classes are imported from their submodule on first access (see
+# openmun_ech/_lazy.py), so e.g. dwellings do not load construction projects.
+_EXPORTS = {
+    'ECH0129BuildingAuthority': '.authority_person',
+    'ECH0129BuildingAuthorityOnly': '.authority_person',
+    'ECH0129Email': '.authority_person',
+    'ECH0129IdentificationChoice': '.authority_person',
+    'ECH0129Person': '.authority_person',
+    'ECH0129PersonOnly': '.authority_person',
+    'ECH0129Phone': '.authority_person',
+    'ECH0129BuildingDate': '.base_types',
+    'ECH0129BuildingVolume': '.base_types',
+    'ECH0129Contact': '.base_types',
+    'ECH0129Coordinates': '.base_types',
+    'ECH0129DatePartiallyKnown': '.base_types',
+    'ECH0129DateRange': '.base_types',
+    'ECH0129Heating': '.base_types',
+    'ECH0129HotWater': '.base_types',
+    'ECH0129NamedId': '.base_types',
+    'ECH0129NamedMetaData': '.base_types',
+    'ECH0129PersonIdentification': '.base_types',
+    'ECH0129ConstructionLocalisation': '.construction',
+    'ECH0129ConstructionProject': '.construction',
+    'ECH0129ConstructionProjectIdentification': '.construction',
+    'ECH0129KindOfConstructionWork': '.construction',
+    'ECH0129Dwelling': '.dwelling',
+    'ECH0129DwellingIdentification': '.dwelling',
+    'ECH0129DwellingUsage': '.dwelling',
+    'ECH0129Building': '.building',
+    'ECH0129BuildingIdentification': '.building',
+    'ECH0129BuildingOnly': '.building',
+    'ECH0129AddressStreetDescription': '.entrance',
+    'ECH0129AddressStreetEntry': '.entrance',
+    'ECH0129BuildingAddress': '.entrance',
+    'ECH0129BuildingAddressLight': '.entrance',
+    'ECH0129BuildingEntrance': '.entrance',
+    'ECH0129BuildingEntranceIdentification': '.entrance',
+    'ECH0129BuildingEntranceOnly': '.entrance',
+    'ECH0129CadastralMap': '.cadastral',
+    'ECH0129CadastralSurveyorRemark': '.cadastral',
+    'ECH0129CoveringAreaOfSDR': '.cadastral',
+    'ECH0129PartialAreaOfBuilding': '.cadastral',
+    'ECH0129Right': '.cadastral',
+    'ECH0129EstimationObject': '.estimation',
+    'ECH0129EstimationObjectOnly': '.estimation',
+    'ECH0129EstimationValue': '.estimation',
+    'ECH0129Value': '.estimation',
+    'ECH0129InsuranceObject': '.insurance',
+    'ECH0129InsuranceObjectOnly': '.insurance',
+    'ECH0129InsuranceSum': '.insurance',
+    'ECH0129InsuranceValue': '.insurance',
+    'ECH0129InsuranceVolume': '.insurance',
+    'ECH0129Area': '.realestate',
+    'ECH0129FiscalOwnership': '.realestate',
+    'ECH0129Realestate': '.realestate',
+    'ECH0129RealestateIdentification': '.realestate',
+    'ECH0129Locality': '.street_locality',
+    'ECH0129LocalityName': '.street_locality',
+    'ECH0129PlaceName': '.street_locality',
+    'ECH0129Street': '.street_locality',
+    'ECH0129StreetDescription': '.street_locality',
+    'ECH0129StreetDescriptionEntry': '.street_locality',
+    'ECH0129StreetSection': '.street_locality',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'ECH0129AddressStreetDescription',
@@ -0,0 +1,278 @@
+"""eCH-0133 streaming reader/writer for full-dump base deliveries.
+
+realestateBaseDelivery and estimationBaseDelivery carry a whole canton's
+parcels or valuations. ECH0133Delivery.from_file()/to_file() hold all of them
+in memory as nested eCH-0129 model trees. This module processes one record at
+a time instead:
+
+- Reading: iterparse yields one validated ECH0133RealestateInfo /
+  ECH0133EstimationInfo per element; parsed elements are released, so memory
+  stays bounded by the largest single record
+- Writing: the header is written once, then every record as soon as it is
+  produced
+
+Design goals:
+- Same models as the in-memory API (records are built with from_xml())
+- Documents written here parse back with ECH0133Delivery.from_file()
+- No namespace pollution (not added to ech0133 exports)
+
+Usage:
+    from openmun_ech.ech0133.streaming import (
+        ECH0133StreamWriter, iter_realestate_information, read_delivery_header,
+    )
+
+    header = read_delivery_header('dump.xml')
+    for info in iter_realestate_information('dump.xml'):
+        ...
+
+    with ECH0133StreamWriter('out.xml', header, 'realestateBaseDelivery') as writer:
+        for info in produce_records():
+            writer.write(info)
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Type, Union
+
+from openmun_ech.core import ECHModel, NS
+from openmun_ech.core.indent import indent
+from openmun_ech.ech0058 import codec
+from openmun_ech.ech0058.v5 import ECH0058Header
+from openmun_ech.utils._xml_entities import Source, iterparse
+from openmun_ech.utils._xml_stream import (
+    StreamTarget,
+    root_namespaces,
+    serialize_fragment,
+    xmlns_attributes,
+)
+
+from .v3 import ECH0133EstimationInfo, ECH0133RealestateInfo
+
+
+# Streamable message type → record class (record element name from __xml_element__)
+RECORD_TYPES = {
+    'realestateBaseDelivery': ECH0133RealestateInfo,
+    'estimationBaseDelivery': ECH0133EstimationInfo,
+}
+
+_MESSAGE_TYPES = (
+    'ownerOrBeneficiary',
+    'estimation',
+    'realestateBaseDelivery',
+    'estimationBaseDelivery',
+)
+
+# Namespaces declared once on <delivery>
+_ROOT_NAMESPACES = root_namespaces([
+    NS.ECH0133_V3, NS.ECH0058_V5, NS.ECH0129_V6, NS.ECH0007_V6,
+    NS.ECH0008_V3, NS.ECH0044_V4, NS.ECH0097_V2,
+])
+
+_INDENT = '  '
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def read_delivery_header(source: Source, namespace: str = NS.ECH0133_V3) -> ECH0058Header:
+    """Parse only the deliveryHeader of an eCH-0133 delivery.
+
+    Stops reading as soon as the header is complete, regardless of file size
+    (see ech0058.codec.read_delivery_header).
+
+    Raises:
+        ValueError: If the document is not an eCH-0133 delivery or has no header
+    """
+    return codec.read_delivery_header(source, root=f'{{{namespace}}}delivery')
+
+
+def _iter_records(source: Source, message_type: str, namespace: str) -> Iterator[ECHModel]:
+    """Yield the records of one base delivery message type, one at a time."""
+    record_cls: Type[ECHModel] = RECORD_TYPES[message_type]
+    container_tag = f'{{{namespace}}}{message_type}'
+    record_tag = f'{{{namespace}}}{record_cls.__xml_element__}'
+    other_tags = {f'{{{namespace}}}{name}': name for name in _MESSAGE_TYPES if name != message_type}
+
+    root = None
+    container = None
+    depth = 0
+    for event, elem in iterparse(source):
+        if event == 'start':
+            depth += 1
+            if depth == 1:
+                if elem.tag != f'{{{namespace}}}delivery':
+                    raise ValueError(f"Not an eCH-0133 delivery: root element is {elem.tag}")
+                root = elem
+            elif depth == 2:
+                if elem.tag == container_tag:
+                    container = elem
+                elif elem.tag in other_tags:
+                    raise ValueError(
+                        f"Delivery contains {other_tags[elem.tag]}, not {message_type}"
+                    )
+            continue
+
+        depth -= 1
+        if depth == 2 and container is not None and elem.tag == record_tag:
+            yield record_cls.from_xml(elem, namespace=namespace)
+            container.remove(elem)  # Release the parsed record
+        elif depth == 1 and elem is not container:
+            root.remove(elem)  # deliveryHeader / extensions: not needed here
+
+    if container is None:
+        raise ValueError(f"Delivery does not contain {message_type}")
+
+
+def iter_realestate_information(
+    source: Source,
+    namespace: str = NS.ECH0133_V3,
+) -> Iterator[ECH0133RealestateInfo]:
+    """Yield realestateInformation records of a realestateBaseDelivery.
+
+    Args:
+        source: File path or binary file object
+        namespace: eCH-0133 namespace
+
+    Yields:
+        ECH0133RealestateInfo in document order
+
+    Raises:
+        ValueError: If the document is not a realestateBaseDelivery
+        ValidationError: If a record is invalid (raised when it is reached)
+    """
+    return _iter_records(source, 'realestateBaseDelivery', namespace)
+
+
+def iter_estimation_information(
+    source: Source,
+    namespace: str = NS.ECH0133_V3,
+) -> Iterator[ECH0133EstimationInfo]:
+    """Yield estimationInformation records of an estimationBaseDelivery.
+
+    Args and errors as for iter_realestate_information().
+    """
+    return _iter_records(source, 'estimationBaseDelivery', namespace)
+
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+class ECH0133StreamWriter:
+    """Write a realestateBaseDelivery / estimationBaseDelivery record by record.
+
+    Args:
+        target: Output path or writable binary file object
+        header: eCH-0058 v5 delivery header (written once)
+        message_type: 'realestateBaseDelivery' or 'estimationBaseDelivery'
+        encoding: Output encoding
+        pretty_print: Indent output like ECH0133Delivery.to_file()
+
+    For a path, output goes to a temporary file that replaces `target` on
+    close(); an exception inside the `with` block leaves `target` untouched.
+
+    Raises:
+        ValueError: If message_type is not a base delivery type
+    """
+
+    def __init__(
+        self,
+        target: Union[str, Path, BinaryIO],
+        header: ECH0058Header,
+        message_type: str,
+        encoding: str = 'utf-8',
+        pretty_print: bool = True,
+    ):
+        if message_type not in RECORD_TYPES:
+            raise ValueError(
+                f"Unknown message type '{message_type}', expected one of {tuple(RECORD_TYPES)}"
+            )
+        self.message_type = message_type
+        self.record_cls = RECORD_TYPES[message_type]
+        self.pretty_print = pretty_print
+        self.count = 0
+        self._out = StreamTarget(target, encoding)
+        try:
+            self._write_prefix(header)
+        except BaseException:
+            self._out.abort()
+            raise
+
+    def _write_prefix(self, header: ECH0058Header) -> None:
+        ns = NS.ECH0133_V3
+        prefix = _ROOT_NAMESPACES[ns]
+        header_elem = ET.Element(f'{{{ns}}}deliveryHeader')
+        header.to_xml(parent=header_elem, namespace=NS.ECH0058_V5, skip_wrapper=True)
+        if self.pretty_print:
+            indent(header_elem, space=_INDENT, level=1)
+
+        self._root_tag = f'{prefix}:delivery'
+        self._container_tag = f'{prefix}:{self.message_type}'
+        self._out.write_declaration()
+        self._out.write(f'<{self._root_tag}{xmlns_attributes(_ROOT_NAMESPACES)}>')
+        self._write_at(1, serialize_fragment(header_elem, _ROOT_NAMESPACES))
+        self._write_at(1, f'<{self._container_tag}>')
+
+    def _write_at(self, level: int, text: str) -> None:
+        if self.pretty_print:
+            self._out.write('\n' + _INDENT * level)
+        self._out.write(text)
+
+    def write(self, record: Union[ECH0133RealestateInfo, ECH0133EstimationInfo]) -> None:
+        """Serialize and write one record.
+
+        Raises:
+            TypeError: If the record does not belong to this message type
+            ValueError: If the writer is closed
+        """
+        if self._out.closed:
+            raise ValueError("ECH0133StreamWriter is closed")
+        if not isinstance(record, self.record_cls):
+            raise TypeError(
+                f"{self.message_type} expects {self.record_cls.__name__}, "
+                f"got {type(record).__name__}"
+            )
+        data = record.to_xml_bytes(
+            namespace=NS.ECH0133_V3, indent=_INDENT if self.pretty_print else None,
+            level=2, declared=_ROOT_NAMESPACES,
+        )
+        self._write_at(2, data.decode('utf-8'))
+        self.count += 1
+
+    def write_all(self, records: Iterable[Union[ECH0133RealestateInfo, ECH0133EstimationInfo]]) -> int:
+        """Write all records of an iterable; returns the number written."""
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self) -> None:
+        """Finish the document (and move it into place for path targets).
+
+        Raises:
+            ValueError: If no record was written (the XSD requires at least one)
+        """
+        if self._out.closed:
+            return
+        if self.count == 0:
+            self.abort()
+            raise ValueError(
+                f"{self.message_type} requires at least one "
+                f"{self.record_cls.__xml_element__} element"
+            )
+        self._write_at(1, f'</{self._container_tag}>')
+        self._write_at(0, f'</{self._root_tag}>')
+        self._out.commit()
+
+    def abort(self) -> None:
+        """Stop writing; a path target is left untouched (partial output removed)."""
+        self._out.abort()
+
+    def __enter__(self) -> 'ECH0133StreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
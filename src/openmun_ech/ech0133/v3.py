@@ -26,6 +26,7 @@ from pydantic import Field, model_validator
 from typing_extensions import Self
 
 from openmun_ech.core import ECHModel, xml_field, NS
+from openmun_ech.core.indent import indent
 from openmun_ech.ech0129 import (
     ECH0129Realestate,
     ECH0129FiscalOwnership,
@@ -534,7 +535,7 @@ class ECH0133Delivery(ECHModel):
         path = Path(file_path) if isinstance(file_path, str) else file_path
         root = self.to_xml()
         if pretty_print:
-            ET.indent(root, space='  ')
+            indent(root, space='  ')
         tree = ET.ElementTree(root)
         tree.write(
             path, encoding=encoding,
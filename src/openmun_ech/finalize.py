@@ -23,7 +23,8 @@ from typing import Iterable, List, Optional
 from uuid import uuid4
 
 from openmun_ech.ech0020 import BaseDeliveryEvent, DeliveryConfig
-from openmun_ech.ech0020.v3 import ECH0020Delivery, ECH0020Header
+from openmun_ech.ech0020.layer2.event import build_delivery_header
+from openmun_ech.ech0020.v3 import ECH0020Delivery
 from openmun_ech.ech0099 import ECH0099Delivery, ECH0099ReportedPerson
 from openmun_ech.ech0099.models import (
     StatisticsDeliveryEvent,
@@ -31,7 +32,6 @@ from openmun_ech.ech0099.models import (
     finalize_statistics_delivery,
 )
 from openmun_ech.ech0058 import ActionType, ECH0058SendingApplication as ECH0058SendingApplicationV5
-from openmun_ech.ech0058 import v5 as ech0058_v5
 from openmun_ech.ech0058 import v4 as ech0058_v4
 from openmun_ech.core import NS
 
@@ -50,34 +50,8 @@ def finalize_0020_base(
     `BaseDeliveryEvent` to its Layer 1 `eventBaseDelivery`, returning an
     `ECH0020Delivery` with a list payload (baseDelivery/messages).
     """
-    msg_id = message_id or str(uuid4())
-    msg_date = message_date or datetime.now(timezone.utc)
-
-    message_type = config.message_type_override or NS.ECH0020_V3
-
-    sending_application = ech0058_v5.ECH0058SendingApplication(
-        manufacturer=config.manufacturer,
-        product=config.product,
-        product_version=config.product_version,
-    )
-
-    header = ech0058_v5.ECH0058Header(
-        sender_id=config.sender_id,
-        message_id=msg_id,
-        message_type=message_type,
-        sending_application=sending_application,
-        message_date=msg_date,
-        action=action,
-        test_delivery_flag=config.test_delivery_flag,
-        original_sender_id=config.original_sender_id,
-        **optional_header_fields,
-    )
-
-    delivery_header = ECH0020Header(
-        header=header,
-        data_lock=None,
-        data_lock_valid_from=None,
-        data_lock_valid_till=None,
+    delivery_header = build_delivery_header(
+        config, message_id or None, message_date, action, **optional_header_fields
     )
 
     layer1_events: List = [e.to_ech0020_event() for e in events]
@@ -0,0 +1,294 @@
+"""Persistent index of the persons in eCH deliveries.
+
+Inbound events (moveIn, moveOut, correctReporting) are reconciled against
+the last full baseDelivery, looked up by local person ID or VN. Scanning a
+full register per event does not scale; this module keeps a disk-backed
+index (SQLite, standard library) of one or more deliveries:
+
+- Each entity (eCH-0020 messages, eCH-0099 reportedPerson, as in diff) is
+  recorded with its byte range in the delivery file and the digest of its
+  canonical form (diff: equal digests mean equal content)
+- VN, local person ID, other person IDs and EU person IDs map to entities
+- Deliveries are scanned once with expat (no element tree of the whole
+  file, as for seekable sidecars); only one entity at a time is parsed,
+  for its IDs and digest
+- element() re-reads a single entity by seeking to its byte range; the
+  namespace declarations in scope (on the root element) are restored
+
+A delivery is re-indexed by add() when its size or modification time
+changed; element() refuses to read a delivery that changed since.
+
+Usage:
+    from openmun_ech.person_index import PersonIndex
+
+    with PersonIndex('persons.sqlite') as index:
+        index.add('register_2025-01-01.xml')
+        for hit in index.find(vn='7561234567897'):
+            event = ECH0020EventBaseDelivery.from_xml(index.element(hit))
+        index.find(local_person_id='100042', category='MU.261')
+"""
+
+import json
+import mmap
+import os
+import sqlite3
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from openmun_ech.utils._xml_entities import (
+    Document,
+    ECH0020_ENTITY,
+    ECH0020_PERSON,
+    ECH0099_ENTITY,
+    ECH0099_PERSON,
+    PREFIX_URIS,
+    default_entity,
+    canonical_digest,
+    entity_ranges,
+    parse_fragment,
+)
+
+# Entity path → path of its personIdentification (relative to the entity)
+IDENTIFICATIONS: Dict[str, str] = {
+    ECH0020_ENTITY: ECH0020_PERSON,
+    ECH0099_ENTITY: ECH0099_PERSON,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS delivery (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    entity TEXT NOT NULL,
+    encoding TEXT,
+    namespaces TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entity (
+    delivery INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    start_byte INTEGER NOT NULL,
+    end_byte INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    PRIMARY KEY (delivery, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS person_id (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    category TEXT NOT NULL,
+    delivery INTEGER NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS person_id_lookup ON person_id (kind, value, category);
+CREATE INDEX IF NOT EXISTS person_id_delivery ON person_id (delivery);
+"""
+
+
+@dataclass(frozen=True)
+class IndexedEntity:
+    """An entity found in the index.
+
+    Args:
+        delivery: Absolute path of the delivery file
+        position: 0-based position of the entity in the delivery
+        start: Offset of the entity's start tag in the file
+        end: Offset after the entity's end tag
+        digest: Digest of the canonical form (as diff)
+    """
+
+    delivery: str
+    position: int
+    start: int
+    end: int
+    digest: bytes
+
+
+def _person_ids(elem: ET.Element, identification: str) -> Iterator[Tuple[str, str, str]]:
+    """(kind, value, category) of the IDs in an entity's personIdentification."""
+    ident = elem.find(identification, PREFIX_URIS)
+    if ident is None:
+        return
+    vn = ident.findtext('eCH-0044:vn', namespaces=PREFIX_URIS)
+    if vn and vn.strip():
+        yield 'vn', vn.strip(), ''
+    for kind, tag in (('local', 'eCH-0044:localPersonId'), ('other', 'eCH-0044:otherPersonId'),
+                      ('eu', 'eCH-0044:euPersonId')):
+        for named in ident.iterfind(tag, PREFIX_URIS):
+            value = named.findtext('eCH-0044:personId', namespaces=PREFIX_URIS)
+            category = named.findtext('eCH-0044:personIdCategory', namespaces=PREFIX_URIS)
+            if value and value.strip():
+                yield kind, value.strip(), (category or '').strip()
+
+
+class PersonIndex:
+    """Disk-backed index of the persons in deliveries (see module docstring).
+
+    Args:
+        path: SQLite database file (created if missing; ':memory:' for a
+            temporary index)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(_SCHEMA)
+        # Delivery id → (path, size, mtime_ns, encoding, namespaces)
+        self._deliveries: Dict[int, Tuple[str, int, int, Optional[str], Dict[str, str]]] = {}
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'PersonIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, delivery: Union[str, Path], entity: Optional[str] = None) -> int:
+        """Index a delivery file (again, if it changed); returns its number of entities.
+
+        Args:
+            delivery: Path of the delivery
+            entity: Entity path (as diff.EntityKey.entity); by default from
+                the root element (eCH-0020 messages, eCH-0099 reportedPerson)
+
+        Raises:
+            ValueError: If the entity path has no known personIdentification,
+                or does not match the root element
+        """
+        path = str(Path(delivery).resolve())
+        stat = os.stat(path)
+        row = self._db.execute(
+            'SELECT id, size, mtime_ns FROM delivery WHERE path = ?', (path,)
+        ).fetchone()
+        if row is not None and row[1:] == (stat.st_size, stat.st_mtime_ns):
+            return self._db.execute(
+                'SELECT COUNT(*) FROM entity WHERE delivery = ?', (row[0],)
+            ).fetchone()[0]
+
+        if entity is None:
+            entity = default_entity(path)
+        identification = IDENTIFICATIONS.get(entity)
+        if identification is None:
+            raise ValueError(f"No personIdentification path known for entity {entity!r}")
+
+        with self._db:
+            if row is not None:
+                self._remove(row[0])
+            delivery_id = self._db.execute(
+                'INSERT INTO delivery (path, size, mtime_ns, entity, namespaces) '
+                "VALUES (?, ?, ?, ?, '{}')",
+                (path, stat.st_size, stat.st_mtime_ns, entity),
+            ).lastrowid
+            count = self._index(delivery_id, path, entity, identification)
+        return count
+
+    def _index(self, delivery_id: int, path: str, entity: str, identification: str) -> int:
+        document = Document()
+        count = 0
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for position, (start, end) in enumerate(entity_ranges(data, entity, document)):
+                elem = parse_fragment(data[start:end], document.encoding, document.namespaces)
+                self._db.execute(
+                    'INSERT INTO entity VALUES (?, ?, ?, ?, ?)',
+                    (delivery_id, position, start, end, canonical_digest(elem)),
+                )
+                self._db.executemany(
+                    'INSERT INTO person_id VALUES (?, ?, ?, ?, ?)',
+                    [(kind, value, category, delivery_id, position)
+                     for kind, value, category in _person_ids(elem, identification)],
+                )
+                count = position + 1
+        self._db.execute(
+            'UPDATE delivery SET encoding = ?, namespaces = ? WHERE id = ?',
+            (document.encoding, json.dumps(document.namespaces or {}), delivery_id),
+        )
+        return count
+
+    def remove(self, delivery: Union[str, Path]) -> None:
+        """Drop a delivery from the index (nothing if it is not indexed)."""
+        row = self._db.execute(
+            'SELECT id FROM delivery WHERE path = ?', (str(Path(delivery).resolve()),)
+        ).fetchone()
+        if row is not None:
+            with self._db:
+                self._remove(row[0])
+
+    def _remove(self, delivery_id: int) -> None:
+        self._deliveries.pop(delivery_id, None)
+        for table, column in (('person_id', 'delivery'), ('entity', 'delivery'),
+                              ('delivery', 'id')):
+            self._db.execute(f'DELETE FROM {table} WHERE {column} = ?', (delivery_id,))
+
+    def deliveries(self) -> List[str]:
+        """Paths of the indexed deliveries, in the order they were added."""
+        return [path for path, in self._db.execute('SELECT path FROM delivery ORDER BY id')]
+
+    def find(self, *, vn: Optional[str] = None, local_person_id: Optional[str] = None,
+             other_person_id: Optional[str] = None, eu_person_id: Optional[str] = None,
+             category: Optional[str] = None) -> List[IndexedEntity]:
+        """Entities with a person ID, most recently indexed delivery first.
+
+        Exactly one ID must be given; category (personIdCategory, e.g.
+        'MU.261') narrows local, other and EU person IDs.
+
+        Raises:
+            ValueError: If not exactly one ID is given
+        """
+        given = [(kind, value) for kind, value in (
+            ('vn', vn), ('local', local_person_id), ('other', other_person_id),
+            ('eu', eu_person_id),
+        ) if value is not None]
+        if len(given) != 1:
+            raise ValueError("find() needs exactly one of vn, local_person_id, "
+                             "other_person_id, eu_person_id")
+        (kind, value), = given
+        query = (
+            'SELECT d.id, e.position, e.start_byte, e.end_byte, e.digest FROM person_id p '
+            'JOIN entity e ON e.delivery = p.delivery AND e.position = p.position '
+            'JOIN delivery d ON d.id = p.delivery '
+            'WHERE p.kind = ? AND p.value = ?'
+        )
+        params: list = [kind, value.strip()]
+        if category is not None:
+            query += ' AND p.category = ?'
+            params.append(category)
+        query += ' ORDER BY d.id DESC, e.position'
+        return [
+            IndexedEntity(self._delivery(delivery_id)[0], position, start, end, digest)
+            for delivery_id, position, start, end, digest in self._db.execute(query, params)
+        ]
+
+    def _delivery(self, delivery_id: int) -> Tuple[str, int, int, Optional[str], Dict[str, str]]:
+        info = self._deliveries.get(delivery_id)
+        if info is None:
+            path, size, mtime_ns, encoding, namespaces = self._db.execute(
+                'SELECT path, size, mtime_ns, encoding, namespaces FROM delivery WHERE id = ?',
+                (delivery_id,),
+            ).fetchone()
+            info = self._deliveries[delivery_id] = (
+                path, size, mtime_ns, encoding, json.loads(namespaces),
+            )
+        return info
+
+    def element(self, hit: IndexedEntity) -> ET.Element:
+        """Parse the entity of a find() result from its delivery file.
+
+        Raises:
+            ValueError: If the delivery is no longer indexed or changed since
+                it was indexed
+        """
+        row = self._db.execute(
+            'SELECT id FROM delivery WHERE path = ?', (hit.delivery,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"{hit.delivery} is not indexed")
+        path, size, mtime_ns, encoding, namespaces = self._delivery(row[0])
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                raise ValueError(f"{path} changed since it was indexed; add() it again")
+            f.seek(hit.start)
+            fragment = f.read(hit.end - hit.start)
+        return parse_fragment(fragment, encoding, namespaces)
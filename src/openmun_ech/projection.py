@@ -0,0 +1,442 @@
+"""Projection parsing: selected fields of each entity, without building models.
+
+Reporting jobs need five to ten fields per person (VN, names, date of
+birth, dwelling address, marital status), but from_xml() builds the whole
+event graph for every person. A projection reads only what was asked for:
+
+- Fields are Layer 2 names ('person.vn', 'dwelling_address.street', see
+  ECH0020_FIELDS / ECH0099_FIELDS) or eCH paths relative to the entity
+  element, with the prefixes of core.namespace
+  ('eCH-0020:baseDeliveryPerson/eCH-0020:religionData/eCH-0011:religion')
+- The paths are compiled into a tree of element tags that is matched
+  against the start/end events of the expat parser (the events iterparse
+  is built on); subtrees outside the projection are skipped, and neither
+  an element tree nor a model is ever built
+- Entities are the same as in diff (eCH-0020 messages, eCH-0099
+  reportedPerson); a row holds only the selected values, so memory does
+  not grow with the file
+
+Values are the element texts (stripped) passed through the field's
+converter; absent fields are None. A field with several paths (XSD
+choices such as main/secondary/other residence) takes the first present
+value; repeated fields collect all values in document order as a tuple.
+
+Usage:
+    from openmun_ech.projection import project
+
+    for row in project('register.xml', ['person.vn', 'person.official_name',
+                                         'dwelling_address.street']):
+        print(row['person.vn'], row['dwelling_address.street'])
+
+    # eCH paths and custom converters
+    origins = ProjectionField(
+        'eCH-0020:baseDeliveryPerson/eCH-0020:placeOfOriginInfo/'
+        'eCH-0020:placeOfOrigin/eCH-0011:originName',
+        repeated=True,
+    )
+    for row in project('register.xml', {'vn': 'person.vn', 'origins': origins}):
+        ...
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union,
+)
+from xml.parsers import expat
+
+from openmun_ech.core.codes import decode_enum
+from openmun_ech.ech0011.enums import MaritalStatus, NationalityStatus, TypeOfHousehold
+from openmun_ech.ech0021.enums import DataLockType
+from openmun_ech.ech0044 import Sex
+from openmun_ech.utils._xml_entities import (
+    ECH0020_ENTITY,
+    ECH0099_ENTITY,
+    Source,
+    clark_name,
+    default_entity,
+    entity_tags,
+    expat_name,
+    qname,
+)
+
+
+@dataclass(frozen=True)
+class ProjectionField:
+    """How one projected value is read.
+
+    Args:
+        paths: eCH path relative to the entity element, or several
+            alternatives (the first present value wins)
+        convert: Applied to the stripped element text; None keeps the str
+        repeated: Collect the values of all matching elements (tuple)
+
+    Raises:
+        ValueError: If a path is malformed or uses an unknown prefix
+    """
+
+    paths: Union[str, Tuple[str, ...]]
+    convert: Optional[Callable[[str], Any]] = None
+    repeated: bool = False
+
+    def __post_init__(self):
+        paths = (self.paths,) if isinstance(self.paths, str) else tuple(self.paths)
+        if not paths:
+            raise ValueError("ProjectionField needs at least one path")
+        object.__setattr__(self, 'paths', paths)
+        object.__setattr__(self, '_tags', tuple(entity_tags(path) for path in paths))
+
+
+def _enum(enum_cls: type) -> Callable[[str], Any]:
+    return lambda text: decode_enum(enum_cls, text)
+
+
+def _partial_date(text: str) -> date:
+    """eCH-0044 datePartiallyKnown text; partial dates as in Layer 2 (first day)."""
+    if len(text) == 4:
+        return date(int(text), 1, 1)
+    if len(text) == 7:
+        return date(int(text[:4]), int(text[5:]), 1)
+    return date.fromisoformat(text)
+
+
+def _at(prefixes: Iterable[str], path: str) -> Tuple[str, ...]:
+    return tuple(f'{prefix}/{path}' for prefix in prefixes)
+
+
+def _person_fields(identification: str, religion_data: str, marital_data: str,
+                   nationality_data: str) -> Dict[str, ProjectionField]:
+    """Layer 2 person fields (BaseDeliveryPerson names), given the eCH-0011 containers."""
+    pid = (identification,)
+    return {
+        'person.vn': ProjectionField(_at(pid, 'eCH-0044:vn')),
+        'person.local_person_id': ProjectionField(
+            _at(pid, 'eCH-0044:localPersonId/eCH-0044:personId')),
+        'person.local_person_id_category': ProjectionField(
+            _at(pid, 'eCH-0044:localPersonId/eCH-0044:personIdCategory')),
+        'person.official_name': ProjectionField(_at(pid, 'eCH-0044:officialName')),
+        'person.first_name': ProjectionField(_at(pid, 'eCH-0044:firstName')),
+        'person.sex': ProjectionField(_at(pid, 'eCH-0044:sex'), _enum(Sex)),
+        'person.date_of_birth': ProjectionField(
+            _at(pid, 'eCH-0044:dateOfBirth/eCH-0044:yearMonthDay')
+            + _at(pid, 'eCH-0044:dateOfBirth/eCH-0044:yearMonth')
+            + _at(pid, 'eCH-0044:dateOfBirth/eCH-0044:year'),
+            _partial_date),
+        'person.religion': ProjectionField(f'{religion_data}/eCH-0011:religion'),
+        'person.marital_status': ProjectionField(
+            f'{marital_data}/eCH-0011:maritalStatus', _enum(MaritalStatus)),
+        'person.date_of_marital_status': ProjectionField(
+            f'{marital_data}/eCH-0011:dateOfMaritalStatus', date.fromisoformat),
+        'person.nationality_status': ProjectionField(
+            f'{nationality_data}/eCH-0011:nationalityStatus', _enum(NationalityStatus)),
+    }
+
+
+def _residence_fields(residences: Tuple[str, ...], prefix: str,
+                      municipalities: Tuple[str, ...]) -> Dict[str, ProjectionField]:
+    """Layer 2 residence and dwelling address fields.
+
+    residences are the XSD choices, municipalities the forms of the
+    reportingMunicipality element within a residence.
+    """
+    reporting = tuple(
+        f'{residence}/{municipality}' for residence in residences for municipality in municipalities
+    )
+    fields = {
+        'reporting_municipality_bfs': ProjectionField(
+            _at(reporting, 'eCH-0007-v5:municipalityId')),
+        'reporting_municipality_name': ProjectionField(
+            _at(reporting, 'eCH-0007-v5:municipalityName')),
+        'arrival_date': ProjectionField(
+            _at(residences, f'{prefix}:arrivalDate'), date.fromisoformat),
+        'departure_date': ProjectionField(
+            _at(residences, f'{prefix}:departureDate'), date.fromisoformat),
+    }
+    dwelling = {
+        'egid': ('eCH-0011:EGID', int),
+        'ewid': ('eCH-0011:EWID', int),
+        'household_id': ('eCH-0011:householdID', None),
+        'street': ('eCH-0011:address/eCH-0010:street', None),
+        'house_number': ('eCH-0011:address/eCH-0010:houseNumber', None),
+        'town': ('eCH-0011:address/eCH-0010:town', None),
+        'swiss_zip_code': ('eCH-0011:address/eCH-0010:swissZipCode', int),
+        'type_of_household': ('eCH-0011:typeOfHousehold', _enum(TypeOfHousehold)),
+        'moving_date': ('eCH-0011:movingDate', date.fromisoformat),
+    }
+    for name, (path, convert) in dwelling.items():
+        fields[f'dwelling_address.{name}'] = ProjectionField(
+            _at(residences, f'{prefix}:dwellingAddress/{path}'), convert)
+    return fields
+
+
+_ECH0020_PERSON = 'eCH-0020:baseDeliveryPerson'
+_ECH0099_PERSON = 'eCH-0099:baseData/eCH-0011:person'
+
+# Layer 2 field name → paths relative to eCH-0020 messages (BaseDeliveryEvent names)
+ECH0020_FIELDS: Dict[str, ProjectionField] = {
+    **_person_fields(
+        f'{_ECH0020_PERSON}/eCH-0020:personIdentification',
+        f'{_ECH0020_PERSON}/eCH-0020:religionData',
+        f'{_ECH0020_PERSON}/eCH-0020:maritalInfo/eCH-0020:maritalData',
+        f'{_ECH0020_PERSON}/eCH-0020:nationalityData',
+    ),
+    'person.data_lock': ProjectionField(
+        f'{_ECH0020_PERSON}/eCH-0020:lockData/eCH-0021-v7:dataLock',
+        _enum(DataLockType)),
+    **_residence_fields(
+        ('eCH-0020:hasMainResidence', 'eCH-0020:hasSecondaryResidence',
+         'eCH-0020:hasOtherResidence'),
+        'eCH-0020',
+        ('eCH-0020:reportingMunicipality',),
+    ),
+}
+
+# Layer 2 field name → paths relative to eCH-0099 reportedPerson (StatisticsDeliveryEvent names)
+ECH0099_FIELDS: Dict[str, ProjectionField] = {
+    **_person_fields(
+        f'{_ECH0099_PERSON}/eCH-0011:personIdentification',
+        f'{_ECH0099_PERSON}/eCH-0011:religionData',
+        f'{_ECH0099_PERSON}/eCH-0011:maritalData',
+        f'{_ECH0099_PERSON}/eCH-0011:nationalityData',
+    ),
+    **_residence_fields(
+        ('eCH-0099:baseData/eCH-0011:hasMainResidence/eCH-0011:mainResidence',
+         'eCH-0099:baseData/eCH-0011:hasSecondaryResidence/eCH-0011:secondaryResidence',
+         'eCH-0099:baseData/eCH-0011:hasOtherResidence/eCH-0011:secondaryResidence'),
+        'eCH-0011',
+        # XSD form, and the eCH-0007 form written for secondary and other residences
+        ('eCH-0011:reportingMunicipality',
+         'eCH-0007-v5:reportingMunicipality/eCH-0007-v5:swissMunicipality'),
+    ),
+}
+
+_CHUNK_SIZE = 1 << 16
+
+
+def _chunks(source: Source) -> Iterator[bytes]:
+    """Bytes of a path or binary file (rewound first, as in diff)."""
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                yield chunk
+    else:
+        source.seek(0)
+        while chunk := source.read(_CHUNK_SIZE):
+            yield chunk
+
+
+# Entity path → Layer 2 field names of its entities
+FIELD_TABLES: Dict[str, Dict[str, ProjectionField]] = {
+    ECH0020_ENTITY: ECH0020_FIELDS,
+    ECH0099_ENTITY: ECH0099_FIELDS,
+}
+
+FieldSpec = Union[str, ProjectionField]
+
+
+class _Node:
+    """Element tag tree of the projected paths; targets are field indexes."""
+
+    __slots__ = ('children', 'targets')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.targets: List[int] = []
+
+
+class Projection:
+    """Selected fields of the entities of one entity path, compiled once.
+
+    Args:
+        fields: Field names / eCH paths (the row keys), or a mapping of row
+            key → field name, eCH path or ProjectionField
+        entity: '/'-separated path of the entity elements from the root
+            (as diff.EntityKey.entity); its Layer 2 names are FIELD_TABLES[entity]
+
+    Raises:
+        ValueError: If a field is neither a known name nor a valid eCH path,
+            or a row key is used twice
+    """
+
+    def __init__(self, fields: Union[Iterable[str], Mapping[str, FieldSpec]], entity: str):
+        self.entity = entity
+        self._entity_tags = entity_tags(entity)
+        items = list(fields.items()) if isinstance(fields, Mapping) else [(f, f) for f in fields]
+        self.names: Tuple[str, ...] = tuple(name for name, _ in items)
+        if len(set(self.names)) != len(self.names):
+            raise ValueError(f"Duplicate field names in projection: {self.names}")
+
+        table = FIELD_TABLES.get(entity, {})
+        self.fields: Tuple[ProjectionField, ...] = tuple(
+            self._resolve(spec, table) for _, spec in items
+        )
+        self._root = _Node()
+        for index, field in enumerate(self.fields):
+            for tags in field._tags:
+                node = self._root
+                for tag in tags:
+                    node = node.children.setdefault(expat_name(tag), _Node())
+                node.targets.append(index)
+
+    def _resolve(self, spec: FieldSpec, table: Dict[str, ProjectionField]) -> ProjectionField:
+        if isinstance(spec, ProjectionField):
+            return spec
+        field = table.get(spec)
+        if field is not None:
+            return field
+        if ':' in spec:
+            return ProjectionField(spec)
+        raise ValueError(
+            f"Unknown field {spec!r} for {self.entity!r}: neither a field name "
+            f"({', '.join(sorted(table)) or 'none defined'}) nor an eCH path"
+        )
+
+    def rows(self, source: Source) -> Iterator[tuple]:
+        """Values of each entity in the order of self.names.
+
+        Raises:
+            ValueError: If the root element is not on the entity path, or a
+                converter rejects an element text
+            xml.parsers.expat.ExpatError: If the document is not well-formed
+        """
+        tags = [expat_name(tag) for tag in self._entity_tags]
+        entity_level = len(tags) - 1
+        root = self._root
+        repeated = [field.repeated for field in self.fields]
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.buffer_text = True
+
+        # Rows completed by the current chunk, and entities seen so far
+        done: List[tuple] = []
+        count = 0
+        # Open elements above and at the entity level (all on the entity path)
+        depth = 0
+        # Inside an entity: tree nodes of the open projected elements
+        nodes: List[_Node] = []
+        values: list = []
+        # Text buffers of the open projected elements with targets
+        texts: List[List[str]] = []
+        capturing = False
+        # Depth within a subtree outside the projection (or off the entity
+        # path), parsed by the skip handlers
+        skip = 0
+
+        def skip_subtree() -> None:
+            nonlocal skip, capturing
+            skip = 1
+            parser.StartElementHandler = skip_start
+            parser.EndElementHandler = skip_end
+            if capturing:
+                # Like Element.text: only the text before the first child element
+                parser.CharacterDataHandler = None
+                capturing = False
+
+        def skip_start(_name: str, _attributes) -> None:
+            nonlocal skip
+            skip += 1
+
+        def skip_end(_name: str) -> None:
+            nonlocal skip
+            skip -= 1
+            if not skip:
+                parser.StartElementHandler = start
+                parser.EndElementHandler = end
+
+        def start(name: str, _attributes) -> None:
+            nonlocal depth, values, capturing
+            if nodes:
+                node = nodes[-1].children.get(name)
+                if node is None:
+                    skip_subtree()
+                    return
+                nodes.append(node)
+                if node.targets:
+                    text: List[str] = []
+                    texts.append(text)
+                    parser.CharacterDataHandler = text.append
+                    capturing = True
+                elif capturing:
+                    parser.CharacterDataHandler = None
+                    capturing = False
+                return
+            if name != tags[depth]:
+                if not depth:
+                    raise ValueError(
+                        f"Root element {qname(clark_name(name))} does not match entity path "
+                        f"{self.entity!r}"
+                    )
+                skip_subtree()
+                return
+            if depth == entity_level:
+                nodes.append(root)
+                values = [[] if is_list else None for is_list in repeated]
+            depth += 1
+
+        def end(_name: str) -> None:
+            nonlocal depth, count, capturing
+            if nodes:
+                node = nodes.pop()
+                if node.targets:
+                    if capturing:
+                        parser.CharacterDataHandler = None
+                        capturing = False
+                    value = ''.join(texts.pop()).strip()
+                    if value:
+                        for index in node.targets:
+                            if repeated[index]:
+                                values[index].append(self._convert(index, value, count))
+                            elif values[index] is None:
+                                values[index] = self._convert(index, value, count)
+                if nodes:
+                    return
+                count += 1
+                done.append(tuple(
+                    tuple(value) if is_list else value
+                    for value, is_list in zip(values, repeated)
+                ))
+            depth -= 1
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        for chunk in _chunks(source):
+            parser.Parse(chunk, False)
+            yield from done
+            done.clear()
+        parser.Parse(b'', True)
+        yield from done
+
+    def _convert(self, index: int, text: str, count: int) -> Any:
+        convert = self.fields[index].convert
+        if convert is None:
+            return text
+        try:
+            return convert(text)
+        except ValueError as e:
+            raise ValueError(
+                f"Entity #{count + 1} ({self.entity}): invalid {self.names[index]} {text!r}: {e}"
+            ) from e
+
+    def dicts(self, source: Source) -> Iterator[Dict[str, Any]]:
+        """Values of each entity keyed by self.names."""
+        names = self.names
+        for row in self.rows(source):
+            yield dict(zip(names, row))
+
+
+def project(source: Source, fields: Union[Iterable[str], Mapping[str, FieldSpec]],
+            entity: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Selected fields of each entity of a delivery (see module docstring).
+
+    Args:
+        source: Path or binary file of the delivery
+        fields: See Projection
+        entity: Entity path; by default eCH-0020 messages or eCH-0099
+            reportedPerson, from the root element
+
+    Raises:
+        ValueError: If the entity cannot be inferred, or see Projection
+    """
+    if entity is None:
+        entity = default_entity(source)
+    return Projection(fields, entity).dicts(source)
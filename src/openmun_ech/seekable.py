@@ -0,0 +1,209 @@
+"""Random access to the entities of a delivery file.
+
+Case tools show one person out of a multi-GB eCH-0020 or eCH-0099 file.
+Parsing the file for that takes as long as parsing the whole register;
+this module scans it once and then reads single entities directly:
+
+- build_sidecar() records the byte range of each entity (eCH-0020
+  messages, eCH-0099 reportedPerson, as in diff) with one expat pass (no
+  element tree), in a sidecar file next to the delivery
+  ('register.xml' → 'register.xml.entities')
+- DeliveryReader memory-maps delivery and sidecar; reader[i] slices the
+  bytes of entity i and parses only them, with the namespace declarations
+  in scope (on the root element) and the document encoding restored
+
+The sidecar records size and modification time of the delivery; a reader
+rebuilds a missing or outdated sidecar (or refuses, with build=False).
+
+Sidecar layout: 8-byte magic, then per entity start and end offset
+(little-endian uint64), then a JSON trailer (delivery size, mtime,
+entity path, encoding, namespaces) and its length (uint64).
+
+Usage:
+    from openmun_ech.seekable import DeliveryReader
+
+    with DeliveryReader('register.xml') as reader:
+        print(len(reader))
+        event = ECH0020EventBaseDelivery.from_xml(reader[9999])
+"""
+
+import json
+import mmap
+import os
+import struct
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from openmun_ech.utils._xml_entities import (
+    Document,
+    default_entity,
+    entity_ranges,
+    parse_fragment,
+)
+
+SIDECAR_SUFFIX = '.entities'
+
+_MAGIC = b'OMECHSK1'
+# Start and end offset of an entity; length of the trailer
+_RANGE = struct.Struct('<QQ')
+_LENGTH = struct.Struct('<Q')
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _sidecar_path(delivery: Union[str, Path]) -> Path:
+    return Path(str(delivery) + SIDECAR_SUFFIX)
+
+
+def build_sidecar(delivery: Union[str, Path], entity: Optional[str] = None,
+                  sidecar: Optional[Union[str, Path]] = None) -> Path:
+    """Scan a delivery once and write the byte ranges of its entities.
+
+    Args:
+        delivery: Path of the delivery
+        entity: Entity path (as diff.EntityKey.entity); by default from the
+            root element (eCH-0020 messages, eCH-0099 reportedPerson)
+        sidecar: Sidecar path; by default next to the delivery
+
+    Returns:
+        Path of the sidecar (written atomically)
+
+    Raises:
+        ValueError: If the entity path does not match the root element
+    """
+    if entity is None:
+        entity = default_entity(delivery)
+    target = Path(sidecar) if sidecar is not None else _sidecar_path(delivery)
+    partial = target.with_name(target.name + '.partial')
+    document = Document()
+    try:
+        with open(delivery, 'rb') as f, open(partial, 'wb') as out:
+            stat = os.fstat(f.fileno())
+            out.write(_MAGIC)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                buffer = bytearray()
+                for start, end in entity_ranges(data, entity, document):
+                    buffer += _RANGE.pack(start, end)
+                    if len(buffer) >= _CHUNK_SIZE:
+                        out.write(buffer)
+                        buffer.clear()
+                out.write(buffer)
+            trailer = json.dumps({
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'entity': entity,
+                'encoding': document.encoding,
+                'namespaces': document.namespaces or {},
+            }).encode('utf-8')
+            out.write(trailer)
+            out.write(_LENGTH.pack(len(trailer)))
+        os.replace(partial, target)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    return target
+
+
+class DeliveryReader:
+    """Entities of a delivery by position, through its sidecar (see module docstring).
+
+    Args:
+        delivery: Path of the delivery
+        entity: Entity path, used when the sidecar is (re)built
+        sidecar: Sidecar path; by default next to the delivery
+        build: Build a missing or outdated sidecar; if False, raise instead
+
+    Raises:
+        ValueError: If the sidecar is outdated or invalid (and build is False),
+            or was built for another entity path
+        FileNotFoundError: If the sidecar is missing and build is False
+    """
+
+    def __init__(self, delivery: Union[str, Path], entity: Optional[str] = None,
+                 sidecar: Optional[Union[str, Path]] = None, build: bool = True):
+        self.delivery = Path(delivery)
+        self.sidecar = Path(sidecar) if sidecar is not None else _sidecar_path(delivery)
+        self._file = open(self.delivery, 'rb')
+        self._ranges: Optional[mmap.mmap] = None
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self._open_sidecar()
+            except (FileNotFoundError, ValueError):
+                if not build:
+                    raise
+                build_sidecar(self.delivery, entity, self.sidecar)
+                self._open_sidecar()
+            if entity is not None and entity != self.entity:
+                raise ValueError(
+                    f"{self.sidecar} was built for entity {self.entity!r}, not {entity!r}"
+                )
+        except BaseException:
+            self.close()
+            raise
+
+    def _open_sidecar(self) -> None:
+        if self._ranges is not None:
+            self._ranges.close()
+            self._ranges = None
+        with open(self.sidecar, 'rb') as f:
+            ranges = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            size = len(ranges)
+            if size < len(_MAGIC) + _LENGTH.size or ranges[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{self.sidecar} is not a sidecar file")
+            (trailer_size,) = _LENGTH.unpack_from(ranges, size - _LENGTH.size)
+            trailer_start = size - _LENGTH.size - trailer_size
+            info = json.loads(ranges[trailer_start:size - _LENGTH.size])
+            stat = os.fstat(self._file.fileno())
+            if (info['size'], info['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+                raise ValueError(f"{self.sidecar} is outdated: {self.delivery} changed")
+        except BaseException:
+            ranges.close()
+            raise
+        self._ranges = ranges
+        self._count = (trailer_start - len(_MAGIC)) // _RANGE.size
+        self.entity: str = info['entity']
+        self._encoding: Optional[str] = info['encoding']
+        self._namespaces: Dict[str, str] = info['namespaces']
+
+    def close(self) -> None:
+        for resource in (getattr(self, '_ranges', None), getattr(self, '_data', None)):
+            if resource is not None:
+                resource.close()
+        self._file.close()
+
+    def __enter__(self) -> 'DeliveryReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def byte_range(self, position: int) -> Tuple[int, int]:
+        """(start, end) offsets of an entity in the delivery file.
+
+        Raises:
+            IndexError: If there is no entity at position
+        """
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(f"Entity {position} out of range ({self._count} entities)")
+        return _RANGE.unpack_from(self._ranges, len(_MAGIC) + position * _RANGE.size)
+
+    def raw(self, position: int) -> bytes:
+        """Bytes of an entity as in the delivery file."""
+        start, end = self.byte_range(position)
+        return self._data[start:end]
+
+    def __getitem__(self, position: int) -> ET.Element:
+        """Parsed entity element (namespace declarations and encoding restored)."""
+        return parse_fragment(self.raw(position), self._encoding, self._namespaces)
+
+    def __iter__(self) -> Iterator[ET.Element]:
+        for position in range(self._count):
+            yield self[position]
@@ -0,0 +1,254 @@
+"""Shared helpers for reading deliveries entity by entity.
+
+Used by diff, projection, seekable, person_index, ech0020.minimize and the
+eCH-0133 streaming reader:
+- Sources are paths or binary files; iterparse() closes the files it opens
+- Entity paths are '/'-separated qualified names with the prefixes of
+  core.namespace ('eCH-0099:delivery/eCH-0099:reportedPerson');
+  entity_tags() resolves them, qname() turns tags back into such names
+- canonical_digest(): digest of a subtree (prefixes, indentation and
+  attribute order do not matter)
+- entity_ranges() / parse_fragment(): byte ranges of the entity elements
+  (one expat pass) and parsing of one range on its own
+"""
+
+import hashlib
+import mmap
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from xml.parsers import expat
+from xml.sax.saxutils import quoteattr
+
+from openmun_ech.core.namespace import URI_PREFIXES
+
+Source = Union[str, Path, BinaryIO]
+
+# Prefix → namespace URI, for entity paths and ElementPath expressions
+PREFIX_URIS: Dict[str, str] = {prefix: uri for uri, prefix in URI_PREFIXES.items()}
+
+
+# ============================================================================
+# Entity paths and qualified names
+# ============================================================================
+
+ECH0020_ENTITY = 'eCH-0020:delivery/eCH-0020:baseDelivery/eCH-0020:messages'
+ECH0099_ENTITY = 'eCH-0099:delivery/eCH-0099:reportedPerson'
+
+# personIdentification of an entity (relative to the entity element)
+ECH0020_PERSON = 'eCH-0020:baseDeliveryPerson/eCH-0020:personIdentification'
+ECH0099_PERSON = 'eCH-0099:baseData/eCH-0011:person/eCH-0011:personIdentification'
+
+
+def clark(qname: str, path: str) -> str:
+    """Clark tag '{uri}local' of one step of an entity path.
+
+    Raises:
+        ValueError: If the step is malformed or uses an unknown prefix
+    """
+    prefix, sep, local = qname.partition(':')
+    uri = PREFIX_URIS.get(prefix)
+    if not sep or not local or uri is None:
+        raise ValueError(f"Invalid step {qname!r} in entity path {path!r}")
+    return f'{{{uri}}}{local}'
+
+
+def entity_tags(path: str) -> Tuple[str, ...]:
+    """Clark tags of the steps of an entity path, root first."""
+    return tuple(clark(step, path) for step in path.split('/'))
+
+
+# Element tag → prefix:localName (Clark notation if unregistered)
+_QNAMES: Dict[str, str] = {}
+
+
+def qname(tag: str) -> str:
+    """Name of a tag with the core.namespace prefix (unregistered: unchanged)."""
+    name = _QNAMES.get(tag)
+    if name is None:
+        name = tag
+        if tag[:1] == '{':
+            uri, local = tag[1:].rsplit('}', 1)
+            prefix = URI_PREFIXES.get(uri)
+            if prefix is not None:
+                name = f'{prefix}:{local}'
+        _QNAMES[tag] = name
+    return name
+
+
+def expat_name(tag: str) -> str:
+    """Clark tag '{uri}local' as reported by expat with namespace_separator '}'."""
+    return tag[1:] if tag[:1] == '{' else tag
+
+
+def clark_name(name: str) -> str:
+    """Clark tag of a name reported by expat with namespace_separator '}'."""
+    return '{' + name if '}' in name else name
+
+
+# Root element → entity path used when none is given
+DEFAULT_ENTITIES: Dict[str, str] = {
+    entity_tags(path)[0]: path for path in (ECH0020_ENTITY, ECH0099_ENTITY)
+}
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+def iterparse(source: Source, events: Sequence[str] = ('start', 'end'),
+              rewind: bool = False) -> Iterator[tuple]:
+    """iterparse() over a path or binary file; files we open are always closed.
+
+    rewind=True seeks a binary file to its start first (sources read several times).
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            yield from ET.iterparse(f, events=events)
+    else:
+        if rewind:
+            source.seek(0)
+        yield from ET.iterparse(source, events=events)
+
+
+def root_tag(source: Source) -> str:
+    """Tag of the root element (a binary file is rewound first)."""
+    for _event, elem in iterparse(source, rewind=True):
+        return elem.tag
+    raise ValueError("Empty document")
+
+
+def default_entity(source: Source) -> str:
+    """Entity path of a delivery from its root element (eCH-0020, eCH-0099).
+
+    Raises:
+        ValueError: If there is no default entity for the root element
+    """
+    root = root_tag(source)
+    entity = DEFAULT_ENTITIES.get(root)
+    if entity is None:
+        raise ValueError(f"No default entity for root element {qname(root)}; pass entity")
+    return entity
+
+
+# ============================================================================
+# Canonical digests
+# ============================================================================
+
+def _canonical(elem: ET.Element, parts: List[str]) -> None:
+    # Tokens per element: tag, attributes, text, children..., '/'. The
+    # fixed layout and '/' (never a tag) keep the token stream unambiguous
+    parts.append(elem.tag)
+    attrib = elem.attrib
+    parts.append(repr(sorted(attrib.items())) if attrib else '')
+    text = elem.text
+    parts.append(text.strip() if text else '')
+    for child in elem:
+        _canonical(child, parts)
+    parts.append('/')
+
+
+def canonical_digest(elem: ET.Element) -> bytes:
+    """Digest of the canonical form of elem's subtree (tail not included)."""
+    parts: List[str] = []
+    _canonical(elem, parts)
+    # NUL cannot occur in XML, so it cannot be part of a token
+    data = '\x00'.join(parts).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# ============================================================================
+# Byte ranges of entities
+# ============================================================================
+
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class Document:
+    """What a fragment of a delivery needs to be parsed on its own."""
+
+    encoding: Optional[str] = None
+    # Namespace declarations in scope at the entity elements (prefix '' = default)
+    namespaces: Optional[Dict[str, str]] = None
+
+
+def entity_ranges(data: mmap.mmap, entity: str, document: Document) -> Iterator[Tuple[int, int]]:
+    """(start, end) byte range of each entity element; fills in document."""
+    tags = [expat_name(tag) for tag in entity_tags(entity)]
+    entity_level = len(tags) - 1
+    parser = expat.ParserCreate(namespace_separator='}')
+
+    done: List[Tuple[int, int]] = []
+    # Namespace scopes of the open elements on the entity path
+    scopes: List[Dict[str, str]] = [{}]
+    declared: Dict[str, str] = {}
+    # Depth within an entity or an element off the entity path
+    skip = 0
+    start_byte = -1
+
+    def xml_decl(_version, encoding, _standalone) -> None:
+        document.encoding = encoding
+
+    def namespace_decl(prefix, uri) -> None:
+        if not skip:
+            declared[prefix or ''] = uri
+
+    def start(name: str, _attributes) -> None:
+        nonlocal skip, start_byte
+        if skip:
+            skip += 1
+            return
+        depth = len(scopes) - 1
+        scopes.append({**scopes[-1], **declared})
+        declared.clear()
+        if name != tags[depth]:
+            if not depth:
+                raise ValueError(
+                    f"Root element {qname(clark_name(name))} does not match entity path {entity!r}"
+                )
+            skip = 1
+        elif depth == entity_level:
+            if document.namespaces is None:
+                document.namespaces = scopes[-2]
+            start_byte = parser.CurrentByteIndex
+            skip = 1
+
+    def end(_name: str) -> None:
+        nonlocal skip, start_byte
+        if skip:
+            skip -= 1
+            if skip:
+                return
+            if start_byte >= 0:
+                # CurrentByteIndex is at '</' of the end tag
+                done.append((start_byte, data.find(b'>', parser.CurrentByteIndex) + 1))
+                start_byte = -1
+        scopes.pop()
+
+    parser.XmlDeclHandler = xml_decl
+    parser.StartNamespaceDeclHandler = namespace_decl
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    for position in range(0, len(data), _CHUNK_SIZE):
+        parser.Parse(data[position:position + _CHUNK_SIZE], False)
+        yield from done
+        done.clear()
+    parser.Parse(b'', True)
+    yield from done
+
+
+def parse_fragment(fragment: bytes, encoding: Optional[str],
+                   namespaces: Dict[str, str]) -> ET.Element:
+    """Parse the bytes of one element of a document, with the declarations in scope."""
+    declarations = ''.join(
+        f' xmlns:{prefix}={quoteattr(uri)}' if prefix else f' xmlns={quoteattr(uri)}'
+        for prefix, uri in namespaces.items()
+    )
+    codec = encoding or 'utf-8'
+    parser = ET.XMLParser(encoding=codec)
+    parser.feed(f'<fragment{declarations}>'.encode(codec))
+    parser.feed(fragment)
+    parser.feed(b'</fragment>')
+    return parser.close()[0]
@@ -0,0 +1,134 @@
+"""Shared helpers for writing XML documents record by record.
+
+Used by the streaming writers (eCH-0133, eCH-0099):
+- Namespaces are declared once on the root element, with the prefixes
+  registered by openmun_ech.core (eCH-0133, eCH-0058-v4, ...)
+- Each record is serialized on its own (ECHModel.to_xml_bytes(declared=...),
+  or ElementTree and serialize_fragment()); declarations that repeat the
+  root's are dropped from the record's start tag
+- StreamTarget writes text to a path (atomically) or a binary file object
+- create_temp_file(): uniquely named temporary file next to a target, so
+  concurrent writers of the same target never share one
+"""
+
+import io
+import os
+import re
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple, Union
+
+_XMLNS_DECL = re.compile(r' xmlns:([^=\s]+)="([^"]*)"')
+_GENERATED_PREFIX = re.compile(r'ns\d+$')
+
+
+def registered_prefix(uri: str) -> Optional[str]:
+    """Return the ElementTree prefix registered for `uri` (None if unregistered)."""
+    text = ET.tostring(ET.Element(f'{{{uri}}}x'), encoding='unicode')
+    prefix = text[1:text.index(':')]
+    return None if _GENERATED_PREFIX.match(prefix) else prefix
+
+
+def root_namespaces(uris: Iterable[str]) -> Dict[str, str]:
+    """Map namespace URI → registered prefix for declaration on the root element."""
+    namespaces = {}
+    for uri in uris:
+        prefix = registered_prefix(uri)
+        if prefix is not None:
+            namespaces[uri] = prefix
+    return namespaces
+
+
+def xmlns_attributes(namespaces: Dict[str, str]) -> str:
+    """Render namespace declarations for a start tag (leading space included)."""
+    return ''.join(f' xmlns:{prefix}="{uri}"' for uri, prefix in namespaces.items())
+
+
+def serialize_fragment(elem: ET.Element, namespaces: Dict[str, str]) -> str:
+    """Serialize an element, dropping declarations already made on the root.
+
+    Declarations of other namespaces stay on the fragment's start tag, so the
+    output is correct even for namespaces the root does not declare.
+    """
+    text = ET.tostring(elem, encoding='unicode')
+    end = text.index('>')
+
+    def keep(match: re.Match) -> str:
+        prefix, uri = match.groups()
+        return '' if namespaces.get(uri) == prefix else match.group(0)
+
+    return _XMLNS_DECL.sub(keep, text[:end]) + text[end:]
+
+
+# Process umask, read once: mkstemp() creates files 0600, outputs get the usual mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def create_temp_file(path: Path) -> Tuple[BinaryIO, Path]:
+    """Open a new temporary file in path's directory, for os.replace() onto path.
+
+    The name is unique ('.delivery.xml.<random>.tmp'); the file mode is that
+    of a newly created file (0666 minus the umask).
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        os.chmod(name, 0o666 & ~_UMASK)
+        return os.fdopen(fd, 'wb'), Path(name)
+    except BaseException:
+        os.close(fd)
+        os.unlink(name)
+        raise
+
+
+class StreamTarget:
+    """Text output of a streamed XML document.
+
+    - Path target: written to a uniquely named temporary file next to it,
+      moved into place by commit(); abort() removes the partial output
+    - Binary file object: written directly; commit()/abort() flush but never
+      close it (the caller owns it)
+    """
+
+    def __init__(self, target: Union[str, Path, BinaryIO], encoding: str = 'utf-8'):
+        self.encoding = encoding
+        if isinstance(target, (str, Path)):
+            self.path: Optional[Path] = Path(target)
+            binary, tmp_path = create_temp_file(self.path)
+            self._tmp_path: Optional[Path] = tmp_path
+        else:
+            self.path = self._tmp_path = None
+            binary = target
+        self._out = io.TextIOWrapper(binary, encoding=encoding, errors='xmlcharrefreplace', newline='\n')
+        self.closed = False
+
+    def write(self, text: str) -> None:
+        self._out.write(text)
+
+    def write_declaration(self) -> None:
+        self._out.write(f"<?xml version='1.0' encoding='{self.encoding}'?>\n")
+
+    def _release(self) -> None:
+        self.closed = True
+        if self.path is not None:
+            self._out.close()
+        else:
+            self._out.flush()
+            self._out.detach()
+
+    def commit(self) -> None:
+        """Finish output (path targets: replace the target file)."""
+        if self.closed:
+            return
+        self._release()
+        if self.path is not None:
+            os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Stop output; a path target is left untouched."""
+        if self.closed:
+            return
+        self._release()
+        if self._tmp_path is not None:
+            self._tmp_path.unlink(missing_ok=True)
@@ -1,6 +1,8 @@
 """Shared pytest fixtures for eCH model testing.
 
-This module provides fixtures for testing eCH standards with production data.
+This module provides fixtures for testing eCH standards with production data,
+and the fictive test data factories shared by several test modules (import them
+from tests.conftest; test modules never import from each other).
 
 ⚠️ CRITICAL: Zero Tolerance Policy for Government Data
 - NO defaults, NO fallbacks, NO assumptions
@@ -10,12 +12,62 @@ This module provides fixtures for testing eCH standards with production data.
 
 import os
 import sys
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import List, Optional
 import xml.etree.ElementTree as ET
 
 import pytest
 
+from openmun_ech.ech0007.v6 import ECH0007v6SwissMunicipality
+from openmun_ech.ech0020.models import (
+    BaseDeliveryEvent,
+    BaseDeliveryPerson,
+    DeliveryConfig,
+    DwellingAddressInfo,
+    PlaceType,
+    ResidenceType,
+)
+from openmun_ech.ech0020.streaming import write_base_delivery
+from openmun_ech.ech0044.v4 import ECH0044PersonIdentificationLight
+from openmun_ech.ech0058.v5 import ECH0058Header, ECH0058SendingApplication
+from openmun_ech.ech0099 import (
+    DwellingAddressInfo as StatisticsDwellingAddressInfo,
+    NationalityType,
+    PlaceOfOriginInfo,
+    PlaceType as StatisticsPlaceType,
+    StatisticsDeliveryConfig,
+    StatisticsPerson,
+)
+from openmun_ech.ech0129 import (
+    ECH0129Area,
+    ECH0129BuildingOnly,
+    ECH0129EstimationObject,
+    ECH0129EstimationValue,
+    ECH0129FiscalOwnership,
+    ECH0129NamedId,
+    ECH0129PersonIdentification,
+    ECH0129Realestate,
+    ECH0129RealestateIdentification,
+    ECH0129Value,
+)
+from openmun_ech.ech0129.enums import (
+    AreaDescriptionCode,
+    AreaType,
+    BuildingCategory,
+    FiscalRelationship,
+    RealestateType,
+    TypeOfValue,
+)
+from openmun_ech.ech0129.v6.building import ECH0129Building
+from openmun_ech.ech0129.v6.entrance import ECH0129BuildingEntrance
+from openmun_ech.ech0129.v6.street_locality import ECH0129StreetSection
+from openmun_ech.ech0133 import (
+    ECH0133BuildingInfo,
+    ECH0133FiscalOwnershipInfo,
+    ECH0133RealestateInfo,
+)
+
 
 def _get_production_data_path() -> Optional[Path]:
     """Resolve production data path from OPENMUN_PRODUCTION_DATA env var."""
@@ -165,3 +217,329 @@ def ech0099_files(production_data_path) -> List[Path]:
         production_data_path,
         namespace="http://www.ech.ch/xmlns/eCH-0099/2"
     )
+
+
+# ===========================================================================
+# Test data factories shared by several test modules
+# (Personal data: ALWAYS fictive; BFS data: real codes)
+# ===========================================================================
+
+# --- eCH-0020 base deliveries ---
+
+ECH0020 = 'http://www.ech.ch/xmlns/eCH-0020/3'
+ECH0011 = 'http://www.ech.ch/xmlns/eCH-0011/8'
+ECH0044 = 'http://www.ech.ch/xmlns/eCH-0044/4'
+NAMESPACES = {'eCH-0020': ECH0020, 'eCH-0011': ECH0011, 'eCH-0044': ECH0044}
+
+ORIGINS = [
+    {"bfs_code": "261", "name": "Zürich", "canton": "ZH"},
+    {"bfs_code": "351", "name": "Bern", "canton": "BE"},
+]
+
+
+def make_event(i: int, places_of_origin=ORIGINS) -> BaseDeliveryEvent:
+    person = BaseDeliveryPerson(
+        official_name="Muster",
+        first_name=f"Person{i}",
+        sex="1" if i % 2 else "2",
+        date_of_birth=date(1980 + i, 1, 15),
+        vn=f"756123456{i:04d}",
+        local_person_id=str(10000 + i),
+        local_person_id_category="MU.261",
+        religion="111",
+        marital_status="1",
+        nationality_status="2",
+        data_lock="0",
+        places_of_origin=places_of_origin,
+        birth_place_type=PlaceType.SWISS,
+        birth_municipality_bfs="261",
+        birth_municipality_name="Zürich",
+    )
+    return BaseDeliveryEvent(
+        person=person,
+        residence_type=ResidenceType.MAIN,
+        reporting_municipality_bfs="261",
+        reporting_municipality_name="Zürich",
+        arrival_date=date(2024, 1, 1),
+        dwelling_address=DwellingAddressInfo(
+            street="Teststrasse",
+            house_number=str(i + 1),
+            town="Zürich",
+            swiss_zip_code=8000,
+            type_of_household="1",
+        ),
+    )
+
+
+def write_delivery(path, events, pretty_print=True):
+    config = DeliveryConfig(
+        sender_id="sedex://T1-TEST-001",
+        manufacturer="TestManufacturer",
+        product="TestProduct",
+        product_version="1.0.0",
+        test_delivery_flag=True,
+    )
+    write_base_delivery(events, config, path, pretty_print=pretty_print)
+    return path
+
+
+def parsed_messages(path):
+    """The baseDelivery messages elements of a delivery written by write_delivery()."""
+    return ET.parse(path).getroot().findall('eCH-0020:baseDelivery/eCH-0020:messages', NAMESPACES)
+
+
+def ech0099_delivery(path, encoding='utf-8'):
+    """Write a minimal eCH-0099 delivery with one reported person (default namespace)."""
+    path.write_bytes((
+        f'<?xml version="1.0" encoding="{encoding}"?>'
+        '<delivery xmlns="http://www.ech.ch/xmlns/eCH-0099/2" '
+        f'xmlns:p="{ECH0011}" xmlns:i="{ECH0044}">'
+        '<reportedPerson><baseData><p:person><p:personIdentification>'
+        '<i:vn>7561234560001</i:vn><i:officialName>Müller</i:officialName>'
+        '</p:personIdentification></p:person></baseData></reportedPerson>'
+        '</delivery>'
+    ).encode(encoding))
+    return path
+
+
+# --- eCH-0099 Layer 2 (fixtures) ---
+
+@pytest.fixture
+def swiss_person():
+    """Create a valid Swiss person for testing."""
+    return StatisticsPerson(
+        vn="7561234567890",
+        local_person_id="12345",
+        local_person_id_category="MU.6172",
+        official_name="Müller",
+        first_name="Hans",
+        sex="1",
+        date_of_birth=date(1980, 5, 15),
+        birth_place_type=StatisticsPlaceType.SWISS,
+        birth_municipality_bfs=261,
+        birth_municipality_name="Zürich",
+        birth_municipality_canton="ZH",
+        religion="111",
+        marital_status="1",
+        nationality_type=NationalityType.SWISS,
+        nationality_status="2",  # 2 = has known nationality
+        nationality_country_name="Schweiz",
+        places_of_origin=[
+            PlaceOfOriginInfo(origin_name="Zürich", canton="ZH")
+        ],
+    )
+
+
+@pytest.fixture
+def foreign_person():
+    """Create a valid foreign person for testing."""
+    return StatisticsPerson(
+        local_person_id="67890",
+        local_person_id_category="MU.6172",
+        official_name="Schmidt",
+        first_name="Maria",
+        sex="2",
+        date_of_birth=date(1985, 3, 20),
+        birth_place_type=StatisticsPlaceType.FOREIGN,
+        birth_country_id=8207,
+        birth_country_iso2="DE",
+        birth_country_name="Deutschland",
+        religion="111",
+        marital_status="2",
+        nationality_type=NationalityType.FOREIGN,
+        nationality_status="2",  # 2 = has known nationality
+        nationality_country_id=8207,
+        nationality_country_iso2="DE",
+        nationality_country_name="Deutschland",
+        # BFS residence permit code: 02 = B permit (Aufenthaltsbewilligung)
+        residence_permit="02",
+        residence_permit_valid_from=date(2020, 1, 1),
+        residence_permit_valid_till=date(2025, 12, 31),
+    )
+
+
+@pytest.fixture
+def dwelling_address():
+    """Create a valid dwelling address for testing."""
+    return StatisticsDwellingAddressInfo(
+        egid=123456789,
+        ewid=1,
+        street="Bahnhofstrasse",
+        house_number="1",
+        town="Zürich",
+        swiss_zip_code=8001,
+        type_of_household="1",
+    )
+
+
+@pytest.fixture
+def config():
+    """Create a valid delivery config for testing."""
+    return StatisticsDeliveryConfig(
+        sender_id="T1-6172-1",
+        manufacturer="OpenMun Test",
+        product="Test Suite",
+        product_version="1.0.0",
+        test_delivery_flag=True,
+    )
+
+
+# ============================================================================
+
+
+# --- eCH-0129 buildings ---
+
+def make_named_id(category='IDBBP', value='12345'):
+    return ECH0129NamedId(id_category=category, id_value=value)
+
+
+def make_building(**kwargs):
+    """Create a Building with required fields + overrides."""
+    defaults = {
+        'building_category': BuildingCategory.RESIDENTIAL_ONLY,
+    }
+    defaults.update(kwargs)
+    return ECH0129Building(**defaults)
+
+
+def make_street_section():
+    """Create a minimal StreetSection for entrance tests."""
+    return ECH0129StreetSection(
+        esid=12345678,
+        local_id=make_named_id('ESID', '99'),
+        swiss_zip_code=3983,
+        swiss_zip_code_add_on='00',
+    )
+
+
+def make_entrance():
+    """Create a minimal BuildingEntrance."""
+    return ECH0129BuildingEntrance(
+        local_id=make_named_id('EDID', '1'),
+        street_section=make_street_section(),
+    )
+
+
+# --- eCH-0133 records (municipality: fictive test municipality Bister 6172) ---
+
+def make_realestate_id() -> ECH0129RealestateIdentification:
+    return ECH0129RealestateIdentification(
+        egrid="CH123456789012",
+        number="1234",
+    )
+
+
+def make_realestate() -> ECH0129Realestate:
+    return ECH0129Realestate(
+        realestate_identification=make_realestate_id(),
+        realestate_type=RealestateType.LIEGENSCHAFT,
+    )
+
+
+def make_municipality() -> ECH0007v6SwissMunicipality:
+    return ECH0007v6SwissMunicipality(
+        municipality_id="6172",
+        municipality_name="Bister",
+    )
+
+
+def make_fiscal_ownership() -> ECH0129FiscalOwnership:
+    return ECH0129FiscalOwnership(
+        accession_date=date(2024, 1, 1),
+        fiscal_relationship=FiscalRelationship.OWNER,
+        denominator="1.000",
+        numerator="1.000",
+    )
+
+
+def make_person_identification() -> ECH0129PersonIdentification:
+    return ECH0129PersonIdentification(
+        individual=ECH0044PersonIdentificationLight(
+            official_name="Müller",
+            first_name="Hans",
+        ),
+    )
+
+
+def make_fiscal_ownership_info() -> ECH0133FiscalOwnershipInfo:
+    return ECH0133FiscalOwnershipInfo(
+        fiscal_ownership=make_fiscal_ownership(),
+        person_identification=make_person_identification(),
+    )
+
+
+def make_area() -> ECH0129Area:
+    return ECH0129Area(
+        area_type=AreaType.GROUND_COVER,
+        area_description_code=AreaDescriptionCode.GEBAEUDE,
+        area_description="Wohngebaeude",
+        area_value="450.00",
+    )
+
+
+def make_building_only() -> ECH0129BuildingOnly:
+    return ECH0129BuildingOnly(
+        building_category=BuildingCategory.RESIDENTIAL_ONLY,
+    )
+
+
+def make_estimation_object() -> ECH0129EstimationObject:
+    return ECH0129EstimationObject(
+        local_id=ECH0129NamedId(id_category="SCH", id_value="001"),
+        year_of_construction="2020",
+        estimation_value=[
+            ECH0129EstimationValue(
+                local_id=ECH0129NamedId(id_category="VAL", id_value="001"),
+                value=ECH0129Value(amount="500000.00"),
+                type_of_value=TypeOfValue.TAX_VALUE,
+            ),
+        ],
+    )
+
+
+def make_building_info() -> ECH0133BuildingInfo:
+    return ECH0133BuildingInfo(
+        building=make_building_only(),
+        estimation_object=[make_estimation_object()],
+    )
+
+
+def make_header() -> ECH0058Header:
+    return ECH0058Header(
+        sender_id="T4-123456-1",
+        recipient_id=["T4-654321-1"],
+        message_id="msg-001",
+        message_type="0133",
+        action="1",
+        sending_application=ECH0058SendingApplication(
+            manufacturer="OpenMun",
+            product="Valreg-Test",
+            product_version="1.0",
+        ),
+        message_date=datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc),
+        test_delivery_flag=True,
+    )
+
+
+# ---------------------------------------------------------------------------
+
+
+def make_numbered_realestate(i: int) -> ECH0129Realestate:
+    return ECH0129Realestate(
+        realestate_identification=ECH0129RealestateIdentification(
+            egrid=f"CH{100000000000 + i}",
+            number=str(1000 + i),
+        ),
+        realestate_type=RealestateType.LIEGENSCHAFT,
+    )
+
+
+def make_realestate_info(i: int) -> ECH0133RealestateInfo:
+    return ECH0133RealestateInfo(
+        realestate=make_numbered_realestate(i),
+        municipality=make_municipality(),
+        area=[make_area()],
+        fiscal_ownership_information=[make_fiscal_ownership_info()],
+        estimation_object=make_estimation_object(),
+        building_information=[make_building_info()],
+    )
@@ -0,0 +1,233 @@
+"""Test the asyncio export facade (openmun_ech.async_export).
+
+What This File Tests
+====================
+1. export_delivery() output equals the synchronous finalize() + to_file() output
+2. Files are written atomically (unique temporary files, none left behind)
+3. XSD validation runs in the executor and failures propagate (nothing written)
+4. Concurrency limit: never more than max_concurrency exports in flight
+5. The event loop stays responsive while exports run
+6. Per-stage timings are reported
+
+XSD validation itself is covered by the *_xsd_validation tests; here the
+validator is replaced by a recorder so the tests run without cached schemas.
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, dates, IDs, VNs)
+- BFS data: real opendata fixtures (Zürich 261)
+- Config data: ALWAYS fictive (sender IDs, product names, versions)
+"""
+
+import asyncio
+import threading
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+
+from openmun_ech import async_export
+from openmun_ech.async_export import AsyncExporter, export_delivery
+from openmun_ech.ech0020.models import (
+    BaseDeliveryEvent,
+    BaseDeliveryPerson,
+    DeliveryConfig,
+    DwellingAddressInfo,
+    PlaceType,
+    ResidenceType,
+)
+
+CONFIG = DeliveryConfig(
+    sender_id="sedex://T1-TEST-001",
+    manufacturer="TestManufacturer",
+    product="TestProduct",
+    product_version="1.0.0",
+    test_delivery_flag=True,
+)
+
+MESSAGE_DATE = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def _event(i: int = 0) -> BaseDeliveryEvent:
+    return BaseDeliveryEvent(
+        person=BaseDeliveryPerson(
+            official_name="Muster",
+            first_name=f"Hans{i}",
+            sex="1",
+            date_of_birth=date(1980, 1, 15),
+            vn="7561234567897",
+            local_person_id=f"ASYNC-{i}",
+            local_person_id_category="MU.6172",
+            religion="111",
+            marital_status="1",
+            nationality_status="2",
+            data_lock="0",
+            places_of_origin=[{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+            birth_place_type=PlaceType.SWISS,
+            birth_municipality_bfs="261",
+            birth_municipality_name="Zürich",
+        ),
+        residence_type=ResidenceType.MAIN,
+        reporting_municipality_bfs="261",
+        reporting_municipality_name="Zürich",
+        arrival_date=date(2024, 1, 1),
+        dwelling_address=DwellingAddressInfo(
+            street="Teststrasse",
+            house_number="42",
+            town="Zürich",
+            swiss_zip_code=8000,
+            type_of_household="1",
+        ),
+    )
+
+
+@pytest.fixture
+def validated(monkeypatch):
+    """Record validate_xml_cached() calls instead of loading XSD schemas."""
+    calls = []
+
+    def fake_validate(root, schema_name, raise_on_error):
+        calls.append((root.tag, schema_name, threading.current_thread().name))
+        return True
+
+    monkeypatch.setattr(async_export, "validate_xml_cached", fake_validate)
+    return calls
+
+
+class TestExportDelivery:
+
+    def test_output_matches_sync_api(self, tmp_path, validated):
+        event = _event()
+        path = tmp_path / "delivery.xml"
+        result = asyncio.run(export_delivery(
+            event, CONFIG, path=path, message_id="msg-1", message_date=MESSAGE_DATE
+        ))
+
+        reference = tmp_path / "reference.xml"
+        event.finalize(CONFIG, message_id="msg-1", message_date=MESSAGE_DATE).to_file(reference)
+
+        assert path.read_bytes() == reference.read_bytes() == result.data
+        assert result.path == path
+        assert result.delivery.delivery_header.header.message_id == "msg-1"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["delivery.xml", "reference.xml"]
+
+    def test_validation_runs_in_executor(self, validated):
+        asyncio.run(export_delivery(_event(), CONFIG))
+        assert len(validated) == 1
+        tag, schema_name, thread_name = validated[0]
+        assert tag.endswith("}delivery")
+        assert schema_name == "eCH-0020-3-0.xsd"
+        assert thread_name.startswith("openmun-export")
+
+    def test_validate_false_skips_validation(self, validated):
+        result = asyncio.run(export_delivery(_event(), CONFIG, validate=False))
+        assert validated == []
+        assert result.timings.validate_s < 0.01
+        assert result.path is None
+
+    def test_validation_failure_propagates_and_writes_nothing(self, tmp_path, monkeypatch):
+        def failing_validate(root, schema_name, raise_on_error):
+            raise RuntimeError("schema violation")
+
+        monkeypatch.setattr(async_export, "validate_xml_cached", failing_validate)
+        with pytest.raises(RuntimeError, match="schema violation"):
+            asyncio.run(export_delivery(_event(), CONFIG, path=tmp_path / "delivery.xml"))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_concurrent_exports_to_same_path_use_own_temp_files(self, tmp_path, monkeypatch):
+        replaced = []
+        real_replace = async_export.os.replace
+
+        def record_replace(src, dst):
+            replaced.append(src)
+            real_replace(src, dst)
+
+        monkeypatch.setattr(async_export.os, "replace", record_replace)
+        target = tmp_path / "delivery.xml"
+        async_export._write_atomic(target, b"<a/>")
+        async_export._write_atomic(target, b"<b/>")
+        assert len(set(replaced)) == 2
+        assert target.read_bytes() == b"<b/>"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_exporter_config_mismatch(self):
+        other = CONFIG.model_copy(update={"sender_id": "sedex://T1-TEST-999"})
+
+        async def run():
+            async with AsyncExporter(other) as exporter:
+                await export_delivery(_event(), CONFIG, exporter=exporter)
+
+        with pytest.raises(ValueError, match="different DeliveryConfig"):
+            asyncio.run(run())
+
+
+class TestAsyncExporter:
+
+    def test_concurrency_limit(self, tmp_path, monkeypatch):
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        def slow_validate(root, schema_name, raise_on_error):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return True
+
+        monkeypatch.setattr(async_export, "validate_xml_cached", slow_validate)
+
+        async def run():
+            async with AsyncExporter(CONFIG, max_concurrency=2) as exporter:
+                return await asyncio.gather(*[
+                    exporter.export(_event(i), path=tmp_path / f"msg-{i}.xml") for i in range(8)
+                ])
+
+        results = asyncio.run(run())
+        assert peak == 2
+        assert len(list(tmp_path.glob("msg-*.xml"))) == 8
+        assert len({r.delivery.delivery_header.header.message_id for r in results}) == 8
+        # Later exports waited for a slot
+        assert max(r.timings.wait_s for r in results) >= 0.02
+
+    def test_event_loop_not_blocked(self, monkeypatch):
+        monkeypatch.setattr(
+            async_export, "validate_xml_cached",
+            lambda root, schema_name, raise_on_error: time.sleep(0.1) or True,
+        )
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            async with AsyncExporter(CONFIG, max_concurrency=1) as exporter:
+                await exporter.export(_event())
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) >= 5
+
+    def test_timings(self, tmp_path, validated):
+        async def run():
+            async with AsyncExporter(CONFIG) as exporter:
+                return await exporter.export(_event(), path=tmp_path / "msg.xml")
+
+        timings = asyncio.run(run()).timings
+        for stage in ("wait_s", "convert_s", "validate_s", "serialize_s", "write_s"):
+            assert getattr(timings, stage) >= 0
+        assert timings.convert_s > 0 and timings.write_s > 0
+        assert timings.total_s == pytest.approx(
+            timings.wait_s + timings.convert_s + timings.validate_s + timings.serialize_s + timings.write_s
+        )
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncExporter(CONFIG, max_concurrency=0)
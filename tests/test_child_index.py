@@ -0,0 +1,65 @@
+"""Test the child element index used by hand-written from_xml() parsers.
+
+What This File Tests
+====================
+1. find/findall/text agree with ElementTree find()/findall() for direct children
+2. require() raises the parsers' "Missing required field" ValueError
+3. findall() returns a copy in document order
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from openmun_ech.core.children import ChildIndex
+
+NS = 'http://www.ech.ch/xmlns/eCH-0011/8'
+OTHER = 'http://www.ech.ch/xmlns/eCH-0007/5'
+
+XML = f'''<p:person xmlns:p="{NS}" xmlns:m="{OTHER}">
+  <p:placeOfOrigin>A</p:placeOfOrigin>
+  <p:languageOfCorrespondance> de </p:languageOfCorrespondance>
+  <m:placeOfOrigin>other namespace</m:placeOfOrigin>
+  <p:deathData/>
+  <p:placeOfOrigin>B</p:placeOfOrigin>
+  <p:nested><p:languageOfCorrespondance>fr</p:languageOfCorrespondance></p:nested>
+</p:person>'''
+
+
+@pytest.fixture
+def elem():
+    return ET.fromstring(XML)
+
+
+class TestChildIndex:
+
+    @pytest.mark.parametrize("name", ['placeOfOrigin', 'languageOfCorrespondance', 'deathData', 'missing'])
+    def test_matches_elementtree(self, elem, name):
+        children = ChildIndex(elem)
+        assert children.find(NS, name) is elem.find(f'{{{NS}}}{name}')
+        assert children.findall(NS, name) == elem.findall(f'{{{NS}}}{name}')
+
+    def test_namespace_and_depth(self, elem):
+        children = ChildIndex(elem)
+        assert [e.text for e in children.findall(NS, 'placeOfOrigin')] == ['A', 'B']
+        assert children.find(OTHER, 'placeOfOrigin').text == 'other namespace'
+        assert children.find(NS, 'nested') is not None
+        assert f'{{{NS}}}deathData' in children
+        assert f'{{{OTHER}}}deathData' not in children
+
+    def test_text(self, elem):
+        children = ChildIndex(elem)
+        assert children.text(NS, 'languageOfCorrespondance') == 'de'
+        assert children.text(NS, 'deathData') is None
+        assert children.text(NS, 'missing') is None
+
+    def test_require(self, elem):
+        children = ChildIndex(elem)
+        assert children.require(NS, 'deathData').tag == f'{{{NS}}}deathData'
+        with pytest.raises(ValueError, match="Missing required field: nameData"):
+            children.require(NS, 'nameData')
+
+    def test_findall_returns_copy(self, elem):
+        children = ChildIndex(elem)
+        children.findall(NS, 'placeOfOrigin').clear()
+        assert len(children.findall(NS, 'placeOfOrigin')) == 2
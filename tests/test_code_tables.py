@@ -0,0 +1,98 @@
+"""Test enum code tables and text interning (openmun_ech.core.codes).
+
+What This File Tests
+====================
+1. decode_enum(): members, surrounding whitespace, same errors as Enum(value)
+2. enum_text(): XML text of members
+3. Generic from_xml() decodes enums through the tables
+4. intern_text() and xml_field(intern=True): repeated names share one string,
+   also through the hand-written eCH-0011 parsers; the pool is bounded
+
+Data Policy
+===========
+- Personal data: none
+- BFS data: real municipality codes (Zürich 261)
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from openmun_ech.core import NS, codes
+from openmun_ech.core.codes import clear_text_pool, decode_enum, enum_text, intern_text
+from openmun_ech.ech0007 import CantonAbbreviation, ECH0007SwissMunicipality
+from openmun_ech.ech0008 import ECH0008Country
+from openmun_ech.ech0011 import ECH0011GeneralPlace, Sex
+from openmun_ech.ech0129.enums import BuildingCategory
+
+
+class TestDecodeEnum:
+
+    def test_members(self):
+        assert decode_enum(Sex, '1') is Sex('1')
+        assert decode_enum(CantonAbbreviation, 'ZH') is CantonAbbreviation.ZH
+        assert decode_enum(BuildingCategory, '1020') is BuildingCategory('1020')
+
+    def test_surrounding_whitespace(self):
+        assert decode_enum(CantonAbbreviation, '\n  ZH \n') is CantonAbbreviation.ZH
+
+    @pytest.mark.parametrize("text", ['XX', '', None])
+    def test_unknown_code(self, text):
+        with pytest.raises(ValueError, match="is not a valid CantonAbbreviation"):
+            decode_enum(CantonAbbreviation, text)
+
+    def test_enum_text(self):
+        assert enum_text(CantonAbbreviation.BE) == 'BE'
+        assert enum_text(Sex('2')) == '2'
+
+    def test_generic_from_xml(self):
+        elem = ET.fromstring(
+            f'<m:swissMunicipality xmlns:m="{NS.ECH0007_V5}">'
+            '<m:municipalityId>261</m:municipalityId>'
+            '<m:municipalityName>Zürich</m:municipalityName>'
+            '<m:cantonAbbreviation> ZH </m:cantonAbbreviation>'
+            '</m:swissMunicipality>'
+        )
+        municipality = ECH0007SwissMunicipality.from_xml(elem)
+        assert municipality.canton_abbreviation is CantonAbbreviation.ZH
+
+
+class TestInterning:
+
+    def test_intern_text(self):
+        first = ''.join(['Zü', 'rich'])
+        second = ''.join(['Zür', 'ich'])
+        assert first is not second
+        assert intern_text(first) is intern_text(second)
+
+    def test_interned_field(self):
+        def country():
+            elem = ET.fromstring(
+                f'<c:country xmlns:c="{NS.ECH0008_V3}">'
+                '<c:countryNameShort>Deutschland</c:countryNameShort></c:country>'
+            )
+            return ECH0008Country.from_xml(elem)
+
+        assert country().country_name_short is country().country_name_short
+
+    def test_hand_written_parser(self):
+        def place():
+            elem = ET.fromstring(
+                f'<p:placeOfBirth xmlns:p="{NS.ECH0011_V8}" xmlns:m="{NS.ECH0007_V5}">'
+                '<p:swissTown><m:municipalityId>261</m:municipalityId>'
+                '<m:municipalityName>Zürich</m:municipalityName></p:swissTown></p:placeOfBirth>'
+            )
+            return ECH0011GeneralPlace.from_xml(elem, NS.ECH0011_V8)
+
+        first, second = place(), place()
+        name = first.swiss_municipality.swiss_municipality.municipality_name
+        assert name is second.swiss_municipality.swiss_municipality.municipality_name
+
+    def test_pool_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(codes, '_TEXT_POOL_MAX', 3)
+        clear_text_pool()
+        for i in range(10):
+            intern_text(f'name{i}')
+        assert len(codes._TEXT_POOL) <= 3
+        clear_text_pool()
+        assert not codes._TEXT_POOL
@@ -0,0 +1,124 @@
+"""Test content hashing of Layer 1 models (ECHModel.content_hash()).
+
+What This File Tests
+====================
+1. Equal content → equal digest: separate instances, XML round trip with other
+   prefixes and whitespace; None and empty lists are both absent
+2. Any difference changes the digest: values, list order, model type,
+   fields without xml_field() (hand-written classes)
+3. Composition: a child's change reaches the parent; frozen models compute
+   their digest once, invisibly to ==, hash() and model_dump();
+   model_copy(update=...) does not reuse it
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs)
+- BFS data: real country codes (Germany 8207, Italy 8218)
+"""
+
+import xml.etree.ElementTree as ET
+from typing import List, Optional
+
+from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.ech0008 import ECH0008Country
+from openmun_ech.ech0021.v7 import ECH0021NameOfParent
+
+TEST_NS = 'urn:example:hash'
+
+GERMANY = ECH0008Country(country_id='8207', country_id_iso2='DE', country_name_short='Deutschland')
+
+
+class Sample(ECHModel):
+    __xml_ns__ = TEST_NS
+    __xml_element__ = 'sample'
+
+    name: str = xml_field('name')
+    alias: List[str] = xml_field('alias', is_list=True, default_factory=list)
+    country: Optional[ECH0008Country] = xml_field('country', ns=NS.ECH0008_V3, default=None)
+    size: Optional[int] = xml_field('size', default=None)
+
+
+class OtherSample(Sample):
+    __xml_element__ = 'other'
+
+
+def sample(**overrides) -> Sample:
+    data = {'name': 'Muster', 'alias': ['A', 'B'], 'country': GERMANY, 'size': 3}
+    data.update(overrides)
+    return Sample(**data)
+
+
+class TestEqualContent:
+
+    def test_equal_instances(self):
+        assert sample().content_hash() == sample().content_hash()
+        assert len(sample().content_hash()) == 16
+
+    def test_xml_round_trip(self):
+        elem = sample().to_xml()
+        ET.register_namespace('x', TEST_NS)
+        ET.indent(elem)
+        parsed = Sample.from_xml(ET.fromstring(ET.tostring(elem)))
+        assert parsed.content_hash() == sample().content_hash()
+
+    def test_absent_values(self):
+        absent = Sample(name='Muster', country=GERMANY)
+        assert sample(alias=[], size=None).content_hash() == absent.content_hash()
+
+
+class TestDifferentContent:
+
+    def test_values(self):
+        digests = {
+            sample().content_hash(),
+            sample(name='Muster2').content_hash(),
+            sample(alias=['B', 'A']).content_hash(),
+            sample(alias=['AB']).content_hash(),
+            sample(size=4).content_hash(),
+            sample(size=None).content_hash(),
+            sample(country=GERMANY.model_copy(update={'country_id': '8218'})).content_hash(),
+        }
+        assert len(digests) == 7
+
+    def test_model_type(self):
+        assert OtherSample(**dict(sample())).content_hash() != sample().content_hash()
+
+    def test_fields_without_xml_field(self):
+        first = ECH0021NameOfParent(first_name='Anna', official_name='Muster')
+        other = ECH0021NameOfParent(first_name='Anna', official_name='Meier')
+        assert first.content_hash() != other.content_hash()
+        assert first.content_hash() == ECH0021NameOfParent(
+            first_name='Anna', official_name='Muster'
+        ).content_hash()
+
+
+class TestComposition:
+
+    def test_child_digest_reused(self):
+        country = ECH0008Country(country_id='8207', country_name_short='Deutschland')
+        assert country._content_hash is None
+        parent = sample(country=country).content_hash()
+        assert country._content_hash.digest == country.content_hash()
+        assert parent == sample(country=country.model_copy()).content_hash()
+
+    def test_memo_invisible(self):
+        hashed = ECH0008Country(country_id='8207', country_name_short='Deutschland')
+        hashed.content_hash()
+        plain = ECH0008Country(country_id='8207', country_name_short='Deutschland')
+        assert hashed == plain and hash(hashed) == hash(plain)
+        assert hashed.model_dump() == plain.model_dump()
+
+    def test_model_copy_update(self):
+        GERMANY.content_hash()
+        italy = GERMANY.model_copy(update={'country_id': '8218', 'country_name_short': 'Italien'})
+        assert italy.content_hash() != GERMANY.content_hash()
+        assert italy.content_hash() == ECH0008Country(
+            country_id='8218', country_id_iso2='DE', country_name_short='Italien'
+        ).content_hash()
+
+    def test_mutable_models_not_memoized(self):
+        model = sample()
+        before = model.content_hash()
+        model.size = 5
+        assert model.__pydantic_private__ is None
+        assert model.content_hash() != before
@@ -0,0 +1,187 @@
+"""Test the structural diff of eCH deliveries (openmun_ech.diff).
+
+What This File Tests
+====================
+1. Identical content is unchanged regardless of order, indentation and prefixes
+2. Added, removed and changed entities; paths and values of changes
+3. Repeated siblings (placeOfOrigin): reordering is no change, positions in paths
+4. Keys: local person ID (default), VN, eCH-0099 default key
+5. Errors: missing and duplicate keys, unknown root element
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261, Bern 351)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from openmun_ech.diff import (
+    ECH0020_VN,
+    Change,
+    EntityKey,
+    diff_deliveries,
+    diff_entities,
+)
+from tests.conftest import ECH0011, ECH0044, NAMESPACES, ORIGINS, make_event, write_delivery
+
+
+@pytest.fixture
+def old(tmp_path):
+    return write_delivery(tmp_path / 'old.xml', [make_event(i) for i in range(4)])
+
+
+def edit(source, target, change):
+    """Copy a delivery, calling change(baseDelivery element) in between."""
+    tree = ET.parse(source)
+    messages = tree.getroot().find('eCH-0020:baseDelivery', NAMESPACES)
+    change(messages)
+    tree.write(target, encoding='utf-8', xml_declaration=True)
+    return target
+
+
+def person_of(messages, i):
+    return messages.findall('eCH-0020:messages', NAMESPACES)[i].find('eCH-0020:baseDeliveryPerson', NAMESPACES)
+
+
+class TestUnchanged:
+
+    def test_same_delivery(self, old):
+        result = diff_deliveries(old, old)
+        assert not result
+        assert result.unchanged == 4
+
+    def test_order_indentation_and_header_ignored(self, old, tmp_path):
+        events = [make_event(i) for i in reversed(range(4))]
+        new = write_delivery(tmp_path / 'new.xml', events, pretty_print=False)
+        result = diff_deliveries(old, new)
+        assert not result
+        assert result.unchanged == 4
+
+    def test_reordered_repeated_siblings(self, old, tmp_path):
+        events = [make_event(i) for i in range(4)]
+        events[1] = make_event(1, places_of_origin=ORIGINS[::-1])
+        new = write_delivery(tmp_path / 'new.xml', events)
+        assert not diff_deliveries(old, new)
+
+
+class TestChanges:
+
+    def test_added_removed_changed(self, old, tmp_path):
+        events = [make_event(i) for i in range(1, 5)]
+        events[0].person.first_name = "Renamed"
+        new = write_delivery(tmp_path / 'new.xml', events)
+
+        result = diff_deliveries(old, new)
+        assert result.added == [('MU.261', '10004')]
+        assert result.removed == [('MU.261', '10000')]
+        assert result.unchanged == 2
+        (entity,) = result.changed
+        assert entity.key == ('MU.261', '10001')
+        assert Change(
+            'changed',
+            'eCH-0020:baseDeliveryPerson/eCH-0020:personIdentification/eCH-0044:firstName',
+            'Person1',
+            'Renamed',
+        ) in entity.changes
+
+    def test_removed_element_and_changed_origin(self, old, tmp_path):
+        def change(messages):
+            person = person_of(messages, 2)
+            person.find('eCH-0020:personIdentification', NAMESPACES).remove(
+                person.find('eCH-0020:personIdentification/eCH-0044:vn', NAMESPACES)
+            )
+            origins = person.findall('.//eCH-0011:originName', NAMESPACES)
+            origins[1].text = 'Bümpliz'
+
+        new = edit(old, tmp_path / 'new.xml', change)
+        (entity,) = diff_deliveries(old, new).changed
+        person = 'eCH-0020:baseDeliveryPerson'
+        assert entity.changes == [
+            Change('removed', f'{person}/eCH-0020:personIdentification/eCH-0044:vn', old='7561234560002'),
+            Change(
+                'changed',
+                f'{person}/eCH-0020:placeOfOriginInfo[2]/eCH-0020:placeOfOrigin/eCH-0011:originName',
+                'Bern',
+                'Bümpliz',
+            ),
+        ]
+
+    def test_diff_entities(self):
+        old = ET.fromstring('<a><b>1</b><c x="1"/></a>')
+        new = ET.fromstring('<a>\n  <b>1</b>\n  <c x="2"/>\n  <d>new</d>\n</a>')
+        assert diff_entities(old, new) == [
+            Change('changed', 'c/@x', '1', '2'),
+            Change('added', 'd', new='new'),
+        ]
+        assert diff_entities(old, ET.fromstring('<a><c x="1" /><b>1</b></a>')) == []
+
+
+class TestKeys:
+
+    def test_vn_key(self, old, tmp_path):
+        def change_local_ids(messages):
+            for elem in messages.iterfind('.//eCH-0044:localPersonId/eCH-0044:personId', NAMESPACES):
+                elem.text = '9' + elem.text
+
+        new = edit(old, tmp_path / 'new.xml', change_local_ids)
+        assert len(diff_deliveries(old, new).added) == 4
+        result = diff_deliveries(old, new, key=ECH0020_VN)
+        assert not result.added and len(result.changed) == 4
+        assert result.changed[0].key == ('7561234560000',)
+
+    def test_ech0099_default_key(self):
+        def delivery(name):
+            return (
+                '<d:delivery xmlns:d="http://www.ech.ch/xmlns/eCH-0099/2" '
+                f'xmlns:p="{ECH0011}" xmlns:i="{ECH0044}">'
+                '<d:reportedPerson><d:baseData><p:person><p:personIdentification>'
+                '<i:localPersonId><i:personIdCategory>MU.351</i:personIdCategory>'
+                '<i:personId>1</i:personId></i:localPersonId>'
+                f'<i:officialName>{name}</i:officialName>'
+                '</p:personIdentification></p:person></d:baseData></d:reportedPerson>'
+                '</d:delivery>'
+            ).encode('utf-8')
+
+        result = diff_deliveries(io.BytesIO(delivery('Muster')), io.BytesIO(delivery('Beispiel')))
+        (entity,) = result.changed
+        assert entity.key == ('MU.351', '1')
+        assert entity.changes[0].path.endswith('eCH-0044:officialName')
+
+    def test_file_objects_read_twice(self, old, tmp_path):
+        events = [make_event(i) for i in range(4)]
+        events[3].person.first_name = "Renamed"
+        new = write_delivery(tmp_path / 'new.xml', events)
+        with open(old, 'rb') as f, open(new, 'rb') as g:
+            result = diff_deliveries(f, g)
+        assert len(result.changed) == 1
+
+
+class TestErrors:
+
+    def test_duplicate_key(self, old, tmp_path):
+        events = [make_event(0), make_event(0)]
+        new = write_delivery(tmp_path / 'new.xml', events)
+        with pytest.raises(ValueError, match="Duplicate key"):
+            diff_deliveries(new, old)
+        with pytest.raises(ValueError, match="Duplicate key"):
+            diff_deliveries(old, new)
+
+    def test_missing_key(self, old, tmp_path):
+        with pytest.raises(ValueError, match="has no key"):
+            diff_deliveries(old, old, key=EntityKey(
+                ECH0020_VN.entity, ['eCH-0020:baseDeliveryPerson/eCH-0020:jobData']
+            ))
+
+    def test_unknown_root(self):
+        source = io.BytesIO(b'<delivery xmlns="urn:example:other"/>')
+        with pytest.raises(ValueError, match="No default entity key"):
+            diff_deliveries(source, source)
+
+    @pytest.mark.parametrize("entity", ['delivery/messages', 'eCH-9999:delivery'])
+    def test_invalid_entity_path(self, entity):
+        with pytest.raises(ValueError, match="entity path"):
+            EntityKey(entity, ['x'])
@@ -0,0 +1,185 @@
+"""Test streaming privacy minimization of eCH-0020 deliveries.
+
+What This File Tests
+====================
+1. PRIVACY_POLICY removes VN, job, health insurance and armed forces data
+2. Streamed output equals the in-memory policy.apply() on the same document
+3. Output parses back with ECH0020Delivery.from_file()
+4. Policy paths: wildcards, keep exceptions, text replacement, invalid paths
+5. Worker processes keep input order; non-eCH-0020 input is rejected
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import date
+
+import pytest
+
+from openmun_ech.ech0020.minimize import (
+    PRIVACY_POLICY,
+    MinimizationPolicy,
+    minimize_delivery,
+)
+from openmun_ech.ech0020.models import (
+    BaseDeliveryEvent,
+    BaseDeliveryPerson,
+    DeliveryConfig,
+    DwellingAddressInfo,
+    PlaceType,
+    ResidenceType,
+)
+from openmun_ech.ech0020.streaming import write_base_delivery
+from openmun_ech.ech0020.v3 import ECH0020Delivery
+
+PERSON = 'eCH-0020:delivery/eCH-0020:baseDelivery/eCH-0020:messages/eCH-0020:baseDeliveryPerson'
+
+
+@pytest.fixture
+def source(tmp_path):
+    config = DeliveryConfig(
+        sender_id="sedex://T1-TEST-001",
+        manufacturer="TestManufacturer",
+        product="TestProduct",
+        product_version="1.0.0",
+        test_delivery_flag=True,
+    )
+    events = []
+    for i in range(5):
+        person = BaseDeliveryPerson(
+            official_name="Muster",
+            first_name=f"Person{i}",
+            sex="1" if i % 2 else "2",
+            date_of_birth=date(1980 + i, 1, 15),
+            vn=f"756123456{i:04d}",
+            local_person_id=str(10000 + i),
+            local_person_id_category="MU.261",
+            religion="111",
+            marital_status="1",
+            nationality_status="2",
+            data_lock="0",
+            places_of_origin=[{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+            birth_place_type=PlaceType.SWISS,
+            birth_municipality_bfs="261",
+            birth_municipality_name="Zürich",
+            kind_of_employment="1",
+            job_title="Gärtnerin",
+            health_insured=True,
+            health_insurance_name="Testkasse",
+            armed_forces_service="1",
+        )
+        events.append(BaseDeliveryEvent(
+            person=person,
+            residence_type=ResidenceType.MAIN,
+            reporting_municipality_bfs="261",
+            reporting_municipality_name="Zürich",
+            arrival_date=date(2024, 1, 1),
+            dwelling_address=DwellingAddressInfo(
+                street="Teststrasse",
+                house_number=str(i + 1),
+                town="Zürich",
+                swiss_zip_code=8000,
+                type_of_household="1",
+            ),
+        ))
+    path = tmp_path / 'base_delivery.xml'
+    write_base_delivery(events, config, path)
+    return path
+
+
+def canonical(data) -> str:
+    return ET.canonicalize(data, strip_text=True)
+
+
+class TestPrivacyPolicy:
+
+    def test_removes_privacy_sensitive_data(self, source, tmp_path):
+        target = tmp_path / 'minimized.xml'
+        result = minimize_delivery(source, target)
+        assert result.messages == 5
+
+        delivery = ECH0020Delivery.from_file(target)
+        for event in delivery.event:
+            person = event.base_delivery_person
+            assert person.person_identification.vn is None
+            assert person.job_data is None
+            assert person.health_insurance_data is None
+            assert person.armed_forces_data is None
+            assert person.person_identification.official_name == "Muster"
+            assert person.lock_data is not None
+
+        assert result.counts[f'{PERSON}/eCH-0020:jobData'] == 5
+        assert result.counts[f'{PERSON}/eCH-0020:personIdentification/eCH-0044:vn'] == 5
+        assert result.counts[f'{PERSON}/eCH-0020:guardianRelationship'] == 0
+
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_same_as_in_memory_policy(self, source, tmp_path, pretty_print):
+        target = tmp_path / 'minimized.xml'
+        minimize_delivery(source, target, pretty_print=pretty_print)
+
+        root = ET.parse(source).getroot()
+        PRIVACY_POLICY.apply(root)
+        assert canonical(target.read_text('utf-8')) == canonical(ET.tostring(root, encoding='unicode'))
+
+    def test_workers_keep_input_order(self, source, tmp_path):
+        minimize_delivery(source, tmp_path / 'serial.xml')
+        minimize_delivery(source, tmp_path / 'parallel.xml', workers=2, batch_size=2)
+        assert (tmp_path / 'serial.xml').read_bytes() == (tmp_path / 'parallel.xml').read_bytes()
+
+    def test_binary_file_source_and_target(self, source):
+        out = io.BytesIO()
+        with open(source, 'rb') as f:
+            minimize_delivery(f, out)
+        assert not out.closed
+        delivery = ECH0020Delivery.from_xml(ET.fromstring(out.getvalue()))
+        assert len(delivery.event) == 5
+
+
+class TestPolicy:
+
+    def test_wildcards_and_keep(self, source, tmp_path):
+        policy = MinimizationPolicy(
+            drop=[f'{PERSON}/*:*Data'],
+            keep=[f'{PERSON}/eCH-0020:lockData', '**/eCH-0020:religionData'],
+        )
+        target = tmp_path / 'minimized.xml'
+        result = minimize_delivery(source, target, policy)
+
+        person = ET.parse(target).find('.//{http://www.ech.ch/xmlns/eCH-0020/3}baseDeliveryPerson')
+        names = [child.tag.rsplit('}', 1)[1] for child in person]
+        assert 'lockData' in names and 'religionData' in names
+        assert 'jobData' not in names and 'nationalityData' not in names
+        assert result.counts[f'{PERSON}/*:*Data'] > 0
+
+    def test_replace_text(self, source, tmp_path):
+        policy = MinimizationPolicy(replace={
+            '**/eCH-0058*:sendingApplication/eCH-0058*:manufacturer': 'openmun',
+        })
+        target = tmp_path / 'minimized.xml'
+        minimize_delivery(source, target, policy)
+        header = ECH0020Delivery.from_file(target).delivery_header.header
+        assert header.sending_application.manufacturer == 'openmun'
+
+    @pytest.mark.parametrize("path", ['eCH-0020:delivery//eCH-0020:jobData', 'jobData', 'eCH-9999:jobData'])
+    def test_invalid_paths_rejected(self, path):
+        with pytest.raises(ValueError, match="policy path"):
+            MinimizationPolicy(drop=[path])
+
+
+class TestErrors:
+
+    def test_not_an_ech0020_delivery(self, tmp_path):
+        source = tmp_path / 'other.xml'
+        source.write_text('<delivery xmlns="http://www.ech.ch/xmlns/eCH-0099/2"/>')
+        target = tmp_path / 'minimized.xml'
+        with pytest.raises(ValueError, match="Not an eCH-0020 delivery"):
+            minimize_delivery(source, target)
+        assert not target.exists()
+
+    def test_invalid_batch_size(self, source, tmp_path):
+        with pytest.raises(ValueError, match="batch_size"):
+            minimize_delivery(source, tmp_path / 'minimized.xml', batch_size=0)
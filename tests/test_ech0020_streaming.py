@@ -0,0 +1,159 @@
+"""Test eCH-0020 streaming export for baseDelivery (full register extracts).
+
+What This File Tests
+====================
+1. Streamed output is the same document as finalize_0020_base(...).to_file()
+2. Output parses back with ECH0020Delivery.from_file()
+3. Events are consumed lazily (generator input)
+4. Empty input and exceptions leave path targets untouched
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timezone
+
+import pytest
+
+from openmun_ech.ech0020.models import (
+    BaseDeliveryEvent,
+    BaseDeliveryPerson,
+    DeliveryConfig,
+    DwellingAddressInfo,
+    PlaceType,
+    ResidenceType,
+)
+from openmun_ech.ech0020.streaming import ECH0020StreamWriter, write_base_delivery
+from openmun_ech.ech0020.v3 import ECH0020Delivery
+from openmun_ech.finalize import finalize_0020_base
+
+MESSAGE_ID = "stream-test-0020"
+MESSAGE_DATE = datetime(2024, 3, 31, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def config():
+    return DeliveryConfig(
+        sender_id="sedex://T1-TEST-001",
+        manufacturer="TestManufacturer",
+        product="TestProduct",
+        product_version="1.0.0",
+        test_delivery_flag=True,
+    )
+
+
+@pytest.fixture
+def events():
+    result = []
+    for i in range(5):
+        person = BaseDeliveryPerson(
+            official_name="Muster",
+            first_name=f"Person{i}",
+            sex="1" if i % 2 else "2",
+            date_of_birth=date(1980 + i, 1, 15),
+            vn=f"756123456{i:04d}",
+            local_person_id=str(10000 + i),
+            local_person_id_category="MU.261",
+            religion="111",
+            marital_status="1",
+            nationality_status="2",
+            data_lock="0",
+            places_of_origin=[{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+            birth_place_type=PlaceType.SWISS,
+            birth_municipality_bfs="261",
+            birth_municipality_name="Zürich",
+        )
+        result.append(BaseDeliveryEvent(
+            person=person,
+            residence_type=ResidenceType.MAIN,
+            reporting_municipality_bfs="261",
+            reporting_municipality_name="Zürich",
+            arrival_date=date(2024, 1, 1),
+            dwelling_address=DwellingAddressInfo(
+                street="Teststrasse",
+                house_number=str(i + 1),
+                town="Zürich",
+                swiss_zip_code=8000,
+                type_of_household="1",
+            ),
+        ))
+    return result
+
+
+def canonical(path) -> str:
+    return ET.canonicalize(from_file=str(path), strip_text=True)
+
+
+class TestWriteBaseDelivery:
+
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_same_document_as_to_file(self, tmp_path, events, config, pretty_print):
+        count = write_base_delivery(
+            iter(events), config, tmp_path / 'stream.xml',
+            message_id=MESSAGE_ID, message_date=MESSAGE_DATE, pretty_print=pretty_print,
+        )
+        assert count == 5
+
+        finalize_0020_base(
+            events, config, message_id=MESSAGE_ID, message_date=MESSAGE_DATE,
+        ).to_file(tmp_path / 'memory.xml')
+
+        assert canonical(tmp_path / 'stream.xml') == canonical(tmp_path / 'memory.xml')
+
+    def test_parses_back_with_from_file(self, tmp_path, events, config):
+        path = tmp_path / 'base_delivery.xml'
+        write_base_delivery(events, config, path, message_id=MESSAGE_ID)
+
+        delivery = ECH0020Delivery.from_file(path)
+        assert delivery.version == "3.0"
+        assert delivery.delivery_header.header.message_id == MESSAGE_ID
+        assert delivery.event == [e.to_ech0020_event() for e in events]
+
+    def test_events_consumed_lazily(self, tmp_path, events, config):
+        consumed = []
+
+        def generate():
+            for event in events:
+                consumed.append(event)
+                yield event
+
+        write_base_delivery(generate(), config, tmp_path / 'base_delivery.xml')
+        assert consumed == events
+
+    def test_binary_file_target_left_open(self, events, config):
+        buffer = io.BytesIO()
+        write_base_delivery(events, config, buffer)
+        assert not buffer.closed
+        delivery = ECH0020Delivery.from_xml(ET.fromstring(buffer.getvalue()))
+        assert len(delivery.event) == 5
+
+    def test_empty_events_rejected(self, tmp_path, config):
+        with pytest.raises(ValueError, match="at least one messages"):
+            write_base_delivery(iter(()), config, tmp_path / 'base_delivery.xml')
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStreamWriter:
+
+    def test_exception_leaves_target_untouched(self, tmp_path, events, config):
+        path = tmp_path / 'base_delivery.xml'
+        path.write_text('previous')
+        header = finalize_0020_base(events[:1], config).delivery_header
+        with pytest.raises(RuntimeError):
+            with ECH0020StreamWriter(path, header) as writer:
+                writer.write_event(events[0])
+                raise RuntimeError("register query failed")
+        assert path.read_text() == 'previous'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_write_after_close(self, tmp_path, events, config):
+        header = finalize_0020_base(events[:1], config).delivery_header
+        writer = ECH0020StreamWriter(tmp_path / 'base_delivery.xml', header)
+        writer.write_event(events[0])
+        writer.close()
+        with pytest.raises(ValueError, match="closed"):
+            writer.write_event(events[1])
@@ -0,0 +1,135 @@
+"""Tests for the eCH-0058 header codec (openmun_ech.ech0058.codec)."""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from openmun_ech.core import NS
+from openmun_ech.ech0058 import ActionType, ECH0058Header, ECH0058SendingApplication, v4
+from openmun_ech.ech0058.codec import HeaderTemplate, read_delivery_header
+
+MESSAGE_DATE = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_header(**kwargs) -> ECH0058Header:
+    fields = dict(
+        sender_id="T4-123456-1",
+        recipient_id=["T4-654321-1"],
+        message_id="template",
+        message_type="http://www.ech.ch/xmlns/eCH-0133/3",
+        sending_application=ECH0058SendingApplication(
+            manufacturer="OpenMun", product="Gateway", product_version="1.0",
+        ),
+        message_date=MESSAGE_DATE,
+        action=ActionType.NEW,
+        test_delivery_flag=True,
+    )
+    fields.update(kwargs)
+    return ECH0058Header(**fields)
+
+
+def delivery_bytes(header_bytes: bytes, payload_size: int = 3) -> bytes:
+    return (
+        f'<d:delivery xmlns:d="{NS.ECH0133_V3}">'.encode()
+        + header_bytes
+        + b'<d:payload>' + b'<d:item/>' * payload_size + b'</d:payload></d:delivery>'
+    )
+
+
+class TestHeaderTemplate:
+    """Pre-serialized header with per-message slots."""
+
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_same_element_as_to_xml(self, pretty_print):
+        template = HeaderTemplate(make_header(), pretty_print=pretty_print)
+        rendered = template.render(message_id="msg-002", action=ActionType.CORRECTION)
+
+        expected = make_header(message_id="msg-002", action=ActionType.CORRECTION).to_xml()
+        if pretty_print:
+            ET.indent(expected, space='  ')
+        assert ET.canonicalize(rendered.decode()) == ET.canonicalize(
+            ET.tostring(expected, encoding='unicode')
+        )
+
+    def test_values_are_escaped(self):
+        template = HeaderTemplate(make_header(comment="static"), slots=['message_id', 'comment'])
+        rendered = template.render(message_id="a<b", comment="R&D")
+        header = ECH0058Header.from_xml(ET.fromstring(rendered))
+        assert header.message_id == "a<b"
+        assert header.comment == "R&D"
+
+    def test_values_are_validated(self):
+        template = HeaderTemplate(make_header())
+        with pytest.raises(ValidationError):
+            template.render(message_id="x" * 37)
+        with pytest.raises(ValidationError):
+            template.render(message_date=datetime(2024, 6, 1))  # naive datetime
+
+    def test_static_fields_are_not_slots(self):
+        template = HeaderTemplate(make_header())
+        with pytest.raises(ValueError, match="Not a slot"):
+            template.render(sender_id="T4-999999-1")
+
+    def test_slot_must_be_set_in_template(self):
+        with pytest.raises(ValueError, match="must be set in the template"):
+            HeaderTemplate(make_header(), slots=['reference_message_id'])
+        with pytest.raises(ValueError, match="Unknown header slot"):
+            HeaderTemplate(make_header(), slots=['sender_id'])
+
+    def test_v4_header(self):
+        header = v4.ECH0058Header(
+            sender_id="T4-123456-1",
+            message_id="template",
+            message_type=NS.ECH0099_V2,
+            sending_application=v4.ECH0058SendingApplication(
+                manufacturer="OpenMun", product="Gateway", product_version="1.0",
+            ),
+            message_date=MESSAGE_DATE,
+            action=ActionType.NEW,
+            test_delivery_flag=False,
+        )
+        rendered = HeaderTemplate(header).render(message_id="msg-004")
+        assert f'xmlns:eCH-0058-v4="{NS.ECH0058_V4}"' in rendered.decode()
+        assert read_delivery_header(rendered).message_id == "msg-004"
+
+
+class TestReadDeliveryHeader:
+    """Header-only pull parsing."""
+
+    def test_reads_header_of_delivery(self, tmp_path):
+        template = HeaderTemplate(make_header(), wrapper=f'{{{NS.ECH0133_V3}}}deliveryHeader')
+        path = tmp_path / 'delivery.xml'
+        path.write_bytes(delivery_bytes(template.render(message_id="msg-010")))
+
+        header = read_delivery_header(path)
+        assert isinstance(header, ECH0058Header)
+        assert header == make_header(message_id="msg-010")
+        assert read_delivery_header(str(path)) == header
+
+    def test_payload_is_not_read(self):
+        template = HeaderTemplate(make_header(), wrapper=f'{{{NS.ECH0133_V3}}}deliveryHeader')
+        # Malformed after the header: never reached
+        document = delivery_bytes(template.render()) + b'<<< not xml' + b' ' * 100_000
+        stream = io.BytesIO(document)
+
+        assert read_delivery_header(stream).message_id == "template"
+        assert stream.tell() < len(document)
+        assert not stream.closed
+
+    def test_standalone_header(self):
+        assert read_delivery_header(ET.tostring(make_header().to_xml())) == make_header()
+
+    def test_missing_header(self):
+        with pytest.raises(ValueError, match="Missing required deliveryHeader"):
+            read_delivery_header(b'<delivery><payload/><deliveryHeader/></delivery>')
+
+    def test_expected_root(self):
+        template = HeaderTemplate(make_header(), wrapper=f'{{{NS.ECH0133_V3}}}deliveryHeader')
+        document = delivery_bytes(template.render())
+        header = read_delivery_header(document, root=f'{{{NS.ECH0133_V3}}}delivery')
+        assert header.message_id == "template"
+        with pytest.raises(ValueError, match="Unexpected root element"):
+            read_delivery_header(document, root=f'{{{NS.ECH0020_V3}}}delivery')
@@ -5,6 +5,7 @@ import pytest
 from datetime import datetime, date, timezone
 from pydantic import ValidationError
 
+from openmun_ech.core.indent import indent
 from openmun_ech.ech0058 import (
     AnyXMLContent,
     ActionType,
@@ -97,6 +98,32 @@ class TestAnyXMLContent:
         assert parent[0].tag == "customElement"
         assert parent[0].text == "test"
 
+    def test_to_xml_appends_stored_element(self):
+        """Test that to_xml() passes the stored element through without copying."""
+        elem = ET.fromstring('<payload><doc>large</doc></payload>')
+        content = AnyXMLContent.from_element(elem)
+
+        assert content.to_element() is elem
+        assert content.to_xml(ET.Element("parent")) is elem
+
+    def test_equality_across_representations(self):
+        """Test that equal content compares equal regardless of storage."""
+        elem = ET.fromstring('<customData>test</customData>')
+        assert AnyXMLContent.from_element(elem) == AnyXMLContent(xml_content='<customData>test</customData>')
+        assert AnyXMLContent(xml_content='<a/>') != AnyXMLContent(xml_content='<b/>')
+
+    def test_model_dump_roundtrip(self):
+        """Test that model_dump() exposes xml_content and validates back."""
+        content = AnyXMLContent.from_element(ET.fromstring('<customData>test</customData>'))
+        dumped = content.model_dump()
+        assert dumped == {'xml_content': '<customData>test</customData>'}
+        assert AnyXMLContent.model_validate(dumped) == content
+
+    def test_xml_content_required(self):
+        """Test that construction without content fails."""
+        with pytest.raises(ValueError):
+            AnyXMLContent()
+
 
 class TestECH0058NamedMetaData:
     """Test named metadata model."""
@@ -738,3 +765,29 @@ class TestECH0058Header:
         assert parsed.attachment is not None
         assert parsed.extension is not None
         assert len(parsed.attachment) == 1
+
+    def test_pretty_printing_leaves_payload_unchanged(self):
+        """Test that core.indent.indent() does not modify the stored payloads."""
+        payload = '<ext><a>1</a><b>2</b></ext>'
+        header = ECH0058Header(
+            sender_id="sedex://T1-CH01-1",
+            message_id="msg-123",
+            message_type="http://www.ech.ch/xmlns/eCH-0020/3",
+            sending_application=ECH0058SendingApplication(
+                manufacturer="OpenMun",
+                product="Test",
+                product_version="1.0"
+            ),
+            message_date=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+            action=ActionType.NEW,
+            test_delivery_flag=True,
+            attachment=[AnyXMLContent.from_element(ET.fromstring(payload))],
+            extension=AnyXMLContent.from_element(ET.fromstring(payload))
+        )
+        compact = ET.tostring(header.to_xml())
+
+        indent(header.to_xml())
+
+        assert header.extension == AnyXMLContent(xml_content=payload)
+        assert header.attachment[0].xml_content == payload
+        assert ET.tostring(header.to_xml()) == compact
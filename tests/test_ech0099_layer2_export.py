@@ -19,7 +19,6 @@ from openmun_ech.ech0099 import (
     # Layer 2
     StatisticsPerson,
     StatisticsDeliveryEvent,
-    StatisticsDeliveryConfig,
     DwellingAddressInfo,
     DestinationInfo,
     PlaceOfOriginInfo,
@@ -34,90 +33,6 @@ from openmun_ech.ech0099 import (
 from openmun_ech.finalize import finalize_0099_layer2
 
 
-# ============================================================================
-# TEST FIXTURES
-# ============================================================================
-
-@pytest.fixture
-def swiss_person():
-    """Create a valid Swiss person for testing."""
-    return StatisticsPerson(
-        vn="7561234567890",
-        local_person_id="12345",
-        local_person_id_category="MU.6172",
-        official_name="Müller",
-        first_name="Hans",
-        sex="1",
-        date_of_birth=date(1980, 5, 15),
-        birth_place_type=PlaceType.SWISS,
-        birth_municipality_bfs=261,
-        birth_municipality_name="Zürich",
-        birth_municipality_canton="ZH",
-        religion="111",
-        marital_status="1",
-        nationality_type=NationalityType.SWISS,
-        nationality_status="2",  # 2 = has known nationality
-        nationality_country_name="Schweiz",
-        places_of_origin=[
-            PlaceOfOriginInfo(origin_name="Zürich", canton="ZH")
-        ],
-    )
-
-
-@pytest.fixture
-def foreign_person():
-    """Create a valid foreign person for testing."""
-    return StatisticsPerson(
-        local_person_id="67890",
-        local_person_id_category="MU.6172",
-        official_name="Schmidt",
-        first_name="Maria",
-        sex="2",
-        date_of_birth=date(1985, 3, 20),
-        birth_place_type=PlaceType.FOREIGN,
-        birth_country_id=8207,
-        birth_country_iso2="DE",
-        birth_country_name="Deutschland",
-        religion="111",
-        marital_status="2",
-        nationality_type=NationalityType.FOREIGN,
-        nationality_status="2",  # 2 = has known nationality
-        nationality_country_id=8207,
-        nationality_country_iso2="DE",
-        nationality_country_name="Deutschland",
-        # BFS residence permit code: 02 = B permit (Aufenthaltsbewilligung)
-        residence_permit="02",
-        residence_permit_valid_from=date(2020, 1, 1),
-        residence_permit_valid_till=date(2025, 12, 31),
-    )
-
-
-@pytest.fixture
-def dwelling_address():
-    """Create a valid dwelling address for testing."""
-    return DwellingAddressInfo(
-        egid=123456789,
-        ewid=1,
-        street="Bahnhofstrasse",
-        house_number="1",
-        town="Zürich",
-        swiss_zip_code=8001,
-        type_of_household="1",
-    )
-
-
-@pytest.fixture
-def config():
-    """Create a valid delivery config for testing."""
-    return StatisticsDeliveryConfig(
-        sender_id="T1-6172-1",
-        manufacturer="OpenMun Test",
-        product="Test Suite",
-        product_version="1.0.0",
-        test_delivery_flag=True,
-    )
-
-
 # ============================================================================
 # LAYER 2 MODEL VALIDATION TESTS
 # ============================================================================
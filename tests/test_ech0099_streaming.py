@@ -0,0 +1,170 @@
+"""Test eCH-0099 streaming export for full municipal populations.
+
+What This File Tests
+====================
+1. Streamed output is the same document as finalize_statistics_delivery().to_file()
+2. Output parses back with ECH0099Delivery.from_file()
+3. generalData is written after all reportedPerson elements
+4. Events are consumed lazily (generator input, bounded batches)
+5. Worker processes produce the same output, in input order
+6. Empty input, exceptions and header failures leave path targets untouched
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs)
+- Municipality: fictive test municipality (Bister 6172, as in test_ech0099_layer2_export)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timezone
+
+import pytest
+
+from openmun_ech.ech0099 import (
+    ECH0099DataType,
+    ECH0099Delivery,
+    ResidenceType,
+    StatisticsDeliveryEvent,
+    finalize_statistics_delivery,
+)
+from openmun_ech.ech0099 import streaming
+from openmun_ech.ech0099.models import build_statistics_header
+from openmun_ech.ech0099.streaming import ECH0099StreamWriter, write_statistics_delivery
+
+MESSAGE_ID = "stream-test-0001"
+MESSAGE_DATE = datetime(2024, 3, 31, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def events(swiss_person, foreign_person, dwelling_address):
+    result = []
+    for i in range(5):
+        person = (swiss_person if i % 2 else foreign_person).model_copy(
+            update={'local_person_id': str(10000 + i)}
+        )
+        result.append(StatisticsDeliveryEvent(
+            person=person,
+            residence_type=ResidenceType.MAIN,
+            reporting_municipality_bfs=261,
+            reporting_municipality_name="Zürich",
+            dwelling_address=dwelling_address,
+            arrival_date=date(2024, 1, 1),
+        ))
+    return result
+
+
+def canonical(path) -> str:
+    return ET.canonicalize(from_file=str(path), strip_text=True)
+
+
+class TestWriteStatisticsDelivery:
+
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_same_document_as_to_file(self, tmp_path, events, config, pretty_print):
+        general_data = [ECH0099DataType(field='population', value='5')]
+        count = write_statistics_delivery(
+            iter(events), config, tmp_path / 'stream.xml',
+            message_id=MESSAGE_ID, message_date=MESSAGE_DATE,
+            general_data=general_data, pretty_print=pretty_print,
+        )
+        assert count == 5
+
+        finalize_statistics_delivery(
+            events, config, message_id=MESSAGE_ID, message_date=MESSAGE_DATE,
+            general_data=general_data,
+        ).to_file(tmp_path / 'memory.xml')
+
+        assert canonical(tmp_path / 'stream.xml') == canonical(tmp_path / 'memory.xml')
+
+    def test_parses_back_with_from_file(self, tmp_path, events, config):
+        path = tmp_path / 'statpop.xml'
+        write_statistics_delivery(events, config, path, message_id=MESSAGE_ID)
+
+        delivery = ECH0099Delivery.from_file(path)
+        assert delivery.version == "2.1"
+        assert delivery.delivery_header.message_id == MESSAGE_ID
+        assert delivery.reported_person == [e.to_ech0099_reported_person() for e in events]
+
+    def test_events_consumed_lazily(self, tmp_path, events, config):
+        consumed = []
+
+        def generate():
+            for event in events:
+                consumed.append(event)
+                yield event
+
+        write_statistics_delivery(generate(), config, tmp_path / 'statpop.xml', batch_size=2)
+        assert consumed == events
+
+    def test_workers_keep_input_order(self, tmp_path, events, config):
+        write_statistics_delivery(
+            events, config, tmp_path / 'serial.xml',
+            message_id=MESSAGE_ID, message_date=MESSAGE_DATE,
+        )
+        count = write_statistics_delivery(
+            events, config, tmp_path / 'parallel.xml',
+            message_id=MESSAGE_ID, message_date=MESSAGE_DATE,
+            workers=2, batch_size=2,
+        )
+        assert count == 5
+        assert (tmp_path / 'parallel.xml').read_bytes() == (tmp_path / 'serial.xml').read_bytes()
+
+    def test_binary_file_target_left_open(self, events, config):
+        buffer = io.BytesIO()
+        write_statistics_delivery(events, config, buffer)
+        assert not buffer.closed
+        delivery = ECH0099Delivery.from_xml(ET.fromstring(buffer.getvalue()))
+        assert len(delivery.reported_person) == 5
+
+    def test_empty_events_rejected(self, tmp_path, config):
+        with pytest.raises(ValueError, match="At least one StatisticsDeliveryEvent"):
+            write_statistics_delivery(iter(()), config, tmp_path / 'statpop.xml')
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_batch_size(self, tmp_path, events, config):
+        with pytest.raises(ValueError, match="batch_size"):
+            write_statistics_delivery(events, config, tmp_path / 'statpop.xml', batch_size=0)
+
+
+class TestStreamWriter:
+
+    def test_general_data_from_streamed_count(self, tmp_path, events, config):
+        path = tmp_path / 'statpop.xml'
+        header = finalize_statistics_delivery(events[:1], config).delivery_header
+        with ECH0099StreamWriter(path, header) as writer:
+            for event in events:
+                writer.write_event(event)
+            writer.close(general_data=[ECH0099DataType(field='count', value=str(writer.count))])
+
+        delivery = ECH0099Delivery.from_file(path)
+        assert delivery.general_data == [ECH0099DataType(field='count', value='5')]
+        assert path.read_text(encoding='utf-8').count('xmlns:eCH-0044=') == 1
+
+    def test_exception_leaves_target_untouched(self, tmp_path, events, config):
+        path = tmp_path / 'statpop.xml'
+        path.write_text('previous')
+        header = finalize_statistics_delivery(events[:1], config).delivery_header
+        with pytest.raises(RuntimeError):
+            with ECH0099StreamWriter(path, header) as writer:
+                writer.write_event(events[0])
+                raise RuntimeError("register query failed")
+        assert path.read_text() == 'previous'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_header_failure_leaves_no_temporary_file(self, tmp_path, config, monkeypatch):
+        def failing_serialize(elem, namespaces):
+            raise RuntimeError("header failed")
+
+        monkeypatch.setattr(streaming, 'serialize_fragment', failing_serialize)
+        with pytest.raises(RuntimeError, match="header failed"):
+            ECH0099StreamWriter(tmp_path / 'statpop.xml', build_statistics_header(config))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_write_after_close(self, tmp_path, events, config):
+        header = finalize_statistics_delivery(events[:1], config).delivery_header
+        writer = ECH0099StreamWriter(tmp_path / 'statpop.xml', header)
+        writer.write_event(events[0])
+        writer.close()
+        with pytest.raises(ValueError, match="closed"):
+            writer.write_event(events[1])
@@ -27,7 +27,6 @@ from openmun_ech.ech0129.v6.base_types import (
     ECH0129DatePartiallyKnown,
     ECH0129Heating,
     ECH0129HotWater,
-    ECH0129NamedId,
     ECH0129NamedMetaData,
 )
 from openmun_ech.ech0129.v6.building import (
@@ -35,10 +34,7 @@ from openmun_ech.ech0129.v6.building import (
     ECH0129BuildingIdentification,
     ECH0129BuildingOnly,
 )
-from openmun_ech.ech0129.v6.entrance import ECH0129BuildingEntrance
-from openmun_ech.ech0129.v6.street_locality import (
-    ECH0129StreetSection,
-)
+from tests.conftest import make_building, make_entrance, make_named_id
 
 NS_0129 = NS.ECH0129_V6
 
@@ -47,15 +43,11 @@ NS_0129 = NS.ECH0129_V6
 # Helpers
 # ===========================================================================
 
-def _make_named_id(category='IDBBP', value='12345'):
-    return ECH0129NamedId(id_category=category, id_value=value)
-
-
 def _make_building_id_egid(**kwargs):
     """Create a BuildingIdentification with branch 1 (EGID)."""
     defaults = {
         'egid': 123456789,
-        'local_id': [_make_named_id()],
+        'local_id': [make_named_id()],
         'municipality': 6002,
     }
     defaults.update(kwargs)
@@ -68,7 +60,7 @@ def _make_building_id_address(**kwargs):
         'street': 'Bahnhofstrasse',
         'house_number': '42',
         'zip_code': 3983,
-        'local_id': [_make_named_id()],
+        'local_id': [make_named_id()],
         'municipality': 6002,
     }
     defaults.update(kwargs)
@@ -80,7 +72,7 @@ def _make_building_id_egrid(**kwargs):
     defaults = {
         'egrid': 'CH123456789012',
         'official_building_no': 'B001',
-        'local_id': [_make_named_id()],
+        'local_id': [make_named_id()],
         'municipality': 6002,
     }
     defaults.update(kwargs)
@@ -93,22 +85,13 @@ def _make_building_id_cadaster(**kwargs):
         'cadaster_area_number': 'CA-1234',
         'number': '567',
         'official_building_no': 'B002',
-        'local_id': [_make_named_id()],
+        'local_id': [make_named_id()],
         'municipality': 6002,
     }
     defaults.update(kwargs)
     return ECH0129BuildingIdentification(**defaults)
 
 
-def _make_building(**kwargs):
-    """Create a Building with required fields + overrides."""
-    defaults = {
-        'building_category': BuildingCategory.RESIDENTIAL_ONLY,
-    }
-    defaults.update(kwargs)
-    return ECH0129Building(**defaults)
-
-
 def _make_building_only(**kwargs):
     """Create a BuildingOnly with required fields + overrides."""
     defaults = {
@@ -118,24 +101,6 @@ def _make_building_only(**kwargs):
     return ECH0129BuildingOnly(**defaults)
 
 
-def _make_street_section():
-    """Create a minimal StreetSection for entrance tests."""
-    return ECH0129StreetSection(
-        esid=12345678,
-        local_id=_make_named_id('ESID', '99'),
-        swiss_zip_code=3983,
-        swiss_zip_code_add_on='00',
-    )
-
-
-def _make_entrance():
-    """Create a minimal BuildingEntrance."""
-    return ECH0129BuildingEntrance(
-        local_id=_make_named_id('EDID', '1'),
-        street_section=_make_street_section(),
-    )
-
-
 def _roundtrip(obj):
     """Serialize to XML and back, return the new object."""
     xml = obj.to_xml()
@@ -220,21 +185,21 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='street'):
             ECH0129BuildingIdentification(
                 house_number='1', zip_code=3983,
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch2_missing_house_number_rejected(self):
         with pytest.raises(ValueError, match='houseNumber'):
             ECH0129BuildingIdentification(
                 street='Hauptstrasse', zip_code=3983,
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch2_missing_zip_code_rejected(self):
         with pytest.raises(ValueError, match='zipCode'):
             ECH0129BuildingIdentification(
                 street='Hauptstrasse', house_number='1',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch2_name_constraints(self):
@@ -311,7 +276,7 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='number'):
             ECH0129BuildingIdentification(
                 cadaster_area_number='CA', official_building_no='B1',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     # --- Cross-branch validation ---
@@ -320,7 +285,7 @@ class TestBuildingIdentification:
         """Must set at least one branch."""
         with pytest.raises(ValueError, match='must set one of'):
             ECH0129BuildingIdentification(
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch1_and_branch2_rejected(self):
@@ -328,7 +293,7 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='mutually exclusive'):
             ECH0129BuildingIdentification(
                 egid=1, street='Hauptstr', house_number='1', zip_code=3000,
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch1_and_branch3_rejected(self):
@@ -336,7 +301,7 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='mutually exclusive'):
             ECH0129BuildingIdentification(
                 egid=1, egrid='CH1234', official_building_no='B1',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch3_egrid_and_cadaster_rejected(self):
@@ -345,7 +310,7 @@ class TestBuildingIdentification:
             ECH0129BuildingIdentification(
                 egrid='CH1234', cadaster_area_number='CA',
                 number='1', official_building_no='B1',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch3_egrid_with_number_rejected(self):
@@ -353,7 +318,7 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='number only valid'):
             ECH0129BuildingIdentification(
                 egrid='CH1234', number='99', official_building_no='B1',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch3_egrid_with_realestate_type_rejected(self):
@@ -362,14 +327,14 @@ class TestBuildingIdentification:
             ECH0129BuildingIdentification(
                 egrid='CH1234', official_building_no='B1',
                 realestate_type=RealestateType.LIEGENSCHAFT,
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_branch3_missing_official_building_no_rejected(self):
         with pytest.raises(ValueError, match='officialBuildingNo'):
             ECH0129BuildingIdentification(
                 egrid='CH1234',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_name_of_building_only_in_branch2(self):
@@ -377,7 +342,7 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='nameOfBuilding only valid'):
             ECH0129BuildingIdentification(
                 egid=1, name_of_building='Villa',
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     def test_realestate_type_only_in_branch3(self):
@@ -385,7 +350,7 @@ class TestBuildingIdentification:
         with pytest.raises(ValueError, match='realestateType only valid'):
             ECH0129BuildingIdentification(
                 egid=1, realestate_type=RealestateType.LIEGENSCHAFT,
-                local_id=[_make_named_id()], municipality=6002,
+                local_id=[make_named_id()], municipality=6002,
             )
 
     # --- Required after-choice fields ---
@@ -398,13 +363,13 @@ class TestBuildingIdentification:
 
     def test_multiple_local_ids(self):
         bi = _make_building_id_egid(
-            local_id=[_make_named_id('A', '1'), _make_named_id('B', '2')],
+            local_id=[make_named_id('A', '1'), make_named_id('B', '2')],
         )
         assert len(bi.local_id) == 2
 
     def test_multiple_local_ids_roundtrip(self):
         bi = _make_building_id_egid(
-            local_id=[_make_named_id('A', '1'), _make_named_id('B', '2')],
+            local_id=[make_named_id('A', '1'), make_named_id('B', '2')],
         )
         bi2 = _roundtrip(bi)
         assert len(bi2.local_id) == 2
@@ -427,7 +392,7 @@ class TestBuilding:
 
     def test_create_minimal(self):
         """Only buildingCategory is required."""
-        b = _make_building()
+        b = make_building()
         assert b.building_category == BuildingCategory.RESIDENTIAL_ONLY
         assert b.egid is None
         assert b.building_identification is None
@@ -437,7 +402,7 @@ class TestBuilding:
         assert b.building_free_text == []
 
     def test_create_with_all_scalar_fields(self):
-        b = _make_building(
+        b = make_building(
             egid=100000001,
             official_building_no='GEB-001',
             name='Gemeindehaus Bister',
@@ -459,7 +424,7 @@ class TestBuilding:
         assert b.neighbourhood == 6002
 
     def test_create_with_complex_subobjects(self):
-        b = _make_building(
+        b = make_building(
             building_identification=_make_building_id_egid(),
             date_of_construction=ECH0129BuildingDate(year='1985'),
             date_of_renovation=ECH0129BuildingDate(year='2020'),
@@ -474,8 +439,8 @@ class TestBuilding:
         assert b.volume.volume == 5000
 
     def test_create_with_list_fields(self):
-        b = _make_building(
-            other_id=[_make_named_id('GIS', 'A1')],
+        b = make_building(
+            other_id=[make_named_id('GIS', 'A1')],
             local_code=['AB12', 'CD34'],
             heating=[ECH0129Heating(
                 heat_generator_heating=HeatGeneratorHeating.HEAT_PUMP_SINGLE,
@@ -484,7 +449,7 @@ class TestBuilding:
             hot_water=[ECH0129HotWater(
                 heat_generator_hot_water=HeatGeneratorHotWater.HEAT_PUMP,
             )],
-            building_entrance=[_make_entrance()],
+            building_entrance=[make_entrance()],
             named_meta_data=[ECH0129NamedMetaData(
                 meta_data_name='source', meta_data_value='GWR',
             )],
@@ -501,14 +466,14 @@ class TestBuilding:
             ECH0129Building()
 
     def test_xml_element_order_minimal(self):
-        b = _make_building()
+        b = make_building()
         xml = b.to_xml()
         names = _child_names(xml)
         assert names == ['buildingCategory']
 
     def test_xml_element_order_full(self):
         """Verify element ordering matches XSD sequence."""
-        b = _make_building(
+        b = make_building(
             building_identification=_make_building_id_egid(),
             egid=999,
             official_building_no='B1',
@@ -517,7 +482,7 @@ class TestBuilding:
             number_of_floors=2,
             building_class=1150,
             status=BuildingStatus.EXISTING,
-            other_id=[_make_named_id()],
+            other_id=[make_named_id()],
             civil_defense_shelter=False,
             neighbourhood=6002,
             local_code=['A1'],
@@ -541,12 +506,12 @@ class TestBuilding:
         assert names == expected
 
     def test_roundtrip_minimal(self):
-        b = _make_building()
+        b = make_building()
         b2 = _roundtrip(b)
         assert b2.building_category == b.building_category
 
     def test_roundtrip_full(self):
-        b = _make_building(
+        b = make_building(
             egid=100000001,
             official_building_no='GEB-001',
             name='Gemeindehaus Bister',
@@ -560,7 +525,7 @@ class TestBuilding:
             civil_defense_shelter=True,
             neighbourhood=6002,
             energy_relevant_surface=450,
-            other_id=[_make_named_id('GIS', 'A1')],
+            other_id=[make_named_id('GIS', 'A1')],
             local_code=['AB12'],
             building_free_text=['historic'],
         )
@@ -584,7 +549,7 @@ class TestBuilding:
         assert b2.building_free_text == ['historic']
 
     def test_roundtrip_with_subobjects(self):
-        b = _make_building(
+        b = make_building(
             building_identification=_make_building_id_address(
                 name_of_building='Schulhaus',
             ),
@@ -596,7 +561,7 @@ class TestBuilding:
             hot_water=[ECH0129HotWater(
                 heat_generator_hot_water=HeatGeneratorHotWater.BOILER_GENERIC,
             )],
-            building_entrance=[_make_entrance()],
+            building_entrance=[make_entrance()],
             named_meta_data=[ECH0129NamedMetaData(
                 meta_data_name='src', meta_data_value='GWR',
             )],
@@ -616,7 +581,7 @@ class TestBuilding:
 
     def test_signale_object_xml_name(self):
         """XSD has typo 'Signale' in element name — verify preserved."""
-        b = _make_building(surface_area_of_building_signale_object=100)
+        b = make_building(surface_area_of_building_signale_object=100)
         xml = b.to_xml()
         names = _child_names(xml)
         assert 'surfaceAreaOfBuildingSignaleObject' in names
@@ -625,64 +590,64 @@ class TestBuilding:
 
     def test_building_class_range(self):
         with pytest.raises(ValueError):
-            _make_building(building_class=1109)
+            make_building(building_class=1109)
         with pytest.raises(ValueError):
-            _make_building(building_class=1279)
+            make_building(building_class=1279)
         # Valid boundaries
-        assert _make_building(building_class=1110).building_class == 1110
-        assert _make_building(building_class=1278).building_class == 1278
+        assert make_building(building_class=1110).building_class == 1110
+        assert make_building(building_class=1278).building_class == 1278
 
     def test_number_of_floors_range(self):
         with pytest.raises(ValueError):
-            _make_building(number_of_floors=0)
+            make_building(number_of_floors=0)
         with pytest.raises(ValueError):
-            _make_building(number_of_floors=100)
+            make_building(number_of_floors=100)
 
     def test_neighbourhood_range(self):
         with pytest.raises(ValueError):
-            _make_building(neighbourhood=999)
+            make_building(neighbourhood=999)
         with pytest.raises(ValueError):
-            _make_building(neighbourhood=10000000)
+            make_building(neighbourhood=10000000)
 
     def test_energy_relevant_surface_range(self):
         with pytest.raises(ValueError):
-            _make_building(energy_relevant_surface=4)
+            make_building(energy_relevant_surface=4)
         with pytest.raises(ValueError):
-            _make_building(energy_relevant_surface=900001)
+            make_building(energy_relevant_surface=900001)
 
     # --- List cardinality validation ---
 
     def test_local_code_max_4(self):
         with pytest.raises(ValueError, match='maxOccurs=4'):
-            _make_building(local_code=['A', 'B', 'C', 'D', 'E'])
+            make_building(local_code=['A', 'B', 'C', 'D', 'E'])
 
     def test_local_code_item_length(self):
         with pytest.raises(ValueError, match='1-8 chars'):
-            _make_building(local_code=[''])
+            make_building(local_code=[''])
         with pytest.raises(ValueError, match='1-8 chars'):
-            _make_building(local_code=['123456789'])
+            make_building(local_code=['123456789'])
 
     def test_heating_max_2(self):
         with pytest.raises(ValueError, match='maxOccurs=2'):
-            _make_building(heating=[
+            make_building(heating=[
                 ECH0129Heating(), ECH0129Heating(), ECH0129Heating(),
             ])
 
     def test_hot_water_max_2(self):
         with pytest.raises(ValueError, match='maxOccurs=2'):
-            _make_building(hot_water=[
+            make_building(hot_water=[
                 ECH0129HotWater(), ECH0129HotWater(), ECH0129HotWater(),
             ])
 
     def test_building_free_text_max_2(self):
         with pytest.raises(ValueError, match='maxOccurs=2'):
-            _make_building(building_free_text=['a', 'b', 'c'])
+            make_building(building_free_text=['a', 'b', 'c'])
 
     def test_building_free_text_item_length(self):
         with pytest.raises(ValueError, match='1-32 chars'):
-            _make_building(building_free_text=[''])
+            make_building(building_free_text=[''])
         with pytest.raises(ValueError, match='1-32 chars'):
-            _make_building(building_free_text=['A' * 33])
+            make_building(building_free_text=['A' * 33])
 
 
 # ===========================================================================
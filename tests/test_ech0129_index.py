@@ -0,0 +1,259 @@
+"""Tests for the eCH-0129 object index (openmun_ech.ech0129.index).
+
+Verifies:
+1. Lookups by EGID, EGAID, (EGID, EDID), (EGID, EWID), EGRID, (municipality, number)
+2. Reverse links: entrance/dwelling → building, building ↔ realestates
+3. Models are referenced, not copied; equal duplicates collapse (and are not retained), conflicts raise
+4. Building from eCH-0133 deliveries and streamed records
+"""
+
+import gc
+import weakref
+
+import pytest
+
+from openmun_ech.ech0129.enums import BuildingCategory, RealestateType
+from openmun_ech.ech0129.index import ECH0129ObjectIndex
+from openmun_ech.ech0129.v6.base_types import ECH0129NamedId
+from openmun_ech.ech0129.v6.building import ECH0129Building, ECH0129BuildingOnly
+from openmun_ech.ech0129.v6.dwelling import ECH0129Dwelling
+from openmun_ech.ech0129.v6.entrance import ECH0129BuildingEntrance
+from openmun_ech.ech0129.v6.realestate import (
+    ECH0129Realestate,
+    ECH0129RealestateIdentification,
+)
+from openmun_ech.ech0129.v6.street_locality import ECH0129StreetSection
+from openmun_ech.ech0133 import (
+    ECH0133BuildingInfo,
+    ECH0133Delivery,
+    ECH0133EstBaseBldgRealestateInfo,
+    ECH0133EstBaseBuildingInfo,
+    ECH0133EstimationBaseDelivery,
+    ECH0133EstimationInfo,
+    ECH0133RealestateBaseDelivery,
+    ECH0133RealestateInfo,
+)
+from tests.conftest import (
+    make_area,
+    make_estimation_object,
+    make_fiscal_ownership_info,
+    make_header,
+    make_municipality,
+)
+
+
+# ===========================================================================
+# Helpers
+# ===========================================================================
+
+def _named_id(category='IDBBP', value='1'):
+    return ECH0129NamedId(id_category=category, id_value=value)
+
+
+def _realestate(number='1234', egrid='CH123456789012'):
+    return ECH0129Realestate(
+        realestate_identification=ECH0129RealestateIdentification(egrid=egrid, number=number),
+        realestate_type=RealestateType.LIEGENSCHAFT,
+    )
+
+
+def _entrance(egaid, edid):
+    return ECH0129BuildingEntrance(
+        egaid=egaid,
+        edid=edid,
+        local_id=_named_id('EDID', str(edid)),
+        street_section=ECH0129StreetSection(
+            esid=12345678,
+            local_id=_named_id('ESID', '99'),
+            swiss_zip_code=3983,
+            swiss_zip_code_add_on='00',
+        ),
+    )
+
+
+def _building(egid, **kwargs):
+    return ECH0129Building(
+        egid=egid, building_category=BuildingCategory.RESIDENTIAL_ONLY, **kwargs
+    )
+
+
+def _building_only(egid):
+    return ECH0129BuildingOnly(egid=egid, building_category=BuildingCategory.RESIDENTIAL_ONLY)
+
+
+def _dwelling(ewid):
+    return ECH0129Dwelling(local_id=[_named_id('EWID', str(ewid))], ewid=ewid)
+
+
+def _realestate_info(number, egrid, egids):
+    return ECH0133RealestateInfo(
+        realestate=_realestate(number, egrid),
+        municipality=make_municipality(),
+        area=[make_area()],
+        fiscal_ownership_information=[make_fiscal_ownership_info()],
+        estimation_object=make_estimation_object(),
+        building_information=[
+            ECH0133BuildingInfo(building=_building_only(egid), estimation_object=[make_estimation_object()])
+            for egid in egids
+        ],
+    )
+
+
+# ===========================================================================
+# eCH-0129 registration and lookups
+# ===========================================================================
+
+class TestLookups:
+
+    def test_building_entrances_and_dwellings(self):
+        index = ECH0129ObjectIndex()
+        entrance = _entrance(egaid=100000001, edid=0)
+        building = _building(190123, building_entrance=[entrance])
+        dwelling = _dwelling(3)
+
+        assert index.add_building(building) is building
+        assert index.add_dwelling(dwelling, building) is dwelling
+
+        assert index.get_building(190123) is building
+        assert index.get_entrance(100000001) is entrance
+        assert index.get_entrance_by_edid(190123, 0) is entrance
+        assert index.get_dwelling(egid=190123, ewid=3) is dwelling
+        assert index.get_dwelling(egid=190123, ewid=4) is None
+        assert index.get_building(1) is None
+
+    def test_building_egid_from_identification(self):
+        from openmun_ech.ech0129.v6.building import ECH0129BuildingIdentification
+        building = ECH0129BuildingOnly(
+            building_identification=ECH0129BuildingIdentification(
+                egid=555, local_id=[_named_id()], municipality=6172,
+            ),
+            building_category=BuildingCategory.RESIDENTIAL_ONLY,
+        )
+        index = ECH0129ObjectIndex()
+        index.add_building(building)
+        assert index.get_building(555) is building
+
+    def test_realestate_by_egrid_and_number(self):
+        index = ECH0129ObjectIndex()
+        realestate = _realestate()
+        index.add_realestate(realestate, make_municipality())
+        assert index.get_realestate('CH123456789012') is realestate
+        assert index.get_realestate_by_number(6172, '1234') is realestate
+        assert index.get_realestate_by_number('6172', '1234') is realestate
+        assert index.get_realestate_by_number(6173, '1234') is None
+
+    def test_dwelling_before_building(self):
+        index = ECH0129ObjectIndex()
+        dwelling = _dwelling(1)
+        index.add_dwelling(dwelling, 190123)
+        assert index.get_building_of(dwelling) is None
+
+        building = _building(190123)
+        index.add_building(building)
+        assert index.get_building_of(dwelling) is building
+        assert index.get_dwellings_of(building) == [dwelling]
+
+    def test_dwelling_without_ewid_rejected(self):
+        index = ECH0129ObjectIndex()
+        with pytest.raises(ValueError, match="has no EWID"):
+            index.add_dwelling(ECH0129Dwelling(local_id=[_named_id()]), 190123)
+
+    def test_reverse_links(self):
+        index = ECH0129ObjectIndex()
+        entrance = _entrance(egaid=100000001, edid=0)
+        building = _building(190123, building_entrance=[entrance])
+        parcel_a = index.add_realestate(_realestate('1', 'CH000000000001'), 6172)
+        parcel_b = index.add_realestate(_realestate('2', 'CH000000000002'), 6172)
+        index.add_building(building, [parcel_a, parcel_b])
+
+        assert index.get_building_of(entrance) is building
+        assert index.get_realestates_of(building) == [parcel_a, parcel_b]
+        assert index.get_buildings_on(parcel_a) == [building]
+        assert index.get_building_of(_entrance(egaid=100000002, edid=1)) is None
+
+    def test_equal_duplicates_collapse(self):
+        index = ECH0129ObjectIndex()
+        first = index.add_building(_building_only(190123), [_realestate()])
+        duplicate = _building_only(190123)
+        assert index.add_building(duplicate, [_realestate()]) is first
+        assert index.get_realestates_of(duplicate) == index.get_realestates_of(first)
+        assert len(index.get_realestates_of(first)) == 1
+
+    def test_equal_duplicates_not_retained(self):
+        index = ECH0129ObjectIndex()
+        entrance = _entrance(egaid=100000001, edid=0)
+        first = index.add_building(_building(190123, building_entrance=[entrance]))
+        parcel = index.add_realestate(_realestate(), 6172)
+        duplicate = _building(190123, building_entrance=[_entrance(egaid=100000001, edid=0)])
+        duplicate_parcel = _realestate()
+        refs = [weakref.ref(duplicate), weakref.ref(duplicate.building_entrance[0]),
+                weakref.ref(duplicate_parcel)]
+        assert index.add_realestate(duplicate_parcel, 6172) is parcel
+        assert index.add_building(duplicate, [duplicate_parcel]) is first
+        assert index.get_realestates_of(first) == [parcel]
+        assert index.get_realestates_of(first)[0] is parcel
+        del duplicate, duplicate_parcel
+        gc.collect()
+        assert [ref() for ref in refs] == [None, None, None]
+        assert index.get_building_of(entrance) is first
+
+    def test_conflicting_models_rejected(self):
+        index = ECH0129ObjectIndex()
+        index.add_realestate(_realestate('1'), 6172)
+        with pytest.raises(ValueError, match="Conflicting realestate"):
+            index.add_realestate(_realestate('2'), 6172)
+
+
+# ===========================================================================
+# eCH-0133
+# ===========================================================================
+
+class TestFromECH0133:
+
+    def test_realestate_base_delivery(self):
+        records = [
+            _realestate_info('1', 'CH000000000001', [1001]),
+            _realestate_info('2', 'CH000000000002', [1001, 1002]),
+        ]
+        delivery = ECH0133Delivery(
+            delivery_header=make_header(),
+            realestate_base_delivery=ECH0133RealestateBaseDelivery(realestate_information=records),
+        )
+        index = ECH0129ObjectIndex.from_ech0133(delivery)
+
+        parcel_1 = index.get_realestate_by_number(6172, '1')
+        parcel_2 = index.get_realestate('CH000000000002')
+        assert parcel_1 is records[0].realestate
+        assert parcel_2 is records[1].realestate
+
+        # Building 1001 appears in both records: one building, two parcels
+        shared = index.get_building(1001)
+        assert shared is records[0].building_information[0].building
+        assert index.get_realestates_of(shared) == [parcel_1, parcel_2]
+        assert index.get_buildings_on(parcel_2) == [shared, index.get_building(1002)]
+
+    def test_streamed_estimation_records(self):
+        records = [
+            ECH0133EstimationInfo(
+                estimation_object=make_estimation_object(),
+                building_information=[
+                    ECH0133EstBaseBuildingInfo(
+                        building=_building_only(2001),
+                        realestate_information=[
+                            ECH0133EstBaseBldgRealestateInfo(
+                                realestate=_realestate('7', 'CH000000000007'),
+                                municipality=make_municipality(),
+                            ),
+                        ],
+                    ),
+                ],
+            ),
+        ]
+        delivery = ECH0133Delivery(
+            delivery_header=make_header(),
+            estimation_base_delivery=ECH0133EstimationBaseDelivery(estimation_information=records),
+        )
+        for source in (delivery, iter(records)):
+            index = ECH0129ObjectIndex.from_ech0133(source)
+            building = index.get_building(2001)
+            assert index.get_realestates_of(building) == [index.get_realestate_by_number(6172, '7')]
@@ -5,32 +5,11 @@ enforcement for all 13 eCH-0133 classes.
 """
 
 import xml.etree.ElementTree as ET
-from datetime import date
 
 import pytest
 
 from openmun_ech.core import NS
-from openmun_ech.ech0007.v6 import ECH0007v6SwissMunicipality
-from openmun_ech.ech0058.v5 import ECH0058Header
-from openmun_ech.ech0044.v4 import ECH0044PersonIdentificationLight
-from openmun_ech.ech0129 import (
-    ECH0129Area,
-    ECH0129BuildingOnly,
-    ECH0129EstimationObject,
-    ECH0129FiscalOwnership,
-    ECH0129PersonIdentification,
-    ECH0129Realestate,
-    ECH0129RealestateIdentification,
-    ECH0129Value,
-)
-from openmun_ech.ech0129.enums import (
-    AreaDescriptionCode,
-    AreaType,
-    BuildingCategory,
-    FiscalRelationship,
-    RealestateType,
-    TypeOfValue,
-)
+from openmun_ech.ech0129.enums import BuildingCategory
 from openmun_ech.ech0133 import (
     ECH0133BuildingInfo,
     ECH0133Delivery,
@@ -41,117 +20,20 @@ from openmun_ech.ech0133 import (
     ECH0133EstimationBaseDelivery,
     ECH0133EstimationInfo,
     ECH0133EstimationRealestateInfo,
-    ECH0133FiscalOwnershipInfo,
     ECH0133OwnerOrBeneficiary,
     ECH0133RealestateBaseDelivery,
     ECH0133RealestateInfo,
 )
-
-
-# ---------------------------------------------------------------------------
-# Test data factories
-# ---------------------------------------------------------------------------
-
-def make_realestate_id() -> ECH0129RealestateIdentification:
-    return ECH0129RealestateIdentification(
-        egrid="CH123456789012",
-        number="1234",
-    )
-
-
-def make_realestate() -> ECH0129Realestate:
-    return ECH0129Realestate(
-        realestate_identification=make_realestate_id(),
-        realestate_type=RealestateType.LIEGENSCHAFT,
-    )
-
-
-def make_municipality() -> ECH0007v6SwissMunicipality:
-    return ECH0007v6SwissMunicipality(
-        municipality_id="6172",
-        municipality_name="Bister",
-    )
-
-
-def make_fiscal_ownership() -> ECH0129FiscalOwnership:
-    return ECH0129FiscalOwnership(
-        accession_date=date(2024, 1, 1),
-        fiscal_relationship=FiscalRelationship.OWNER,
-        denominator="1.000",
-        numerator="1.000",
-    )
-
-
-def make_person_identification() -> ECH0129PersonIdentification:
-    return ECH0129PersonIdentification(
-        individual=ECH0044PersonIdentificationLight(
-            official_name="Müller",
-            first_name="Hans",
-        ),
-    )
-
-
-def make_fiscal_ownership_info() -> ECH0133FiscalOwnershipInfo:
-    return ECH0133FiscalOwnershipInfo(
-        fiscal_ownership=make_fiscal_ownership(),
-        person_identification=make_person_identification(),
-    )
-
-
-def make_area() -> ECH0129Area:
-    return ECH0129Area(
-        area_type=AreaType.GROUND_COVER,
-        area_description_code=AreaDescriptionCode.GEBAEUDE,
-        area_description="Wohngebaeude",
-        area_value="450.00",
-    )
-
-
-def make_building_only() -> ECH0129BuildingOnly:
-    return ECH0129BuildingOnly(
-        building_category=BuildingCategory.RESIDENTIAL_ONLY,
-    )
-
-
-def make_estimation_object() -> ECH0129EstimationObject:
-    from openmun_ech.ech0129 import ECH0129NamedId, ECH0129EstimationValue
-    return ECH0129EstimationObject(
-        local_id=ECH0129NamedId(id_category="SCH", id_value="001"),
-        year_of_construction="2020",
-        estimation_value=[
-            ECH0129EstimationValue(
-                local_id=ECH0129NamedId(id_category="VAL", id_value="001"),
-                value=ECH0129Value(amount="500000.00"),
-                type_of_value=TypeOfValue.TAX_VALUE,
-            ),
-        ],
-    )
-
-
-def make_building_info() -> ECH0133BuildingInfo:
-    return ECH0133BuildingInfo(
-        building=make_building_only(),
-        estimation_object=[make_estimation_object()],
-    )
-
-
-def make_header() -> ECH0058Header:
-    from datetime import datetime, timezone
-    from openmun_ech.ech0058.v5 import ECH0058SendingApplication
-    return ECH0058Header(
-        sender_id="T4-123456-1",
-        recipient_id=["T4-654321-1"],
-        message_id="msg-001",
-        message_type="0133",
-        action="1",
-        sending_application=ECH0058SendingApplication(
-            manufacturer="OpenMun",
-            product="Valreg-Test",
-            product_version="1.0",
-        ),
-        message_date=datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc),
-        test_delivery_flag=True,
-    )
+from tests.conftest import (
+    make_area,
+    make_building_info,
+    make_building_only,
+    make_estimation_object,
+    make_fiscal_ownership_info,
+    make_header,
+    make_municipality,
+    make_realestate,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,230 @@
+"""Test eCH-0133 streaming reader/writer for base deliveries.
+
+What This File Tests
+====================
+1. Writer output parses back with ECH0133Delivery.from_file() (same models)
+2. Reader yields the same records as the in-memory API, one at a time
+3. read_delivery_header() returns the header without reading the records
+4. Message type checks (wrong type, wrong record class, empty delivery)
+5. Path targets are written atomically (unique temporary file; abort or a
+   failing header leaves no partial file)
+6. Memory: parsed records are released while iterating
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs)
+- Municipality: fictive test municipality (Bister 6172, as in test_ech0133)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from openmun_ech.ech0133 import (
+    ECH0133Delivery,
+    ECH0133EstBaseRealestateInfo,
+    ECH0133EstimationBaseDelivery,
+    ECH0133EstimationInfo,
+    ECH0133RealestateBaseDelivery,
+)
+from openmun_ech.ech0133 import streaming
+from openmun_ech.ech0133.streaming import (
+    ECH0133StreamWriter,
+    iter_estimation_information,
+    iter_realestate_information,
+    read_delivery_header,
+)
+from tests.conftest import (
+    make_estimation_object,
+    make_header,
+    make_municipality,
+    make_numbered_realestate,
+    make_realestate_info,
+)
+
+
+def make_estimation_info(i: int) -> ECH0133EstimationInfo:
+    return ECH0133EstimationInfo(
+        estimation_object=make_estimation_object(),
+        realestate_information=ECH0133EstBaseRealestateInfo(
+            realestate=make_numbered_realestate(i),
+            municipality=make_municipality(),
+        ),
+    )
+
+
+def write_realestate(path, n: int, **kwargs) -> list:
+    records = [make_realestate_info(i) for i in range(n)]
+    with ECH0133StreamWriter(path, make_header(), 'realestateBaseDelivery', **kwargs) as writer:
+        for record in records:
+            writer.write(record)
+    return records
+
+
+class TestWriter:
+
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_parses_back_with_from_file(self, tmp_path, pretty_print):
+        path = tmp_path / 'realestate.xml'
+        records = write_realestate(path, 3, pretty_print=pretty_print)
+
+        delivery = ECH0133Delivery.from_file(path)
+        assert delivery.delivery_header == make_header()
+        assert delivery.realestate_base_delivery.realestate_information == records
+
+    def test_same_document_as_to_file(self, tmp_path):
+        records = write_realestate(tmp_path / 'stream.xml', 3)
+        ECH0133Delivery(
+            delivery_header=make_header(),
+            realestate_base_delivery=ECH0133RealestateBaseDelivery(realestate_information=records),
+        ).to_file(tmp_path / 'memory.xml')
+
+        def canonical(name):
+            return ET.canonicalize(from_file=str(tmp_path / name), strip_text=True)
+
+        assert canonical('stream.xml') == canonical('memory.xml')
+
+    def test_namespaces_declared_once(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        write_realestate(path, 5)
+        text = path.read_text(encoding='utf-8')
+        assert text.count('xmlns:eCH-0129=') == 1
+        assert text.startswith("<?xml version='1.0' encoding='utf-8'?>")
+
+    def test_estimation_base_delivery(self, tmp_path):
+        path = tmp_path / 'estimation.xml'
+        records = [make_estimation_info(i) for i in range(3)]
+        with ECH0133StreamWriter(path, make_header(), 'estimationBaseDelivery') as writer:
+            assert writer.write_all(iter(records)) == 3
+
+        delivery = ECH0133Delivery.from_file(path)
+        assert delivery.estimation_base_delivery == ECH0133EstimationBaseDelivery(
+            estimation_information=records
+        )
+
+    def test_binary_file_target_left_open(self):
+        buffer = io.BytesIO()
+        with ECH0133StreamWriter(buffer, make_header(), 'realestateBaseDelivery') as writer:
+            writer.write(make_realestate_info(1))
+        assert not buffer.closed
+        root = ET.fromstring(buffer.getvalue())
+        assert ECH0133Delivery.from_xml(root).realestate_base_delivery is not None
+
+    def test_wrong_record_type(self, tmp_path):
+        with ECH0133StreamWriter(tmp_path / 'x.xml', make_header(), 'realestateBaseDelivery') as writer:
+            with pytest.raises(TypeError, match="expects ECH0133RealestateInfo"):
+                writer.write(make_estimation_info(1))
+            writer.write(make_realestate_info(1))
+
+    def test_unknown_message_type(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown message type"):
+            ECH0133StreamWriter(tmp_path / 'x.xml', make_header(), 'estimation')
+
+    def test_empty_delivery_rejected(self, tmp_path):
+        path = tmp_path / 'empty.xml'
+        with pytest.raises(ValueError, match="at least one realestateInformation"):
+            with ECH0133StreamWriter(path, make_header(), 'realestateBaseDelivery'):
+                pass
+        assert list(tmp_path.iterdir()) == []
+
+    def test_exception_leaves_target_untouched(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        path.write_text('previous')
+        with pytest.raises(RuntimeError):
+            with ECH0133StreamWriter(path, make_header(), 'realestateBaseDelivery') as writer:
+                writer.write(make_realestate_info(1))
+                raise RuntimeError("producer failed")
+        assert path.read_text() == 'previous'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_header_failure_leaves_no_temporary_file(self, tmp_path, monkeypatch):
+        def failing_serialize(elem, namespaces):
+            raise RuntimeError("header failed")
+
+        monkeypatch.setattr(streaming, 'serialize_fragment', failing_serialize)
+        with pytest.raises(RuntimeError, match="header failed"):
+            ECH0133StreamWriter(tmp_path / 'x.xml', make_header(), 'realestateBaseDelivery')
+        assert list(tmp_path.iterdir()) == []
+
+    def test_writers_of_same_path_use_own_temporary_files(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        first = ECH0133StreamWriter(path, make_header(), 'realestateBaseDelivery')
+        second = ECH0133StreamWriter(path, make_header(), 'realestateBaseDelivery')
+        first.write(make_realestate_info(1))
+        second.write(make_realestate_info(2))
+        first.close()
+        second.close()
+        records = list(iter_realestate_information(path))
+        assert [r.realestate for r in records] == [make_realestate_info(2).realestate]
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestReader:
+
+    def test_realestate_records_in_order(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        records = write_realestate(path, 4)
+        assert list(iter_realestate_information(path)) == records
+        assert list(iter_realestate_information(str(path))) == records
+
+    def test_from_binary_file(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        records = write_realestate(path, 2)
+        with open(path, 'rb') as f:
+            assert list(iter_realestate_information(f)) == records
+
+    def test_reads_to_file_output(self, tmp_path):
+        path = tmp_path / 'estimation.xml'
+        records = [make_estimation_info(i) for i in range(3)]
+        ECH0133Delivery(
+            delivery_header=make_header(),
+            estimation_base_delivery=ECH0133EstimationBaseDelivery(estimation_information=records),
+        ).to_file(path)
+        assert list(iter_estimation_information(path)) == records
+
+    def test_is_lazy(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        records = write_realestate(path, 3)
+        iterator = iter_realestate_information(path)
+        assert next(iterator) == records[0]
+
+    def test_wrong_message_type(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        write_realestate(path, 1)
+        with pytest.raises(ValueError, match="contains realestateBaseDelivery, not estimationBaseDelivery"):
+            list(iter_estimation_information(path))
+
+    def test_not_a_delivery(self, tmp_path):
+        path = tmp_path / 'other.xml'
+        path.write_text('<root/>')
+        with pytest.raises(ValueError, match="Not an eCH-0133 delivery"):
+            list(iter_realestate_information(path))
+        with pytest.raises(ValueError, match="Unexpected root element root"):
+            read_delivery_header(path)
+
+    def test_read_delivery_header(self, tmp_path):
+        path = tmp_path / 'realestate.xml'
+        write_realestate(path, 2)
+        assert read_delivery_header(path) == make_header()
+
+    def test_parsed_records_are_released(self, tmp_path, monkeypatch):
+        path = tmp_path / 'realestate.xml'
+        write_realestate(path, 200)
+        total = sum(1 for _ in ET.parse(path).getroot().iter())
+
+        sizes = []
+        original = streaming.iterparse
+
+        def tracking_iterparse(source):
+            for event, elem in original(source):
+                if event == 'start' and elem.tag.endswith('}delivery'):
+                    root = elem
+                if event == 'end' and elem.tag.endswith('}realestateInformation'):
+                    sizes.append(sum(1 for _ in root.iter()))
+                yield event, elem
+
+        monkeypatch.setattr(streaming, 'iterparse', tracking_iterparse)
+        assert len(list(iter_realestate_information(path))) == 200
+        # Only the current record (plus the parser's read-ahead) is in memory
+        assert max(sizes) < total / 10
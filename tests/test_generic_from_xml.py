@@ -0,0 +1,114 @@
+"""Test the single-pass generic deserializer (ECHModel.from_xml()) and strict_xml().
+
+What This File Tests
+====================
+1. Lenient mode: any field order, unknown elements skipped, first occurrence
+   of a repeated single field wins, lists keep document order
+2. Required fields, namespace overrides, nested models
+3. Round trip of a wide generic model (ECH0129Building)
+4. strict_xml(): unexpected, repeated and out-of-order elements raise,
+   also for generic models nested in hand-written parsers
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs)
+- Municipality: fictive test municipality (Bister 6172, as in test_ech0133)
+"""
+
+import xml.etree.ElementTree as ET
+from typing import List, Optional
+
+import pytest
+
+from openmun_ech.core import ECHModel, NS, strict_xml, xml_field
+from openmun_ech.ech0008 import ECH0008Country
+from openmun_ech.ech0129.v6.building import ECH0129Building
+from tests.conftest import make_building
+
+TEST_NS = 'urn:example:generic'
+
+
+class Sample(ECHModel):
+    __xml_ns__ = TEST_NS
+    __xml_element__ = 'sample'
+
+    name: str = xml_field('name')
+    alias: List[str] = xml_field('alias', is_list=True, default_factory=list)
+    country: Optional[ECH0008Country] = xml_field('country', ns=NS.ECH0008_V3, default=None)
+    size: Optional[int] = xml_field('size', default=None)
+
+
+def parse(body: str) -> ET.Element:
+    return ET.fromstring(
+        f'<s:sample xmlns:s="{TEST_NS}" xmlns:c="{NS.ECH0008_V3}">{body}</s:sample>'
+    )
+
+
+class TestLenient:
+
+    def test_fields_in_any_order(self):
+        sample = Sample.from_xml(parse(
+            '<s:size>3</s:size><s:alias>b</s:alias>'
+            '<c:country><c:countryNameShort>Schweiz</c:countryNameShort></c:country>'
+            '<s:name>Muster</s:name><s:alias>a</s:alias>'
+        ))
+        assert sample.name == 'Muster'
+        assert sample.alias == ['b', 'a']
+        assert sample.country.country_name_short == 'Schweiz'
+        assert sample.size == 3
+
+    def test_unknown_and_repeated_elements(self):
+        sample = Sample.from_xml(parse(
+            '<!-- comment --><s:name>first</s:name><s:other>x</s:other>'
+            '<s:name>second</s:name><c:size>9</c:size>'
+        ))
+        assert sample.name == 'first'
+        assert sample.size is None
+
+    def test_missing_required_field(self):
+        with pytest.raises(ValueError, match="Missing required field: name"):
+            Sample.from_xml(parse('<s:alias>a</s:alias>'))
+
+    def test_wide_model_roundtrip(self):
+        building = make_building()
+        assert ECH0129Building.from_xml(building.to_xml()) == building
+
+
+class TestStrict:
+
+    def test_valid_document_accepted(self):
+        with strict_xml():
+            sample = Sample.from_xml(parse(
+                '<s:name>Muster</s:name><!-- comment --><s:alias>a</s:alias><s:alias>b</s:alias>'
+            ))
+            building = ECH0129Building.from_xml(make_building().to_xml())
+        assert sample.alias == ['a', 'b']
+        assert building == make_building()
+
+    @pytest.mark.parametrize("body, message", [
+        ('<s:name>Muster</s:name><s:other>x</s:other>', "Unexpected element .*other in Sample"),
+        ('<s:name>a</s:name><s:name>b</s:name>', "Repeated element name in Sample"),
+        ('<s:alias>a</s:alias><s:name>Muster</s:name>', "Element name out of order in Sample"),
+    ])
+    def test_rejected(self, body, message):
+        elem = parse(body)
+        Sample.from_xml(elem)
+        with strict_xml():
+            with pytest.raises(ValueError, match=message):
+                Sample.from_xml(elem)
+
+    def test_nested_generic_model(self):
+        elem = parse(
+            '<s:name>Muster</s:name>'
+            '<c:country><c:countryNameShort>Schweiz</c:countryNameShort><c:extra/></c:country>'
+        )
+        with strict_xml():
+            with pytest.raises(ValueError, match="in ECH0008Country"):
+                Sample.from_xml(elem)
+
+    def test_reset_after_context(self):
+        elem = parse('<s:name>Muster</s:name><s:other>x</s:other>')
+        with pytest.raises(ValueError):
+            with strict_xml():
+                Sample.from_xml(elem)
+        assert Sample.from_xml(elem).name == 'Muster'
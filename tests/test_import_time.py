@@ -0,0 +1,124 @@
+"""Tests for lazy package imports (openmun_ech._lazy, ech0021 deferred classes).
+
+Verifies:
+1. `import openmun_ech` loads no standard and stays within the time budget
+2. Package exports resolve on first access to the defining module's object
+3. Lazy subpackages (ech0020, ech0021, ech0129) load none of their submodules
+   on import; eCH-0021 enums load without the version models; v7/v8 factory
+   classes are created on first access and exported by `import *`
+
+Each import is measured in a fresh interpreter (python -X importtime).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).resolve().parents[1] / 'src')
+
+# Cumulative import time of `import openmun_ech` (µs). Eager imports took
+# ~430 ms; the lazy package takes ~20 ms, the budget leaves room for slow CI.
+IMPORT_BUDGET_US = 150_000
+
+
+def run_python(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC, env.get('PYTHONPATH')]))
+    args = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', code]
+    result = subprocess.run(args, capture_output=True, text=True, env=env, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def import_times(statement: str) -> dict:
+    """Cumulative import time (µs) per module for `statement`."""
+    times = {}
+    for line in run_python(statement, importtime=True).stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded_modules(statement: str) -> set:
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    return set(run_python(code).stdout.split())
+
+
+class TestTopLevelImport:
+
+    def test_import_within_budget(self):
+        times = import_times('import openmun_ech')
+        assert times['openmun_ech'] < IMPORT_BUDGET_US, (
+            f"import openmun_ech took {times['openmun_ech'] / 1000:.0f} ms "
+            f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+        )
+        # The budget only means something if the standards were not imported
+        assert not [name for name in times if name.startswith('openmun_ech.ech')]
+        assert 'pydantic' not in times
+
+    def test_no_standard_loaded(self):
+        modules = loaded_modules('import openmun_ech')
+        assert not [m for m in modules if m.startswith('openmun_ech.ech')]
+        assert 'pydantic' not in modules
+
+    def test_export_resolves_on_access(self):
+        import openmun_ech
+        from openmun_ech.ech0058.v5 import ECH0058Header
+        assert openmun_ech.ECH0058Header is ECH0058Header
+        assert 'ECH0058Header' in dir(openmun_ech)
+        assert 'ech0020' in dir(openmun_ech)
+
+    def test_unknown_attribute(self):
+        import openmun_ech
+        with pytest.raises(AttributeError, match="has no attribute 'ECH9999Missing'"):
+            openmun_ech.ECH9999Missing
+
+
+class TestSubpackages:
+
+    @pytest.mark.parametrize('package', ['ech0020', 'ech0021', 'ech0129'])
+    def test_import_loads_no_submodule(self, package):
+        modules = loaded_modules(f'import openmun_ech.{package}')
+        assert not [m for m in modules if m.startswith(f'openmun_ech.{package}.')]
+        assert 'pydantic' not in modules
+
+    def test_enums_without_models(self):
+        modules = loaded_modules(
+            'from openmun_ech.ech0021 import MrMrs\n'
+            'from openmun_ech.ech0129 import BuildingCategory\n'
+            'from openmun_ech.ech0020 import Sex'
+        )
+        assert 'openmun_ech.ech0021.v8' not in modules
+        assert 'openmun_ech.ech0129.v6.building' not in modules
+        assert 'openmun_ech.ech0020.layer2' not in modules
+
+    def test_ech0021_classes_created_on_access(self):
+        code = (
+            'from openmun_ech.ech0021 import v8\n'
+            "print('ECH0021JobData' in vars(v8))\n"
+            'job_data = v8.ECH0021JobData\n'
+            "print(all(name in vars(v8) for name in "
+            "('ECH0021UIDStructure', 'ECH0021OccupationData', 'ECH0021JobData')))\n"
+            "print('ECH0021PersonAdditionalData' in vars(v8))"
+        )
+        assert run_python(code).stdout.split() == ['False', 'True', 'False']
+
+    def test_ech0021_classes_are_stable(self):
+        from openmun_ech import ech0021
+        from openmun_ech.ech0021 import v7, v8
+        assert ech0021.ECH0021JobData is v8.ECH0021JobData
+        assert v7.ECH0021JobData is not v8.ECH0021JobData
+        assert v7.ECH0021JobData.__xml_ns__ != v8.ECH0021JobData.__xml_ns__
+        assert v8.ECH0021OccupationData is v8.ECH0021OccupationData
+
+    @pytest.mark.parametrize('version', ['v7', 'v8'])
+    def test_ech0021_star_import(self, version):
+        namespace = {}
+        exec(f'from openmun_ech.ech0021.{version} import *', namespace)
+        assert {'ECH0021JobData', 'ECH0021PersonAdditionalData', 'ECH0021Partner',
+                'ECH0021LockData'} <= set(namespace)
@@ -0,0 +1,123 @@
+"""Test BaseDeliveryPerson.bulk_from_rows() batch construction.
+
+What This File Tests
+====================
+1. trusted=False is identical to constructing each person individually
+2. trusted=True produces identical instances (same model_dump)
+3. trusted=True still rejects CHOICE violations, batch-wise, naming the row
+4. trusted=True never bypasses field validation (bad enum values still fail)
+5. A large batch (2000 rows) gives the same persons either way
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, dates, IDs)
+- BFS data: real opendata fixtures (Zürich 261, Germany 8207)
+"""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from openmun_ech.ech0020.models import BaseDeliveryPerson, PlaceType
+
+
+def _swiss_row(i: int) -> dict:
+    return {
+        "local_person_id": f"BULK-{i}",
+        "local_person_id_category": "MU.6172",
+        "official_name": "Muster",
+        "first_name": f"Person{i}",
+        "sex": "1" if i % 2 else "2",
+        "date_of_birth": date(1980, 1, 1 + i % 28),
+        "religion": "111",
+        "marital_status": "1",
+        "nationality_status": "2",
+        "data_lock": "0",
+        "places_of_origin": [{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+        "birth_place_type": PlaceType.SWISS,
+        "birth_municipality_bfs": "261",
+        "birth_municipality_name": "Zürich",
+    }
+
+
+def _foreign_row(i: int) -> dict:
+    row = _swiss_row(i)
+    del row["places_of_origin"], row["birth_municipality_bfs"], row["birth_municipality_name"]
+    row.update(
+        nationality_status="2",
+        nationalities=[{"country_id": "8207", "country_iso": "DE", "country_name_short": "Deutschland"}],
+        residence_permit="0302",
+        birth_place_type="foreign",
+        birth_country_id="8207",
+        birth_country_iso="DE",
+        birth_country_name_short="Deutschland",
+    )
+    return row
+
+
+def _rows(n: int) -> list:
+    return [_swiss_row(i) if i % 3 else _foreign_row(i) for i in range(n)]
+
+
+class TestBulkFromRows:
+    """bulk_from_rows() must be observationally identical to per-row construction."""
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_same_result_as_individual_construction(self, trusted):
+        rows = _rows(12)
+        expected = [BaseDeliveryPerson(**row) for row in rows]
+        persons = BaseDeliveryPerson.bulk_from_rows(rows, trusted=trusted)
+        assert [p.model_dump() for p in persons] == [p.model_dump() for p in expected]
+
+    def test_accepts_iterator(self):
+        persons = BaseDeliveryPerson.bulk_from_rows(iter(_rows(3)), trusted=True)
+        assert len(persons) == 3
+
+    @pytest.mark.parametrize("mutate, message", [
+        (lambda r: r.pop("places_of_origin"), "Must provide either places_of_origin"),
+        (lambda r: r.update(residence_permit="0302"), "Cannot provide both places_of_origin"),
+        (lambda r: r.update(birth_country_iso="DE"), "Swiss birth cannot have foreign"),
+        (lambda r: r.update(birth_place_type="unknown"), "Unknown birth place cannot have"),
+        (lambda r: r.update(name_on_foreign_passport="Mustermann",
+                            declared_foreign_name="Mustermann"),
+         "Cannot provide both name_on_foreign_passport"),
+        (lambda r: r.update(contact_organization_name="Heim AG"),
+         "contact_address_postal_code is required"),
+    ])
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_choice_violations_rejected_in_both_modes(self, mutate, message, trusted):
+        rows = _rows(5)
+        mutate(rows[4])
+        with pytest.raises(ValueError, match=message):
+            BaseDeliveryPerson.bulk_from_rows(rows, trusted=trusted)
+
+    def test_trusted_error_names_row(self):
+        rows = _rows(5)
+        rows[4]["residence_permit"] = "0302"
+        with pytest.raises(ValueError, match=r"^Row 4: "):
+            BaseDeliveryPerson.bulk_from_rows(rows, trusted=True)
+
+    def test_trusted_keeps_field_validation(self):
+        rows = _rows(3)
+        rows[1]["sex"] = "9"
+        with pytest.raises(ValidationError):
+            BaseDeliveryPerson.bulk_from_rows(rows, trusted=True)
+
+    def test_direct_construction_still_validates_choices(self):
+        """The trusted context must never leak into normal construction."""
+        BaseDeliveryPerson.bulk_from_rows(_rows(2), trusted=True)
+        row = _swiss_row(0)
+        row["residence_permit"] = "0302"
+        with pytest.raises(ValidationError, match="Cannot provide both"):
+            BaseDeliveryPerson(**row)
+
+
+class TestBulkFromRowsLargeBatch:
+
+    def test_trusted_equals_untrusted(self):
+        rows = _rows(2000)
+        untrusted = BaseDeliveryPerson.bulk_from_rows(rows, trusted=False)
+        trusted = BaseDeliveryPerson.bulk_from_rows(rows, trusted=True)
+        assert len(trusted) == len(untrusted) == 2000
+        assert [p.model_dump() for p in trusted] == [p.model_dump() for p in untrusted]
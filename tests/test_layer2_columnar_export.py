@@ -0,0 +1,154 @@
+"""Test columnar export/import of Layer 2 base delivery persons.
+
+What This File Tests
+====================
+1. COLUMNS schema: one column per BaseDeliveryPerson field, correct kinds
+2. iter_column_batches(): batching, mixed Layer 1 / Layer 2 input records
+3. NDJSON and CSV roundtrip: BaseDeliveryPerson → file → BaseDeliveryPerson (zero data loss)
+4. Parquet roundtrip (skipped if pyarrow is not installed)
+5. Error handling: unknown formats, unsupported records, empty strings in CSV
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, dates, IDs, VNs)
+- BFS data: real opendata fixtures (Zürich 261, Germany 8207)
+"""
+
+from datetime import date
+
+import pytest
+
+from openmun_ech.ech0020.layer2 import columnar
+from openmun_ech.ech0020.layer2.columnar import (
+    COLUMNS,
+    iter_column_batches,
+    read_columnar,
+    write_columnar,
+)
+from openmun_ech.ech0020.models import (
+    BaseDeliveryPerson, DatePrecision, ParentInfo, PersonIdentification, PlaceType,
+)
+
+
+def _person(i: int) -> BaseDeliveryPerson:
+    kwargs = dict(
+        local_person_id=f"COL-{i}",
+        local_person_id_category="MU.6172",
+        vn="7561234567897",
+        official_name="Muster",
+        first_name=f"Anna{i}",
+        sex="2",
+        date_of_birth=date(1990, 3, 1 + i % 28),
+        date_of_birth_precision=DatePrecision.FULL,
+        religion="111",
+        marital_status="1",
+        nationality_status="2",
+        data_lock="0",
+        birth_place_type=PlaceType.SWISS,
+        birth_municipality_bfs="261",
+        birth_municipality_name="Zürich",
+        places_of_origin=[{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+        birth_mother_first_name="Maria",
+        birth_mother_official_proof=True,
+    )
+    if i % 2:
+        kwargs["parents"] = [ParentInfo(
+            person=PersonIdentification(
+                local_person_id=f"COL-M{i}", local_person_id_category="MU.6172",
+                official_name="Muster", first_name="Maria", sex="2",
+                date_of_birth=date(1960, 1, 1), date_of_birth_precision=DatePrecision.YEAR_ONLY,
+            ),
+            relationship_type="4",
+            care="2",
+            relationship_valid_from=date(1990, 3, 1),
+        )]
+    return BaseDeliveryPerson(**kwargs)
+
+
+PERSONS = [_person(i) for i in range(7)]
+
+
+class TestColumnSchema:
+
+    def test_one_column_per_field(self):
+        assert list(COLUMNS) == list(BaseDeliveryPerson.model_fields)
+
+    def test_column_kinds(self):
+        assert COLUMNS["official_name"] == "str"
+        assert COLUMNS["sex"] == "str"
+        assert COLUMNS["date_of_birth"] == "date"
+        assert COLUMNS["places_of_origin"] == "json"
+        assert COLUMNS["parents"] == "json"
+        assert COLUMNS["birth_mother_official_proof"] == "bool"
+
+
+class TestColumnBatches:
+
+    def test_batching(self):
+        batches = list(iter_column_batches(PERSONS, batch_size=3))
+        assert [len(b["official_name"]) for b in batches] == [3, 3, 1]
+        assert batches[0]["first_name"] == ["Anna0", "Anna1", "Anna2"]
+        assert batches[0]["date_of_birth"][0] == date(1990, 3, 1)
+        assert batches[0]["residence_permit"] == [None, None, None]
+
+    def test_layer1_records_accepted(self):
+        layer1 = PERSONS[1].to_ech0020()
+        batch = next(iter_column_batches([layer1, PERSONS[1]]))
+        assert batch["first_name"] == ["Anna1", "Anna1"]
+        assert batch["parents"][0] == batch["parents"][1]
+
+    def test_unsupported_record_rejected(self):
+        with pytest.raises(TypeError, match="Cannot export str"):
+            list(iter_column_batches(["not a person"]))
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            list(iter_column_batches(PERSONS, batch_size=0))
+
+
+class TestRoundtrip:
+
+    @pytest.mark.parametrize("suffix", [".ndjson", ".jsonl", ".csv"])
+    def test_pure_python_roundtrip(self, tmp_path, suffix):
+        path = tmp_path / f"persons{suffix}"
+        assert write_columnar(iter(PERSONS), path, batch_size=2) == len(PERSONS)
+        restored = list(read_columnar(path, batch_size=3))
+        assert restored == PERSONS
+
+    def test_trusted_read(self, tmp_path):
+        path = tmp_path / "persons.ndjson"
+        write_columnar(PERSONS, path)
+        assert list(read_columnar(path, trusted=True)) == PERSONS
+
+    def test_parquet_roundtrip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "persons.parquet"
+        assert write_columnar(PERSONS, path, batch_size=4) == len(PERSONS)
+        assert list(read_columnar(path, batch_size=3)) == PERSONS
+
+    def test_parquet_without_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(columnar, "HAS_PYARROW", False)
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            write_columnar(PERSONS, tmp_path / "persons.parquet")
+
+
+class TestErrors:
+
+    def test_unknown_suffix(self, tmp_path):
+        with pytest.raises(ValueError, match="Cannot infer columnar format"):
+            write_columnar(PERSONS, tmp_path / "persons.xml")
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown columnar format"):
+            write_columnar(PERSONS, tmp_path / "persons.csv", format="xlsx")
+
+    def test_csv_rejects_empty_string(self, tmp_path):
+        person = PERSONS[0].model_copy(update={"call_name": ""})
+        with pytest.raises(ValueError, match="call_name"):
+            write_columnar([person], tmp_path / "persons.csv")
+
+    def test_ndjson_keeps_empty_string(self, tmp_path):
+        person = PERSONS[0].model_copy(update={"call_name": ""})
+        path = tmp_path / "persons.ndjson"
+        write_columnar([person], path)
+        assert list(read_columnar(path)) == [person]
@@ -0,0 +1,164 @@
+"""Test DeliveryFactory: cached header template for repeated deliveries.
+
+What This File Tests
+====================
+1. build() produces the same ECH0020Delivery as BaseDeliveryEvent.finalize()
+2. to_bytes() parses back to the same delivery and is C14N-equal to to_xml()
+3. Per-message fields (messageId, messageDate, action) are validated on every call
+4. Static optional header fields are validated once and emitted in every delivery
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, dates, IDs, VNs)
+- BFS data: real opendata fixtures (Zürich 261)
+- Config data: ALWAYS fictive (sender IDs, product names, versions)
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from openmun_ech.ech0020.models import (
+    BaseDeliveryEvent,
+    BaseDeliveryPerson,
+    DeliveryConfig,
+    DwellingAddressInfo,
+    PlaceType,
+    ResidenceType,
+)
+from openmun_ech.ech0020.layer2 import DeliveryFactory
+from openmun_ech.ech0020.v3 import ECH0020Delivery
+from openmun_ech.ech0058 import ActionType
+
+CONFIG = DeliveryConfig(
+    sender_id="sedex://T1-TEST-001",
+    manufacturer="TestManufacturer",
+    product="TestProduct",
+    product_version="1.0.0",
+    test_delivery_flag=True,
+)
+
+MESSAGE_DATE = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def _event(i: int = 0) -> BaseDeliveryEvent:
+    person = BaseDeliveryPerson(
+        official_name="Muster",
+        first_name=f"Hans{i}",
+        sex="1",
+        date_of_birth=date(1980, 1, 15),
+        vn="7561234567897",
+        local_person_id=f"FACT-{i}",
+        local_person_id_category="MU.6172",
+        religion="111",
+        marital_status="1",
+        nationality_status="2",
+        data_lock="0",
+        places_of_origin=[{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+        birth_place_type=PlaceType.SWISS,
+        birth_municipality_bfs="261",
+        birth_municipality_name="Zürich",
+    )
+    return BaseDeliveryEvent(
+        person=person,
+        residence_type=ResidenceType.MAIN,
+        reporting_municipality_bfs="261",
+        reporting_municipality_name="Zürich",
+        arrival_date=date(2024, 1, 1),
+        dwelling_address=DwellingAddressInfo(
+            street="Teststrasse",
+            house_number="42",
+            town="Zürich",
+            swiss_zip_code=8000,
+            type_of_household="1",
+        ),
+    )
+
+
+def _c14n(xml: str) -> str:
+    return ET.canonicalize(xml, strip_text=True)
+
+
+class TestDeliveryFactoryBuild:
+
+    def test_build_equals_finalize(self):
+        event = _event()
+        factory = DeliveryFactory(CONFIG)
+        built = factory.build(event, message_id="msg-1", message_date=MESSAGE_DATE, action=ActionType.CORRECTION)
+        expected = event.finalize(CONFIG, message_id="msg-1", message_date=MESSAGE_DATE, action=ActionType.CORRECTION)
+        assert built == expected
+
+    def test_template_not_mutated(self):
+        factory = DeliveryFactory(CONFIG)
+        first = factory.build(_event(), message_id="msg-1", message_date=MESSAGE_DATE)
+        second = factory.build(_event(), message_id="msg-2", message_date=MESSAGE_DATE)
+        assert first.delivery_header.header.message_id == "msg-1"
+        assert second.delivery_header.header.message_id == "msg-2"
+
+    def test_defaults_generate_id_and_date(self):
+        header = DeliveryFactory(CONFIG).build(_event()).delivery_header.header
+        assert len(header.message_id) == 36
+        assert header.message_date.tzinfo is not None
+        assert header.action == ActionType.NEW
+
+    def test_optional_header_fields(self):
+        factory = DeliveryFactory(CONFIG, comment="Factory test", recipient_id=["sedex://T1-TEST-002"])
+        header = factory.build(_event(), message_id="msg-1", message_date=MESSAGE_DATE).delivery_header.header
+        assert header.comment == "Factory test"
+        assert header.recipient_id == ["sedex://T1-TEST-002"]
+
+    def test_invalid_static_field_fails_at_construction(self):
+        with pytest.raises(ValidationError):
+            DeliveryFactory(CONFIG, comment="")
+
+    @pytest.mark.parametrize("kwargs", [
+        {"message_id": "x" * 37},
+        {"message_id": ""},
+        {"message_date": datetime(2025, 3, 1, 12, 30)},  # naive datetime
+        {"action": "2"},
+    ])
+    @pytest.mark.parametrize("method", ["build", "to_bytes"])
+    def test_per_message_fields_validated(self, kwargs, method):
+        factory = DeliveryFactory(CONFIG)
+        with pytest.raises(ValidationError):
+            getattr(factory, method)(_event(), **kwargs)
+
+
+class TestDeliveryFactoryBytes:
+
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    def test_bytes_roundtrip(self, pretty_print):
+        factory = DeliveryFactory(CONFIG, pretty_print=pretty_print, comment="A & B <test>")
+        event = _event()
+        data = factory.to_bytes(event, message_id="id&<1>", message_date=MESSAGE_DATE, action=ActionType.RECALL)
+        assert data.startswith(b"<?xml version='1.0' encoding='utf-8'?>\n")
+        parsed = ECH0020Delivery.from_xml(ET.fromstring(data))
+        expected = factory.build(event, message_id="id&<1>", message_date=MESSAGE_DATE, action=ActionType.RECALL)
+        assert parsed == expected
+
+    def test_bytes_canonically_equal_to_to_xml(self):
+        factory = DeliveryFactory(CONFIG)
+        event = _event()
+        data = factory.to_bytes(event, message_id="msg-1", message_date=MESSAGE_DATE)
+        reference = factory.build(event, message_id="msg-1", message_date=MESSAGE_DATE).to_xml()
+        assert _c14n(data.decode("utf-8")) == _c14n(ET.tostring(reference, encoding="unicode"))
+
+    def test_pretty_print_layout_matches_to_file(self, tmp_path):
+        factory = DeliveryFactory(CONFIG)
+        event = _event()
+        data = factory.to_bytes(event, message_id="msg-1", message_date=MESSAGE_DATE)
+        path = tmp_path / "delivery.xml"
+        factory.build(event, message_id="msg-1", message_date=MESSAGE_DATE).to_file(path)
+        # Same lines apart from where namespace declarations are placed
+        strip_ns = lambda line: line.split(" xmlns:")[0].rstrip(">").strip()
+        assert [strip_ns(l) for l in data.decode("utf-8").splitlines()] == \
+            [strip_ns(l) for l in path.read_text(encoding="utf-8").splitlines()]
+
+    def test_other_encoding(self):
+        data = DeliveryFactory(CONFIG, encoding="iso-8859-1").to_bytes(
+            _event(), message_id="msg-1", message_date=MESSAGE_DATE
+        )
+        assert "Zürich".encode("iso-8859-1") in data
+        ECH0020Delivery.from_xml(ET.fromstring(data))
@@ -0,0 +1,119 @@
+"""Test shared Layer 1 sub-objects in BaseDeliveryPerson.to_ech0020().
+
+What This File Tests
+====================
+1. Equal places, countries and partially known dates are ONE object across persons
+2. Shared leaf models are frozen (assignment raises)
+3. Invalid values are not cached: they raise on every conversion
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, dates, IDs)
+- BFS data: real opendata fixtures (Zürich 261, Germany 8207)
+"""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from openmun_ech.ech0007 import CantonAbbreviation
+from openmun_ech.ech0020.layer2.helpers import (
+    UNKNOWN_PLACE,
+    shared_country,
+    shared_swiss_place,
+)
+from openmun_ech.ech0020.models import BaseDeliveryPerson, PlaceType
+from openmun_ech.ech0044 import ECH0044DatePartiallyKnown
+
+
+def _person(i: int, **overrides) -> BaseDeliveryPerson:
+    data = {
+        "local_person_id": f"SHARED-{i}",
+        "local_person_id_category": "MU.6172",
+        "official_name": "Muster",
+        "first_name": f"Person{i}",
+        "sex": "1" if i % 2 else "2",
+        "date_of_birth": date(1980, 5, 17),
+        "religion": "111",
+        "marital_status": "1",
+        "nationality_status": "2",
+        "data_lock": "0",
+        "places_of_origin": [{"bfs_code": "261", "name": "Zürich", "canton": "ZH"}],
+        "birth_place_type": PlaceType.SWISS,
+        "birth_municipality_bfs": "261",
+        "birth_municipality_name": "Zürich",
+        "birth_canton_abbreviation": "ZH",
+    }
+    data.update(overrides)
+    return BaseDeliveryPerson(**data)
+
+
+def _foreign_person(i: int) -> BaseDeliveryPerson:
+    return _person(
+        i,
+        places_of_origin=None,
+        nationalities=[{"country_id": "8207", "country_iso": "DE", "country_name_short": "Deutschland"}],
+        residence_permit="0302",
+        birth_place_type=PlaceType.FOREIGN,
+        birth_municipality_bfs=None,
+        birth_municipality_name=None,
+        birth_canton_abbreviation=None,
+        birth_country_id="8207",
+        birth_country_iso="DE",
+        birth_country_name_short="Deutschland",
+    )
+
+
+class TestSharedObjects:
+    """Equal immutable sub-objects are built once and shared."""
+
+    def test_swiss_birth_place_shared_across_persons(self):
+        a, b = _person(1).to_ech0020(), _person(2).to_ech0020()
+        assert a.birth_info.birth_data.place_of_birth is b.birth_info.birth_data.place_of_birth
+
+    def test_foreign_birth_place_and_nationality_shared(self):
+        a, b = _foreign_person(1).to_ech0020(), _foreign_person(2).to_ech0020()
+        assert a.birth_info.birth_data.place_of_birth is b.birth_info.birth_data.place_of_birth
+        country_a = a.nationality_data.country_info[0].country
+        assert country_a is b.nationality_data.country_info[0].country
+        # Nationality and birth country are the same value object
+        assert country_a is a.birth_info.birth_data.place_of_birth.foreign_country
+
+    def test_date_of_birth_wrapper_shared(self):
+        a, b = _person(1).to_ech0020(), _person(2).to_ech0020()
+        assert a.person_identification.date_of_birth is b.person_identification.date_of_birth
+
+    def test_unknown_place_shared(self):
+        person = _person(1, birth_place_type=PlaceType.UNKNOWN,
+                         birth_municipality_bfs=None, birth_municipality_name=None,
+                         birth_canton_abbreviation=None)
+        assert person.to_ech0020().birth_info.birth_data.place_of_birth is UNKNOWN_PLACE
+
+    def test_different_values_are_different_objects(self):
+        other = _person(2, birth_municipality_bfs="230", birth_municipality_name="Winterthur")
+        a, b = _person(1).to_ech0020(), other.to_ech0020()
+        assert a.birth_info.birth_data.place_of_birth != b.birth_info.birth_data.place_of_birth
+
+    def test_conversion_still_validates(self):
+        with pytest.raises(ValueError, match="Invalid birth canton abbreviation"):
+            _person(1, birth_canton_abbreviation="XX").to_ech0020()
+        # Errors are not cached: the same invalid values fail again
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                shared_country("81", "DE", "Deutschland")
+
+
+class TestFrozenLeafModels:
+    """Shared leaf models must be immutable."""
+
+    @pytest.mark.parametrize("obj, field, value", [
+        (shared_country("8207", "DE", "Deutschland"), "country_name_short", "Allemagne"),
+        (shared_swiss_place("261", "Zürich", CantonAbbreviation.ZH, None), "foreign_town", "Bern"),
+        (shared_swiss_place("261", "Zürich", CantonAbbreviation.ZH, None).swiss_municipality.swiss_municipality,
+         "municipality_name", "Bern"),
+        (ECH0044DatePartiallyKnown.from_year(1980), "year", "1981"),
+    ])
+    def test_assignment_raises(self, obj, field, value):
+        with pytest.raises(ValidationError):
+            setattr(obj, field, value)
@@ -0,0 +1,76 @@
+"""Test compact read-only records of Layer 1 models (openmun_ech.core.records).
+
+What This File Tests
+====================
+1. Record types: slotted, immutable, model field names, lists as tuples
+2. parse_record() → to_model() equals from_xml(), for generic models and
+   models with hand-written parsers (eCH-0020 base delivery events)
+3. to_record() of a model instance, required fields
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261)
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from openmun_ech.core import NS
+from openmun_ech.core.records import ModelRecord, parse_record, record_type, to_record
+from openmun_ech.ech0008 import ECH0008Country
+from openmun_ech.ech0020.v3 import ECH0020EventBaseDelivery
+from openmun_ech.ech0129.v6.building import ECH0129Building
+from tests.conftest import make_building, make_event, write_delivery
+
+
+@pytest.fixture
+def events(tmp_path):
+    path = write_delivery(tmp_path / 'delivery.xml', [make_event(i) for i in range(3)])
+    return ET.parse(path).getroot().findall(f'.//{{{NS.ECH0020_V3}}}messages')
+
+
+class TestRecordType:
+
+    def test_compact_and_immutable(self):
+        record = to_record(ECH0008Country(country_id='8207', country_iso='DE', country_name_short='Deutschland'))
+        assert isinstance(record, ModelRecord)
+        assert record.country_name_short == 'Deutschland'
+        assert record._fields == tuple(ECH0008Country.model_fields)
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(AttributeError):
+            record.country_name_short = 'Schweiz'
+
+    def test_cached_per_model(self):
+        assert record_type(ECH0008Country) is record_type(ECH0008Country)
+        assert record_type(ECH0008Country).__name__ == 'ECH0008CountryRecord'
+
+
+class TestParseRecord:
+
+    def test_generic_model(self):
+        elem = make_building().to_xml()
+        record = parse_record(ECH0129Building, elem)
+        assert record.to_model() == ECH0129Building.from_xml(elem)
+
+    def test_base_delivery_events(self, events):
+        for elem in events:
+            record = parse_record(ECH0020EventBaseDelivery, elem)
+            assert record.to_model() == ECH0020EventBaseDelivery.from_xml(elem)
+
+        person = record.base_delivery_person
+        assert person.person_identification.official_name == 'Muster'
+        assert isinstance(person.place_of_origin_info, tuple)
+        assert [info.place_of_origin.origin_name for info in person.place_of_origin_info] == ['Zürich', 'Bern']
+
+    def test_to_record_roundtrip(self, events):
+        model = ECH0020EventBaseDelivery.from_xml(events[0])
+        record = to_record(model)
+        assert record == parse_record(ECH0020EventBaseDelivery, events[0])
+        assert record.to_model() == model
+
+    def test_missing_required_field(self):
+        elem = ET.fromstring(f'<c:country xmlns:c="{NS.ECH0008_V3}"><c:countryId>8207</c:countryId></c:country>')
+        with pytest.raises(ValueError, match="Missing required field: countryNameShort"):
+            parse_record(ECH0008Country, elem)
@@ -0,0 +1,122 @@
+"""Test the persistent person index (openmun_ech.person_index).
+
+What This File Tests
+====================
+1. find() by VN, local person ID (with and without category), other person ID
+2. element(): the entity re-read from its byte range equals the full parse,
+   also for default namespaces and non-UTF-8 deliveries
+3. Digests: equal content → equal digest, regardless of formatting
+4. Persistence, re-indexing of changed deliveries, remove()
+5. Errors: changed delivery, find() arguments, unknown root element
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261, Bern 351)
+"""
+
+import pytest
+
+from openmun_ech.ech0020.v3 import ECH0020EventBaseDelivery
+from openmun_ech.person_index import PersonIndex
+from tests.conftest import (
+    ECH0044,
+    ech0099_delivery,
+    make_event,
+    parsed_messages,
+    write_delivery,
+)
+
+
+def events(count=3):
+    events = [make_event(i) for i in range(count)]
+    events[1].person.other_person_ids = [{'person_id': 'Z-1', 'person_id_category': 'CH.ZAR'}]
+    return events
+
+
+@pytest.fixture
+def delivery(tmp_path):
+    return write_delivery(tmp_path / 'delivery.xml', events())
+
+
+@pytest.fixture
+def index(tmp_path):
+    with PersonIndex(tmp_path / 'index.sqlite') as index:
+        yield index
+
+
+class TestFind:
+
+    def test_by_ids(self, index, delivery):
+        assert index.add(delivery) == 3
+        (by_vn,) = index.find(vn='7561234560001')
+        (by_local,) = index.find(local_person_id='10001', category='MU.261')
+        (by_other,) = index.find(other_person_id='Z-1')
+        assert by_vn == by_local == by_other
+        assert by_vn.position == 1
+        assert by_vn.delivery == str(delivery.resolve())
+        assert index.find(local_person_id='10001', category='MU.351') == []
+
+    def test_element_equals_full_parse(self, index, delivery):
+        index.add(delivery)
+        for i, messages in enumerate(parsed_messages(delivery)):
+            (hit,) = index.find(vn=f'756123456{i:04d}')
+            assert (ECH0020EventBaseDelivery.from_xml(index.element(hit))
+                    == ECH0020EventBaseDelivery.from_xml(messages))
+
+    @pytest.mark.parametrize("encoding", ['utf-8', 'iso-8859-1'])
+    def test_default_namespace_and_encoding(self, index, tmp_path, encoding):
+        index.add(ech0099_delivery(tmp_path / 'statistics.xml', encoding))
+        (hit,) = index.find(vn='7561234560001')
+        name = index.element(hit).findtext('.//{%s}officialName' % ECH0044)
+        assert name == 'Müller'
+
+    def test_digest_ignores_formatting(self, index, tmp_path):
+        pretty = write_delivery(tmp_path / 'pretty.xml', events())
+        compact = write_delivery(tmp_path / 'compact.xml', events(), pretty_print=False)
+        index.add(pretty)
+        index.add(compact)
+        hits = index.find(vn='7561234560002')
+        assert [hit.delivery for hit in hits] == [str(compact.resolve()), str(pretty.resolve())]
+        assert hits[0].digest == hits[1].digest
+        assert hits[0].start != hits[1].start
+
+
+class TestMaintenance:
+
+    def test_persistent(self, tmp_path, delivery):
+        with PersonIndex(tmp_path / 'index.sqlite') as index:
+            index.add(delivery)
+        with PersonIndex(tmp_path / 'index.sqlite') as index:
+            assert index.deliveries() == [str(delivery.resolve())]
+            (hit,) = index.find(vn='7561234560000')
+            assert index.element(hit) is not None
+
+    def test_changed_delivery(self, index, delivery):
+        index.add(delivery)
+        (hit,) = index.find(vn='7561234560002')
+        write_delivery(delivery, events(5))
+        with pytest.raises(ValueError, match="changed since it was indexed"):
+            index.element(hit)
+        assert index.add(delivery) == 5
+        assert len(index.find(local_person_id='10004')) == 1
+
+    def test_remove(self, index, delivery):
+        index.add(delivery)
+        index.remove(delivery)
+        assert index.deliveries() == []
+        assert index.find(vn='7561234560000') == []
+
+
+class TestErrors:
+
+    @pytest.mark.parametrize("ids", [{}, {'vn': '7561234560000', 'local_person_id': '10000'}])
+    def test_find_needs_one_id(self, index, ids):
+        with pytest.raises(ValueError, match="exactly one"):
+            index.find(**ids)
+
+    def test_unknown_root(self, index, tmp_path):
+        path = tmp_path / 'other.xml'
+        path.write_bytes(b'<delivery xmlns="urn:example:other"/>')
+        with pytest.raises(ValueError, match="No default entity"):
+            index.add(path)
@@ -0,0 +1,170 @@
+"""Test projection parsing of deliveries (openmun_ech.projection).
+
+What This File Tests
+====================
+1. Layer 2 field names: values equal those of the full models, eCH-0020 and
+   eCH-0099 (residence choices, both reportingMunicipality forms)
+2. eCH paths, repeated fields, row keys, converters
+3. Projection reuse: rows() in field order, paths and file objects
+4. Errors: unknown fields, duplicate keys, root element, converter failures
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261, Bern 351)
+"""
+
+import io
+from datetime import date
+
+import pytest
+
+from openmun_ech.diff import ECH0020_VN, ECH0099_VN
+from openmun_ech.ech0011.enums import MaritalStatus
+from openmun_ech.ech0044 import Sex
+from openmun_ech.projection import ECH0020_FIELDS, Projection, ProjectionField, project
+from tests.conftest import ECH0011, ECH0044, make_event, write_delivery
+
+ECH0007 = 'http://www.ech.ch/xmlns/eCH-0007/5'
+ECH0010 = 'http://www.ech.ch/xmlns/eCH-0010/5'
+
+ORIGIN_NAME = (
+    'eCH-0020:baseDeliveryPerson/eCH-0020:placeOfOriginInfo/'
+    'eCH-0020:placeOfOrigin/eCH-0011:originName'
+)
+
+
+@pytest.fixture
+def events():
+    return [make_event(i) for i in range(3)]
+
+
+@pytest.fixture
+def delivery(tmp_path, events):
+    return write_delivery(tmp_path / 'delivery.xml', events)
+
+
+def ech0099_delivery(residence: str) -> io.BytesIO:
+    return io.BytesIO((
+        '<d:delivery xmlns:d="http://www.ech.ch/xmlns/eCH-0099/2" '
+        f'xmlns:p="{ECH0011}" xmlns:i="{ECH0044}" xmlns:m="{ECH0007}" xmlns:a="{ECH0010}">'
+        '<d:reportedPerson><d:baseData><p:person><p:personIdentification>'
+        '<i:vn>7561234560001</i:vn><i:officialName>Muster</i:officialName>'
+        '<i:sex>2</i:sex><i:dateOfBirth><i:yearMonth>1980-05</i:yearMonth></i:dateOfBirth>'
+        '</p:personIdentification>'
+        '<p:maritalData><p:maritalStatus>1</p:maritalStatus></p:maritalData>'
+        f'</p:person>{residence}</d:baseData></d:reportedPerson>'
+        '</d:delivery>'
+    ).encode('utf-8'))
+
+
+RESIDENCE_DATA = (
+    '<p:arrivalDate>2020-03-01</p:arrivalDate>'
+    '<p:dwellingAddress><p:address><a:street>Teststrasse</a:street>'
+    '<a:swissZipCode>3000</a:swissZipCode></p:address></p:dwellingAddress>'
+)
+
+
+class TestFieldNames:
+
+    def test_ech0020_matches_models(self, delivery, events):
+        rows = list(project(delivery, list(ECH0020_FIELDS)))
+        assert len(rows) == len(events)
+        for row, event in zip(rows, events):
+            person, address = event.person, event.dwelling_address
+            assert row['person.vn'] == person.vn
+            assert row['person.local_person_id'] == person.local_person_id
+            assert row['person.first_name'] == person.first_name
+            assert row['person.sex'] is person.sex
+            assert row['person.date_of_birth'] == person.date_of_birth
+            assert row['person.marital_status'] is MaritalStatus.SINGLE
+            assert row['reporting_municipality_bfs'] == '261'
+            assert row['arrival_date'] == event.arrival_date
+            assert row['departure_date'] is None
+            assert row['dwelling_address.house_number'] == address.house_number
+            assert row['dwelling_address.swiss_zip_code'] == address.swiss_zip_code
+
+    def test_ech0099_main_residence(self):
+        row, = project(ech0099_delivery(
+            '<p:hasMainResidence><p:mainResidence>'
+            '<p:reportingMunicipality><m:municipalityId>261</m:municipalityId>'
+            '<m:municipalityName>Zürich</m:municipalityName></p:reportingMunicipality>'
+            f'{RESIDENCE_DATA}</p:mainResidence></p:hasMainResidence>'
+        ), ['person.vn', 'person.sex', 'person.date_of_birth', 'person.marital_status',
+            'reporting_municipality_bfs', 'dwelling_address.street'])
+        assert row == {
+            'person.vn': '7561234560001',
+            'person.sex': Sex.FEMALE,
+            'person.date_of_birth': date(1980, 5, 1),
+            'person.marital_status': MaritalStatus.SINGLE,
+            'reporting_municipality_bfs': '261',
+            'dwelling_address.street': 'Teststrasse',
+        }
+
+    def test_ech0099_secondary_residence(self):
+        row, = project(ech0099_delivery(
+            '<p:hasSecondaryResidence><m:mainResidence><m:swissMunicipality>'
+            '<m:municipalityId>261</m:municipalityId></m:swissMunicipality></m:mainResidence>'
+            '<p:secondaryResidence><m:reportingMunicipality><m:swissMunicipality>'
+            '<m:municipalityId>351</m:municipalityId></m:swissMunicipality>'
+            f'</m:reportingMunicipality>{RESIDENCE_DATA}</p:secondaryResidence>'
+            '</p:hasSecondaryResidence>'
+        ), ['reporting_municipality_bfs', 'arrival_date', 'dwelling_address.swiss_zip_code'])
+        assert row == {
+            'reporting_municipality_bfs': '351',
+            'arrival_date': date(2020, 3, 1),
+            'dwelling_address.swiss_zip_code': 3000,
+        }
+
+
+class TestPaths:
+
+    def test_paths_and_repeated_fields(self, delivery):
+        rows = list(project(delivery, {
+            'vn': 'person.vn',
+            'religion': 'eCH-0020:baseDeliveryPerson/eCH-0020:religionData/eCH-0011:religion',
+            'origins': ProjectionField(ORIGIN_NAME, repeated=True),
+            'job': 'eCH-0020:baseDeliveryPerson/eCH-0020:jobData/eCH-0021-v7:jobTitle',
+        }))
+        assert rows[0] == {
+            'vn': '7561234560000', 'religion': '111', 'origins': ('Zürich', 'Bern'), 'job': None,
+        }
+
+    def test_first_occurrence_wins(self, delivery):
+        row = next(project(delivery, {'origin': ProjectionField(ORIGIN_NAME)}))
+        assert row == {'origin': 'Zürich'}
+
+    def test_projection_reused(self, delivery):
+        projection = Projection(['person.first_name', 'person.vn'], ECH0020_VN.entity)
+        with open(delivery, 'rb') as f:
+            assert list(projection.rows(f)) == list(projection.rows(f))
+        assert next(projection.rows(delivery)) == ('Person0', '7561234560000')
+
+
+class TestErrors:
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="Unknown field 'person.shoe_size'"):
+            Projection(['person.shoe_size'], ECH0020_VN.entity)
+
+    def test_invalid_path(self):
+        with pytest.raises(ValueError, match="Invalid step"):
+            Projection(['eCH-9999:person'], ECH0020_VN.entity)
+
+    def test_duplicate_names(self):
+        with pytest.raises(ValueError, match="Duplicate field names"):
+            Projection(['person.vn', 'person.vn'], ECH0020_VN.entity)
+
+    def test_root_element_mismatch(self, delivery):
+        with pytest.raises(ValueError, match="does not match entity path"):
+            list(Projection(['person.vn'], ECH0099_VN.entity).rows(delivery))
+
+    def test_unknown_root(self):
+        source = io.BytesIO(b'<delivery xmlns="urn:example:other"/>')
+        with pytest.raises(ValueError, match="No default entity"):
+            list(project(source, ['person.vn']))
+
+    def test_converter_error(self, delivery):
+        first_name = 'eCH-0020:baseDeliveryPerson/eCH-0020:personIdentification/eCH-0044:firstName'
+        with pytest.raises(ValueError, match=r"Entity #1 .* invalid first_name 'Person0'"):
+            list(project(delivery, {'first_name': ProjectionField(first_name, int)}))
@@ -0,0 +1,99 @@
+"""Test random access to the entities of a delivery (openmun_ech.seekable).
+
+What This File Tests
+====================
+1. reader[i] equals the full parse for every entity; negative positions,
+   raw bytes, out of range
+2. Default namespaces and non-UTF-8 deliveries (eCH-0099)
+3. Sidecar: written next to the delivery, reused, rebuilt when outdated,
+   build=False errors, entity path mismatch
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs, VNs)
+- BFS data: real municipality codes (Zürich 261, Bern 351)
+"""
+
+import os
+
+import pytest
+
+from openmun_ech.diff import ECH0099_VN
+from openmun_ech.ech0020.v3 import ECH0020EventBaseDelivery
+from openmun_ech.seekable import SIDECAR_SUFFIX, DeliveryReader, build_sidecar
+from tests.conftest import (
+    ECH0044,
+    ech0099_delivery,
+    make_event,
+    parsed_messages,
+    write_delivery,
+)
+
+
+@pytest.fixture
+def delivery(tmp_path):
+    return write_delivery(tmp_path / 'delivery.xml', [make_event(i) for i in range(4)])
+
+
+class TestReader:
+
+    def test_entities_equal_full_parse(self, delivery):
+        with DeliveryReader(delivery) as reader:
+            assert len(reader) == 4
+            for elem, messages in zip(reader, parsed_messages(delivery)):
+                assert (ECH0020EventBaseDelivery.from_xml(elem)
+                        == ECH0020EventBaseDelivery.from_xml(messages))
+
+    def test_positions(self, delivery):
+        with DeliveryReader(delivery) as reader:
+            event = ECH0020EventBaseDelivery.from_xml(reader[-1])
+            assert event.base_delivery_person.person_identification.vn == '7561234560003'
+            raw = reader.raw(0)
+            assert raw.startswith(b'<') and raw.endswith(b'messages>')
+            start, end = reader.byte_range(0)
+            assert delivery.read_bytes()[start:end] == raw
+            with pytest.raises(IndexError):
+                reader[4]
+
+    @pytest.mark.parametrize("encoding", ['utf-8', 'iso-8859-1'])
+    def test_default_namespace_and_encoding(self, tmp_path, encoding):
+        path = ech0099_delivery(tmp_path / 'statistics.xml', encoding)
+        with DeliveryReader(path) as reader:
+            assert reader.entity == ECH0099_VN.entity
+            assert reader[0].findtext('.//{%s}officialName' % ECH0044) == 'Müller'
+
+
+class TestSidecar:
+
+    def test_written_once(self, delivery):
+        sidecar = build_sidecar(delivery)
+        assert sidecar.name == 'delivery.xml' + SIDECAR_SUFFIX
+        written = os.stat(sidecar).st_mtime_ns
+        with DeliveryReader(delivery, build=False) as reader:
+            assert len(reader) == 4
+        assert os.stat(sidecar).st_mtime_ns == written
+
+    def test_outdated(self, delivery):
+        build_sidecar(delivery)
+        write_delivery(delivery, [make_event(i) for i in range(6)])
+        with pytest.raises(ValueError, match="outdated"):
+            DeliveryReader(delivery, build=False)
+        with DeliveryReader(delivery) as reader:
+            assert len(reader) == 6
+
+    def test_missing(self, delivery):
+        with pytest.raises(FileNotFoundError):
+            DeliveryReader(delivery, build=False)
+
+    def test_other_location(self, delivery, tmp_path):
+        sidecar = tmp_path / 'sidecars' / 'register.idx'
+        sidecar.parent.mkdir()
+        with DeliveryReader(delivery, sidecar=sidecar) as reader:
+            assert len(reader) == 4
+        assert sidecar.exists()
+        assert not (tmp_path / ('delivery.xml' + SIDECAR_SUFFIX)).exists()
+
+    def test_entity_mismatch(self, delivery):
+        with pytest.raises(ValueError, match="does not match entity path"):
+            build_sidecar(delivery, ECH0099_VN.entity)
+        assert not list(delivery.parent.glob('*' + SIDECAR_SUFFIX + '*'))
@@ -0,0 +1,129 @@
+"""Test the bytes-level serializer (ECHModel.to_xml_bytes() / write_xml()).
+
+What This File Tests
+====================
+1. Conformance: output is canonically equal to ET.tostring(to_xml()),
+   compact and indented, for generic models, hand-written to_xml() overrides
+   and generic models containing them
+2. Escaping of text, non-ASCII content
+3. Namespace declarations: root declarations, unregistered namespaces,
+   namespaces already declared by the enclosing document
+4. Output targets: bytearray and binary file objects
+
+Data Policy
+===========
+- Personal data: ALWAYS fictive (names, IDs)
+- Municipality: fictive test municipality (Bister 6172, as in test_ech0133)
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+import pytest
+
+from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.ech0008 import ECH0008Country
+from openmun_ech.ech0129.v6.base_types import ECH0129BuildingVolume
+from openmun_ech.ech0129.v6.building import ECH0129Building
+from tests.conftest import make_building, make_entrance, make_realestate_info
+
+UNREGISTERED_NS = 'urn:example:unregistered'
+
+
+class Wrapped(ECHModel):
+    __xml_ns__ = UNREGISTERED_NS
+    __xml_element__ = 'wrapped'
+
+    label: Optional[str] = xml_field('label', default=None)
+    country: Optional[ECH0008Country] = xml_field('country', ns=NS.ECH0008_V3, default=None)
+
+
+def make_country() -> ECH0008Country:
+    return ECH0008Country(country_id='8207', country_iso='DE', country_name_short='Deutschland')
+
+
+def canonical(data: bytes) -> str:
+    return ET.canonicalize(data.decode('utf-8'), strip_text=True)
+
+
+def element_tree_bytes(model, indent=None, level=0, **kwargs) -> bytes:
+    elem = model.to_xml(**kwargs)
+    if indent is not None:
+        ET.indent(elem, space=indent, level=level)
+    return ET.tostring(elem, encoding='utf-8')
+
+
+CASES = {
+    'generic': lambda: make_country(),
+    'generic_with_overrides': lambda: make_building(
+        building_entrance=[make_entrance()],
+        volume=ECH0129BuildingVolume(volume=1200, norm_nil=True),
+    ),
+    'override': lambda: ECH0129BuildingVolume(volume_nil=True, information_source_nil=True),
+    'ech0133_record': lambda: make_realestate_info(1),
+}
+
+
+class TestConformance:
+
+    @pytest.mark.parametrize("indent", [None, '  '])
+    @pytest.mark.parametrize("case", sorted(CASES))
+    def test_canonically_equal_to_element_tree(self, case, indent):
+        model = CASES[case]()
+        expected = element_tree_bytes(model, indent=indent, level=1)
+        actual = model.to_xml_bytes(indent=indent, level=1)
+        assert canonical(actual) == canonical(expected)
+        # Same markup, not only the same infoset
+        assert actual == expected
+
+    def test_to_xml_arguments(self):
+        realestate = make_realestate_info(1)
+        kwargs = dict(namespace=NS.ECH0133_V3, element_name='realestateInformation')
+        assert realestate.to_xml_bytes(**kwargs) == element_tree_bytes(realestate, **kwargs)
+
+    def test_generic_flag(self):
+        assert ECH0008Country.__xml_generic__
+        assert ECH0129Building.__xml_generic__
+        assert not ECH0129BuildingVolume.__xml_generic__
+
+    def test_escaping_and_non_ascii(self):
+        country = ECH0008Country(country_iso='CI', country_name_short='Côte d’Ivoire & <Test>')
+        data = country.to_xml_bytes()
+        assert 'Côte d’Ivoire &amp; &lt;Test&gt;'.encode('utf-8') in data
+        assert data == element_tree_bytes(country)
+        assert ECH0008Country.from_xml(ET.fromstring(data)) == country
+
+    def test_empty_model_is_empty_element(self):
+        assert Wrapped().to_xml_bytes() == element_tree_bytes(Wrapped())
+
+
+class TestNamespaces:
+
+    def test_unregistered_namespace_numbered_like_element_tree(self):
+        model = Wrapped(label='x', country=make_country())
+        data = model.to_xml_bytes()
+        assert data.startswith(b'<ns0:wrapped ')
+        assert data == element_tree_bytes(model)
+
+    def test_declared_namespaces_not_repeated(self):
+        country = make_country()
+        data = country.to_xml_bytes(declared={NS.ECH0008_V3: 'eCH-0008'})
+        assert data.startswith(b'<eCH-0008:country>')
+
+        # A different prefix for the URI is not a declaration of it
+        data = country.to_xml_bytes(declared={NS.ECH0008_V3: 'other'})
+        assert data.startswith(b'<eCH-0008:country xmlns:eCH-0008=')
+
+
+class TestTargets:
+
+    def test_appends_to_bytearray(self):
+        buf = bytearray(b'<root>')
+        make_country().write_xml(buf)
+        assert buf == b'<root>' + make_country().to_xml_bytes()
+
+    def test_binary_file(self):
+        out = io.BytesIO()
+        make_country().write_xml(out, indent='  ')
+        assert out.getvalue() == make_country().to_xml_bytes(indent='  ')
@@ -0,0 +1,152 @@
+"""Tests for per-class to_xml()/from_xml() profiling (openmun_ech.core.profiling)."""
+
+import os
+import pstats
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from openmun_ech.core import ECHModel, NS, xml_field
+from openmun_ech.core import profiling
+from openmun_ech.core.profiling import profile_xml
+from openmun_ech.ech0020.v3 import ECH0020Delivery
+from openmun_ech.ech0044 import (
+    ECH0044DatePartiallyKnown,
+    ECH0044NamedPersonId,
+    ECH0044PersonIdentification,
+)
+from tests.conftest import make_event, write_delivery
+
+SRC = str(Path(__file__).resolve().parents[1] / 'src')
+
+
+def make_person() -> ECH0044PersonIdentification:
+    return ECH0044PersonIdentification(
+        vn="7560123456789",
+        local_person_id=ECH0044NamedPersonId(person_id_category="veka.id", person_id="MU.6172.1"),
+        official_name="Muster",
+        first_name="Anna",
+        sex="2",
+        date_of_birth=ECH0044DatePartiallyKnown.from_date(date(1990, 5, 15)),
+    )
+
+
+def rows(profile) -> dict:
+    return {(s.name.rsplit('.', 1)[-1], s.method): s for s in profile.stats()}
+
+
+class TestProfileXml:
+
+    def test_records_nested_classes(self):
+        person = make_person()
+        with profile_xml() as profile:
+            elem = person.to_xml()
+            ECH0044PersonIdentification.from_xml(elem)
+
+        stats = rows(profile)
+        for method in ('to_xml', 'from_xml'):
+            outer = stats[('ECH0044PersonIdentification', method)]
+            nested = stats[('ECH0044NamedPersonId', method)]
+            assert outer.calls == nested.calls == 1
+            assert outer.total_time >= outer.own_time
+            assert outer.total_time >= nested.total_time
+            # Own elements add up to the document
+            total = sum(s.elements for s in profile.stats() if s.method == method)
+            assert total == sum(1 for _ in elem.iter())
+
+    def test_methods_restored_on_exit(self):
+        original = ECHModel.__dict__['to_xml']
+        with profile_xml():
+            assert ECHModel.__dict__['to_xml'] is not original
+        assert ECHModel.__dict__['to_xml'] is original
+        assert profiling._active is None
+
+    def test_super_delegation_counted_once(self):
+        class Wrapped(ECHModel):
+            __xml_ns__ = NS.ECH0044_V4
+            __xml_element__ = 'wrapped'
+
+            value: Optional[str] = xml_field('value', default=None)
+
+            def to_xml(self, parent=None, namespace=None, element_name=None, wrapper_namespace=None):
+                return super().to_xml(parent, namespace, element_name, wrapper_namespace)
+
+        with profile_xml() as profile:
+            Wrapped(value="x").to_xml()
+        assert rows(profile)[('Wrapped', 'to_xml')].calls == 1
+
+    def test_class_defined_while_profiling(self):
+        with profile_xml() as profile:
+            class Late(ECHModel):
+                __xml_ns__ = NS.ECH0044_V4
+                __xml_element__ = 'late'
+
+                value: Optional[str] = xml_field('value', default=None)
+
+                @classmethod
+                def from_xml(cls, elem, namespace=None):
+                    return super().from_xml(elem, namespace)
+
+            Late.from_xml(Late(value="x").to_xml())
+        assert rows(profile)[('Late', 'from_xml')].calls == 1
+        assert not hasattr(Late.__dict__['from_xml'].__func__, '__wrapped__')  # Restored
+
+    def test_element_passed_by_keyword(self, tmp_path):
+        # ECH0020Delivery.from_xml(cls, element): not the generic 'elem' parameter
+        path = write_delivery(tmp_path / 'delivery.xml', [make_event(0)])
+        root = ET.parse(path).getroot()
+        with profile_xml() as profile:
+            ECH0020Delivery.from_xml(element=root)
+        assert rows(profile)[('ECH0020Delivery', 'from_xml')].elements > 0
+
+    def test_table_and_sort(self):
+        with profile_xml() as profile:
+            make_person().to_xml()
+        table = profile.table(sort='calls', limit=2)
+        assert table.splitlines()[0].split()[:3] == ['class', 'method', 'calls']
+        assert len(table.splitlines()) == 3
+        assert [s.name for s in profile.stats('name')] == sorted(s.name for s in profile.stats())
+        with pytest.raises(ValueError, match="Unknown sort key"):
+            profile.stats('slowest')
+
+    def test_dump_stats_loads_with_pstats(self, tmp_path):
+        with profile_xml() as profile:
+            make_person().to_xml()
+        path = tmp_path / 'xml.prof'
+        profile.dump_stats(str(path))
+
+        stats = pstats.Stats(str(path)).stats
+        names = {func[2] for func in stats}
+        assert 'ECH0044PersonIdentification.to_xml' in names
+        (callee,) = [f for f in stats if f[2] == 'ECH0044NamedPersonId.to_xml']
+        callers = stats[callee][4]
+        assert [f[2] for f in callers] == ['ECH0044PersonIdentification.to_xml']
+
+    def test_nested_profiles_rejected(self):
+        with profile_xml():
+            with pytest.raises(RuntimeError, match="already active"):
+                with profile_xml():
+                    pass
+
+
+class TestEnvironmentSwitch:
+
+    def test_pstats_written_at_exit(self, tmp_path):
+        path = tmp_path / 'env.prof'
+        env = dict(os.environ, OPENMUN_ECH_PROFILE=str(path))
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC, env.get('PYTHONPATH')]))
+        code = (
+            "from openmun_ech.ech0008 import ECH0008Country\n"
+            "ECH0008Country(country_id='8207', country_iso='DE', country_name_short='Deutschland').to_xml()"
+        )
+        result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True,
+                                text=True, timeout=120)
+        assert result.returncode == 0, result.stderr
+
+        names = {func[2] for func in pstats.Stats(str(path)).stats}
+        assert 'ECH0008Country.to_xml' in names
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""Performance Benchmarks for openmun-ech
+=========================================
+
+Times parsing, building, serialization and validation on synthetic
+deliveries from synthetic_data.py (fictive data only, see
+tests/test_no_production_data_leakage.py):
+
+- eCH-0020 baseDelivery: Layer 2 → Layer 1 build, to_xml, from_xml,
+  BaseDeliveryPerson.to_ech0020() (time and allocations per person),
+  BaseDeliveryPerson.bulk_from_rows() (trusted=False vs. trusted=True),
+  Layer 2 round trip (XML → Layer 1 → Layer 2), projection of reporting
+  fields (XML → values, see openmun_ech.projection), XSD validation,
+  validate_swiss_data()
+- eCH-0099 statistics delivery: build, to_xml, from_xml, XSD validation
+- eCH-0129 buildings (with entrances): to_xml, to_xml_bytes, from_xml
+- eCH-0133 realestate base delivery: to_xml, to_xml_bytes (records, as
+  written by the streaming writer), from_xml, XSD validation
+
+Each benchmark is run for every size (number of persons/objects). The best of
+--repeat runs is reported with its throughput and time per item; peak memory,
+and the memory and GC-tracked objects held by the benchmark's result (per
+item), are measured in a separate run with tracemalloc (which slows
+execution down). Benchmarks whose
+prerequisites are missing (XSD schemas not cached and no network, opendata
+not installed) are reported as skipped.
+
+Usage:
+    python tools/benchmark.py --sizes 1,100,1000
+    python tools/benchmark.py --sizes 100000 --only ech0020.from_xml
+    python tools/benchmark.py --save-baseline benchmarks.json
+    python tools/benchmark.py --baseline benchmarks.json --tolerance 0.25
+
+Regression check:
+    python tools/benchmark.py --sizes 100,1000 --baseline
+
+With --baseline, exits with status 1 if a benchmark is slower than the
+baseline by more than the tolerance. Without a file name it compares with
+tools/benchmark_baseline.json, committed with the code and regenerated
+(--sizes 100,1000 --save-baseline tools/benchmark_baseline.json) whenever a
+change is meant to alter performance. Timings depend on the machine: compare
+on the kind of machine that recorded the baseline (its Python version and
+platform are stored in the file and printed with the comparison).
+"""
+
+import argparse
+import functools
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_data import SyntheticRegister
+
+MESSAGE_DATE = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+# Committed reference results (see "Regression check" above)
+BASELINE = Path(__file__).with_name('benchmark_baseline.json')
+
+
+class Skip(Exception):
+    """Raised by a benchmark setup whose prerequisites are missing."""
+
+
+# ============================================================================
+# Synthetic data (fictive register, see synthetic_data.py)
+# ============================================================================
+
+REGISTER = SyntheticRegister(seed=0)
+
+
+def ech0020_config():
+    return REGISTER.ech0020_config()
+
+
+def ech0020_events(n: int) -> list:
+    return list(REGISTER.ech0020_events(n))
+
+
+def ech0099_config():
+    return REGISTER.ech0099_config()
+
+
+def ech0099_events(n: int) -> list:
+    return list(REGISTER.ech0099_events(n))
+
+
+def ech0129_buildings(n: int) -> list:
+    return list(REGISTER.ech0129_buildings(n))
+
+
+def ech0133_delivery(n: int):
+    """Realestate base delivery with n parcels, one building each."""
+    from openmun_ech.ech0133 import ECH0133Delivery, ECH0133RealestateBaseDelivery
+    return ECH0133Delivery(
+        delivery_header=REGISTER.ech0133_header("benchmark"),
+        realestate_base_delivery=ECH0133RealestateBaseDelivery(
+            realestate_information=list(REGISTER.ech0133_realestates(n)),
+        ),
+    )
+
+
+# ============================================================================
+# Benchmarks: setup(n) -> timed callable
+# ============================================================================
+
+def _schema(schema_name: str):
+    from openmun_ech.utils.schema_cache import get_cached_schema
+    try:
+        return get_cached_schema(schema_name)
+    except (ImportError, RuntimeError) as e:
+        raise Skip(f"{schema_name} not available ({e})") from e
+
+
+def _ech0020_delivery(n: int):
+    from openmun_ech.finalize import finalize_0020_base
+    return finalize_0020_base(ech0020_events(n), ech0020_config(), message_id="benchmark",
+                              message_date=MESSAGE_DATE)
+
+
+def bench_ech0020_build(n: int) -> Callable:
+    from openmun_ech.finalize import finalize_0020_base
+    events, config = ech0020_events(n), ech0020_config()
+    return lambda: finalize_0020_base(events, config, message_id="benchmark",
+                                      message_date=MESSAGE_DATE)
+
+
+def bench_ech0020_to_ech0020(n: int) -> Callable:
+    """BaseDeliveryPerson.to_ech0020(); the result keeps the Layer 1 persons alive."""
+    persons = [event.person for event in ech0020_events(n)]
+    return lambda: [person.to_ech0020() for person in persons]
+
+
+def bench_ech0020_bulk_from_rows(n: int, trusted: bool = False) -> Callable:
+    """BaseDeliveryPerson.bulk_from_rows(); run with trusted=False and True to compare."""
+    from openmun_ech.ech0020.models import BaseDeliveryPerson
+    rows = [event.person.model_dump(exclude_unset=True) for event in ech0020_events(n)]
+    return lambda: BaseDeliveryPerson.bulk_from_rows(rows, trusted=trusted)
+
+
+def bench_ech0020_to_xml(n: int) -> Callable:
+    return _ech0020_delivery(n).to_xml
+
+
+def bench_ech0020_from_xml(n: int) -> Callable:
+    from openmun_ech.ech0020.v3 import ECH0020Delivery
+    root = _ech0020_delivery(n).to_xml()
+    return lambda: ECH0020Delivery.from_xml(root)
+
+
+def bench_ech0020_roundtrip(n: int) -> Callable:
+    from openmun_ech.ech0020 import BaseDeliveryEvent
+    from openmun_ech.ech0020.v3 import ECH0020Delivery
+    data = ET.tostring(_ech0020_delivery(n).to_xml())
+
+    def roundtrip():
+        delivery = ECH0020Delivery.from_xml(ET.fromstring(data))
+        return [BaseDeliveryEvent.from_ech0020_event(e) for e in delivery.event]
+    return roundtrip
+
+
+def bench_ech0020_project(n: int) -> Callable:
+    from openmun_ech.projection import project
+    data = ET.tostring(_ech0020_delivery(n).to_xml())
+    fields = ['person.vn', 'person.official_name', 'person.first_name', 'person.date_of_birth',
+              'person.marital_status', 'dwelling_address.street',
+              'dwelling_address.house_number', 'dwelling_address.swiss_zip_code',
+              'dwelling_address.town']
+    return lambda: list(project(io.BytesIO(data), fields))
+
+
+def bench_ech0020_validate_xsd(n: int) -> Callable:
+    from openmun_ech.utils.schema_cache import validate_xml_cached
+    _schema('eCH-0020-3-0.xsd')
+    root = _ech0020_delivery(n).to_xml()
+    return lambda: validate_xml_cached(root, 'eCH-0020-3-0.xsd')
+
+
+def bench_ech0020_validate_swiss_data(n: int) -> Callable:
+    from openmun_ech.validation.cache import OPENDATA_AVAILABLE
+    if not OPENDATA_AVAILABLE:
+        raise Skip("openmun-opendata not installed")
+    events = ech0020_events(n)
+    return lambda: [event.validate_swiss_data() for event in events]
+
+
+def _ech0099_delivery(n: int):
+    from openmun_ech.ech0099 import finalize_statistics_delivery
+    return finalize_statistics_delivery(ech0099_events(n), ech0099_config(),
+                                        message_id="benchmark", message_date=MESSAGE_DATE)
+
+
+def bench_ech0099_build(n: int) -> Callable:
+    from openmun_ech.ech0099 import finalize_statistics_delivery
+    events, config = ech0099_events(n), ech0099_config()
+    return lambda: finalize_statistics_delivery(events, config, message_id="benchmark",
+                                                message_date=MESSAGE_DATE)
+
+
+def bench_ech0099_to_xml(n: int) -> Callable:
+    return _ech0099_delivery(n).to_xml
+
+
+def bench_ech0099_from_xml(n: int) -> Callable:
+    from openmun_ech.ech0099 import ECH0099Delivery
+    root = _ech0099_delivery(n).to_xml()
+    return lambda: ECH0099Delivery.from_xml(root)
+
+
+def bench_ech0099_validate_xsd(n: int) -> Callable:
+    from openmun_ech.utils.schema_cache import validate_xml_cached
+    _schema('eCH-0099-2-1.xsd')
+    root = _ech0099_delivery(n).to_xml()
+    return lambda: validate_xml_cached(root, 'eCH-0099-2-1.xsd')
+
+
+def bench_ech0129_to_xml(n: int) -> Callable:
+    buildings = ech0129_buildings(n)
+    return lambda: [b.to_xml() for b in buildings]
+
+
+def bench_ech0129_to_xml_bytes(n: int) -> Callable:
+    buildings = ech0129_buildings(n)
+    return lambda: [b.to_xml_bytes(indent='  ') for b in buildings]
+
+
+def bench_ech0129_from_xml(n: int) -> Callable:
+    from openmun_ech.ech0129 import ECH0129Building
+    elements = [b.to_xml() for b in ech0129_buildings(n)]
+    return lambda: [ECH0129Building.from_xml(e) for e in elements]
+
+
+def bench_ech0133_to_xml(n: int) -> Callable:
+    return ech0133_delivery(n).to_xml
+
+
+def bench_ech0133_to_xml_bytes(n: int) -> Callable:
+    from openmun_ech.core import NS
+    records = list(REGISTER.ech0133_realestates(n))
+    return lambda: [r.to_xml_bytes(namespace=NS.ECH0133_V3, indent='  ') for r in records]
+
+
+def bench_ech0133_from_xml(n: int) -> Callable:
+    from openmun_ech.ech0133 import ECH0133Delivery
+    root = ech0133_delivery(n).to_xml()
+    return lambda: ECH0133Delivery.from_xml(root)
+
+
+def bench_ech0133_validate_xsd(n: int) -> Callable:
+    from openmun_ech.utils.schema_cache import validate_xml_cached
+    _schema('eCH-0133-3-0.xsd')
+    root = ech0133_delivery(n).to_xml()
+    return lambda: validate_xml_cached(root, 'eCH-0133-3-0.xsd')
+
+
+BENCHMARKS: Dict[str, Callable[[int], Callable]] = {
+    'ech0020.build': bench_ech0020_build,
+    'ech0020.to_ech0020': bench_ech0020_to_ech0020,
+    'ech0020.bulk_from_rows': bench_ech0020_bulk_from_rows,
+    'ech0020.bulk_from_rows_trusted': functools.partial(bench_ech0020_bulk_from_rows, trusted=True),
+    'ech0020.to_xml': bench_ech0020_to_xml,
+    'ech0020.from_xml': bench_ech0020_from_xml,
+    'ech0020.roundtrip': bench_ech0020_roundtrip,
+    'ech0020.project': bench_ech0020_project,
+    'ech0020.validate_xsd': bench_ech0020_validate_xsd,
+    'ech0020.validate_swiss_data': bench_ech0020_validate_swiss_data,
+    'ech0099.build': bench_ech0099_build,
+    'ech0099.to_xml': bench_ech0099_to_xml,
+    'ech0099.from_xml': bench_ech0099_from_xml,
+    'ech0099.validate_xsd': bench_ech0099_validate_xsd,
+    'ech0129.to_xml': bench_ech0129_to_xml,
+    'ech0129.to_xml_bytes': bench_ech0129_to_xml_bytes,
+    'ech0129.from_xml': bench_ech0129_from_xml,
+    'ech0133.to_xml': bench_ech0133_to_xml,
+    'ech0133.to_xml_bytes': bench_ech0133_to_xml_bytes,
+    'ech0133.from_xml': bench_ech0133_from_xml,
+    'ech0133.validate_xsd': bench_ech0133_validate_xsd,
+}
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def run_benchmark(setup: Callable[[int], Callable], n: int, repeat: int,
+                  measure_memory: bool = True) -> dict:
+    """Time one benchmark for size n.
+
+    Returns:
+        {'seconds': best time, 'per_second': n / seconds, 'us_per_item': ...,
+         'peak_bytes': ..., 'retained_bytes_per_item': ..., 'objects_per_item': ...}
+        or {'skipped': reason}. Retained bytes and objects are those still
+        referenced by the callable's return value.
+    """
+    try:
+        fn = setup(n)
+    except Skip as e:
+        return {'skipped': str(e)}
+
+    fn()  # Warm-up (lazy imports, class creation, schema caches)
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    result = {'seconds': best, 'per_second': n / best if best else None,
+              'us_per_item': best / n * 1e6}
+
+    if measure_memory:
+        gc.collect()
+        objects = len(gc.get_objects())
+        tracemalloc.start()
+        try:
+            held = [fn()]  # Alive until its objects are counted
+            retained, result['peak_bytes'] = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result['retained_bytes_per_item'] = retained / n
+        result['objects_per_item'] = (len(gc.get_objects()) - objects) / n
+        held.clear()
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Names of results slower than the baseline by more than `tolerance`."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or 'seconds' not in base or 'seconds' not in result:
+            continue
+        result['baseline_ratio'] = result['seconds'] / base['seconds']
+        if result['baseline_ratio'] > 1 + tolerance:
+            regressions.append(key)
+    return regressions
+
+
+def format_row(key: str, result: dict) -> str:
+    if 'skipped' in result:
+        return f"{key:<40} skipped: {result['skipped']}"
+    row = f"{key:<40} {result['seconds'] * 1000:>11.2f} ms {result['per_second'] or 0:>12,.0f}/s"
+    if 'us_per_item' in result:
+        row += f" {result['us_per_item']:>9.1f} us/item"
+    if 'peak_bytes' in result:
+        row += f" {result['peak_bytes'] / 2**20:>9.1f} MiB"
+    if 'retained_bytes_per_item' in result:
+        row += (f" {result['retained_bytes_per_item'] / 1024:>7.1f} KiB/item"
+                f" {result['objects_per_item']:>7.1f} obj/item")
+    if 'baseline_ratio' in result:
+        row += f"  x{result['baseline_ratio']:.2f} vs baseline"
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark parse, build, serialize and validate for each standard',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--sizes', default='1,100,1000',
+                        help='Comma-separated numbers of persons/objects (default: 1,100,1000)')
+    parser.add_argument('--only', action='append', default=[],
+                        help=f'Benchmark name or prefix (repeatable): {", ".join(BENCHMARKS)}')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark (default: 3)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc run')
+    parser.add_argument('--baseline', type=Path, nargs='?', const=BASELINE,
+                        help=f'Compare against a saved results file (default: {BASELINE.name})')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown vs baseline before failing (default: 0.25)')
+    parser.add_argument('--save-baseline', type=Path, help='Write results to this file')
+
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    names = [name for name in BENCHMARKS
+             if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+
+    results = {}
+    for name in names:
+        for n in sizes:
+            key = f'{name}[{n}]'
+            results[key] = run_benchmark(BENCHMARKS[name], n, args.repeat,
+                                         measure_memory=not args.no_memory)
+            print(format_row(key, results[key]), flush=True)
+
+    status = 0
+    if args.baseline:
+        saved = json.loads(args.baseline.read_text())
+        regressions = compare(results, saved['results'], args.tolerance)
+        print(f"\nCompared with {args.baseline} "
+              f"(Python {saved['python']}, {saved['platform']}):")
+        for key, result in results.items():
+            if 'baseline_ratio' in result:
+                print(format_row(key, result))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+            status = 1
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps({
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created': datetime.now(timezone.utc).isoformat(),
+            'results': {key: result for key, result in results.items() if 'skipped' not in result},
+        }, indent=2) + '\n')
+        print(f"\nResults saved to: {args.save_baseline}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
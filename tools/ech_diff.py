@@ -8,10 +8,19 @@ Compares original vs filtered XML files and displays a colored diff showing:
 - RED ✗ = Elements removed for privacy
 
 This is a reusable utility that works with any XML structure.
+
+With --changes, two deliveries (e.g. consecutive nightly exports) are
+instead compared per person with openmun_ech.diff, streaming both files, and
+only added/removed persons and changed paths are listed.
 """
 
+import sys
 import xml.etree.ElementTree as ET
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 # ANSI color codes
 RED = '\033[91m'
@@ -49,18 +58,27 @@ def compare_elements_recursive(orig: ET.Element, filt: ET.Element, indent: int =
     """
     ind = '  ' * indent
 
-    # Build maps of children by tag
-    orig_children = {child.tag: child for child in orig}
-    filt_children = {child.tag: child for child in filt}
+    # Group children by tag; repeated siblings (placeOfOrigin, ...) pair up by position
+    orig_children: Dict[str, List[ET.Element]] = {}
+    filt_children: Dict[str, List[ET.Element]] = {}
+    for child in orig:
+        orig_children.setdefault(child.tag, []).append(child)
+    for child in filt:
+        filt_children.setdefault(child.tag, []).append(child)
 
     # Get all unique child tags (sorted for consistent output)
     all_tags = sorted(set(orig_children.keys()) | set(filt_children.keys()))
 
-    for child_tag in all_tags:
-        if child_tag in orig_children and child_tag in filt_children:
+    pairs = [
+        (child_tag, i)
+        for child_tag in all_tags
+        for i in range(len(orig_children.get(child_tag, ())))
+    ]
+    for child_tag, i in pairs:
+        if i < len(filt_children.get(child_tag, ())):
             # Element exists in both - need to recurse
-            orig_child = orig_children[child_tag]
-            filt_child = filt_children[child_tag]
+            orig_child = orig_children[child_tag][i]
+            filt_child = filt_children[child_tag][i]
 
             child_tag_name = child_tag.split('}')[-1] if '}' in child_tag else child_tag
 
@@ -77,9 +95,9 @@ def compare_elements_recursive(orig: ET.Element, filt: ET.Element, indent: int =
                 compare_elements_recursive(orig_child, filt_child, indent + 1)
                 print(f"{GREEN}✓ {ind}</{child_tag_name}>{RESET}")
 
-        elif child_tag in orig_children and child_tag not in filt_children:
+        else:
             # Element only in original - removed (red)
-            print_element_colored(orig_children[child_tag], indent, RED, '✗ ')
+            print_element_colored(orig_children[child_tag][i], indent, RED, '✗ ')
 
 
 def compare_xml_files(original_path: str, filtered_path: str,
@@ -151,6 +169,42 @@ def compare_xml_files(original_path: str, filtered_path: str,
     print("\nYou can now manually verify each field that was kept vs removed.")
 
 
+def print_changes(original_path: str, other_path: str, key_name: str = 'local-person-id'):
+    """Compare two deliveries per person and print added/removed/changed persons."""
+    from openmun_ech.diff import ECH0020_VN, ECH0099_VN, diff_deliveries
+
+    key = None
+    if key_name == 'vn':
+        root = next(ET.iterparse(original_path, events=('start',)))[1].tag
+        key = ECH0020_VN if root.startswith('{http://www.ech.ch/xmlns/eCH-0020/') else ECH0099_VN
+    elif key_name != 'local-person-id':
+        raise ValueError(f"Unknown key {key_name!r} (choose local-person-id or vn)")
+
+    result = diff_deliveries(original_path, other_path, key=key)
+
+    print(f"\n{BOLD}STRUCTURAL DIFF{RESET}")
+    print("=" * 80)
+    print(f"\nOld: {original_path}")
+    print(f"New: {other_path}\n")
+    for entity_key in result.added:
+        print(f"{GREEN}+ {' / '.join(entity_key)}{RESET}")
+    for entity_key in result.removed:
+        print(f"{RED}- {' / '.join(entity_key)}{RESET}")
+    for entity in result.changed:
+        print(f"{BOLD}~ {' / '.join(entity.key)}{RESET}")
+        for change in entity.changes:
+            color = GREEN if change.kind == 'added' else RED if change.kind == 'removed' else ''
+            values = ''
+            if change.kind == 'changed':
+                values = f": {change.old!r} → {change.new!r}"
+            elif change.old or change.new:
+                values = f": {change.old or change.new!r}"
+            print(f"  {color}{change.kind:<8} {change.path}{values}{RESET}")
+
+    print(f"\n{BOLD}SUMMARY{RESET}: {len(result.added)} added, {len(result.removed)} removed, "
+          f"{len(result.changed)} changed, {result.unchanged} unchanged")
+
+
 def detect_entity_xpath(xml_path: str) -> tuple:
     """Auto-detect entity xpath based on XML content."""
     tree = ET.parse(xml_path)
@@ -193,9 +247,21 @@ def main():
                        help='XPath to get entity name (default: auto-detect)')
     parser.add_argument('--max-entities', type=int, default=None,
                        help='Maximum entities to show (default: all)')
+    parser.add_argument('--changes', action='store_true',
+                       help='List added/removed/changed persons instead (streams, for large deliveries)')
+    parser.add_argument('--key', choices=['local-person-id', 'vn'], default='local-person-id',
+                       help='Person key for --changes (default: local-person-id)')
 
     args = parser.parse_args()
 
+    if args.changes:
+        try:
+            print_changes(args.original, args.filtered, args.key)
+        except ValueError as e:
+            print(f"{RED}Error: {e}{RESET}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     # Auto-detect if not specified
     if args.entity_xpath is None or args.name_xpath is None:
         entity_xpath, name_xpath = detect_entity_xpath(args.original)
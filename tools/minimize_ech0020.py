@@ -10,19 +10,21 @@ Applies privacy-first filtering to eCH-0020 base delivery:
 - Keeps parent names (nameOfFather/nameOfMother in birthAddonData)
 - Replaces vendor info with openmun (by default)
 
-Then shows complete XML diff with color coding.
+Then shows complete XML diff with color coding (--no-diff for large files).
+
+Filtering streams element by element (openmun_ech.ech0020.minimize,
+PRIVACY_POLICY), so full-register exports run in constant memory.
 """
 
 import sys
 import argparse
-import xml.etree.ElementTree as ET
 from pathlib import Path
 import re
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from openmun_ech.ech0020.v3 import ECH0020Delivery
+from openmun_ech.ech0020.minimize import PRIVACY_POLICY, MinimizationPolicy, minimize_delivery
 
 # Import general diff tool
 from ech_diff import compare_xml_files
@@ -52,62 +54,40 @@ def main():
     parser.add_argument('output', type=Path, help='Output XML file')
     parser.add_argument('--keep-original-vendor', action='store_true',
                        help='Keep original vendor information (default: replace with openmun)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Filter in this many worker processes')
+    parser.add_argument('--no-diff', action='store_true',
+                       help='Skip the XML diff (re-parses both files in memory)')
 
     args = parser.parse_args()
 
     input_file = args.input
     output_file = args.output
-    keep_vendor = args.keep_original_vendor
-
-    # Parse original
-    tree = ET.parse(input_file)
-    root = tree.getroot()
-
-    # Parse to Pydantic and filter
-    print("Loading and filtering eCH-0020 data...")
-    delivery = ECH0020Delivery.from_xml(root)
-
-    # Apply eCH-0020 specific filtering
-    # delivery.event is a list of events, each with base_delivery_person
-    for event in delivery.event:
-        if hasattr(event, 'base_delivery_person') and event.base_delivery_person:
-            person = event.base_delivery_person
-
-            # Remove VN (always remove - privacy-sensitive)
-            if person.person_identification and person.person_identification.vn:
-                person.person_identification.vn = None
-
-            # Remove optional privacy-sensitive data
-            # NOTE: contact_data is KEPT (contains c/o addresses for care homes)
-            person.job_data = None
-            person.health_insurance_data = None
-            person.armed_forces_data = None
-            person.civil_defense_data = None
-            person.fire_service_data = None
-            person.person_additional_data = None
-            person.matrimonial_inheritance_arrangement_data = None
-            person.political_right_data = None
-
-            # Remove guardian relationships only (keep parental - father/mother names)
-            # NOTE: parental_relationship is KEPT (contains father/mother names for genealogy)
-            person.guardian_relationship = []
-
-    # Replace vendor information (unless --keep-original-vendor)
-    if not keep_vendor:
-        if hasattr(delivery.delivery_header, 'sending_application') and delivery.delivery_header.sending_application:
-            app = delivery.delivery_header.sending_application
-            app.manufacturer = "openmun"
-            app.product = "openmun"
-            app.product_version = get_project_version()
-
-    # Export filtered XML
-    filtered_root = delivery.to_xml()
-    filtered_tree = ET.ElementTree(filtered_root)
-    ET.indent(filtered_tree, space='  ')
+
+    policy = PRIVACY_POLICY
+    if not args.keep_original_vendor:
+        application = '**/eCH-0058*:sendingApplication'
+        policy = MinimizationPolicy(
+            drop=PRIVACY_POLICY.drop,
+            keep=PRIVACY_POLICY.keep,
+            replace={
+                f'{application}/eCH-0058*:manufacturer': 'openmun',
+                f'{application}/eCH-0058*:product': 'openmun',
+                f'{application}/eCH-0058*:productVersion': get_project_version(),
+            },
+        )
+
+    print("Filtering eCH-0020 data...")
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    filtered_tree.write(output_file, encoding='utf-8', xml_declaration=True)
+    result = minimize_delivery(input_file, output_file, policy, workers=args.workers)
+
+    print(f"Filtered file saved to: {output_file} ({result.messages} messages)")
+    for rule, count in result.counts.items():
+        print(f"  {count:>8}  {rule.rsplit('/', 1)[-1]}")
+    print()
 
-    print(f"Filtered file saved to: {output_file}\n")
+    if args.no_diff:
+        return
 
     # Use general diff tool to compare (baseDeliveryPerson in eCH-0020 namespace)
     compare_xml_files(
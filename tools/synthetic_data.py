@@ -0,0 +1,860 @@
+#!/usr/bin/env python3
+"""Synthetic Register Data for Load Testing
+==========================================
+
+Generates realistic-looking, fictive register data of arbitrary size
+(production data must never be used, see tests/test_no_production_data_leakage.py):
+
+- eCH-0020 BaseDeliveryEvent (BaseDeliveryPerson + residence)
+- eCH-0099 StatisticsDeliveryEvent
+- eCH-0129 buildings
+- eCH-0133 parcels (realestate information with building and tax value)
+
+All outputs derive from one building register: building plans are generated
+first and their dwellings are filled with households, so EGID/EWID of a
+person match the buildings and parcels generated with the same seed.
+
+Distributions (approximate, per person):
+- Households: 36% single, 28% couple, 27% couple with children,
+  6% single parent, collective households (care homes) in 1% of buildings
+- Family relations: spouses reference each other, children reference
+  both parents (joint parental authority)
+- 26% foreigners (60% EU/EFTA), permits C 55%, B 35%, L 6%, F 4%;
+  a quarter of them born in Switzerland (second generation)
+- 4% secondary residences (weekly residents with main residence elsewhere),
+  3% of main residents with a secondary residence elsewhere
+
+Names, VNs and addresses are fictive; BFS municipality and country codes
+are real. Output is deterministic for a given seed.
+
+Everything is generated lazily, so deliveries with millions of persons are
+written through the streaming writers without holding them in memory.
+
+Usage:
+    python tools/synthetic_data.py ech0020 base_delivery.xml --count 1000000
+    python tools/synthetic_data.py ech0099 statpop.xml --count 1000000 --seed 7
+    python tools/synthetic_data.py ech0133 parcels.xml --count 100000
+
+    # As a library (e.g. from tools/benchmark.py)
+    from synthetic_data import SyntheticRegister
+    events = list(SyntheticRegister(seed=1).ech0020_events(1000))
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+REFERENCE_DATE = date(2024, 12, 31)
+MESSAGE_DATE = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+# ============================================================================
+# Reference data (real BFS codes, fictive names)
+# ============================================================================
+
+@dataclass(frozen=True)
+class Municipality:
+    bfs: int
+    name: str
+    canton: str
+    zip_codes: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class Country:
+    bfs: int
+    iso: str
+    name: str
+    eu_efta: bool
+
+
+ZURICH = Municipality(261, "Zürich", "ZH", (8001, 8003, 8004, 8005, 8006, 8008))
+
+# Previous / secondary / main residences elsewhere
+OTHER_MUNICIPALITIES = (
+    Municipality(230, "Winterthur", "ZH"),
+    Municipality(351, "Bern", "BE"),
+    Municipality(1061, "Luzern", "LU"),
+    Municipality(2701, "Basel", "BS"),
+    Municipality(3203, "St. Gallen", "SG"),
+    Municipality(3851, "Davos", "GR"),
+    Municipality(5192, "Lugano", "TI"),
+    Municipality(5586, "Lausanne", "VD"),
+)
+
+# (country, weight among foreigners)
+COUNTRIES = (
+    (Country(8218, "IT", "Italien", True), 14),
+    (Country(8207, "DE", "Deutschland", True), 14),
+    (Country(8231, "PT", "Portugal", True), 12),
+    (Country(8212, "FR", "Frankreich", True), 8),
+    (Country(8236, "ES", "Spanien", True), 6),
+    (Country(8229, "AT", "Österreich", True), 6),
+    (Country(8256, "XK", "Kosovo", False), 16),
+    (Country(8239, "TR", "Türkei", False), 14),
+    (Country(8248, "RS", "Serbien", False), 10),
+)
+
+# Fictive names composed from syllables (no real persons)
+_SURNAME_STEMS = ("Muster", "Beispiel", "Probe", "Demo", "Fiktiv", "Tester", "Model", "Schema")
+_SURNAME_ENDINGS = ("", "mann", "li", "er", "berg", "egger", "hofer", "ini", "ovic", "eiro")
+_FIRST_STEMS = ("Al", "Be", "Ca", "Do", "El", "Fi", "Ga", "Hu", "Ir", "Jo",
+                "Ka", "Lu", "Ma", "No", "Ol", "Pe", "Ri", "Sa", "Ti", "Va")
+_FEMALE_ENDINGS = ("na", "ra", "lia", "nora", "ssa")
+_MALE_ENDINGS = ("n", "ro", "mo", "lix", "dan")
+_STREETS = ("Musterstrasse", "Beispielweg", "Testgasse", "Probeplatz", "Demoallee",
+            "Schemaweg", "Fiktivstrasse", "Modellrain")
+
+# (code, weight): röm.-kath., ev.-ref., islamic, unknown/none
+_RELIGIONS = (("111", 32), ("121", 21), ("211", 6), ("000", 41))
+
+# (household kind, weight)
+_HOUSEHOLDS = (("single", 36), ("couple", 28), ("family", 27), ("single_parent", 6))
+
+# (permit code for EU/EFTA, non-EU/EFTA, weight); eCH-0006 residencePermitType
+_PERMITS = (("0301", "0302", 55), ("0201", "0202", 35), ("0701", "0702", 6), ("0503", "0503", 4))
+
+
+def _pick(rng: random.Random, weighted):
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights)[0]
+
+
+def _vn(serial: int) -> str:
+    """Fictive AHV-13 number with valid EAN-13 check digit."""
+    body = f"756{serial:09d}"
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(body))
+    return body + str(-total % 10)
+
+
+def _random_date(rng: random.Random, start: date, end: date) -> date:
+    if end <= start:
+        return start
+    return start + timedelta(days=rng.randrange((end - start).days))
+
+
+def _years_after(d: date, years: int) -> date:
+    try:
+        return d.replace(year=d.year + years)
+    except ValueError:  # 29 February
+        return d.replace(year=d.year + years, day=28)
+
+
+# ============================================================================
+# Register model (plain data, converted to eCH models on output)
+# ============================================================================
+
+@dataclass
+class BuildingPlan:
+    egid: int
+    street: str
+    house_number: str
+    zip_code: int
+    esid: int
+    dwellings: int
+    floors: int
+    year_of_construction: int
+    east: int
+    north: int
+    collective: bool = False
+
+
+@dataclass
+class Resident:
+    serial: int
+    official_name: str
+    first_name: str
+    sex: str
+    date_of_birth: date
+    religion: str
+    marital_status: str = "1"
+    date_of_marital_status: Optional[date] = None
+    nationality: Optional[Country] = None  # None = Swiss
+    origin: Optional[Municipality] = None
+    residence_permit: Optional[str] = None
+    permit_valid_from: Optional[date] = None
+    entry_date: Optional[date] = None
+    birth_municipality: Optional[Municipality] = None
+    birth_country: Optional[Country] = None
+    arrival_date: date = REFERENCE_DATE
+    comes_from: Optional[object] = None  # Municipality, Country or None (born here)
+    building: Optional[BuildingPlan] = None
+    ewid: Optional[int] = None
+    household_id: str = ""
+    type_of_household: str = "1"
+    spouse: Optional['Resident'] = None
+    parents: List['Resident'] = field(default_factory=list)
+    main_residence: Optional[Municipality] = None  # Set for SECONDARY residents
+    secondary_residence: Optional[Municipality] = None
+
+    @property
+    def local_person_id(self) -> str:
+        return str(100000 + self.serial)
+
+    @property
+    def vn(self) -> str:
+        return _vn(self.serial)
+
+
+class SyntheticRegister:
+    """Deterministic generator of a fictive municipal register.
+
+    Args:
+        seed: Random seed (same seed → same register)
+        municipality: Reporting municipality (real BFS code)
+    """
+
+    def __init__(self, seed: int = 0, municipality: Municipality = ZURICH):
+        self.seed = seed
+        self.municipality = municipality
+        self.local_id_category = f"MU.{municipality.bfs}"
+
+    # ------------------------------------------------------------------
+    # Buildings
+    # ------------------------------------------------------------------
+
+    def buildings(self) -> Iterator[BuildingPlan]:
+        """Endless stream of building plans (independent of households)."""
+        rng = random.Random(f"{self.seed}:buildings")
+        m = self.municipality
+        index = 0
+        while True:
+            street_index, house_number = divmod(index, 120)
+            repeat, street = divmod(street_index, len(_STREETS))
+            collective = rng.random() < 0.01
+            kind = rng.random()
+            dwellings = 1 if kind < 0.3 else rng.randint(2, 6) if kind < 0.75 else rng.randint(7, 40)
+            yield BuildingPlan(
+                egid=100000 + index,
+                street=_STREETS[street] + (f" {repeat + 1}" if repeat else ""),
+                house_number=str(house_number + 1),
+                zip_code=m.zip_codes[street_index % len(m.zip_codes)] if m.zip_codes else 8000,
+                esid=10000000 + street_index,
+                dwellings=0 if collective else dwellings,
+                floors=max(1, min(20, dwellings // 2 + rng.randint(0, 2))),
+                year_of_construction=rng.choice((rng.randint(1850, 1945), rng.randint(1946, 2024))),
+                east=2600000 + rng.randrange(80000),
+                north=1200000 + rng.randrange(60000),
+                collective=collective,
+            )
+            index += 1
+
+    # ------------------------------------------------------------------
+    # Persons
+    # ------------------------------------------------------------------
+
+    def residents(self) -> Iterator[Resident]:
+        """Endless stream of residents, household by household."""
+        rng = random.Random(f"{self.seed}:residents")
+        serial = 0
+        household = 0
+        for building in self.buildings():
+            if building.collective:
+                groups = [("collective", None)]
+            else:
+                groups = [(_pick(rng, _HOUSEHOLDS), ewid) for ewid in range(1, building.dwellings + 1)
+                          if rng.random() < 0.93]  # 7% vacant dwellings
+            for kind, ewid in groups:
+                members = self._household(rng, kind, serial)
+                household += 1
+                for member in members:
+                    member.building = building
+                    member.ewid = ewid
+                    member.household_id = str(household)
+                    member.type_of_household = "2" if kind == "collective" else "1"
+                    yield member
+                serial += len(members)
+
+    def _household(self, rng: random.Random, kind: str, serial: int) -> List[Resident]:
+        if kind == "collective":
+            return [self._adult(rng, serial + i, age=(75, 100)) for i in range(rng.randint(20, 60))]
+        first = self._adult(rng, serial)
+        if kind == "single":
+            if rng.random() < 0.25:  # Weekly resident
+                first.main_residence = rng.choice(OTHER_MUNICIPALITIES)
+                first.comes_from = first.main_residence
+                first.secondary_residence = None
+            return [first]
+        if kind == "single_parent":
+            return [first] + self._children(rng, [first], serial + 1, rng.randint(1, 2))
+
+        second = self._partner(rng, first, serial + 1)
+        members = [first, second]
+        if kind == "family":
+            members += self._children(rng, members, serial + 2, _pick(rng, ((1, 40), (2, 45), (3, 15))))
+        return members
+
+    def _adult(self, rng: random.Random, serial: int, age=(18, 90),
+               sex: Optional[str] = None, nationality: Optional[Country] = None,
+               name: Optional[str] = None) -> Resident:
+        sex = sex or rng.choice("12")
+        born = _random_date(rng, REFERENCE_DATE.replace(year=REFERENCE_DATE.year - age[1]),
+                            REFERENCE_DATE.replace(year=REFERENCE_DATE.year - age[0]))
+        if nationality is None and rng.random() < 0.22:
+            nationality = _pick(rng, COUNTRIES)
+        person = Resident(
+            serial=serial,
+            official_name=name or self._surname(rng),
+            first_name=self._first_name(rng, sex),
+            sex=sex,
+            date_of_birth=born,
+            religion=_pick(rng, _RELIGIONS),
+        )
+        if age[0] >= 75 and rng.random() < 0.5:
+            person.marital_status = "3"
+            person.date_of_marital_status = _random_date(rng, _years_after(born, 60), REFERENCE_DATE)
+        elif rng.random() < 0.15 and _years_after(born, 30) < REFERENCE_DATE:
+            person.marital_status = "4"
+            person.date_of_marital_status = _random_date(rng, _years_after(born, 25), REFERENCE_DATE)
+        self._citizenship(rng, person, nationality, born_here=rng.random() < 0.25)
+        self._arrival(rng, person)
+        if person.main_residence is None and rng.random() < 0.03:
+            person.secondary_residence = rng.choice(OTHER_MUNICIPALITIES)
+        return person
+
+    def _partner(self, rng: random.Random, first: Resident, serial: int) -> Resident:
+        # Partners mostly share nationality; the family name is shared in half of the couples
+        nationality = first.nationality if rng.random() < 0.8 else None
+        sex = "2" if first.sex == "1" else "1"
+        if rng.random() < 0.02:
+            sex = first.sex  # Registered partnership
+        second = self._adult(rng, serial, sex=sex, nationality=nationality,
+                             name=first.official_name if rng.random() < 0.5 else None)
+        lower = max(first.date_of_birth, second.date_of_birth)
+        married = _random_date(rng, _years_after(lower, 20), REFERENCE_DATE)
+        status = "6" if first.sex == second.sex else "2"
+        for person, other in ((first, second), (second, first)):
+            person.marital_status = status
+            person.date_of_marital_status = married
+            person.spouse = other
+        second.arrival_date = max(second.arrival_date, first.arrival_date)
+        second.comes_from = first.comes_from
+        return second
+
+    def _children(self, rng: random.Random, parents: List[Resident], serial: int,
+                  count: int) -> List[Resident]:
+        youngest_parent = max(p.date_of_birth for p in parents)
+        earliest = max(_years_after(youngest_parent, 18), REFERENCE_DATE.replace(year=REFERENCE_DATE.year - 25))
+        children = []
+        for i in range(count):
+            sex = rng.choice("12")
+            born = _random_date(rng, earliest, REFERENCE_DATE)
+            child = Resident(
+                serial=serial + i,
+                official_name=parents[0].official_name,
+                first_name=self._first_name(rng, sex),
+                sex=sex,
+                date_of_birth=born,
+                religion=parents[0].religion,
+                parents=list(parents),
+            )
+            self._citizenship(rng, child, parents[0].nationality, born_here=True,
+                              origin=parents[0].origin)
+            child.arrival_date = max(born, min(p.arrival_date for p in parents))
+            child.comes_from = None if child.arrival_date == born else parents[0].comes_from
+            children.append(child)
+        return children
+
+    def _citizenship(self, rng: random.Random, person: Resident, nationality: Optional[Country],
+                     born_here: bool, origin: Optional[Municipality] = None) -> None:
+        person.nationality = nationality
+        if nationality is None:
+            person.origin = origin or rng.choice((self.municipality,) + OTHER_MUNICIPALITIES)
+            person.birth_municipality = (self.municipality if born_here
+                                         else rng.choice(OTHER_MUNICIPALITIES))
+            return
+        eu_code, non_eu_code, _ = rng.choices(_PERMITS, [w for *_, w in _PERMITS])[0]
+        if born_here:
+            person.birth_municipality = self.municipality
+            person.residence_permit = "0301" if nationality.eu_efta else "0302"
+        else:
+            person.birth_country = nationality
+            person.residence_permit = eu_code if nationality.eu_efta else non_eu_code
+
+    def _arrival(self, rng: random.Random, person: Resident) -> None:
+        adult = _years_after(person.date_of_birth, 18)
+        if person.birth_municipality == self.municipality and rng.random() < 0.4:
+            person.arrival_date = person.date_of_birth
+            person.comes_from = None
+        else:
+            person.arrival_date = _random_date(rng, max(adult, date(1980, 1, 1)), REFERENCE_DATE)
+            person.comes_from = person.birth_country or rng.choice(OTHER_MUNICIPALITIES)
+        if person.nationality is not None:
+            if person.birth_country is not None:
+                person.entry_date = person.arrival_date
+            person.permit_valid_from = person.arrival_date
+
+    @staticmethod
+    def _surname(rng: random.Random) -> str:
+        return rng.choice(_SURNAME_STEMS) + rng.choice(_SURNAME_ENDINGS)
+
+    @staticmethod
+    def _first_name(rng: random.Random, sex: str) -> str:
+        return rng.choice(_FIRST_STEMS) + rng.choice(_FEMALE_ENDINGS if sex == "2" else _MALE_ENDINGS)
+
+    # ------------------------------------------------------------------
+    # eCH-0020
+    # ------------------------------------------------------------------
+
+    def ech0020_events(self, n: int) -> Iterator:
+        """First n residents as eCH-0020 BaseDeliveryEvent."""
+        return (self.to_base_delivery_event(r) for r in islice(self.residents(), n))
+
+    def _person_identification(self, person: Resident):
+        from openmun_ech.ech0020 import DatePrecision, PersonIdentification
+        return PersonIdentification(
+            vn=person.vn,
+            local_person_id=person.local_person_id,
+            local_person_id_category=self.local_id_category,
+            official_name=person.official_name,
+            first_name=person.first_name,
+            sex=person.sex,
+            date_of_birth=person.date_of_birth,
+            date_of_birth_precision=DatePrecision.FULL,
+        )
+
+    def _ech0020_destination(self, origin):
+        from openmun_ech.ech0020 import DestinationInfo, PlaceType
+        if isinstance(origin, Country):
+            return DestinationInfo(place_type=PlaceType.FOREIGN, country_id=str(origin.bfs),
+                                   country_iso=origin.iso, country_name_short=origin.name)
+        return DestinationInfo(place_type=PlaceType.SWISS, municipality_bfs=str(origin.bfs),
+                               municipality_name=origin.name, canton_abbreviation=origin.canton)
+
+    def to_base_delivery_event(self, r: Resident):
+        from openmun_ech.ech0020 import (
+            BaseDeliveryEvent,
+            BaseDeliveryPerson,
+            CareType,
+            DwellingAddressInfo,
+            ParentInfo,
+            PlaceType,
+            ResidenceType,
+            SecondaryResidenceInfo,
+            TypeOfRelationship,
+        )
+        m = self.municipality
+        person = dict(
+            vn=r.vn,
+            local_person_id=r.local_person_id,
+            local_person_id_category=self.local_id_category,
+            official_name=r.official_name,
+            first_name=r.first_name,
+            sex=r.sex,
+            date_of_birth=r.date_of_birth,
+            religion=r.religion,
+            marital_status=r.marital_status,
+            date_of_marital_status=r.date_of_marital_status,
+            nationality_status="2",
+            data_lock="0",
+        )
+        if r.birth_municipality is not None:
+            person.update(birth_place_type=PlaceType.SWISS,
+                          birth_municipality_bfs=str(r.birth_municipality.bfs),
+                          birth_municipality_name=r.birth_municipality.name,
+                          birth_canton_abbreviation=r.birth_municipality.canton)
+        else:
+            person.update(birth_place_type=PlaceType.FOREIGN,
+                          birth_country_id=str(r.birth_country.bfs),
+                          birth_country_iso=r.birth_country.iso,
+                          birth_country_name_short=r.birth_country.name)
+        if r.nationality is None:
+            person.update(places_of_origin=[{"bfs_code": str(r.origin.bfs), "name": r.origin.name,
+                                             "canton": r.origin.canton}])
+        else:
+            person.update(
+                nationalities=[{"country_id": str(r.nationality.bfs), "country_iso": r.nationality.iso,
+                                "country_name_short": r.nationality.name}],
+                residence_permit=r.residence_permit,
+                residence_permit_valid_from=r.permit_valid_from,
+                entry_date=r.entry_date,
+            )
+        if r.spouse is not None:
+            person.update(
+                spouse=self._person_identification(r.spouse),
+                marital_relationship_type=(TypeOfRelationship.REGISTERED_PARTNER
+                                           if r.marital_status == "6" else TypeOfRelationship.SPOUSE),
+            )
+        if r.parents:
+            if _years_after(r.date_of_birth, 18) <= REFERENCE_DATE:
+                care = CareType.UNKNOWN  # Adult child (eCH-0021 v7 has no "none")
+            elif len(r.parents) > 1:
+                care = CareType.JOINT_PARENTAL_AUTHORITY
+            else:
+                care = CareType.SOLE_PARENTAL_AUTHORITY
+            person.update(parents=[
+                ParentInfo(
+                    person=self._person_identification(p),
+                    relationship_type=TypeOfRelationship.MOTHER if p.sex == "2" else TypeOfRelationship.FATHER,
+                    care=care,
+                    relationship_valid_from=r.date_of_birth,
+                )
+                for p in r.parents
+            ])
+
+        event = dict(
+            person=BaseDeliveryPerson(**person),
+            residence_type=ResidenceType.MAIN,
+            reporting_municipality_bfs=str(m.bfs),
+            reporting_municipality_name=m.name,
+            reporting_municipality_canton=m.canton,
+            arrival_date=r.arrival_date,
+            comes_from=self._ech0020_destination(r.comes_from) if r.comes_from else None,
+            dwelling_address=DwellingAddressInfo(
+                egid=r.building.egid,
+                ewid=r.ewid,
+                household_id=r.household_id,
+                street=r.building.street,
+                house_number=r.building.house_number,
+                town=m.name,
+                swiss_zip_code=r.building.zip_code,
+                type_of_household=r.type_of_household,
+            ),
+        )
+        if r.main_residence is not None:
+            event.update(residence_type=ResidenceType.SECONDARY,
+                         main_residence_bfs=str(r.main_residence.bfs),
+                         main_residence_name=r.main_residence.name,
+                         main_residence_canton=r.main_residence.canton)
+        elif r.secondary_residence is not None:
+            s = r.secondary_residence
+            event.update(secondary_residence_list=[
+                SecondaryResidenceInfo(bfs=str(s.bfs), name=s.name, canton=s.canton)
+            ])
+        return BaseDeliveryEvent(**event)
+
+    # ------------------------------------------------------------------
+    # eCH-0099
+    # ------------------------------------------------------------------
+
+    def ech0099_events(self, n: int) -> Iterator:
+        """First n residents as eCH-0099 StatisticsDeliveryEvent."""
+        return (self.to_statistics_event(r) for r in islice(self.residents(), n))
+
+    def _ech0099_destination(self, origin):
+        from openmun_ech.ech0099 import DestinationInfo, PlaceType
+        if isinstance(origin, Country):
+            return DestinationInfo(place_type=PlaceType.FOREIGN, country_id=origin.bfs,
+                                   country_iso2=origin.iso, country_name=origin.name)
+        return DestinationInfo(place_type=PlaceType.SWISS, municipality_bfs=origin.bfs,
+                               municipality_name=origin.name, municipality_canton=origin.canton)
+
+    def to_statistics_event(self, r: Resident):
+        from openmun_ech.ech0099 import (
+            DwellingAddressInfo,
+            NationalityType,
+            PlaceOfOriginInfo,
+            PlaceType,
+            ResidenceType,
+            StatisticsDeliveryEvent,
+            StatisticsPerson,
+        )
+        m = self.municipality
+        person = dict(
+            vn=r.vn,
+            local_person_id=r.local_person_id,
+            local_person_id_category=self.local_id_category,
+            official_name=r.official_name,
+            first_name=r.first_name,
+            sex=r.sex,
+            date_of_birth=r.date_of_birth,
+            religion=r.religion,
+            marital_status=r.marital_status,
+            date_of_marital_status=r.date_of_marital_status,
+            nationality_status="2",
+        )
+        if r.birth_municipality is not None:
+            person.update(birth_place_type=PlaceType.SWISS,
+                          birth_municipality_bfs=r.birth_municipality.bfs,
+                          birth_municipality_name=r.birth_municipality.name,
+                          birth_municipality_canton=r.birth_municipality.canton)
+        else:
+            person.update(birth_place_type=PlaceType.FOREIGN,
+                          birth_country_id=r.birth_country.bfs,
+                          birth_country_iso2=r.birth_country.iso,
+                          birth_country_name=r.birth_country.name)
+        if r.nationality is None:
+            person.update(nationality_type=NationalityType.SWISS,
+                          nationality_country_name="Schweiz",
+                          places_of_origin=[PlaceOfOriginInfo(origin_name=r.origin.name,
+                                                              canton=r.origin.canton)])
+        else:
+            person.update(nationality_type=NationalityType.FOREIGN,
+                          nationality_country_id=r.nationality.bfs,
+                          nationality_country_iso2=r.nationality.iso,
+                          nationality_country_name=r.nationality.name,
+                          residence_permit=r.residence_permit,
+                          residence_permit_valid_from=r.permit_valid_from,
+                          entry_date=r.entry_date)
+
+        event = dict(
+            person=StatisticsPerson(**person),
+            residence_type=ResidenceType.MAIN,
+            reporting_municipality_bfs=m.bfs,
+            reporting_municipality_name=m.name,
+            reporting_municipality_canton=m.canton,
+            arrival_date=r.arrival_date,
+            comes_from=self._ech0099_destination(r.comes_from) if r.comes_from else None,
+            dwelling_address=DwellingAddressInfo(
+                egid=r.building.egid,
+                ewid=r.ewid,
+                household_id=r.household_id,
+                street=r.building.street,
+                house_number=r.building.house_number,
+                town=m.name,
+                swiss_zip_code=r.building.zip_code,
+                type_of_household=r.type_of_household,
+            ),
+        )
+        if r.main_residence is not None:
+            event.update(residence_type=ResidenceType.SECONDARY,
+                         main_residence_bfs=r.main_residence.bfs,
+                         main_residence_name=r.main_residence.name,
+                         main_residence_canton=r.main_residence.canton)
+        elif r.secondary_residence is not None:
+            s = r.secondary_residence
+            event.update(secondary_residences=[{'bfs': s.bfs, 'name': s.name, 'canton': s.canton}])
+        return StatisticsDeliveryEvent(**event)
+
+    # ------------------------------------------------------------------
+    # eCH-0129 / eCH-0133
+    # ------------------------------------------------------------------
+
+    def ech0129_buildings(self, n: int) -> Iterator:
+        """First n building plans as eCH-0129 buildings (with entrance)."""
+        return (self.to_building(b) for b in islice(self.buildings(), n))
+
+    def to_building(self, b: BuildingPlan):
+        from openmun_ech.ech0129 import (
+            BuildingCategory,
+            BuildingStatus,
+            ECH0129Building,
+            ECH0129BuildingDate,
+            ECH0129BuildingEntrance,
+            ECH0129Coordinates,
+            ECH0129NamedId,
+            ECH0129StreetSection,
+        )
+        return ECH0129Building(
+            egid=b.egid,
+            date_of_construction=ECH0129BuildingDate(year=str(b.year_of_construction)),
+            number_of_floors=b.floors,
+            building_category=(BuildingCategory.PARTIAL_RESIDENTIAL if b.collective
+                               else BuildingCategory.RESIDENTIAL_ONLY),
+            status=BuildingStatus.EXISTING,
+            coordinates=ECH0129Coordinates(east=f"{b.east}.000", north=f"{b.north}.000"),
+            building_entrance=[ECH0129BuildingEntrance(
+                egaid=100000000 + b.egid,
+                edid=0,
+                building_entrance_no=b.house_number,
+                local_id=ECH0129NamedId(id_category="EDID", id_value=str(b.egid)),
+                street_section=ECH0129StreetSection(
+                    esid=b.esid,
+                    local_id=ECH0129NamedId(id_category="ESID", id_value=str(b.esid)),
+                    swiss_zip_code=b.zip_code,
+                    swiss_zip_code_add_on="00",
+                ),
+            )],
+        )
+
+    def ech0133_realestates(self, n: int) -> Iterator:
+        """First n building plans as eCH-0133 parcels (one building each)."""
+        rng = random.Random(f"{self.seed}:parcels")
+        return (self.to_realestate_information(b, rng) for b in islice(self.buildings(), n))
+
+    def to_realestate_information(self, b: BuildingPlan, rng: random.Random):
+        from openmun_ech.ech0007.v6 import ECH0007v6SwissMunicipality
+        from openmun_ech.ech0044.v4 import ECH0044PersonIdentificationLight
+        from openmun_ech.ech0129 import (
+            AreaDescriptionCode,
+            AreaType,
+            BuildingCategory,
+            ECH0129Area,
+            ECH0129BuildingOnly,
+            ECH0129EstimationObject,
+            ECH0129EstimationValue,
+            ECH0129FiscalOwnership,
+            ECH0129NamedId,
+            ECH0129PersonIdentification,
+            ECH0129Realestate,
+            ECH0129RealestateIdentification,
+            ECH0129Value,
+            FiscalRelationship,
+            RealestateType,
+            TypeOfValue,
+        )
+        from openmun_ech.ech0133 import (
+            ECH0133BuildingInfo,
+            ECH0133FiscalOwnershipInfo,
+            ECH0133RealestateInfo,
+        )
+        m = self.municipality
+        area = rng.randint(250, 900) + 120 * b.dwellings
+        tax_value = 1000 * (rng.randint(300, 900) + 250 * b.dwellings)
+
+        def estimation(category: str):
+            return ECH0129EstimationObject(
+                local_id=ECH0129NamedId(id_category=category, id_value=str(b.egid)),
+                estimation_value=[ECH0129EstimationValue(
+                    local_id=ECH0129NamedId(id_category="VAL", id_value=str(b.egid)),
+                    value=ECH0129Value(amount=f"{tax_value}.00"),
+                    type_of_value=TypeOfValue.TAX_VALUE,
+                )],
+            )
+
+        owners = 1 if b.dwellings <= 1 else rng.choice((1, 2, 2, 3))
+        return ECH0133RealestateInfo(
+            realestate=ECH0129Realestate(
+                realestate_identification=ECH0129RealestateIdentification(
+                    egrid=f"CH{b.egid:012d}", number=str(b.egid - 99000),
+                ),
+                realestate_type=RealestateType.LIEGENSCHAFT,
+            ),
+            municipality=ECH0007v6SwissMunicipality(municipality_id=str(m.bfs), municipality_name=m.name),
+            area=[ECH0129Area(
+                area_type=AreaType.GROUND_COVER,
+                area_description_code=AreaDescriptionCode.GEBAEUDE,
+                area_description="Gebaeude",
+                area_value=f"{area}.00",
+            )],
+            fiscal_ownership_information=[
+                ECH0133FiscalOwnershipInfo(
+                    fiscal_ownership=ECH0129FiscalOwnership(
+                        accession_date=date(rng.randint(b.year_of_construction, 2024)
+                                            if b.year_of_construction > 1960 else rng.randint(1960, 2024),
+                                            1, 1),
+                        fiscal_relationship=FiscalRelationship.OWNER,
+                        denominator=f"{owners}.000",
+                        numerator="1.000",
+                    ),
+                    person_identification=ECH0129PersonIdentification(
+                        individual=ECH0044PersonIdentificationLight(
+                            official_name=self._surname(rng),
+                            first_name=self._first_name(rng, rng.choice("12")),
+                        ),
+                    ),
+                )
+                for _ in range(owners)
+            ],
+            estimation_object=estimation("SCH"),
+            building_information=[ECH0133BuildingInfo(
+                building=ECH0129BuildingOnly(
+                    egid=b.egid,
+                    number_of_floors=b.floors,
+                    building_category=(BuildingCategory.PARTIAL_RESIDENTIAL if b.collective
+                                       else BuildingCategory.RESIDENTIAL_ONLY),
+                ),
+                estimation_object=[estimation("GEB")],
+            )],
+        )
+
+    # ------------------------------------------------------------------
+    # Configs
+    # ------------------------------------------------------------------
+
+    def ech0020_config(self):
+        from openmun_ech.ech0020 import DeliveryConfig
+        return DeliveryConfig(
+            sender_id=f"T1-{self.municipality.bfs}-1",
+            manufacturer="OpenMun Synthetic",
+            product="SyntheticRegister",
+            product_version="1.0.0",
+            test_delivery_flag=True,
+        )
+
+    def ech0099_config(self):
+        from openmun_ech.ech0099 import StatisticsDeliveryConfig
+        return StatisticsDeliveryConfig(
+            sender_id=f"T1-{self.municipality.bfs}-1",
+            manufacturer="OpenMun Synthetic",
+            product="SyntheticRegister",
+            product_version="1.0.0",
+            test_delivery_flag=True,
+        )
+
+    def ech0133_header(self, message_id: str = "synthetic"):
+        from openmun_ech.ech0058.v5 import ECH0058Header, ECH0058SendingApplication
+        return ECH0058Header(
+            sender_id=f"T1-{self.municipality.bfs}-1",
+            message_id=message_id,
+            message_type="0133",
+            action="1",
+            sending_application=ECH0058SendingApplication(
+                manufacturer="OpenMun Synthetic", product="SyntheticRegister", product_version="1.0.0",
+            ),
+            message_date=MESSAGE_DATE,
+            test_delivery_flag=True,
+        )
+
+
+# ============================================================================
+# Output
+# ============================================================================
+
+def write_ech0020(register: SyntheticRegister, count: int, output: Path, pretty_print: bool) -> int:
+    from openmun_ech.ech0020.streaming import write_base_delivery
+    return write_base_delivery(register.ech0020_events(count), register.ech0020_config(), output,
+                               message_id=f"synthetic-{register.seed}", message_date=MESSAGE_DATE,
+                               pretty_print=pretty_print)
+
+
+def write_ech0099(register: SyntheticRegister, count: int, output: Path, pretty_print: bool) -> int:
+    from openmun_ech.ech0099.streaming import write_statistics_delivery
+    return write_statistics_delivery(register.ech0099_events(count), register.ech0099_config(), output,
+                                     message_id=f"synthetic-{register.seed}", message_date=MESSAGE_DATE,
+                                     pretty_print=pretty_print)
+
+
+def write_ech0133(register: SyntheticRegister, count: int, output: Path, pretty_print: bool) -> int:
+    from openmun_ech.ech0133.streaming import ECH0133StreamWriter
+    header = register.ech0133_header(f"synthetic-{register.seed}")
+    with ECH0133StreamWriter(output, header, 'realestateBaseDelivery', pretty_print=pretty_print) as writer:
+        return writer.write_all(register.ech0133_realestates(count))
+
+
+WRITERS = {
+    'ech0020': write_ech0020,
+    'ech0099': write_ech0099,
+    'ech0133': write_ech0133,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic (fictive) register deliveries for load testing',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('standard', choices=sorted(WRITERS),
+                        help='ech0020 baseDelivery, ech0099 statistics delivery, '
+                             'ech0133 realestateBaseDelivery (parcels with eCH-0129 buildings)')
+    parser.add_argument('output', type=Path, help='Output XML file')
+    parser.add_argument('--count', type=int, default=1000,
+                        help='Number of persons (ech0020/ech0099) or parcels (ech0133), default: 1000')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--compact', action='store_true', help='Write without indentation')
+
+    args = parser.parse_args(argv)
+    if args.count < 1:
+        parser.error('--count must be at least 1')
+
+    start = time.perf_counter()
+    written = WRITERS[args.standard](SyntheticRegister(seed=args.seed), args.count, args.output,
+                                     not args.compact)
+    elapsed = time.perf_counter() - start
+    size = args.output.stat().st_size / 2**20
+    print(f"✓ {written:,} records written to {args.output} ({size:.1f} MiB, {elapsed:.1f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())